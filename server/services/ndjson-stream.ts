@@ -0,0 +1,54 @@
+import { Readable } from 'stream';
+import * as readline from 'readline';
+
+/**
+ * Parse a newline delimited JSON stream one line at a time.
+ * Only the current line is buffered, so output of any size can be consumed.
+ */
+export function parseNDJSON(input: Readable, onMessage: (message: any) => void): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const lines = readline.createInterface({ input, crlfDelay: Infinity });
+
+    lines.on('line', (line) => {
+      if (!line.trim()) {
+        return;
+      }
+      try {
+        onMessage(JSON.parse(line));
+      } catch (error) {
+        lines.close();
+        reject(new Error(`Invalid NDJSON line: ${line.slice(0, 200)}`));
+      }
+    });
+
+    lines.on('close', () => resolve());
+    input.on('error', reject);
+  });
+}
+
+/**
+ * Read the --format ndjson output of the OCI discovery scripts
+ * ({"type": "resource"} lines then one {"type": "result"} line) and
+ * rebuild the { success, resources, summary, metadata } document.
+ */
+export async function readOCIResourceStream(input: Readable): Promise<any> {
+  const resources: Record<string, any[]> = {};
+  let result: any;
+
+  await parseNDJSON(input, (message) => {
+    if (message.type === 'resource') {
+      (resources[message.resource_type] ||= []).push(message.data);
+    } else if (message.type === 'result') {
+      result = message.result;
+    } else if (message.success === false) {
+      // scripts report fatal errors as a single JSON document
+      result = message;
+    }
+  });
+
+  if (!result) {
+    throw new Error('OCI discovery output ended without a result');
+  }
+
+  return { ...result, resources };
+}
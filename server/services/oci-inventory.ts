@@ -1,7 +1,9 @@
-import { exec } from 'child_process';
+import { exec, spawn } from 'child_process';
 import { promisify } from 'util';
 import * as fs from 'fs';
 import * as path from 'path';
+import { getOCIPythonWorker } from './oci-python-worker.js';
+import { readOCIResourceStream } from './ndjson-stream.js';
 
 const execAsync = promisify(exec);
 
@@ -1184,21 +1186,48 @@ export class OCIInventoryService {
       throw new Error('OCI credentials not provided');
     }
 
+    // Use the warm worker unless disabled, fall back to one process per call
+    if (process.env.OCI_PYTHON_WORKER !== 'false') {
+      try {
+        return await this.callPythonWorker(operation);
+      } catch (error) {
+        console.error('OCI Python worker failed, running script directly:', error);
+      }
+    }
+
+    return this.callPythonProcess(operation);
+  }
+
+  private getFixedCredentials(): OCICredentials {
+    // Parse credentials if they're a string, otherwise use as-is
+    let credentials = this.credentials!;
+    if (typeof this.credentials === 'string') {
+      credentials = JSON.parse(this.credentials);
+    }
+
+    // Fix escaped newlines in private key for OCI SDK
+    return {
+      ...credentials,
+      privateKey: credentials.privateKey ? credentials.privateKey.replace(/\\n/g, '\n') : credentials.privateKey
+    };
+  }
+
+  private async callPythonWorker(operation: string): Promise<any> {
+    const result = await getOCIPythonWorker().runJob(operation, this.getFixedCredentials());
+
+    if (operation === 'validate') {
+      return { success: true };
+    }
+
+    return result;
+  }
+
+  private async callPythonProcess(operation: string): Promise<any> {
     // Create temporary file for credentials
     const tempFile = path.join('/tmp', `oci_credentials_${Date.now()}.json`);
 
     try {
-      // Parse credentials if they're a string, otherwise use as-is
-      let credentials = this.credentials;
-      if (typeof this.credentials === 'string') {
-        credentials = JSON.parse(this.credentials);
-      }
-
-      // Fix escaped newlines in private key for OCI SDK
-      const fixedCredentials = {
-        ...credentials,
-        privateKey: credentials.privateKey ? credentials.privateKey.replace(/\\n/g, '\n') : credentials.privateKey
-      };
+      const fixedCredentials = this.getFixedCredentials();
 
       // Write credentials to temporary file
       fs.writeFileSync(tempFile, JSON.stringify(fixedCredentials, null, 2));
@@ -1208,21 +1237,38 @@ export class OCIInventoryService {
 
       // Execute Python script using virtual environment Python
       const venvPython = path.resolve(process.cwd(), 'oci-env', 'bin', 'python3');
-      const { stdout, stderr } = await execAsync(
-        `"${venvPython}" "${scriptPath}" --credentials "${tempFile}" --operation "${operation}"`
-      );
 
-      if (stderr) {
-        console.error('OCI Python stderr:', stderr);
-      }
+      if (operation === 'validate') {
+        const { stdout, stderr } = await execAsync(
+          `"${venvPython}" "${scriptPath}" --credentials "${tempFile}" --operation "${operation}"`
+        );
 
-      // Parse the result
-      const result = JSON.parse(stdout);
+        if (stderr) {
+          console.error('OCI Python stderr:', stderr);
+        }
 
-      if (operation === 'validate') {
+        JSON.parse(stdout);
         return { success: true };
       }
 
+      // Discovery output is streamed one resource per line, so its size is not
+      // limited by the exec output buffer
+      const child = spawn(venvPython, [scriptPath, '--credentials', tempFile, '--operation', operation, '--format', 'ndjson']);
+      child.stderr.on('data', (data) => {
+        console.error('OCI Python stderr:', data.toString());
+      });
+
+      const exited = new Promise<number | null>((resolve, reject) => {
+        child.on('error', reject);
+        child.on('close', resolve);
+      });
+
+      const [result, code] = await Promise.all([readOCIResourceStream(child.stdout), exited]);
+
+      if (code !== 0) {
+        throw new Error(result.error || `OCI Python script exited with code ${code}`);
+      }
+
       return result;
 
     } catch (error) {
@@ -0,0 +1,200 @@
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
+import * as path from 'path';
+import * as readline from 'readline';
+
+export interface OCIWorkerHealth {
+  status: string;
+  pid: number;
+  uptime: number;
+  jobs_running: number;
+  jobs_completed: number;
+  cached_clients: number;
+}
+
+interface PendingJob {
+  resolve: (value: any) => void;
+  reject: (error: Error) => void;
+  resources: Record<string, any[]>;
+  timer: NodeJS.Timeout;
+}
+
+const READY_TIMEOUT_MS = 60_000;
+const HEALTH_TIMEOUT_MS = 5_000;
+const JOB_TIMEOUT_MS = 30 * 60_000;
+
+/**
+ * Long-lived oci_worker.py process.
+ * Keeps the OCI SDK imported and signed clients cached between jobs,
+ * jobs and results are exchanged as one JSON message per line over stdio.
+ */
+export class OCIPythonWorker {
+  private child?: ChildProcessWithoutNullStreams;
+  private ready?: Promise<void>;
+  private pending = new Map<string, PendingJob>();
+  private nextId = 0;
+
+  constructor(
+    private pythonPath = path.resolve(process.cwd(), 'oci-env', 'bin', 'python3'),
+    private scriptPath = path.resolve(process.cwd(), 'server', 'services', 'python-scripts', 'oci_worker.py')
+  ) {}
+
+  /**
+   * Start the worker if not running and wait for its ready message
+   */
+  start(): Promise<void> {
+    if (this.ready) {
+      return this.ready;
+    }
+
+    this.ready = new Promise<void>((resolve, reject) => {
+      const child = spawn(this.pythonPath, [this.scriptPath], { stdio: ['pipe', 'pipe', 'pipe'] });
+      this.child = child;
+
+      const readyTimer = setTimeout(() => {
+        reject(new Error('OCI Python worker did not become ready'));
+        this.stop();
+      }, READY_TIMEOUT_MS);
+
+      readline.createInterface({ input: child.stdout }).on('line', (line) => {
+        let message: any;
+        try {
+          message = JSON.parse(line);
+        } catch {
+          console.error('OCI Python worker: invalid message:', line);
+          return;
+        }
+
+        if (message.type === 'ready') {
+          clearTimeout(readyTimer);
+          console.log(`OCI Python worker ready (pid ${message.pid}, oci ${message.oci_sdk_version})`);
+          resolve();
+          return;
+        }
+
+        this.handleMessage(message);
+      });
+
+      child.stderr.on('data', (data) => {
+        console.error('OCI Python stderr:', data.toString());
+      });
+
+      child.on('error', (error) => {
+        clearTimeout(readyTimer);
+        reject(error);
+        if (this.child === child) {
+          this.reset(error);
+        }
+      });
+
+      child.on('exit', (code) => {
+        const error = new Error(`OCI Python worker exited with code ${code}`);
+        clearTimeout(readyTimer);
+        reject(error);
+        if (this.child === child) {
+          this.reset(error);
+        }
+      });
+    });
+
+    return this.ready;
+  }
+
+  /**
+   * Stop the worker, pending jobs are rejected
+   */
+  stop(): void {
+    const child = this.child;
+    this.reset(new Error('OCI Python worker stopped'));
+    child?.kill();
+  }
+
+  /**
+   * Health/ready probe, answered by the worker even while jobs are running
+   */
+  async health(): Promise<OCIWorkerHealth> {
+    await this.start();
+    return this.send({ operation: 'health' }, HEALTH_TIMEOUT_MS);
+  }
+
+  /**
+   * Run a validate or discover job.
+   * Discover results are streamed per compartment and reassembled here into
+   * the same { success, resources, summary, metadata } shape as oci-simple.py.
+   */
+  async runJob(operation: string, credentials: any): Promise<any> {
+    await this.start();
+    return this.send({ operation, credentials }, JOB_TIMEOUT_MS);
+  }
+
+  private send(message: Record<string, any>, timeoutMs: number): Promise<any> {
+    const id = String(++this.nextId);
+
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        this.pending.delete(id);
+        reject(new Error(`OCI Python worker job ${id} timed out`));
+      }, timeoutMs);
+
+      this.pending.set(id, { resolve, reject, resources: {}, timer });
+      this.child!.stdin.write(JSON.stringify({ id, ...message }) + '\n');
+    });
+  }
+
+  private handleMessage(message: any): void {
+    const job = message.id ? this.pending.get(message.id) : undefined;
+    if (!job) {
+      if (message.type === 'error') {
+        console.error('OCI Python worker error:', message.error);
+      }
+      return;
+    }
+
+    switch (message.type) {
+      case 'resources': {
+        const items = (job.resources[message.resource_type] ||= []);
+        for (const item of message.items) {
+          items.push(item);
+        }
+        return;
+      }
+      case 'health':
+        this.finish(message.id, job);
+        job.resolve(message);
+        return;
+      case 'result':
+        this.finish(message.id, job);
+        job.resolve({ ...message.result, resources: job.resources });
+        return;
+      case 'error':
+        this.finish(message.id, job);
+        job.reject(new Error(message.error));
+        return;
+    }
+  }
+
+  private finish(id: string, job: PendingJob): void {
+    clearTimeout(job.timer);
+    this.pending.delete(id);
+  }
+
+  private reset(error: Error): void {
+    this.child = undefined;
+    this.ready = undefined;
+    this.pending.forEach((job, id) => {
+      this.finish(id, job);
+      job.reject(error);
+    });
+  }
+}
+
+let sharedWorker: OCIPythonWorker | undefined;
+
+/**
+ * Shared worker for the server process, started on first use
+ */
+export function getOCIPythonWorker(): OCIPythonWorker {
+  if (!sharedWorker) {
+    sharedWorker = new OCIPythonWorker();
+  }
+  return sharedWorker;
+}
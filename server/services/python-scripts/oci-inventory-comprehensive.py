@@ -10,11 +10,23 @@ import os
 import tempfile
 from typing import Dict, List, Any, Optional
 import oci
+from oci_stream import paginate, NDJSONEmitter
+from oci_clients import ClientRegistry
+from oci_regions import subscribed_regions, RegionScope, scan_regions, region_timing, parse_regions
+from oci_scheduler import SynchronizedList, AdaptiveRateLimiter
+from oci_profile import CallProfile
+from oci_compartments import load_compartment_tree, DEFAULT_COMPARTMENT_DB, DEFAULT_COMPARTMENT_TTL
 
 class OCIInventoryService:
-    def __init__(self, credentials: Dict[str, Any]):
+    def __init__(self, credentials: Dict[str, Any], emitter: Optional[NDJSONEmitter] = None, profile: Optional[CallProfile] = None,
+                 compartment_db: Optional[str] = DEFAULT_COMPARTMENT_DB, compartment_ttl: int = DEFAULT_COMPARTMENT_TTL):
         self.credentials = credentials
+        self.emitter = emitter
+        self.profile = profile
+        self.compartment_db = compartment_db
+        self.compartment_ttl = compartment_ttl
         self.temp_key_file = None
+        self.region_timing = None
         
     def _build_config(self) -> Dict[str, Any]:
         """Build OCI config from credentials"""
@@ -38,8 +50,9 @@ class OCIInventoryService:
             except:
                 pass
     
-    def discover_resources(self) -> Dict[str, Any]:
-        """Discover ALL OCI resources comprehensively"""
+    def discover_resources(self, regions=None) -> Dict[str, Any]:
+        """Discover ALL OCI resources comprehensively, in the config region or
+        concurrently in the subscribed regions given ("all" or names)"""
         try:
             config = self._build_config()
             signer = oci.signer.Signer(
@@ -51,13 +64,12 @@ class OCIInventoryService:
             
             print(f"OCI Config: user={config['user'][:20]}..., tenancy={config['tenancy'][:20]}..., region={config['region']}", file=sys.stderr)
             
-            # Get all compartments
-            identity_client = oci.identity.IdentityClient(config, signer=signer)
-            compartments = self._get_compartments(identity_client, config['tenancy'])
-            
             # Initialize clients
             clients = self._initialize_clients(config, signer)
             
+            # Get all compartments
+            compartments = self._get_compartments(clients['identity'], config['tenancy'])
+            
             # Discover resources
             resources = {
                 "compute_instances": [],
@@ -126,27 +138,20 @@ class OCIInventoryService:
                 "subscription_line_items": []
             }
             
-            for compartment in compartments:
-                compartment_id = compartment["id"]
-                compartment_name = compartment["name"]
-                
-                print(f"Scanning compartment: {compartment_name}", file=sys.stderr)
-                
-                # Discover all resource types
-                self._discover_compute_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_storage_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_network_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_database_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_container_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_serverless_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_analytics_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_ai_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_security_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_monitoring_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_management_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_cost_resources(clients, compartment_id, compartment_name, resources)
-                self._discover_tenant_resources(clients, compartment_id, compartment_name, resources)
+            # Stream resources as they are found instead of keeping them
+            if self.emitter:
+                resources = self.emitter.resources(resources)
+            
+            if regions:
+                if not self.emitter:
+                    resources = {key: SynchronizedList() for key in resources}
+                scopes = RegionScope.for_regions(config, subscribed_regions(clients['identity'], config['tenancy'], regions), resources, signer, profile=self.profile, limiter=clients.limiter)
+                scan_regions(scopes, lambda scope: self._scan_compartments(scope.clients, compartments, scope.resources))
+                self.region_timing = region_timing(scopes)
+            else:
+                self._scan_compartments(clients, compartments, resources)
             
+            clients.print_report()
             print("OCI comprehensive discovery completed successfully", file=sys.stderr)
             return resources
             
@@ -154,127 +159,40 @@ class OCIInventoryService:
             print(f"OCI discovery error: {e}", file=sys.stderr)
             raise e
     
-    def _initialize_clients(self, config: Dict[str, Any], signer) -> Dict[str, Any]:
-        """Initialize all OCI service clients"""
-        clients = {}
-        
-        # Core services
-        clients['identity'] = oci.identity.IdentityClient(config, signer=signer)
-        clients['compute'] = oci.core.ComputeClient(config, signer=signer)
-        clients['blockstorage'] = oci.core.BlockstorageClient(config, signer=signer)
-        clients['network'] = oci.core.VirtualNetworkClient(config, signer=signer)
-        clients['object_storage'] = oci.object_storage.ObjectStorageClient(config, signer=signer)
-        clients['database'] = oci.database.DatabaseClient(config, signer=signer)
-        clients['load_balancer'] = oci.load_balancer.LoadBalancerClient(config, signer=signer)
-        
-        # Additional services
-        try:
-            clients['container_engine'] = oci.container_engine.ContainerEngineClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['functions'] = oci.functions.FunctionsManagementClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['api_gateway'] = oci.apigateway.ApiGatewayClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['streaming'] = oci.streaming.StreamAdminClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['monitoring'] = oci.monitoring.MonitoringClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['logging'] = oci.logging.LoggingManagementClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['analytics'] = oci.analytics.AnalyticsClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['data_integration'] = oci.data_integration.DataIntegrationClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['data_catalog'] = oci.data_catalog.DataCatalogClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['data_science'] = oci.data_science.DataScienceClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['dns'] = oci.dns.DnsClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['certificates'] = oci.certificates_management.CertificatesManagementClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['kms'] = oci.key_management.KmsManagementClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['vault'] = oci.vault.VaultsClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['usage_api'] = oci.usage_api.UsageapiClient(config, signer=signer)
-        except:
-            pass
-        
-        try:
-            clients['budget'] = oci.budget.BudgetClient(config, signer=signer)
-        except:
-            pass
-        
-        return clients
+    def _scan_compartments(self, clients, compartments: List[Dict[str, str]], resources: Dict):
+        """Discover all resource types in each compartment"""
+        for compartment in compartments:
+            compartment_id = compartment["id"]
+            compartment_name = compartment["name"]
+
+            print(f"Scanning compartment: {compartment_name}", file=sys.stderr)
+
+            # Discover all resource types
+            self._discover_compute_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_storage_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_network_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_database_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_container_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_serverless_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_analytics_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_ai_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_security_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_monitoring_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_management_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_cost_resources(clients, compartment_id, compartment_name, resources)
+            self._discover_tenant_resources(clients, compartment_id, compartment_name, resources)
+
+    def _initialize_clients(self, config: Dict[str, Any], signer) -> ClientRegistry:
+        """Service clients, each one is created the first time a discovery method uses it"""
+        return ClientRegistry(config, signer, profile=self.profile, limiter=AdaptiveRateLimiter())
     
     def _get_compartments(self, identity_client, tenancy_id: str) -> List[Dict[str, str]]:
-        """Get all accessible compartments"""
+        """Get all compartments, the root (tenancy itself) first, from the
+        compartment tree cache while it is fresh"""
         try:
-            compartments = []
-            
-            # Add root compartment (tenancy itself)
-            root_compartment = identity_client.get_compartment(tenancy_id).data
-            compartments.append({
-                "id": root_compartment.id,
-                "name": root_compartment.name
-            })
-            
-            # List all compartments in the tenancy (including subcompartments)
-            list_compartments_response = identity_client.list_compartments(
-                tenancy_id,
-                compartment_id_in_subtree=True,
-                access_level="ANY"
-            )
-            for compartment in list_compartments_response.data:
-                compartments.append({
-                    "id": compartment.id,
-                    "name": compartment.name
-                })
-            
-            return compartments
+            tree = load_compartment_tree(identity_client, tenancy_id, self.credentials["userId"], "ANY",
+                                         self.compartment_db, self.compartment_ttl)
+            return [{"id": c.id, "name": c.name} for c in [tree.root] + tree.compartments[:-1]]
         except Exception as e:
             print(f"Error getting compartments: {e}", file=sys.stderr)
             return []
@@ -283,7 +201,7 @@ class OCIInventoryService:
         """Discover compute-related resources"""
         try:
             # Compute instances
-            instances_response = clients['compute'].list_instances(compartment_id=compartment_id)
+            instances_response = paginate(clients['compute'].list_instances, compartment_id=compartment_id)
             for instance in instances_response.data:
                 resources["compute_instances"].append({
                     "id": instance.id,
@@ -306,7 +224,7 @@ class OCIInventoryService:
         """Discover storage-related resources"""
         try:
             # Block volumes
-            volumes_response = clients['blockstorage'].list_volumes(compartment_id=compartment_id)
+            volumes_response = paginate(clients['blockstorage'].list_volumes, compartment_id=compartment_id)
             for volume in volumes_response.data:
                 resources["block_volumes"].append({
                     "id": volume.id,
@@ -326,7 +244,8 @@ class OCIInventoryService:
                 namespace_response = clients['object_storage'].get_namespace()
                 namespace = namespace_response.data
                 
-                buckets_response = clients['object_storage'].list_buckets(
+                buckets_response = paginate(
+                    clients['object_storage'].list_buckets,
                     namespace_name=namespace,
                     compartment_id=compartment_id
                 )
@@ -360,7 +279,7 @@ class OCIInventoryService:
         """Discover network-related resources"""
         try:
             # VCNs
-            vcns_response = clients['network'].list_vcns(compartment_id=compartment_id)
+            vcns_response = paginate(clients['network'].list_vcns, compartment_id=compartment_id)
             for vcn in vcns_response.data:
                 resources["vcns"].append({
                     "id": vcn.id,
@@ -380,7 +299,7 @@ class OCIInventoryService:
             
             # Subnets
             try:
-                subnets_response = clients['network'].list_subnets(compartment_id=compartment_id)
+                subnets_response = paginate(clients['network'].list_subnets, compartment_id=compartment_id)
                 for subnet in subnets_response.data:
                     resources["subnets"].append({
                         "id": subnet.id,
@@ -403,7 +322,7 @@ class OCIInventoryService:
             
             # Security Lists
             try:
-                security_lists_response = clients['network'].list_security_lists(compartment_id=compartment_id)
+                security_lists_response = paginate(clients['network'].list_security_lists, compartment_id=compartment_id)
                 for security_list in security_lists_response.data:
                     resources["security_lists"].append({
                         "id": security_list.id,
@@ -421,7 +340,7 @@ class OCIInventoryService:
             
             # Route Tables
             try:
-                route_tables_response = clients['network'].list_route_tables(compartment_id=compartment_id)
+                route_tables_response = paginate(clients['network'].list_route_tables, compartment_id=compartment_id)
                 for route_table in route_tables_response.data:
                     resources["route_tables"].append({
                         "id": route_table.id,
@@ -438,7 +357,7 @@ class OCIInventoryService:
             
             # Internet Gateways
             try:
-                ig_response = clients['network'].list_internet_gateways(compartment_id=compartment_id)
+                ig_response = paginate(clients['network'].list_internet_gateways, compartment_id=compartment_id)
                 for ig in ig_response.data:
                     resources["internet_gateways"].append({
                         "id": ig.id,
@@ -455,7 +374,7 @@ class OCIInventoryService:
             
             # NAT Gateways
             try:
-                nat_response = clients['network'].list_nat_gateways(compartment_id=compartment_id)
+                nat_response = paginate(clients['network'].list_nat_gateways, compartment_id=compartment_id)
                 for nat in nat_response.data:
                     resources["nat_gateways"].append({
                         "id": nat.id,
@@ -472,7 +391,7 @@ class OCIInventoryService:
             
             # Service Gateways
             try:
-                sg_response = clients['network'].list_service_gateways(compartment_id=compartment_id)
+                sg_response = paginate(clients['network'].list_service_gateways, compartment_id=compartment_id)
                 for sg in sg_response.data:
                     resources["service_gateways"].append({
                         "id": sg.id,
@@ -489,7 +408,7 @@ class OCIInventoryService:
             
             # Load Balancers
             try:
-                lb_response = clients['load_balancer'].list_load_balancers(compartment_id=compartment_id)
+                lb_response = paginate(clients['load_balancer'].list_load_balancers, compartment_id=compartment_id)
                 for lb in lb_response.data:
                     resources["load_balancers"].append({
                         "id": lb.id,
@@ -515,7 +434,7 @@ class OCIInventoryService:
         try:
             # Autonomous Databases
             try:
-                adb_response = clients['database'].list_autonomous_databases(compartment_id=compartment_id)
+                adb_response = paginate(clients['database'].list_autonomous_databases, compartment_id=compartment_id)
                 for adb in adb_response.data:
                     resources["autonomous_databases"].append({
                         "id": adb.id,
@@ -546,7 +465,7 @@ class OCIInventoryService:
             if 'container_engine' in clients:
                 # Clusters
                 try:
-                    clusters_response = clients['container_engine'].list_clusters(compartment_id=compartment_id)
+                    clusters_response = paginate(clients['container_engine'].list_clusters, compartment_id=compartment_id)
                     for cluster in clusters_response.data:
                         resources["clusters"].append({
                             "id": cluster.id,
@@ -563,7 +482,7 @@ class OCIInventoryService:
                 
                 # Node Pools
                 try:
-                    node_pools_response = clients['container_engine'].list_node_pools(compartment_id=compartment_id)
+                    node_pools_response = paginate(clients['container_engine'].list_node_pools, compartment_id=compartment_id)
                     for node_pool in node_pools_response.data:
                         resources["node_pools"].append({
                             "id": node_pool.id,
@@ -589,7 +508,7 @@ class OCIInventoryService:
             if 'functions' in clients:
                 # Functions Applications
                 try:
-                    apps_response = clients['functions'].list_applications(compartment_id=compartment_id)
+                    apps_response = paginate(clients['functions'].list_applications, compartment_id=compartment_id)
                     for app in apps_response.data:
                         resources["applications"].append({
                             "id": app.id,
@@ -605,7 +524,7 @@ class OCIInventoryService:
                 
                 # Functions
                 try:
-                    functions_response = clients['functions'].list_functions(compartment_id=compartment_id)
+                    functions_response = paginate(clients['functions'].list_functions, compartment_id=compartment_id)
                     for function in functions_response.data:
                         resources["functions"].append({
                             "id": function.id,
@@ -631,7 +550,7 @@ class OCIInventoryService:
             if 'streaming' in clients:
                 # Stream Pools
                 try:
-                    stream_pools_response = clients['streaming'].list_stream_pools(compartment_id=compartment_id)
+                    stream_pools_response = paginate(clients['streaming'].list_stream_pools, compartment_id=compartment_id)
                     for pool in stream_pools_response.data:
                         resources["stream_pools"].append({
                             "id": pool.id,
@@ -647,7 +566,7 @@ class OCIInventoryService:
                 
                 # Streams
                 try:
-                    streams_response = clients['streaming'].list_streams(compartment_id=compartment_id)
+                    streams_response = paginate(clients['streaming'].list_streams, compartment_id=compartment_id)
                     for stream in streams_response.data:
                         resources["streams"].append({
                             "id": stream.id,
@@ -671,7 +590,7 @@ class OCIInventoryService:
             if 'data_science' in clients:
                 # Data Science Projects
                 try:
-                    projects_response = clients['data_science'].list_projects(compartment_id=compartment_id)
+                    projects_response = paginate(clients['data_science'].list_projects, compartment_id=compartment_id)
                     for project in projects_response.data:
                         resources["data_science_projects"].append({
                             "id": project.id,
@@ -692,7 +611,7 @@ class OCIInventoryService:
             if 'dns' in clients:
                 # DNS Zones
                 try:
-                    zones_response = clients['dns'].list_zones(compartment_id=compartment_id)
+                    zones_response = paginate(clients['dns'].list_zones, compartment_id=compartment_id)
                     for zone in zones_response.data:
                         resources["dns_zones"].append({
                             "id": zone.id,
@@ -714,7 +633,7 @@ class OCIInventoryService:
             if 'monitoring' in clients:
                 # Alarms
                 try:
-                    alarms_response = clients['monitoring'].list_alarms(compartment_id=compartment_id)
+                    alarms_response = paginate(clients['monitoring'].list_alarms, compartment_id=compartment_id)
                     for alarm in alarms_response.data:
                         resources["alarms"].append({
                             "id": alarm.id,
@@ -741,7 +660,7 @@ class OCIInventoryService:
             if 'usage_api' in clients:
                 # Usage Reports
                 try:
-                    usage_response = clients['usage_api'].list_usage_reports(compartment_id=compartment_id)
+                    usage_response = paginate(clients['usage_api'].list_usage_reports, compartment_id=compartment_id)
                     for report in usage_response.data:
                         resources["usage_reports"].append({
                             "id": report.id,
@@ -762,7 +681,7 @@ class OCIInventoryService:
             if 'budget' in clients:
                 # Budgets
                 try:
-                    budgets_response = clients['budget'].list_budgets(compartment_id=compartment_id)
+                    budgets_response = paginate(clients['budget'].list_budgets, compartment_id=compartment_id)
                     for budget in budgets_response.data:
                         resources["budgets"].append({
                             "id": budget.id,
@@ -783,7 +702,7 @@ class OCIInventoryService:
             if 'usage_api' in clients:
                 # Subscriptions
                 try:
-                    subs_response = clients['usage_api'].list_subscriptions(compartment_id=compartment_id)
+                    subs_response = paginate(clients['usage_api'].list_subscriptions, compartment_id=compartment_id)
                     for sub in subs_response.data:
                         resources["subscriptions"].append({
                             "id": sub.id,
@@ -805,6 +724,12 @@ def main():
     parser = argparse.ArgumentParser(description='OCI Comprehensive Resource Discovery')
     parser.add_argument('--credentials', required=True, help='OCI credentials JSON or file path')
     parser.add_argument('--operation', default='all', choices=['all', 'compute', 'storage', 'database', 'network'], help='Resource type to discover')
+    parser.add_argument('--format', default='json', choices=['json', 'ndjson'], help='Output format, ndjson streams one resource per line')
+    parser.add_argument('--regions', default='', help='Scan these subscribed regions concurrently, "all" or comma separated, records are tagged with region (default=config region)')
+    parser.add_argument('--compartment-db', default=DEFAULT_COMPARTMENT_DB, help=f'Compartment tree cache shared by the scans (default={DEFAULT_COMPARTMENT_DB})')
+    parser.add_argument('--compartment-ttl', default=DEFAULT_COMPARTMENT_TTL, type=int, help=f'Seconds the cached compartment tree is used without listing the compartments, 0 lists them every scan (default={DEFAULT_COMPARTMENT_TTL})')
+    parser.add_argument('--call-profile', default='', help='Write the per call latency and count profile of the OCI API calls to this JSON file')
+    parser.add_argument('--call-profile-prom', default='', help='Write the call profile to this Prometheus text file, needs prometheus-client')
     
     args = parser.parse_args()
     
@@ -817,15 +742,25 @@ def main():
             credentials = json.loads(args.credentials)
         
         # Create service and discover resources
-        service = OCIInventoryService(credentials)
+        emitter = NDJSONEmitter() if args.format == 'ndjson' else None
+        profile = CallProfile() if args.call_profile or args.call_profile_prom else None
+        service = OCIInventoryService(credentials, emitter, profile, args.compartment_db, args.compartment_ttl)
         
         if args.operation == 'all':
-            result = service.discover_resources()
+            result = service.discover_resources(parse_regions(args.regions))
         else:
             # For specific operations, we could implement targeted discovery
-            result = service.discover_resources()
+            result = service.discover_resources(parse_regions(args.regions))
         
-        print(json.dumps(result, indent=2))
+        if emitter:
+            finish = {"success": True, "summary": emitter.summary()}
+            if service.region_timing:
+                finish["region_timing"] = service.region_timing
+            emitter.finish(finish)
+        else:
+            print(json.dumps(result, indent=2))
+        if profile:
+            profile.save(args.call_profile, args.call_profile_prom)
         
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
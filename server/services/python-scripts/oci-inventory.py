@@ -10,22 +10,29 @@ import os
 import tempfile
 import argparse
 from datetime import datetime
-import oci
 from oci.config import from_file
-from oci.signer import Signer
+from oci_stream import paginate, NDJSONEmitter
+from oci_snapshot import SnapshotStore, compute_delta, DEFAULT_SNAPSHOT_DB
+from oci_clients import ClientRegistry
+from oci_regions import subscribed_regions, RegionScope, scan_regions, region_timing, parse_regions
+from oci_scheduler import SynchronizedList, AdaptiveRateLimiter
+from oci_profile import CallProfile
+from oci_compartments import load_compartment_tree, DEFAULT_COMPARTMENT_DB, DEFAULT_COMPARTMENT_TTL
 
 class OCIInventoryService:
-    def __init__(self, config):
+    def __init__(self, config, emitter=None, clients=None, profile=None, compartment_db=DEFAULT_COMPARTMENT_DB, compartment_ttl=DEFAULT_COMPARTMENT_TTL):
         self.config = config
-        self.identity_client = oci.identity.IdentityClient(config)
-        self.compute_client = oci.core.ComputeClient(config)
-        self.blockstorage_client = oci.core.BlockstorageClient(config)
-        self.objectstorage_client = oci.object_storage.ObjectStorageClient(config)
-        self.database_client = oci.database.DatabaseClient(config)
-        self.load_balancer_client = oci.load_balancer.LoadBalancerClient(config)
-        self.virtual_network_client = oci.core.VirtualNetworkClient(config)
-
-    def discover_resources(self):
+        self.emitter = emitter
+        self.profile = profile
+        self.compartment_db = compartment_db
+        self.compartment_ttl = compartment_ttl
+        self.clients = clients if clients is not None else ClientRegistry(config, profile=profile, limiter=AdaptiveRateLimiter())
+        self.scan_identity = True
+        self.region_timing = None
+
+    def discover_resources(self, regions=None):
+        """Discover all OCI resources across all compartments, in the config
+        region or concurrently in the subscribed regions given ("all" or names)"""
         """Discover all OCI resources across all compartments"""
         resources = {
             "compute_instances": [],
@@ -61,19 +68,14 @@ class OCIInventoryService:
             "dynamic_groups": []
         }
 
+        # Stream resources as they are found instead of keeping them
+        if self.emitter:
+            resources = self.emitter.resources(resources)
+
         try:
-            # Get all compartments
-            compartments = self.identity_client.list_compartments(
-                compartment_id=self.config["tenancy"],
-                compartment_id_in_subtree=True,
-                access_level="ACCESSIBLE"
-            ).data
-
-            # Add root compartment
-            root_compartment = self.identity_client.get_compartment(
-                compartment_id=self.config["tenancy"]
-            ).data
-            compartments.append(root_compartment)
+            # Get all compartments and the root compartment, from the cache while it is fresh
+            compartments = load_compartment_tree(self.clients["identity"], self.config["tenancy"], self.config["user"],
+                                                 path=self.compartment_db, ttl=self.compartment_ttl).compartments
 
             print(f"Found {len(compartments)} compartments", file=sys.stderr)
             
@@ -81,42 +83,61 @@ class OCIInventoryService:
             for comp in compartments:
                 print(f"Compartment: {comp.name} (ID: {comp.id[:20]}...)", file=sys.stderr)
 
-            for compartment in compartments:
-                compartment_id = compartment.id
-                compartment_name = compartment.name
-                
-                print(f"Scanning compartment: {compartment_name}", file=sys.stderr)
-                
-                # Discover core resources
-                self._discover_core_resources(compartment_id, compartment_name, resources)
-                
-                # Discover additional network resources
-                self._discover_additional_network_resources(compartment_id, compartment_name, resources)
-                
-                # Discover additional compute resources
-                self._discover_additional_compute_resources(compartment_id, compartment_name, resources)
-                
-                # Discover additional storage resources
-                self._discover_additional_storage_resources(compartment_id, compartment_name, resources)
-                
-                # Discover additional database resources
-                self._discover_additional_database_resources(compartment_id, compartment_name, resources)
-                
-                # Discover additional services
-                self._discover_additional_services(compartment_id, compartment_name, resources)
+            if regions:
+                if not self.emitter:
+                    resources = {key: SynchronizedList() for key in resources}
+                scopes = RegionScope.for_regions(self.config, subscribed_regions(self.clients["identity"], self.config["tenancy"], regions), resources, self.clients.signer, profile=self.profile, limiter=self.clients.limiter)
+
+                # identity is global, only the first (home) region lists it
+                def scan_region(scope):
+                    service = OCIInventoryService(scope.clients.config, self.emitter, scope.clients)
+                    service.scan_identity = scope is scopes[0]
+                    service._scan_compartments(compartments, scope.resources)
+
+                scan_regions(scopes, scan_region)
+                self.region_timing = region_timing(scopes)
+            else:
+                self._scan_compartments(compartments, resources)
 
         except Exception as e:
             print(f"Error during resource discovery: {e}", file=sys.stderr)
             raise
 
+        self.clients.print_report()
         return resources
 
+    def _scan_compartments(self, compartments, resources):
+        """Discover the resources of each compartment with this service's clients"""
+        for compartment in compartments:
+            compartment_id = compartment.id
+            compartment_name = compartment.name
+
+            print(f"Scanning compartment: {compartment_name}", file=sys.stderr)
+
+            # Discover core resources
+            self._discover_core_resources(compartment_id, compartment_name, resources)
+
+            # Discover additional network resources
+            self._discover_additional_network_resources(compartment_id, compartment_name, resources)
+
+            # Discover additional compute resources
+            self._discover_additional_compute_resources(compartment_id, compartment_name, resources)
+
+            # Discover additional storage resources
+            self._discover_additional_storage_resources(compartment_id, compartment_name, resources)
+
+            # Discover additional database resources
+            self._discover_additional_database_resources(compartment_id, compartment_name, resources)
+
+            # Discover additional services
+            self._discover_additional_services(compartment_id, compartment_name, resources)
+
     def _discover_core_resources(self, compartment_id, compartment_name, resources):
         """Discover core OCI resources"""
         try:
             # Compute Instances
             try:
-                instances_response = self.compute_client.list_instances(compartment_id=compartment_id)
+                instances_response = paginate(self.clients["compute"].list_instances, compartment_id=compartment_id)
                 for instance in instances_response.data:
                     resources["compute_instances"].append({
                         "id": instance.id,
@@ -133,7 +154,7 @@ class OCIInventoryService:
 
             # Block Volumes
             try:
-                volumes_response = self.blockstorage_client.list_volumes(compartment_id=compartment_id)
+                volumes_response = paginate(self.clients["blockstorage"].list_volumes, compartment_id=compartment_id)
                 for volume in volumes_response.data:
                     resources["block_volumes"].append({
                         "id": volume.id,
@@ -150,8 +171,9 @@ class OCIInventoryService:
 
             # Object Storage Buckets
             try:
-                namespace = self.objectstorage_client.get_namespace().data
-                buckets_response = self.objectstorage_client.list_buckets(
+                namespace = self.clients["object_storage"].get_namespace().data
+                buckets_response = paginate(
+                    self.clients["object_storage"].list_buckets,
                     namespace_name=namespace,
                     compartment_id=compartment_id
                 )
@@ -169,7 +191,7 @@ class OCIInventoryService:
 
             # Autonomous Databases
             try:
-                adb_response = self.database_client.list_autonomous_databases(compartment_id=compartment_id)
+                adb_response = paginate(self.clients["database"].list_autonomous_databases, compartment_id=compartment_id)
                 for adb in adb_response.data:
                     resources["autonomous_databases"].append({
                         "id": adb.id,
@@ -187,7 +209,7 @@ class OCIInventoryService:
 
             # Load Balancers
             try:
-                lb_response = self.load_balancer_client.list_load_balancers(compartment_id=compartment_id)
+                lb_response = paginate(self.clients["load_balancer"].list_load_balancers, compartment_id=compartment_id)
                 for lb in lb_response.data:
                     resources["load_balancers"].append({
                         "id": lb.id,
@@ -203,7 +225,7 @@ class OCIInventoryService:
 
             # VCNs
             try:
-                vcns_response = self.virtual_network_client.list_vcns(compartment_id=compartment_id)
+                vcns_response = paginate(self.clients["network"].list_vcns, compartment_id=compartment_id)
                 for vcn in vcns_response.data:
                     resources["vcns"].append({
                         "id": vcn.id,
@@ -219,7 +241,7 @@ class OCIInventoryService:
 
             # Subnets
             try:
-                subnets_response = self.virtual_network_client.list_subnets(compartment_id=compartment_id)
+                subnets_response = paginate(self.clients["network"].list_subnets, compartment_id=compartment_id)
                 for subnet in subnets_response.data:
                     resources["subnets"].append({
                         "id": subnet.id,
@@ -237,7 +259,7 @@ class OCIInventoryService:
 
             # Security Lists
             try:
-                security_lists_response = self.virtual_network_client.list_security_lists(compartment_id=compartment_id)
+                security_lists_response = paginate(self.clients["network"].list_security_lists, compartment_id=compartment_id)
                 for sl in security_lists_response.data:
                     resources["security_lists"].append({
                         "id": sl.id,
@@ -259,7 +281,7 @@ class OCIInventoryService:
         try:
             # Route Tables
             try:
-                route_tables_response = self.virtual_network_client.list_route_tables(compartment_id=compartment_id)
+                route_tables_response = paginate(self.clients["network"].list_route_tables, compartment_id=compartment_id)
                 for rt in route_tables_response.data:
                     resources["route_tables"].append({
                         "id": rt.id,
@@ -275,7 +297,7 @@ class OCIInventoryService:
 
             # Internet Gateways
             try:
-                ig_response = self.virtual_network_client.list_internet_gateways(compartment_id=compartment_id)
+                ig_response = paginate(self.clients["network"].list_internet_gateways, compartment_id=compartment_id)
                 for ig in ig_response.data:
                     resources["internet_gateways"].append({
                         "id": ig.id,
@@ -291,7 +313,7 @@ class OCIInventoryService:
 
             # NAT Gateways
             try:
-                nat_response = self.virtual_network_client.list_nat_gateways(compartment_id=compartment_id)
+                nat_response = paginate(self.clients["network"].list_nat_gateways, compartment_id=compartment_id)
                 for nat in nat_response.data:
                     resources["nat_gateways"].append({
                         "id": nat.id,
@@ -307,7 +329,7 @@ class OCIInventoryService:
 
             # Service Gateways
             try:
-                sg_response = self.virtual_network_client.list_service_gateways(compartment_id=compartment_id)
+                sg_response = paginate(self.clients["network"].list_service_gateways, compartment_id=compartment_id)
                 for sg in sg_response.data:
                     resources["service_gateways"].append({
                         "id": sg.id,
@@ -323,7 +345,7 @@ class OCIInventoryService:
 
             # Network Security Groups
             try:
-                nsg_response = self.virtual_network_client.list_network_security_groups(compartment_id=compartment_id)
+                nsg_response = paginate(self.clients["network"].list_network_security_groups, compartment_id=compartment_id)
                 for nsg in nsg_response.data:
                     resources["network_security_groups"].append({
                         "id": nsg.id,
@@ -345,7 +367,7 @@ class OCIInventoryService:
         try:
             # Images (limit to first 20 to avoid timeout)
             try:
-                images_response = self.compute_client.list_images(compartment_id=compartment_id, limit=20)
+                images_response = self.clients["compute"].list_images(compartment_id=compartment_id, limit=20)
                 for image in images_response.data:
                     resources["images"].append({
                         "id": image.id,
@@ -368,7 +390,7 @@ class OCIInventoryService:
         try:
             # Volume Groups
             try:
-                vg_response = self.blockstorage_client.list_volume_groups(compartment_id=compartment_id)
+                vg_response = paginate(self.clients["blockstorage"].list_volume_groups, compartment_id=compartment_id)
                 for vg in vg_response.data:
                     resources["volume_groups"].append({
                         "id": vg.id,
@@ -384,7 +406,7 @@ class OCIInventoryService:
 
             # Boot Volumes
             try:
-                bv_response = self.blockstorage_client.list_boot_volumes(compartment_id=compartment_id)
+                bv_response = paginate(self.clients["blockstorage"].list_boot_volumes, compartment_id=compartment_id)
                 for bv in bv_response.data:
                     resources["boot_volumes"].append({
                         "id": bv.id,
@@ -401,7 +423,7 @@ class OCIInventoryService:
 
             # Backups
             try:
-                backups_response = self.blockstorage_client.list_volume_backups(compartment_id=compartment_id)
+                backups_response = paginate(self.clients["blockstorage"].list_volume_backups, compartment_id=compartment_id)
                 for backup in backups_response.data:
                     resources["backups"].append({
                         "id": backup.id,
@@ -424,7 +446,7 @@ class OCIInventoryService:
         try:
             # DB Systems
             try:
-                db_systems_response = self.database_client.list_db_systems(compartment_id=compartment_id)
+                db_systems_response = paginate(self.clients["database"].list_db_systems, compartment_id=compartment_id)
                 for db_system in db_systems_response.data:
                     resources["db_systems"].append({
                         "id": db_system.id,
@@ -447,9 +469,8 @@ class OCIInventoryService:
         try:
             # Functions
             try:
-                from oci.functions import FunctionsManagementClient
-                functions_client = FunctionsManagementClient(self.config)
-                functions_response = functions_client.list_applications(compartment_id=compartment_id)
+                functions_client = self.clients["functions"]
+                functions_response = paginate(functions_client.list_applications, compartment_id=compartment_id)
                 for func in functions_response.data:
                     resources["functions"].append({
                         "id": func.id,
@@ -466,9 +487,8 @@ class OCIInventoryService:
 
             # Container Instances
             try:
-                from oci.container_instances import ContainerInstanceClient
-                container_client = ContainerInstanceClient(self.config)
-                containers_response = container_client.list_container_instances(compartment_id=compartment_id)
+                container_client = self.clients["container_instances"]
+                containers_response = paginate(container_client.list_container_instances, compartment_id=compartment_id)
                 for container in containers_response.data:
                     resources["containers"].append({
                         "id": container.id,
@@ -485,9 +505,8 @@ class OCIInventoryService:
 
             # Streaming
             try:
-                from oci.streaming import StreamAdminClient
-                streaming_client = StreamAdminClient(self.config)
-                streams_response = streaming_client.list_streams(compartment_id=compartment_id)
+                streaming_client = self.clients["streaming"]
+                streams_response = paginate(streaming_client.list_streams, compartment_id=compartment_id)
                 for stream in streams_response.data:
                     resources["streams"].append({
                         "id": stream.id,
@@ -504,9 +523,8 @@ class OCIInventoryService:
 
             # Notifications
             try:
-                from oci.ons import NotificationControlPlaneClient
-                notification_client = NotificationControlPlaneClient(self.config)
-                topics_response = notification_client.list_topics(compartment_id=compartment_id)
+                notification_client = self.clients["notifications"]
+                topics_response = paginate(notification_client.list_topics, compartment_id=compartment_id)
                 for topic in topics_response.data:
                     resources["topics"].append({
                         "id": topic.topic_id,
@@ -523,9 +541,8 @@ class OCIInventoryService:
 
             # Monitoring alarms
             try:
-                from oci.monitoring import MonitoringClient
-                monitoring_client = MonitoringClient(self.config)
-                alarms_response = monitoring_client.list_alarms(compartment_id=compartment_id)
+                monitoring_client = self.clients["monitoring"]
+                alarms_response = paginate(monitoring_client.list_alarms, compartment_id=compartment_id)
                 for alarm in alarms_response.data:
                     resources["alarms"].append({
                         "id": alarm.id,
@@ -542,9 +559,8 @@ class OCIInventoryService:
 
             # Budgets
             try:
-                from oci.budget import BudgetClient
-                budget_client = BudgetClient(self.config)
-                budgets_response = budget_client.list_budgets(compartment_id=compartment_id)
+                budget_client = self.clients["budget"]
+                budgets_response = paginate(budget_client.list_budgets, compartment_id=compartment_id)
                 for budget in budgets_response.data:
                     resources["budgets"].append({
                         "id": budget.id,
@@ -560,10 +576,10 @@ class OCIInventoryService:
                 print(f"Error discovering budgets in {compartment_name}: {e}", file=sys.stderr)
 
             # Identity resources (only for root compartment)
-            if compartment_id == self.config["tenancy"]:
+            if compartment_id == self.config["tenancy"] and self.scan_identity:
                 try:
                     # Users
-                    users_response = self.identity_client.list_users(compartment_id=compartment_id)
+                    users_response = paginate(self.clients["identity"].list_users, compartment_id=compartment_id)
                     for user in users_response.data:
                         resources["users"].append({
                             "id": user.id,
@@ -575,7 +591,7 @@ class OCIInventoryService:
                     print(f"Found {len(users_response.data)} users", file=sys.stderr)
 
                     # Groups
-                    groups_response = self.identity_client.list_groups(compartment_id=compartment_id)
+                    groups_response = paginate(self.clients["identity"].list_groups, compartment_id=compartment_id)
                     for group in groups_response.data:
                         resources["groups"].append({
                             "id": group.id,
@@ -587,7 +603,7 @@ class OCIInventoryService:
                     print(f"Found {len(groups_response.data)} groups", file=sys.stderr)
 
                     # Dynamic Groups
-                    dynamic_groups_response = self.identity_client.list_dynamic_groups(compartment_id=compartment_id)
+                    dynamic_groups_response = paginate(self.clients["identity"].list_dynamic_groups, compartment_id=compartment_id)
                     for dg in dynamic_groups_response.data:
                         resources["dynamic_groups"].append({
                             "id": dg.id,
@@ -608,8 +624,18 @@ def main():
     parser = argparse.ArgumentParser(description='Discover OCI resources')
     parser.add_argument('--credentials', required=True, help='OCI credentials JSON file or JSON string')
     parser.add_argument('--operation', default='all', help='Operation to perform (all, instances, storage, network)')
+    parser.add_argument('--format', default='json', choices=['json', 'ndjson'], help='Output format, ndjson streams one resource per line')
+    parser.add_argument('--regions', default='', help='Scan these subscribed regions concurrently, "all" or comma separated, records are tagged with region (default=config region)')
+    parser.add_argument('--incremental', action='store_true', help='Add the delta against the last snapshot to the output')
+    parser.add_argument('--snapshot-db', default=DEFAULT_SNAPSHOT_DB, help=f'Snapshot database for --incremental (default={DEFAULT_SNAPSHOT_DB})')
+    parser.add_argument('--compartment-db', default=DEFAULT_COMPARTMENT_DB, help=f'Compartment tree cache shared by the scans (default={DEFAULT_COMPARTMENT_DB})')
+    parser.add_argument('--compartment-ttl', default=DEFAULT_COMPARTMENT_TTL, type=int, help=f'Seconds the cached compartment tree is used without listing the compartments, 0 lists them every scan (default={DEFAULT_COMPARTMENT_TTL})')
+    parser.add_argument('--call-profile', default='', help='Write the per call latency and count profile of the OCI API calls to this JSON file')
+    parser.add_argument('--call-profile-prom', default='', help='Write the call profile to this Prometheus text file, needs prometheus-client')
     
     args = parser.parse_args()
+    if args.incremental and args.format == 'ndjson':
+        parser.error("--incremental needs the full resource set and does not support --format ndjson")
     
     try:
         # Parse credentials
@@ -636,28 +662,13 @@ def main():
         try:
             config["key_file"] = key_file_path
             
-            # Create signer
-            signer = Signer(
-                tenancy=config["tenancy"],
-                user=config["user"],
-                fingerprint=config["fingerprint"],
-                private_key_file_location=config["key_file"]
-            )
-            
-            # Create OCI clients
-            identity_client = oci.identity.IdentityClient(config, signer=signer)
-            compute_client = oci.core.ComputeClient(config, signer=signer)
-            blockstorage_client = oci.core.BlockstorageClient(config, signer=signer)
-            objectstorage_client = oci.object_storage.ObjectStorageClient(config, signer=signer)
-            database_client = oci.database.DatabaseClient(config, signer=signer)
-            load_balancer_client = oci.load_balancer.LoadBalancerClient(config, signer=signer)
-            virtual_network_client = oci.core.VirtualNetworkClient(config, signer=signer)
-            
             print(f"OCI Config: user={config['user'][:20]}..., tenancy={config['tenancy'][:20]}..., region={config['region']}", file=sys.stderr)
             
             # Discover resources
-            service = OCIInventoryService(config)
-            resources = service.discover_resources()
+            emitter = NDJSONEmitter() if args.format == 'ndjson' else None
+            profile = CallProfile() if args.call_profile or args.call_profile_prom else None
+            service = OCIInventoryService(config, emitter, profile=profile, compartment_db=args.compartment_db, compartment_ttl=args.compartment_ttl)
+            resources = service.discover_resources(parse_regions(args.regions))
             
             # Output results
             result = {
@@ -666,9 +677,27 @@ def main():
                 "timestamp": datetime.now().isoformat(),
                 "total_resources": sum(len(resource_list) for resource_list in resources.values())
             }
+            if service.region_timing:
+                result["region_timing"] = service.region_timing
+
+            # This script has no change detection, it scans everything and
+            # reports what changed since the snapshot
+            if args.incremental:
+                store = SnapshotStore(args.snapshot_db)
+                try:
+                    scope = f"oci-inventory:{config['tenancy']}:{args.regions or config['region']}"
+                    result["delta"] = compute_delta(store.load(scope), resources)
+                    store.save(scope, resources)
+                finally:
+                    store.close()
             
-            print(json.dumps(result, indent=2))
+            if emitter:
+                emitter.finish(result)
+            else:
+                print(json.dumps(result, indent=2))
             print("OCI discovery completed successfully", file=sys.stderr)
+            if profile:
+                profile.save(args.call_profile, args.call_profile_prom)
             
         finally:
             # Clean up temporary key file
@@ -680,7 +709,8 @@ def main():
             "error": str(e),
             "timestamp": datetime.now().isoformat()
         }
-        print(json.dumps(error_result, indent=2))
+        # ndjson consumers read the error as a single line
+        print(json.dumps(error_result, indent=None if args.format == 'ndjson' else 2))
         print(f"OCI discovery failed: {e}", file=sys.stderr)
         sys.exit(1)
 
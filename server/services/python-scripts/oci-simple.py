@@ -10,13 +10,25 @@ import os
 import tempfile
 import argparse
 from datetime import datetime
-import oci
 from oci.config import from_file
+from oci_stream import NDJSONEmitter
+from oci_clients import ClientRegistry
+from oci_regions import parse_regions
+from oci_scheduler import AdaptiveRateLimiter
+from oci_profile import CallProfile
+from oci_compartments import DEFAULT_COMPARTMENT_DB, DEFAULT_COMPARTMENT_TTL
+from oci_simple_discovery import discover
 
 def main():
     parser = argparse.ArgumentParser(description='Simple OCI Resource Discovery')
     parser.add_argument('--credentials', required=True, help='OCI credentials JSON file or JSON string')
     parser.add_argument('--operation', default='discover', help='Operation to perform (discover, validate)')
+    parser.add_argument('--format', default='json', choices=['json', 'ndjson'], help='Output format, ndjson streams one resource per line')
+    parser.add_argument('--regions', default='', help='Scan these subscribed regions concurrently, "all" or comma separated, records are tagged with region (default=config region)')
+    parser.add_argument('--compartment-db', default=DEFAULT_COMPARTMENT_DB, help=f'Compartment tree cache shared by the scans (default={DEFAULT_COMPARTMENT_DB})')
+    parser.add_argument('--compartment-ttl', default=DEFAULT_COMPARTMENT_TTL, type=int, help=f'Seconds the cached compartment tree is used without listing the compartments, 0 lists them every scan (default={DEFAULT_COMPARTMENT_TTL})')
+    parser.add_argument('--call-profile', default='', help='Write the per call latency and count profile of the OCI API calls to this JSON file')
+    parser.add_argument('--call-profile-prom', default='', help='Write the call profile to this Prometheus text file, needs prometheus-client')
 
     args = parser.parse_args()
 
@@ -47,144 +59,33 @@ def main():
 
             print(f"Starting simple OCI discovery for tenancy {config['tenancy'][:20]}... in region {config['region']}", file=sys.stderr)
 
-            # Initialize basic clients
-            identity_client = oci.identity.IdentityClient(config)
-            compute_client = oci.core.ComputeClient(config)
-            blockstorage_client = oci.core.BlockstorageClient(config)
-            virtual_network_client = oci.core.VirtualNetworkClient(config)
+            # Clients are created on first use, their calls profiled for --call-profile
+            # and retried at an adapted rate when throttled
+            profile = CallProfile() if args.call_profile or args.call_profile_prom else None
+            clients = ClientRegistry(config, profile=profile, limiter=AdaptiveRateLimiter())
 
             if args.operation == 'validate':
                 # Just validate credentials
                 try:
-                    identity_client.get_tenancy(tenancy_id=config["tenancy"])
+                    clients["identity"].get_tenancy(tenancy_id=config["tenancy"])
                     result = {"success": True, "message": "Credentials validated successfully"}
                 except Exception as e:
                     result = {"success": False, "error": f"Credential validation failed: {str(e)}"}
                 print(json.dumps(result, indent=2))
                 return
 
-            # Get compartments
-            compartments_response = identity_client.list_compartments(
-                compartment_id=config["tenancy"],
-                compartment_id_in_subtree=True,
-                access_level="ACCESSIBLE"
-            )
-            compartments = compartments_response.data
+            # ndjson writes each resource as it is read instead of keeping it
+            emitter = NDJSONEmitter() if args.format == 'ndjson' else None
+            result = discover(clients, config, emitter, parse_regions(args.regions), args.compartment_db, args.compartment_ttl, profile)
+            total_resources = result["summary"]["total_resources"]
 
-            # Add root compartment
-            root_compartment = identity_client.get_compartment(compartment_id=config["tenancy"]).data
-            compartments.append(root_compartment)
-
-            print(f"Found {len(compartments)} compartments to scan", file=sys.stderr)
-
-            resources = {
-                "compute_instances": [],
-                "block_volumes": [],
-                "vcns": [],
-                "subnets": []
-            }
-
-            # Scan each compartment for basic resources
-            for compartment in compartments:
-                compartment_id = compartment.id
-                compartment_name = compartment.name
-
-                print(f"Scanning compartment: {compartment_name}", file=sys.stderr)
-
-                try:
-                    # Compute Instances
-                    instances = compute_client.list_instances(compartment_id=compartment_id).data
-                    for instance in instances:
-                        shape_config_dict = None
-                        if hasattr(instance, 'shape_config') and instance.shape_config:
-                            shape_config_dict = {
-                                "ocpus": getattr(instance.shape_config, 'ocpus', None),
-                                "memory_in_gbs": getattr(instance.shape_config, 'memory_in_gbs', None)
-                            }
-
-                        resources["compute_instances"].append({
-                            "id": instance.id,
-                            "display_name": instance.display_name,
-                            "lifecycle_state": instance.lifecycle_state,
-                            "compartment_id": compartment_id,
-                            "compartment_name": compartment_name,
-                            "shape": instance.shape,
-                            "shape_config": shape_config_dict,
-                            "availability_domain": instance.availability_domain,
-                            "time_created": instance.time_created.isoformat() if instance.time_created else None
-                        })
-
-                    # Block Volumes
-                    volumes = blockstorage_client.list_volumes(compartment_id=compartment_id).data
-                    for volume in volumes:
-                        resources["block_volumes"].append({
-                            "id": volume.id,
-                            "display_name": volume.display_name,
-                            "lifecycle_state": volume.lifecycle_state,
-                            "compartment_id": compartment_id,
-                            "compartment_name": compartment_name,
-                            "size_in_gbs": volume.size_in_gbs,
-                            "availability_domain": volume.availability_domain,
-                            "time_created": volume.time_created.isoformat() if volume.time_created else None
-                        })
-
-                    # VCNs
-                    vcns = virtual_network_client.list_vcns(compartment_id=compartment_id).data
-                    for vcn in vcns:
-                        resources["vcns"].append({
-                            "id": vcn.id,
-                            "display_name": vcn.display_name,
-                            "lifecycle_state": vcn.lifecycle_state,
-                            "compartment_id": compartment_id,
-                            "compartment_name": compartment_name,
-                            "cidr_block": vcn.cidr_block,
-                            "time_created": vcn.time_created.isoformat() if vcn.time_created else None
-                        })
-
-                    # Subnets
-                    subnets = virtual_network_client.list_subnets(compartment_id=compartment_id).data
-                    for subnet in subnets:
-                        resources["subnets"].append({
-                            "id": subnet.id,
-                            "display_name": subnet.display_name,
-                            "lifecycle_state": subnet.lifecycle_state,
-                            "compartment_id": compartment_id,
-                            "compartment_name": compartment_name,
-                            "cidr_block": subnet.cidr_block,
-                            "availability_domain": subnet.availability_domain,
-                            "vcn_id": subnet.vcn_id,
-                            "time_created": subnet.time_created.isoformat() if subnet.time_created else None
-                        })
-
-                except Exception as e:
-                    print(f"Error scanning compartment {compartment_name}: {e}", file=sys.stderr)
-                    continue
-
-            # Calculate summary
-            total_resources = sum(len(resource_list) for resource_list in resources.values())
-            summary_by_service = {}
-            for service_type, resource_list in resources.items():
-                if resource_list:
-                    summary_by_service[service_type] = len(resource_list)
-
-            result = {
-                "success": True,
-                "resources": resources,
-                "summary": {
-                    "total_resources": total_resources,
-                    "by_service": summary_by_service,
-                    "compartments_scanned": len(compartments)
-                },
-                "metadata": {
-                    "scan_time": datetime.now().isoformat(),
-                    "region": config["region"],
-                    "tenancy_id": config["tenancy"],
-                    "provider": "oci"
-                }
-            }
-
-            print(json.dumps(result, indent=2))
+            if emitter:
+                emitter.finish(result)
+            else:
+                print(json.dumps(result, indent=2))
             print(f"Simple discovery completed. Found {total_resources} total resources", file=sys.stderr)
+            if profile:
+                profile.save(args.call_profile, args.call_profile_prom)
 
         finally:
             # Clean up temporary key file
@@ -199,7 +100,8 @@ def main():
             "error": str(e),
             "timestamp": datetime.now().isoformat()
         }
-        print(json.dumps(error_result, indent=2))
+        # ndjson consumers read the error as a single line
+        print(json.dumps(error_result, indent=None if args.format == 'ndjson' else 2))
         print(f"Discovery failed: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -0,0 +1,1032 @@
+#!/usr/bin/env python3
+"""
+asyncio discovery engine for the Cloudedze OCI inventory
+
+AsyncDiscovery - lists the resource types of CloudedzeShowOCI in every
+                 compartment with signed OCI REST calls, all of them issued
+                 from one event loop, the result has the shape of
+                 CloudedzeShowOCI._format_output
+AsyncHTTPPool  - keep-alive HTTP/1.1 connections on asyncio streams, at most
+                 limit connections in total and limit_per_host per service
+                 host, requests wait for a free connection
+RequestSigner  - OCI API key signature (date, (request-target), host) of a
+                 GET, needs cryptography which the OCI SDK installs
+
+    discovery = AsyncDiscovery(config, limit=64, limit_per_host=16)
+    result = discovery.run()
+
+The SDK calls of the thread pool path block one thread each, here a call
+waiting on the network only holds a connection, so the concurrency is
+bounded by the connection limits and not by a worker count. Pages of one
+list are still read in order, every list, compartment and service runs
+at the same time. A 429 pauses the host like ThrottleBackoff does, with
+api_rate the calls of each host go through an AdaptiveRateLimiter bucket.
+The compartment tree comes from the CompartmentCache of the thread pool
+path and a CallProfile records every request.
+
+python oci_async.py --benchmark starts a local fake OCI HTTP server with a
+synthetic tenancy and runs the engine and the thread pool path of
+CloudedzeShowOCI (SDK style clients calling the same server) against it,
+tests/test_oci_async.py checks the engine and its output against the same
+server.
+"""
+
+import re
+import sys
+import ssl
+import json
+import time
+import types
+import base64
+import asyncio
+import email.utils
+from datetime import datetime
+from urllib.parse import urlencode, urlsplit
+from oci_compartments import CompartmentCache, DEFAULT_COMPARTMENT_DB, DEFAULT_COMPARTMENT_TTL
+from oci_relationships import RelationshipGraph
+from oci_scheduler import ThrottleBackoff, AdaptiveRateLimiter, HTTPStatusError
+
+# service -> host, the SDK endpoint templates of the oc1 realm
+SERVICE_HOSTS = {
+    "iaas": "iaas.{region}.oraclecloud.com",
+    "objectstorage": "objectstorage.{region}.oraclecloud.com",
+    "database": "database.{region}.oraclecloud.com",
+    "identity": "identity.{region}.oci.oraclecloud.com",
+    "functions": "functions.{region}.oci.oraclecloud.com",
+    "containers": "compute-containers.{region}.oci.oraclecloud.com",
+    "containerengine": "containerengine.{region}.oci.oraclecloud.com",
+    "streaming": "streaming.{region}.oci.oraclecloud.com",
+    "notification": "notification.{region}.oci.oraclecloud.com",
+    "telemetry": "telemetry.{region}.oraclecloud.com",
+    "usage": "usage.{region}.oci.oraclecloud.com",
+    "bastion": "bastion.{region}.oci.oraclecloud.com",
+    "certificates": "certificatesmanagement.{region}.oci.oraclecloud.com",
+    "waas": "waas.{region}.oraclecloud.com",
+    "artifacts": "artifacts.{region}.oci.oraclecloud.com",
+    "apigateway": "apigateway.{region}.oci.oraclecloud.com"
+}
+
+# resource keys in the order of CloudedzeShowOCI.resources
+RESOURCE_KEYS = [
+    "compute_instances", "block_volumes", "object_storage_buckets", "autonomous_databases", "load_balancers",
+    "vcns", "subnets", "security_lists", "route_tables", "internet_gateways", "nat_gateways", "service_gateways",
+    "network_security_groups", "images", "volume_groups", "boot_volumes", "backups", "db_systems", "functions",
+    "containers", "streams", "topics", "alarms", "budgets", "users", "groups", "dynamic_groups", "policies",
+    "kubernetes_clusters", "container_repositories", "api_gateways", "certificates", "waas_policies",
+    "bastion_sessions", "file_systems", "vault_secrets", "application_dependencies"
+]
+
+BASIC = ("id", "display_name", "lifecycle_state", "compartment_id", "compartment_name")
+VCN_CHILD = BASIC + ("vcn_id", "time_created")
+NAMED = ("id", "name", "lifecycle_state", "compartment_id", "compartment_name")
+IDENTITY = ("id", ("display_name", "name"), "lifecycle_state", "compartment_id", "compartment_name", "time_created")
+
+# resource key -> (service, path, SDK method, record fields), a field is the
+# record key or (record key, REST key) where the REST key is not its camelCase,
+# compartment_id and compartment_name are the scanned compartment
+LIST_CALLS = {
+    "compute_instances": ("iaas", "/20160918/instances", "list_instances", None),
+    "images": ("iaas", "/20160918/images", "list_images", BASIC + ("operating_system", "operating_system_version", "time_created")),
+    "block_volumes": ("iaas", "/20160918/volumes", "list_volumes", BASIC + (("size_in_gbs", "sizeInGBs"), "availability_domain", "kms_key_id", "time_created", "defined_tags", "freeform_tags")),
+    "boot_volumes": ("iaas", "/20160918/bootVolumes", "list_boot_volumes", BASIC + (("size_in_gbs", "sizeInGBs"), "availability_domain", "kms_key_id", "time_created")),
+    "volume_groups": ("iaas", "/20160918/volumeGroups", "list_volume_groups", BASIC + ("availability_domain", "time_created")),
+    "backups": ("iaas", "/20160918/volumeBackups", "list_volume_backups", BASIC + ("volume_id", ("size_in_gbs", "sizeInGBs"), "time_created")),
+    "object_storage_buckets": ("objectstorage", "/n/{namespace}/b", "list_buckets", None),
+    "vcns": ("iaas", "/20160918/vcns", "list_vcns", BASIC + ("cidr_block", "time_created", "defined_tags", "freeform_tags")),
+    "subnets": ("iaas", "/20160918/subnets", "list_subnets", BASIC + ("cidr_block", "availability_domain", "vcn_id", "time_created")),
+    "security_lists": ("iaas", "/20160918/securityLists", "list_security_lists", VCN_CHILD),
+    "route_tables": ("iaas", "/20160918/routeTables", "list_route_tables", VCN_CHILD),
+    "internet_gateways": ("iaas", "/20160918/internetGateways", "list_internet_gateways", VCN_CHILD),
+    "nat_gateways": ("iaas", "/20160918/natGateways", "list_nat_gateways", VCN_CHILD),
+    "service_gateways": ("iaas", "/20160918/serviceGateways", "list_service_gateways", VCN_CHILD),
+    "network_security_groups": ("iaas", "/20160918/networkSecurityGroups", "list_network_security_groups", VCN_CHILD),
+    "load_balancers": ("iaas", "/20170115/loadBalancers", "list_load_balancers", None),
+    "autonomous_databases": ("database", "/20160918/autonomousDatabases", "list_autonomous_databases", BASIC + ("db_name", "db_workload", "cpu_core_count", ("data_storage_size_in_tbs", "dataStorageSizeInTBs"), "time_created")),
+    "db_systems": ("database", "/20160918/dbSystems", "list_db_systems", BASIC + ("shape", "availability_domain", "time_created")),
+    "functions": ("functions", "/20181201/applications", "list_applications", BASIC + ("time_created",)),
+    "containers": ("containers", "/20210415/containerInstances", "list_container_instances", BASIC + ("time_created",)),
+    "kubernetes_clusters": ("containerengine", "/20180222/clusters", "list_clusters", NAMED + ("kubernetes_version", "time_created")),
+    "streams": ("streaming", "/20180418/streams", "list_streams", ("id", ("display_name", "name"), "lifecycle_state", "compartment_id", "compartment_name", "time_created")),
+    "topics": ("notification", "/20181201/topics", "list_topics", (("id", "topicId"), ("display_name", "name"), "lifecycle_state", "compartment_id", "compartment_name", "time_created")),
+    "alarms": ("telemetry", "/20180401/alarms", "list_alarms", BASIC + ("time_created",)),
+    "budgets": ("usage", "/20190111/budgets", "list_budgets", BASIC + ("time_created",)),
+    "bastion_sessions": ("bastion", "/20210331/bastions", "list_bastions", NAMED + ("time_created",)),
+    "certificates": ("certificates", "/20210224/certificates", "list_certificates", NAMED + ("time_created",)),
+    "waas_policies": ("waas", "/20181116/waasPolicies", "list_waas_policies", BASIC + ("time_created",)),
+    "container_repositories": ("artifacts", "/20160918/container/repositories", "list_container_repositories", BASIC + ("time_created",)),
+    "api_gateways": ("apigateway", "/20190501/gateways", "list_gateways", BASIC + ("time_created",))
+}
+
+# tenancy level lists, read once from the root compartment
+IDENTITY_CALLS = {
+    "users": ("identity", "/20160918/users", "list_users", IDENTITY),
+    "groups": ("identity", "/20160918/groups", "list_groups", IDENTITY),
+    "dynamic_groups": ("identity", "/20160918/dynamicGroups", "list_dynamic_groups", IDENTITY),
+    "policies": ("identity", "/20160918/policies", "list_policies", IDENTITY)
+}
+
+# the other calls of the discovery, SDK method -> (service, path)
+OTHER_CALLS = {
+    "list_compartments": ("identity", "/20160918/compartments"),
+    "get_compartment": ("identity", "/20160918/compartments/{compartment_id}"),
+    "get_namespace": ("objectstorage", "/n/"),
+    "get_bucket": ("objectstorage", "/n/{namespace_name}/b/{bucket_name}"),
+    "list_vnic_attachments": ("iaas", "/20160918/vnicAttachments"),
+    "list_volume_attachments": ("iaas", "/20160918/volumeAttachments"),
+    "list_boot_volume_attachments": ("iaas", "/20160918/bootVolumeAttachments"),
+    "list_private_ips": ("iaas", "/20160918/privateIps")
+}
+
+# path -> SDK method, the operation a CallProfile records a request under
+OPERATIONS = {path: method for _, path, method, _ in list(LIST_CALLS.values()) + list(IDENTITY_CALLS.values())}
+OPERATIONS.update((path, method) for method, (_, path) in OTHER_CALLS.items() if "{" not in path)
+
+
+def camel(name):
+    """REST name of a record key, size_in_gbs -> sizeInGbs"""
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+def snake(name):
+    """SDK name of a REST key, sizeInGBs -> size_in_gbs"""
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', name).lower()
+
+
+def iso_time(value):
+    """REST timestamp as the SDK datetime.isoformat() writes it"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).isoformat()
+    except ValueError:
+        return value
+
+
+def convert(item, fields, compartment_id, compartment_name):
+    """Record of a REST list item with the keys and values of the SDK path"""
+    record = {}
+    for field in fields:
+        key, rest_key = field if isinstance(field, tuple) else (field, camel(field))
+        if key == "compartment_id":
+            record[key] = compartment_id
+        elif key == "compartment_name":
+            record[key] = compartment_name
+        elif key == "time_created":
+            record[key] = iso_time(item.get(rest_key))
+        else:
+            record[key] = item.get(rest_key)
+    return record
+
+
+class RequestSigner:
+    """OCI API key signature headers of a GET request"""
+
+    def __init__(self, tenancy, user, fingerprint, key_file=None, key_content=None, pass_phrase=None):
+        try:
+            from cryptography.hazmat.primitives import hashes, serialization
+            from cryptography.hazmat.primitives.asymmetric import padding
+        except ImportError:
+            raise ImportError("The async discovery engine signs requests with the cryptography package, pip install cryptography")
+
+        if key_content is None:
+            with open(key_file, "rb") as f:
+                key_content = f.read()
+        if isinstance(key_content, str):
+            key_content = key_content.encode("ascii")
+
+        self.key = serialization.load_pem_private_key(key_content, password=pass_phrase.encode("utf-8") if pass_phrase else None)
+        self.key_id = f"{tenancy}/{user}/{fingerprint}"
+        self.hash = hashes.SHA256()
+        self.padding = padding.PKCS1v15()
+
+    @classmethod
+    def from_config(cls, config):
+        """Signer of an SDK config, None without a key like config_signer"""
+        if not config.get("key_file") and not config.get("key_content"):
+            return None
+        return cls(config["tenancy"], config["user"], config["fingerprint"], config.get("key_file"),
+                   config.get("key_content"), config.get("pass_phrase"))
+
+    def headers(self, host, target):
+        date = email.utils.formatdate(usegmt=True)
+        signing_string = f"date: {date}\n(request-target): get {target}\nhost: {host}"
+        signature = base64.b64encode(self.key.sign(signing_string.encode("ascii"), self.padding, self.hash)).decode("ascii")
+        return {
+            "date": date,
+            "authorization": f'Signature version="1",keyId="{self.key_id}",algorithm="rsa-sha256",'
+                             f'headers="date (request-target) host",signature="{signature}"'
+        }
+
+
+class AsyncHTTPPool:
+    """Keep-alive connections per host. endpoint (i.e. http://127.0.0.1:8080)
+    sends every host to one server, the host header and limits stay per host."""
+
+    def __init__(self, limit=64, limit_per_host=16, endpoint=None, timeout=60.0):
+        self.limit = max(1, limit)
+        self.limit_per_host = max(1, limit_per_host)
+        self.endpoint = urlsplit(endpoint) if endpoint else None
+        self.timeout = timeout
+        self.semaphore = None
+        self.hosts = {}
+        self.ssl_context = None
+
+    def _host(self, host):
+        pool = self.hosts.get(host)
+        if pool is None:
+            # created on the running loop, asyncio primitives bind to it
+            if self.semaphore is None:
+                self.semaphore = asyncio.Semaphore(self.limit)
+            pool = self.hosts[host] = types.SimpleNamespace(
+                semaphore=asyncio.Semaphore(self.limit_per_host), idle=[],
+                requests=0, connections=0, in_flight=0, max_in_flight=0)
+        return pool
+
+    async def _connect(self, host):
+        if self.endpoint:
+            scheme, address, port = self.endpoint.scheme, self.endpoint.hostname, self.endpoint.port
+        else:
+            scheme, address, port = "https", host, None
+
+        if scheme == "https":
+            if self.ssl_context is None:
+                self.ssl_context = ssl.create_default_context()
+            return await asyncio.open_connection(address, port or 443, ssl=self.ssl_context, server_hostname=host)
+        return await asyncio.open_connection(address, port or 80)
+
+    async def get(self, host, target, sign=None):
+        """(status, headers, body) of GET target, sign(host, target) gives the
+        auth headers once a connection is free so the date is current"""
+        pool = self._host(host)
+        async with self.semaphore, pool.semaphore:
+            pool.requests += 1
+            pool.in_flight += 1
+            pool.max_in_flight = max(pool.max_in_flight, pool.in_flight)
+            try:
+                for attempt in (0, 1):
+                    reused = bool(pool.idle)
+                    if reused:
+                        reader, writer = pool.idle.pop()
+                    else:
+                        reader, writer = await asyncio.wait_for(self._connect(host), self.timeout)
+                        pool.connections += 1
+
+                    try:
+                        request = f"GET {target} HTTP/1.1\r\nhost: {host}\r\naccept: application/json\r\nuser-agent: cloudedze-async\r\n"
+                        for name, value in (sign(host, target) if sign else {}).items():
+                            request += f"{name}: {value}\r\n"
+                        writer.write((request + "\r\n").encode("latin-1"))
+                        status, headers, body, keep_alive = await asyncio.wait_for(self._read_response(reader), self.timeout)
+
+                    except (ConnectionError, asyncio.IncompleteReadError):
+                        writer.close()
+                        # the server closed an idle keep-alive connection, retry on a new one
+                        if reused and attempt == 0:
+                            continue
+                        raise
+                    except BaseException:
+                        writer.close()
+                        raise
+
+                    if keep_alive:
+                        pool.idle.append((reader, writer))
+                    else:
+                        writer.close()
+                    return status, headers, body
+            finally:
+                pool.in_flight -= 1
+
+    @staticmethod
+    async def _read_response(reader):
+        line = await reader.readline()
+        if not line:
+            raise ConnectionResetError("connection closed by server")
+        version, status = line.decode("latin-1").split(" ", 2)[:2]
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        return int(status), headers, body, keep_alive
+
+    async def close(self):
+        for pool in self.hosts.values():
+            for _, writer in pool.idle:
+                writer.close()
+            pool.idle = []
+
+    def stats(self):
+        """{host: {"requests", "connections", "max_in_flight"}}"""
+        return {host: {"requests": pool.requests, "connections": pool.connections, "max_in_flight": pool.max_in_flight}
+                for host, pool in sorted(self.hosts.items())}
+
+
+class AsyncDiscovery:
+    """CloudedzeShowOCI discovery of the config region on one event loop"""
+
+    def __init__(self, config, emitter=None, limit=64, limit_per_host=16, endpoint=None, signer=None,
+                 compartment=None, compartment_recursive=False, relationships=False, profile=None, api_rate=None,
+                 compartment_db=DEFAULT_COMPARTMENT_DB, compartment_ttl=DEFAULT_COMPARTMENT_TTL):
+        self.config = config
+        self.emitter = emitter
+        self.tenancy_id = config["tenancy"]
+        self.region = config["region"]
+        self.signer = signer if signer is not None else RequestSigner.from_config(config)
+        self.pool = AsyncHTTPPool(limit, limit_per_host, endpoint)
+
+        # api_rate None only retries 429s, else every host starts at api_rate
+        # calls per second and adapts like the thread pool path
+        self.backoff = AdaptiveRateLimiter(rate=api_rate) if api_rate else ThrottleBackoff()
+        self.profile = profile
+
+        self.resources = {key: [] for key in RESOURCE_KEYS}
+        if self.emitter:
+            self.resources = self.emitter.resources(self.resources)
+
+        self.compartment_filter = compartment
+        self.compartment_recursive = compartment_recursive
+        self.compartment_db = compartment_db
+        self.compartment_ttl = compartment_ttl
+        self.compartment_tree = None
+        self.compartments = []
+        self.compartment_map = {}
+        self.namespace = None
+
+        self.relationships = relationships
+        self.relationship_graph = None
+
+    def run(self):
+        return asyncio.run(self.discover())
+
+    async def discover(self):
+        """Every compartment, service and list at the same time, the connection
+        limits of the pool are the only bound"""
+        start = time.time()
+        try:
+            await self._load_compartments()
+            print(f"Found {len(self.compartments)} compartments to scan", file=sys.stderr)
+
+            # budgets live in the root compartment
+            tasks = [self._discover_list(resource_key, compartment.id, compartment.name)
+                     for compartment in self.compartments for resource_key in LIST_CALLS
+                     if resource_key != "budgets" or compartment.id == self.tenancy_id]
+            tasks.extend(self._discover_list(resource_key, self.tenancy_id, self.compartment_map.get(self.tenancy_id, "root"))
+                         for resource_key in IDENTITY_CALLS)
+            await asyncio.gather(*tasks)
+        finally:
+            await self.pool.close()
+
+        stats = self.pool.stats()
+        print(f"Async discovery: {sum(s['requests'] for s in stats.values())} requests on "
+              f"{sum(s['connections'] for s in stats.values())} connections to {len(stats)} hosts in {time.time() - start:.1f}s", file=sys.stderr)
+        if isinstance(self.backoff, AdaptiveRateLimiter):
+            self.backoff.print_report()
+        elif self.backoff.throttled:
+            print(f"Throttled {self.backoff.throttled} times", file=sys.stderr)
+
+        self._add_resource_relationships()
+        return self._format_output()
+
+    async def request(self, service, path, params=None, operation=None):
+        """(JSON body, headers) of a signed GET, 429 is retried after the
+        retry-after or backoff delay, during which the host is paused.
+        operation names the call in the profile, the SDK method of the path
+        by default"""
+        host = SERVICE_HOSTS[service].format(region=self.region)
+        target = path + ("?" + urlencode(params) if params else "")
+        sign = self.signer.headers if self.signer else None
+        key = (service, operation or OPERATIONS.get(path, path), self.region)
+
+        attempt = 0
+        while True:
+            delay = self.backoff.reserve(host)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            start = time.time()
+            try:
+                status, headers, body = await self.pool.get(host, target, sign)
+            except Exception:
+                if self.profile:
+                    self.profile.record(key, time.time() - start, None, 0, attempt > 0)
+                raise
+            if self.profile:
+                self.profile.record(key, time.time() - start, status, len(body), attempt > 0)
+
+            if status == 429 and attempt < self.backoff.max_retries:
+                self.backoff.throttle(host, HTTPStatusError(status, headers), attempt)
+                attempt += 1
+                continue
+
+            if status >= 300:
+                raise HTTPStatusError(status, headers)
+            self.backoff.succeeded(host)
+            return (json.loads(body) if body else None), headers
+
+    async def list_all(self, service, path, params=None, pages=None, operation=None):
+        """Every record of a paged list, following opc-next-page, pages limits
+        the pages read"""
+        params = dict(params or {})
+        records = []
+        while True:
+            body, headers = await self.request(service, path, params, operation)
+            # some services return a collection with the records under items
+            records.extend(body["items"] if isinstance(body, dict) else body or [])
+            pages = pages - 1 if pages else None
+            if not headers.get("opc-next-page") or pages == 0:
+                return records
+            params["page"] = headers["opc-next-page"]
+
+    async def _load_compartments(self):
+        """Compartment tree of the tenancy from the compartment tree cache while
+        it is fresh, optionally limited to one compartment"""
+        def model(item):
+            return types.SimpleNamespace(id=item["id"], name=item["name"], compartment_id=item.get("compartmentId"),
+                                         lifecycle_state=item.get("lifecycleState"))
+
+        start = time.time()
+        cache = CompartmentCache(self.compartment_db, self.compartment_ttl)
+        try:
+            self.compartment_tree = cache.cached(self.tenancy_id, self.config.get("user", ""))
+            if self.compartment_tree is None:
+                # the root is read with the list, revalidating does not need it
+                subcompartments, (root, _) = await asyncio.gather(
+                    self.list_all("identity", "/20160918/compartments", {
+                        "compartmentId": self.tenancy_id, "compartmentIdInSubtree": "true", "accessLevel": "ACCESSIBLE"}),
+                    self.request("identity", f"/20160918/compartments/{self.tenancy_id}", operation="get_compartment"))
+                self.compartment_tree = cache.update(self.tenancy_id, self.config.get("user", ""), "ACCESSIBLE",
+                                                     [model(c) for c in subcompartments], lambda: model(root))
+        finally:
+            cache.close()
+        print(f"Compartments: {len(self.compartment_tree)} {self.compartment_tree.source} in {(time.time() - start) * 1000:.0f}ms", file=sys.stderr)
+
+        self.compartments = self.compartment_tree.compartments
+        self.compartment_map = {c.id: c.name for c in self.compartments}
+
+        if self.compartment_filter:
+            self.compartments = self.compartment_tree.select(self.compartment_filter, self.compartment_recursive)
+            if not self.compartments:
+                raise Exception(f"Compartment {self.compartment_filter} not found")
+
+    async def _discover_list(self, resource_key, compartment_id, compartment_name):
+        """One resource type in one compartment, errors are reported and do not stop the scan"""
+        try:
+            if resource_key == "compute_instances":
+                records = await self._discover_instances(compartment_id, compartment_name)
+            elif resource_key == "object_storage_buckets":
+                records = await self._discover_buckets(compartment_id, compartment_name)
+            elif resource_key == "load_balancers":
+                records = await self._discover_load_balancers(compartment_id, compartment_name)
+            else:
+                service, path, _, fields = LIST_CALLS.get(resource_key) or IDENTITY_CALLS[resource_key]
+                if resource_key == "images":
+                    # the latest 50 images only, like the thread pool path
+                    items = await self.list_all(service, path, {"compartmentId": compartment_id, "limit": 50,
+                                                                "sortBy": "TIMECREATED", "sortOrder": "DESC"}, pages=1)
+                else:
+                    items = await self.list_all(service, path, {"compartmentId": compartment_id})
+                records = [convert(item, fields, compartment_id, compartment_name) for item in items]
+
+                if resource_key == "subnets" and self.relationships:
+                    await self._add_private_ips(records)
+
+            self.resources[resource_key].extend(records)
+
+        except Exception as e:
+            print(f"Error discovering {resource_key} in {compartment_name}: {e}", file=sys.stderr)
+
+    async def _discover_instances(self, compartment_id, compartment_name):
+        records = []
+        for instance in await self.list_all("iaas", "/20160918/instances", {"compartmentId": compartment_id}):
+            shape_config = instance.get("shapeConfig")
+            source_details = instance.get("sourceDetails")
+            records.append({
+                "id": instance["id"],
+                "display_name": instance.get("displayName"),
+                "lifecycle_state": instance.get("lifecycleState"),
+                "compartment_id": compartment_id,
+                "compartment_name": compartment_name,
+                "shape": instance.get("shape"),
+                "shape_config": {
+                    "ocpus": shape_config.get("ocpus"),
+                    "memory_in_gbs": shape_config.get("memoryInGBs"),
+                    "local_disks_total_size_in_gbs": shape_config.get("localDisksTotalSizeInGBs"),
+                    "local_disk_description": shape_config.get("localDiskDescription")
+                } if shape_config else None,
+                "source_details": {
+                    "image_id": source_details.get("imageId"),
+                    "boot_volume_size_in_gbs": source_details.get("bootVolumeSizeInGBs"),
+                    "source_type": source_details.get("sourceType")
+                } if source_details else None,
+                "availability_domain": instance.get("availabilityDomain"),
+                "time_created": iso_time(instance.get("timeCreated")),
+                "defined_tags": instance.get("definedTags"),
+                "freeform_tags": instance.get("freeformTags")
+            })
+
+        if self.relationships and records:
+            await self._add_instance_attachments(compartment_id, records)
+        return records
+
+    async def _add_instance_attachments(self, compartment_id, instance_records):
+        """Attached VNICs, boot volume and volumes of the instances, the
+        attachment lists (boot volumes per availability domain) run together"""
+        try:
+            by_id = {record["id"]: record for record in instance_records}
+            for record in instance_records:
+                record["vnic_attachments"] = []
+                record["boot_volume_id"] = None
+                record["volume_ids"] = []
+
+            domains = sorted({record["availability_domain"] for record in instance_records if record["availability_domain"]})
+            vnics, volumes, *boot_volumes = await asyncio.gather(
+                self.list_all("iaas", "/20160918/vnicAttachments", {"compartmentId": compartment_id}),
+                self.list_all("iaas", "/20160918/volumeAttachments", {"compartmentId": compartment_id}),
+                *[self.list_all("iaas", "/20160918/bootVolumeAttachments", {"availabilityDomain": domain, "compartmentId": compartment_id})
+                  for domain in domains])
+
+            def attached(attachments):
+                return [a for a in attachments if a.get("instanceId") in by_id and a.get("lifecycleState") == "ATTACHED"]
+
+            for attachment in attached(vnics):
+                by_id[attachment["instanceId"]]["vnic_attachments"].append({"vnic_id": attachment["vnicId"], "subnet_id": attachment.get("subnetId")})
+            for attachment in attached(volumes):
+                by_id[attachment["instanceId"]]["volume_ids"].append(attachment["volumeId"])
+            for attachments in boot_volumes:
+                for attachment in attached(attachments):
+                    by_id[attachment["instanceId"]]["boot_volume_id"] = attachment["bootVolumeId"]
+
+        except Exception as e:
+            print(f"Error discovering instance attachments in {compartment_id}: {e}", file=sys.stderr)
+
+    async def _add_private_ips(self, subnet_records):
+        """Private IPs of the subnets, they resolve load balancer backends"""
+        private_ips = await asyncio.gather(*[self.list_all("iaas", "/20160918/privateIps", {"subnetId": record["id"]})
+                                             for record in subnet_records])
+        for record, ips in zip(subnet_records, private_ips):
+            record["private_ips"] = {ip["ipAddress"]: ip["vnicId"] for ip in ips if ip.get("vnicId")}
+
+    async def _get_namespace(self):
+        """Object storage namespace, read once for all compartments"""
+        if self.namespace is None:
+            self.namespace = asyncio.ensure_future(self.request("objectstorage", "/n/", operation="get_namespace"))
+        body, _ = await self.namespace
+        return body
+
+    async def _discover_buckets(self, compartment_id, compartment_name):
+        namespace = await self._get_namespace()
+        buckets = await self.list_all("objectstorage", f"/n/{namespace}/b", {"compartmentId": compartment_id}, operation="list_buckets")
+        records = [{
+            "id": f"{namespace}:{bucket['name']}",
+            "name": bucket["name"],
+            "namespace": namespace,
+            "compartment_id": compartment_id,
+            "compartment_name": compartment_name,
+            "time_created": iso_time(bucket.get("timeCreated")),
+            "etag": bucket.get("etag")
+        } for bucket in buckets]
+
+        # the bucket summary has no encryption key, it is only in get_bucket
+        if self.relationships:
+            async def add_kms_key(record):
+                try:
+                    body, _ = await self.request("objectstorage", f"/n/{namespace}/b/{record['name']}", operation="get_bucket")
+                    record["kms_key_id"] = body.get("kmsKeyId")
+                except Exception as e:
+                    print(f"Error reading bucket {record['name']}: {e}", file=sys.stderr)
+
+            await asyncio.gather(*[add_kms_key(record) for record in records])
+        return records
+
+    async def _discover_load_balancers(self, compartment_id, compartment_name):
+        records = []
+        for lb in await self.list_all("iaas", "/20170115/loadBalancers", {"compartmentId": compartment_id}):
+            shape_details = lb.get("shapeDetails")
+            records.append({
+                "id": lb["id"],
+                "display_name": lb.get("displayName"),
+                "lifecycle_state": lb.get("lifecycleState"),
+                "compartment_id": compartment_id,
+                "compartment_name": compartment_name,
+                "shape_name": lb.get("shapeName"),
+                "shape_details": {snake(key): value for key, value in shape_details.items()} if shape_details else None,
+                "subnet_ids": lb.get("subnetIds"),
+                "backends": [
+                    {"backend_set": name, "ip_address": backend.get("ipAddress"), "port": backend.get("port")}
+                    for name, backend_set in (lb.get("backendSets") or {}).items()
+                    for backend in backend_set.get("backends") or []
+                ],
+                "time_created": iso_time(lb.get("timeCreated"))
+            })
+        return records
+
+    def _add_resource_relationships(self):
+        """Relationship graph as CloudedzeShowOCI builds it"""
+        if not self.relationships or self.emitter:
+            return
+
+        try:
+            self.relationship_graph = RelationshipGraph.build(self.resources)
+            print(f"Relationships: {len(self.relationship_graph.edges)} edges", file=sys.stderr)
+        except Exception as e:
+            print(f"Error building resource relationships: {e}", file=sys.stderr)
+
+    def _format_output(self):
+        """Output of CloudedzeShowOCI._format_output, metadata has the engine
+        and the HTTP requests and connections per host"""
+        summary_by_service = {key: len(records) for key, records in self.resources.items() if records}
+
+        result = {
+            "success": True,
+            "resources": self.resources,
+            "summary": {
+                "total_resources": sum(summary_by_service.values()),
+                "by_service": summary_by_service,
+                "compartments_scanned": len(self.compartments)
+            },
+            "metadata": {
+                "scan_time": datetime.now().isoformat(),
+                "region": self.region,
+                "tenancy_id": self.tenancy_id,
+                "provider": "oci",
+                "engine": "async",
+                "http": self.pool.stats()
+            }
+        }
+
+        if isinstance(self.backoff, AdaptiveRateLimiter):
+            result["metadata"]["api_rates"] = self.backoff.rates()
+
+        if self.relationship_graph:
+            result["relationships"] = self.relationship_graph.to_dict()
+
+        return result
+
+
+##########################################################################
+# Benchmark - a fake OCI HTTP server serving a synthetic tenancy, the
+# engine and the thread pool path of CloudedzeShowOCI call it
+##########################################################################
+def synthetic_tenancy(compartments=50, per_type=3):
+    """REST records of a tenancy, lists[path][compartment or subnet id] and
+    the gets the discovery makes"""
+    tenancy_id = "ocid1.tenancy.oc1..root"
+    namespace = "benchspace"
+    lists = {}
+    buckets = {}
+
+    def add(path, key, item):
+        lists.setdefault(path, {}).setdefault(key, []).append(item)
+
+    comps = [{"id": f"ocid1.compartment.oc1..c{i}", "name": f"compartment{i}", "compartmentId": tenancy_id,
+              "lifecycleState": "ACTIVE"} for i in range(compartments)]
+    lists["/20160918/compartments"] = {tenancy_id: comps}
+
+    for n, comp in enumerate(comps + [{"id": tenancy_id}]):
+        cid = comp["id"]
+        for resource_key, (service, path, _, _) in LIST_CALLS.items():
+            path = path.format(namespace=namespace)
+            for i in range(per_type):
+                rid = f"ocid1.{resource_key}.oc1..{n}x{i}"
+                item = {
+                    "id": rid, "displayName": f"{resource_key}-{n}-{i}", "name": f"{resource_key}-{n}-{i}", "topicId": rid,
+                    "lifecycleState": "AVAILABLE", "compartmentId": cid, "timeCreated": f"2024-05-{i % 28 + 1:02d}T10:00:00.123Z",
+                    "availabilityDomain": f"AD-{i % 3 + 1}", "sizeInGBs": 50 + i, "kmsKeyId": f"ocid1.key.oc1..k{i % 5}",
+                    "vcnId": f"ocid1.vcns.oc1..{n}x0", "cidrBlock": "10.0.0.0/16", "shape": "VM.Standard.E4.Flex",
+                    "shapeName": "flexible", "subnetIds": [f"ocid1.subnets.oc1..{n}x0"], "dbName": "db", "dbWorkload": "OLTP",
+                    "cpuCoreCount": 2, "dataStorageSizeInTBs": 1, "operatingSystem": "Oracle Linux",
+                    "operatingSystemVersion": "8", "kubernetesVersion": "v1.29.1", "volumeId": f"ocid1.block_volumes.oc1..{n}x{i}",
+                    "definedTags": {"Operations": {"CostCenter": "42"}}, "freeformTags": {"env": "bench"}, "etag": f"etag-{n}-{i}",
+                    "namespace": namespace
+                }
+                if resource_key == "compute_instances":
+                    item["shapeConfig"] = {"ocpus": 1.0, "memoryInGBs": 16.0, "localDisksTotalSizeInGBs": None, "localDiskDescription": None}
+                    item["sourceDetails"] = {"sourceType": "image", "imageId": f"ocid1.images.oc1..{n}x0", "bootVolumeSizeInGBs": 47}
+                    ip = f"10.{n // 256}.{n % 256}.{i}"
+                    vnic = f"ocid1.vnic.oc1..{n}x{i}"
+                    add("/20160918/vnicAttachments", cid, {"instanceId": rid, "vnicId": vnic, "subnetId": f"ocid1.subnets.oc1..{n}x0", "lifecycleState": "ATTACHED"})
+                    add("/20160918/volumeAttachments", cid, {"instanceId": rid, "volumeId": f"ocid1.block_volumes.oc1..{n}x{i}", "lifecycleState": "ATTACHED"})
+                    add("/20160918/bootVolumeAttachments", cid, {"instanceId": rid, "bootVolumeId": f"ocid1.boot_volumes.oc1..{n}x{i}",
+                                                                 "availabilityDomain": item["availabilityDomain"], "lifecycleState": "ATTACHED"})
+                    add("/20160918/privateIps", f"ocid1.subnets.oc1..{n}x0", {"ipAddress": ip, "vnicId": vnic})
+                if resource_key == "load_balancers":
+                    item["backendSets"] = {"web": {"name": "web", "backends": [{"ipAddress": f"10.{n // 256}.{n % 256}.{b}", "port": 80}
+                                                                               for b in range(per_type)]}}
+                if resource_key == "object_storage_buckets":
+                    buckets[item["name"]] = {"name": item["name"], "namespace": namespace, "kmsKeyId": item["kmsKeyId"]}
+                add(path, cid, item)
+
+    for resource_key, (service, path, _, _) in IDENTITY_CALLS.items():
+        for i in range(per_type * 5):
+            add(path, tenancy_id, {"id": f"ocid1.{resource_key}.oc1..{i}", "name": f"{resource_key}-{i}", "lifecycleState": "ACTIVE",
+                                   "compartmentId": tenancy_id, "timeCreated": "2024-01-01T00:00:00Z"})
+
+    return {
+        "tenancy": {"id": tenancy_id, "name": "root", "compartmentId": None, "lifecycleState": "ACTIVE"},
+        "namespace": namespace,
+        "lists": lists,
+        "buckets": buckets
+    }
+
+
+def start_fake_oci_server(tenancy, latency=0.05, page_size=100, public_key=None, throttle=0, retry_after=0.1):
+    """OCI REST API on localhost serving a synthetic_tenancy, every request
+    waits latency seconds, with public_key requests must carry a valid
+    signature, the first throttle requests get a 429 with retry_after,
+    returns (server, url, stats)"""
+    import threading
+    from urllib.parse import parse_qsl
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    lock = threading.Lock()
+    stats = {"requests": 0, "connections": 0, "rejected": 0, "throttled": 0, "hosts": {}}
+    bucket_path = re.compile(r'^/n/([^/]+)/b/([^/]+)$')
+
+    def verified(handler, target):
+        try:
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.asymmetric import padding
+            fields = dict(re.findall(r'(\w+)="([^"]*)"', handler.headers.get("authorization", "")))
+            lines = [f"(request-target): get {target}" if name == "(request-target)" else f"{name}: {handler.headers.get(name)}"
+                     for name in fields["headers"].split()]
+            public_key.verify(base64.b64decode(fields["signature"]), "\n".join(lines).encode("ascii"), padding.PKCS1v15(), hashes.SHA256())
+            return True
+        except Exception:
+            return False
+
+    def route(path, query):
+        if path == "/n/":
+            return 200, tenancy["namespace"], None
+        if path == "/20160918/compartments/" + tenancy["tenancy"]["id"]:
+            return 200, tenancy["tenancy"], None
+        match = bucket_path.match(path)
+        if match and match.group(2) in tenancy["buckets"]:
+            return 200, tenancy["buckets"][match.group(2)], None
+        if path not in tenancy["lists"]:
+            return 404, {"code": "NotFound", "message": path}, None
+
+        items = tenancy["lists"][path].get(query.get("compartmentId") or query.get("subnetId"), [])
+        if "availabilityDomain" in query:
+            items = [item for item in items if item.get("availabilityDomain") == query["availabilityDomain"]]
+        start = int(query.get("page", 0))
+        size = min(int(query.get("limit", page_size)), page_size)
+        next_page = str(start + size) if start + size < len(items) else None
+        page = items[start:start + size]
+        # collection responses of the newer services
+        if path.startswith(("/20210415/", "/20210224/", "/20160918/container/", "/20190501/")):
+            page = {"items": page}
+        return 200, page, next_page
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with lock:
+                stats["connections"] += 1
+
+        def do_GET(self):
+            time.sleep(latency)
+            url = urlsplit(self.path)
+            host = self.headers.get("host", "")
+            with lock:
+                stats["requests"] += 1
+                stats["hosts"][host] = stats["hosts"].get(host, 0) + 1
+                throttled = stats["throttled"] < throttle
+                if throttled:
+                    stats["throttled"] += 1
+
+            headers = {}
+            if throttled:
+                status, body, next_page = 429, {"code": "TooManyRequests", "message": "Too many requests"}, None
+                headers["retry-after"] = str(retry_after)
+            elif public_key is not None and not verified(self, self.path):
+                with lock:
+                    stats["rejected"] += 1
+                status, body, next_page = 401, {"code": "NotAuthenticated", "message": "Invalid signature"}, None
+            else:
+                status, body, next_page = route(url.path, dict(parse_qsl(url.query)))
+
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(data)))
+            if next_page:
+                headers["opc-next-page"] = next_page
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}", stats
+
+
+def sdk_model(value, key=None):
+    """REST JSON as SDK model objects, snake_case attributes and datetimes"""
+    if isinstance(value, list):
+        return [sdk_model(v) for v in value]
+    if not isinstance(value, dict):
+        if isinstance(value, str) and key and key.startswith("time_"):
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return value
+    if key in ("defined_tags", "freeform_tags"):
+        return value
+    if key == "backend_sets":
+        return {name: sdk_model(v) for name, v in value.items()}
+    return types.SimpleNamespace(**{snake(k): sdk_model(v, snake(k)) for k, v in value.items()})
+
+
+class RestSDKClient:
+    """SDK client stand-in making the REST calls of its list_x / get_x
+    methods with http.client, one keep-alive connection per thread like the
+    SDK session pool, for the thread pool side of the benchmark"""
+
+    def __init__(self, endpoint, region, signer=None):
+        import threading
+        self.endpoint = urlsplit(endpoint)
+        self.region = region
+        self.signer = signer
+        self.local = threading.local()
+        self.calls = dict(OTHER_CALLS)
+        for service, path, method, _ in list(LIST_CALLS.values()) + list(IDENTITY_CALLS.values()):
+            self.calls[method] = (service, path.replace("{namespace}", "{namespace_name}"))
+
+    def __getattr__(self, name):
+        if name not in self.__dict__.get("calls", {}):
+            raise AttributeError(name)
+        service, path = self.calls[name]
+        names = re.findall(r'{(\w+)}', path)
+
+        def call(*args, **kwargs):
+            kwargs.update(zip(names, args))
+            target = path.format(**{n: kwargs.pop(n) for n in names})
+            params = {camel(k): ("true" if v is True else v) for k, v in kwargs.items()}
+            return self._get(SERVICE_HOSTS[service].format(region=self.region), target + ("?" + urlencode(params) if params else ""))
+        return call
+
+    def _get(self, host, target):
+        import http.client
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = http.client.HTTPConnection(self.endpoint.hostname, self.endpoint.port)
+
+        headers = {"host": host, "accept": "application/json"}
+        if self.signer:
+            headers.update(self.signer.headers(host, target))
+        connection.request("GET", target, headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+        if response.status >= 300:
+            raise HTTPStatusError(response.status, dict(response.getheaders()))
+
+        body = json.loads(body)
+        if isinstance(body, dict) and "items" in body:
+            data = types.SimpleNamespace(items=sdk_model(body["items"]))
+        else:
+            data = sdk_model(body)
+        next_page = response.getheader("opc-next-page")
+        return types.SimpleNamespace(data=data, has_next_page=next_page is not None, next_page=next_page, headers=dict(response.getheaders()))
+
+
+class RestSDKClients:
+    """ClientRegistry stand-in, every client name is a RestSDKClient"""
+
+    def __init__(self, config, client):
+        self.config = config
+        self.client = client
+        self.signer = None
+
+    def __getitem__(self, name):
+        return self.client
+
+    def __contains__(self, name):
+        return True
+
+    def get(self, name, default=None):
+        return self.client
+
+    def print_report(self, stream=sys.stderr):
+        pass
+
+
+def load_thread_pool_discovery():
+    """showoci-cloudedze.py as a module, it needs the OCI SDK"""
+    import os
+    import importlib.util
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "showoci-cloudedze.py")
+    spec = importlib.util.spec_from_file_location("showoci_cloudedze", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_benchmark(compartments=50, per_type=3, latency=0.05, page_size=100, limit=64, limit_per_host=16, workers=16, endpoint_workers=4):
+    import contextlib
+    import io
+
+    tenancy = synthetic_tenancy(compartments, per_type)
+    config = {"tenancy": tenancy["tenancy"]["id"], "user": "ocid1.user.oc1..bench", "fingerprint": "00:00", "region": "bench-1"}
+
+    # a throwaway API key, the server verifies every signature with it
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pem = key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+        signer = RequestSigner(config["tenancy"], config["user"], config["fingerprint"], key_content=pem)
+        public_key = key.public_key()
+    except ImportError:
+        signer = public_key = None
+
+    def canonical(resources):
+        return {key: sorted(json.dumps(r, sort_keys=True, default=str) for r in records) for key, records in resources.items()}
+
+    def run(name, discover):
+        server, url, stats = start_fake_oci_server(tenancy, latency, page_size, public_key)
+        try:
+            start = time.time()
+            with contextlib.redirect_stderr(io.StringIO()):
+                result = discover(url)
+            elapsed = time.time() - start
+        finally:
+            server.shutdown()
+            server.server_close()
+        print(f"{name:<18}: {elapsed:6.2f}s, {stats['requests']:>5} requests, {stats['requests'] / elapsed:7.1f} requests/s, "
+              f"{stats['connections']:>4} connections, {result['summary']['total_resources']} resources, {stats['rejected']} rejected")
+        return result
+
+    def discover_async(url):
+        return AsyncDiscovery(config, limit=limit, limit_per_host=limit_per_host, endpoint=url, signer=signer or False,
+                              compartment_db=None, compartment_ttl=0, relationships=True).run()
+
+    def discover_threads(url):
+        module = load_thread_pool_discovery()
+        clients = RestSDKClients(config, RestSDKClient(url, config["region"], signer))
+        service = module.CloudedzeShowOCI(config, {}, None, workers, endpoint_workers, compartment_db=None, compartment_ttl=0,
+                                          relationships=True)
+        service.clients = clients
+        service.scopes = [module.RegionScope(config["region"], clients, service.resources, tag=False)]
+        return service.discover_all_resources()
+
+    print(f"Tenancy           : {compartments + 1} compartments, {per_type} records per type, {page_size} per page")
+    print(f"Latency per call  : {latency * 1000:.0f}ms, requests {'signed and verified' if signer else 'unsigned, cryptography is not installed'}")
+    print(f"Limits            : async {limit} connections, {limit_per_host} per host; threads {workers} workers, {endpoint_workers} per endpoint")
+    async_result = run("async engine", discover_async)
+    try:
+        thread_result = run("thread pool", discover_threads)
+    except ImportError as e:
+        print(f"thread pool       : not run, {e}")
+        return
+    print(f"Same resources    : {canonical(async_result['resources']) == canonical(thread_result['resources'])}")
+    print(f"Same relationships: {sorted(map(tuple, async_result['relationships']['edges'])) == sorted(map(tuple, thread_result['relationships']['edges']))}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Compare the asyncio discovery engine against the thread pool path on a local fake OCI server')
+    parser.add_argument('--benchmark', action='store_true', help='Run the benchmark')
+    parser.add_argument('--compartments', default=50, type=int, help='Synthetic compartments besides the root (default=50)')
+    parser.add_argument('--per-type', default=3, type=int, help='Records of every resource type per compartment (default=3)')
+    parser.add_argument('--latency', default=0.05, type=float, help='Seconds the fake server takes per request (default=0.05)')
+    parser.add_argument('--page-size', default=100, type=int, help='Records per page (default=100)')
+    parser.add_argument('--connections', default=64, type=int, help='Async connections in total (default=64)')
+    parser.add_argument('--host-connections', default=16, type=int, help='Async connections per service host (default=16)')
+    parser.add_argument('--workers', default=16, type=int, help='Thread pool workers (default=16)')
+    parser.add_argument('--endpoint-workers', default=4, type=int, help='Thread pool workers per service endpoint (default=4)')
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        sys.exit(1)
+    run_benchmark(args.compartments, args.per_type, args.latency, args.page_size, args.connections, args.host_connections,
+                  args.workers, args.endpoint_workers)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Lazy OCI SDK client registry for the Cloudedze OCI discovery scripts
+
+ClientRegistry - creates a service client the first time a scan uses it, all
+                 clients share one signer and an HTTP pool sized to the number
+                 of calls the scan runs against one endpoint at a time. The
+                 creation and first request latency of each client is recorded,
+                 with a CallProfile every call of the clients is profiled and
+                 with an AdaptiveRateLimiter every call is rate limited per
+                 region and client and retried when throttled.
+
+    clients = ClientRegistry(config, pool_size=4)
+    clients["compute"]          # created here, raises if it can not be created
+    clients.get("waas")         # None if the SDK has no such client
+    clients.print_report()
+"""
+
+import sys
+import time
+import importlib
+import threading
+import oci
+
+# name -> (oci subpackage, client class)
+CLIENT_CLASSES = {
+    "identity": ("identity", "IdentityClient"),
+    "compute": ("core", "ComputeClient"),
+    "blockstorage": ("core", "BlockstorageClient"),
+    "network": ("core", "VirtualNetworkClient"),
+    "object_storage": ("object_storage", "ObjectStorageClient"),
+    "database": ("database", "DatabaseClient"),
+    "load_balancer": ("load_balancer", "LoadBalancerClient"),
+    "search": ("resource_search", "ResourceSearchClient"),
+    "container_engine": ("container_engine", "ContainerEngineClient"),
+    "container_instances": ("container_instances", "ContainerInstanceClient"),
+    "functions": ("functions", "FunctionsManagementClient"),
+    "api_gateway": ("apigateway", "ApiGatewayClient"),
+    "gateway": ("apigateway", "GatewayClient"),
+    "streaming": ("streaming", "StreamAdminClient"),
+    "notifications": ("ons", "NotificationControlPlaneClient"),
+    "monitoring": ("monitoring", "MonitoringClient"),
+    "logging": ("logging", "LoggingManagementClient"),
+    "analytics": ("analytics", "AnalyticsClient"),
+    "data_integration": ("data_integration", "DataIntegrationClient"),
+    "data_catalog": ("data_catalog", "DataCatalogClient"),
+    "data_science": ("data_science", "DataScienceClient"),
+    "dns": ("dns", "DnsClient"),
+    "certificates": ("certificates_management", "CertificatesManagementClient"),
+    "kms": ("key_management", "KmsManagementClient"),
+    "vault": ("vault", "VaultsClient"),
+    "usage_api": ("usage_api", "UsageapiClient"),
+    "budget": ("budget", "BudgetClient"),
+    "artifacts": ("artifacts", "ArtifactsClient"),
+    "waas": ("waas", "WaasClient"),
+    "bastion": ("bastion", "BastionClient"),
+    "file_storage": ("file_storage", "FileStorageClient"),
+}
+
+
+def config_signer(config):
+    """API key signer for the config, the private key is read once for all clients"""
+    if not config.get("key_file") and not config.get("key_content"):
+        return None
+    return oci.signer.Signer(
+        tenancy=config["tenancy"],
+        user=config["user"],
+        fingerprint=config["fingerprint"],
+        private_key_file_location=config.get("key_file"),
+        pass_phrase=config.get("pass_phrase"),
+        private_key_content=config.get("key_content")
+    )
+
+
+def http_adapter(pool_size):
+    """HTTP adapter keeping up to pool_size connections to the endpoint, None
+    when the requests package the SDK uses can not be found"""
+    try:
+        from oci._vendor.requests.adapters import HTTPAdapter
+    except ImportError:
+        try:
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            return None
+    return HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+
+
+class ClientRegistry:
+    """Service clients by name, created on first use. `name in registry` and
+    get() create the client if needed and tell whether it is available."""
+
+    def __init__(self, config, signer=None, pool_size=None, profile=None, limiter=None):
+        self.config = config
+        self.signer = signer if signer is not None else config_signer(config)
+        self.pool_size = pool_size
+        self.profile = profile
+        self.limiter = limiter
+        self.lock = threading.Lock()
+        self.clients = {}
+        self.errors = {}
+        self.stats = {}
+
+    def __getitem__(self, name):
+        client = self.get(name)
+        if client is None:
+            error = self.errors.get(name)
+            raise error if error else KeyError(name)
+        return client
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def get(self, name):
+        client = self.clients.get(name)
+        if client is not None or name in self.errors:
+            return client
+
+        with self.lock:
+            if name not in self.clients and name not in self.errors:
+                try:
+                    self.clients[name] = self._create(name)
+                except Exception as e:
+                    self.errors[name] = e
+                    print(f"Client {name} not available: {e}", file=sys.stderr)
+        return self.clients.get(name)
+
+    def _create(self, name):
+        if name not in CLIENT_CLASSES:
+            raise KeyError(f"Unknown OCI client {name}")
+
+        package, class_name = CLIENT_CLASSES[name]
+        start = time.time()
+        module = getattr(oci, package, None) or importlib.import_module("oci." + package)
+        client_class = getattr(module, class_name)
+        if self.signer is not None:
+            client = client_class(self.config, signer=self.signer)
+        else:
+            client = client_class(self.config)
+        self.stats[name] = {"create_ms": (time.time() - start) * 1000.0, "first_request_ms": None}
+
+        base_client = getattr(client, "base_client", None)
+        if base_client is not None:
+            session = getattr(base_client, "session", None)
+            adapter = http_adapter(self.pool_size) if self.pool_size and session is not None else None
+            if adapter is not None:
+                session.mount("https://", adapter)
+            if hasattr(base_client, "call_api"):
+                # the limiter retries throttled calls, the profile sees each attempt
+                if self.profile is not None:
+                    self.profile.instrument(base_client, name, self.config.get("region"))
+                if self.limiter is not None:
+                    self.limiter.instrument(base_client, f"{self.config.get('region')}/{name}")
+                self._time_first_request(name, base_client)
+        return client
+
+    def _time_first_request(self, name, base_client):
+        """Every SDK call goes through base_client.call_api, time the first one
+        (connect and TLS handshake included) then restore the method"""
+        call_api = base_client.call_api
+
+        def timed_call_api(*args, **kwargs):
+            start = time.time()
+            try:
+                return call_api(*args, **kwargs)
+            finally:
+                with self.lock:
+                    if self.stats[name]["first_request_ms"] is None:
+                        self.stats[name]["first_request_ms"] = (time.time() - start) * 1000.0
+                        base_client.call_api = call_api
+
+        base_client.call_api = timed_call_api
+
+    def report(self):
+        """{name: {"create_ms", "first_request_ms"}} of the clients created"""
+        return {name: dict(stats) for name, stats in self.stats.items()}
+
+    def print_report(self, stream=sys.stderr):
+        print(f"OCI clients created: {len(self.clients)} of {len(CLIENT_CLASSES)}", file=stream)
+        for name, stats in sorted(self.stats.items()):
+            first = stats["first_request_ms"]
+            first = f"{first:.0f}ms" if first is not None else "not used"
+            print(f"  {name:<20} create {stats['create_ms']:.0f}ms, first request {first}", file=stream)
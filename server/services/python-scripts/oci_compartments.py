@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Compartment tree cache shared by the Cloudedze OCI discovery scripts
+
+CompartmentTree  - compartments of a tenancy with id, name, parent and path,
+                   lookups by id, path and name are dictionary lookups
+CompartmentCache - SQLite store of the tree per tenancy, user and access
+                   level. A tree younger than the TTL is used without any
+                   API call. An older one is revalidated: the compartment
+                   list is read again and its fingerprint compared with the
+                   stored one, like an etag, the stored tree is kept when
+                   nothing changed.
+
+    cache = CompartmentCache(ttl=900)
+    tree = cache.load(clients["identity"], tenancy_id, user_id)
+    tree.compartments                 # sub compartments then the root
+    tree.select("Adi / Sub", recursive=True)
+
+Paths follow showoci -cpath, "Adi / Sub" for a sub compartment of Adi, the
+root path is "/".
+"""
+
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+from collections import namedtuple
+from oci_stream import list_all
+
+DEFAULT_COMPARTMENT_DB = "oci-compartments.db"
+DEFAULT_COMPARTMENT_TTL = 900
+
+Compartment = namedtuple("Compartment", ["id", "name", "parent_id", "lifecycle_state", "path"])
+
+
+class CompartmentTree:
+    """Compartments of one tenancy, the root last as the scripts list them"""
+
+    def __init__(self, root, compartments, source="fetched", age=0.0):
+        self.root = root
+        self.compartments = list(compartments) + [root]
+        self.source = source
+        self.age = age
+        self.by_id = {c.id: c for c in self.compartments}
+        self.by_path = {c.path: c for c in self.compartments}
+        self.by_name = {}
+        self.children = {}
+        for c in self.compartments:
+            self.by_name.setdefault(c.name, []).append(c)
+            if c.parent_id:
+                self.children.setdefault(c.parent_id, []).append(c)
+
+    def __len__(self):
+        return len(self.compartments)
+
+    def __iter__(self):
+        return iter(self.compartments)
+
+    @classmethod
+    def build(cls, root, subcompartments):
+        """Tree from the SDK root and list_compartments records, paths are
+        derived from the parent map"""
+        names = {c.id: c.name for c in subcompartments}
+        parents = {c.id: c.compartment_id for c in subcompartments}
+        paths = {root.id: "/"}
+
+        def path(cid):
+            if cid not in paths:
+                parent = parents.get(cid)
+                # a parent outside the accessible list is shown as part of the path
+                prefix = path(parent) if parent in names or parent == root.id else None
+                paths[cid] = names[cid] if prefix in (None, "/") else prefix + " / " + names[cid]
+            return paths[cid]
+
+        compartments = [Compartment(c.id, c.name, c.compartment_id, c.lifecycle_state, path(c.id)) for c in subcompartments]
+        return cls(Compartment(root.id, root.name, None, root.lifecycle_state, "/"), compartments)
+
+    def find(self, key):
+        """Compartments matching an OCID, a path or a name"""
+        if key in self.by_id:
+            return [self.by_id[key]]
+        if key in self.by_path:
+            return [self.by_path[key]]
+        return list(self.by_name.get(key, []))
+
+    def subtree(self, compartment_id):
+        """The compartment and every compartment below it"""
+        result = []
+        pending = [self.by_id[compartment_id]]
+        while pending:
+            compartment = pending.pop()
+            result.append(compartment)
+            pending.extend(self.children.get(compartment.id, []))
+        return result
+
+    def select(self, key, recursive=False):
+        """Compartments of an OCID, path or name, with their sub compartments if recursive"""
+        selected = {}
+        for compartment in self.find(key):
+            for c in (self.subtree(compartment.id) if recursive else [compartment]):
+                selected[c.id] = c
+        return [c for c in self.compartments if c.id in selected]
+
+    def rows(self):
+        return [list(c) for c in self.compartments]
+
+
+def fingerprint(subcompartments):
+    """Hash of what the tree is built from, changes when a compartment is added,
+    removed, renamed, moved or changes state"""
+    items = sorted((c.id, c.name, c.compartment_id, c.lifecycle_state) for c in subcompartments)
+    return hashlib.sha256(json.dumps(items).encode("utf-8")).hexdigest()
+
+
+class CompartmentCache:
+    """Compartment trees on disk, path None keeps them in memory only"""
+
+    def __init__(self, path=DEFAULT_COMPARTMENT_DB, ttl=DEFAULT_COMPARTMENT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.db = sqlite3.connect(path or ":memory:", timeout=30)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS compartment_trees (
+                key TEXT PRIMARY KEY,
+                etag TEXT NOT NULL,
+                fetched REAL NOT NULL,
+                validated REAL NOT NULL,
+                data TEXT NOT NULL
+            );
+        """)
+
+    def close(self):
+        self.db.close()
+
+    def load(self, identity_client, tenancy_id, user_id="", access_level="ACCESSIBLE", refresh=False):
+        """Compartment tree of the tenancy as the user sees it, tree.source is
+        cache, revalidated or fetched"""
+        start = time.time()
+        tree = None if refresh else self.cached(tenancy_id, user_id, access_level)
+        if tree is None:
+            subcompartments = list(list_all(
+                identity_client.list_compartments,
+                compartment_id=tenancy_id,
+                compartment_id_in_subtree=True,
+                access_level=access_level
+            ))
+            tree = self.update(tenancy_id, user_id, access_level, subcompartments,
+                               lambda: identity_client.get_compartment(compartment_id=tenancy_id).data)
+
+        print(f"Compartments: {len(tree)} {tree.source} in {(time.time() - start) * 1000:.0f}ms", file=sys.stderr)
+        return tree
+
+    def cached(self, tenancy_id, user_id="", access_level="ACCESSIBLE"):
+        """Stored tree while it is younger than the TTL, else None"""
+        row = self.db.execute("SELECT validated, data FROM compartment_trees WHERE key = ?",
+                              (self._key(tenancy_id, user_id, access_level),)).fetchone()
+        age = time.time() - row[0] if row else None
+        return self._tree(row[1], "cache", age) if row and age < self.ttl else None
+
+    def update(self, tenancy_id, user_id, access_level, subcompartments, get_root):
+        """Tree of a fresh compartment list, the stored tree is revalidated when
+        the list has not changed, get_root() is only called to build a new one.
+        load() lists with an SDK client, the async engine with its own calls"""
+        key = self._key(tenancy_id, user_id, access_level)
+        etag = fingerprint(subcompartments)
+        row = self.db.execute("SELECT etag, data FROM compartment_trees WHERE key = ?", (key,)).fetchone()
+
+        with self.db:
+            if row and row[0] == etag:
+                self.db.execute("UPDATE compartment_trees SET validated = ? WHERE key = ?", (time.time(), key))
+                return self._tree(row[1], "revalidated")
+
+            tree = CompartmentTree.build(get_root(), subcompartments)
+            now = time.time()
+            self.db.execute("INSERT OR REPLACE INTO compartment_trees VALUES (?, ?, ?, ?, ?)",
+                            (key, etag, now, now, json.dumps(tree.rows())))
+            return tree
+
+    @staticmethod
+    def _key(tenancy_id, user_id, access_level):
+        return f"{tenancy_id}:{user_id}:{access_level}"
+
+    @staticmethod
+    def _tree(data, source, age=0.0):
+        compartments = [Compartment(*row) for row in json.loads(data)]
+        return CompartmentTree(compartments[-1], compartments[:-1], source, age)
+
+
+def load_compartment_tree(identity_client, tenancy_id, user_id="", access_level="ACCESSIBLE",
+                          path=DEFAULT_COMPARTMENT_DB, ttl=DEFAULT_COMPARTMENT_TTL):
+    """Compartment tree through the cache file, ttl 0 always lists the
+    compartments (the cache is still updated for other scans)"""
+    cache = CompartmentCache(path, ttl)
+    try:
+        return cache.load(identity_client, tenancy_id, user_id, access_level)
+    finally:
+        cache.close()
@@ -1,173 +1,471 @@
 #!/usr/bin/env python3
+"""
+OCI resource discovery with two paths:
+
+  per-service - list every resource type in every compartment,
+                O(compartments x services) API calls
+  search      - one paged structured Resource Search query finds every
+                resource of the discovered types across the tenancy, detail
+                list calls are only made for (compartment, type) pairs that
+                search found and whose fields search summaries do not carry
+
+Both paths return the same resources document.
+
+Usage:
+  python3 oci_discovery.py '<credentials_json>' [--search]
+  python3 oci_discovery.py '<credentials_json>' --record fixture.json
+  python3 oci_discovery.py --benchmark fixture.json [--latency 0.05]
+  python3 oci_discovery.py --benchmark synthetic [--compartments 200 --resources 2000 --occupancy 0.1]
+"""
 import json
 import sys
+import time
+import random
+import argparse
+import types
 import oci
-from oci.config import from_file
-from oci.core import ComputeClient, BlockstorageClient, VirtualNetworkClient
-from oci.database import DatabaseClient
-from oci.object_storage import ObjectStorageClient
-from oci.load_balancer import LoadBalancerClient
-from oci.identity import IdentityClient
-from oci.resource_search import ResourceSearchClient
-
-def discover_oci_resources(credentials):
-    """Discover OCI resources using Python SDK"""
+from oci_stream import list_all
+from oci_clients import ClientRegistry
+from oci_profile import CallProfile
+from oci_scheduler import AdaptiveRateLimiter
+from oci_compartments import CompartmentCache
+
+# Resource Search type -> resources key
+SEARCH_TYPES = {
+    "Instance": "compute_instances",
+    "Volume": "block_volumes",
+    "Bucket": "object_storage_buckets",
+    "AutonomousDatabase": "autonomous_databases",
+    "LoadBalancer": "load_balancers",
+    "Vcn": "vcns"
+}
+
+SEARCH_QUERY = "query " + ", ".join(t.lower() for t in SEARCH_TYPES) + ", compartment resources"
+
+
+def convert_instance(instance, comp_name):
+    return {
+        "id": instance.id,
+        "display_name": instance.display_name,
+        "shape": instance.shape,
+        "state": instance.lifecycle_state,
+        "compartment": comp_name
+    }
+
+
+def convert_volume(volume, comp_name):
+    return {
+        "id": volume.id,
+        "display_name": volume.display_name,
+        "size_gb": volume.size_in_gbs,
+        "state": volume.lifecycle_state,
+        "compartment": comp_name
+    }
+
+
+def convert_bucket(name, namespace, comp_name):
+    return {
+        "id": name,
+        "display_name": name,
+        "namespace": namespace,
+        "compartment": comp_name
+    }
+
+
+def convert_autonomous_database(adb, comp_name):
+    return {
+        "id": adb.id,
+        "display_name": adb.display_name,
+        "cpu_core_count": adb.cpu_core_count,
+        "data_storage_size_in_tbs": adb.data_storage_size_in_tbs,
+        "compartment": comp_name
+    }
+
+
+def convert_load_balancer(lb, comp_name):
+    return {
+        "id": lb.id,
+        "display_name": lb.display_name,
+        "shape_name": lb.shape_name,
+        "lifecycle_state": lb.lifecycle_state,
+        "compartment": comp_name
+    }
+
+
+def convert_vcn(vcn, comp_name):
+    return {
+        "id": vcn.id,
+        "display_name": vcn.display_name,
+        "cidr_block": vcn.cidr_block,
+        "lifecycle_state": vcn.lifecycle_state,
+        "compartment": comp_name
+    }
+
+
+def create_clients(credentials, profile=None):
+    """Create the SDK clients used by both discovery paths"""
+    config = {
+        "user": credentials["userId"],
+        "key_file": None,
+        "fingerprint": credentials["fingerprint"],
+        "tenancy": credentials["tenancyId"],
+        "region": credentials["region"],
+        "key_content": credentials["privateKey"]
+    }
+
+    # created on first use, the search path never builds most of them,
+    # throttled calls are retried at an adapted rate
+    return ClientRegistry(config, profile=profile, limiter=AdaptiveRateLimiter())
+
+
+def empty_resources():
+    return {key: [] for key in SEARCH_TYPES.values()}
+
+
+def get_compartments(clients, tenancy_id, cache=None):
+    """All compartments of the tenancy including the root, as (id, name), from
+    the compartment tree cache when given"""
+    if cache is not None:
+        return [(c.id, c.name) for c in cache.load(clients["identity"], tenancy_id, clients.config.get("user", ""))]
+
+    compartments = [(c.id, c.name) for c in list_all(
+        clients["identity"].list_compartments,
+        compartment_id=tenancy_id,
+        compartment_id_in_subtree=True,
+        access_level="ACCESSIBLE"
+    )]
+    root = clients["identity"].get_compartment(compartment_id=tenancy_id).data
+    compartments.append((root.id, root.name))
+    return compartments
+
+
+def discover_compartment_type(clients, resources, resource_key, comp_id, comp_name, namespace):
+    """List one resource type in one compartment with the per-service API"""
     try:
-        # Create OCI config from credentials
-        config = {
-            "user": credentials["userId"],
-            "key_file": None,
-            "fingerprint": credentials["fingerprint"],
-            "tenancy": credentials["tenancyId"],
-            "region": credentials["region"],
-            "key_content": credentials["privateKey"]
-        }
-        
-        # Initialize clients
-        identity_client = IdentityClient(config)
-        compute_client = ComputeClient(config)
-        blockstorage_client = BlockstorageClient(config)
-        objectstorage_client = ObjectStorageClient(config)
-        database_client = DatabaseClient(config)
-        loadbalancer_client = LoadBalancerClient(config)
-        vcn_client = VirtualNetworkClient(config)
-        resource_search_client = ResourceSearchClient(config)
-        
-        resources = {
-            "compute_instances": [],
-            "block_volumes": [],
-            "object_storage_buckets": [],
-            "autonomous_databases": [],
-            "load_balancers": [],
-            "vcns": []
-        }
-        
-        # Get compartments
-        try:
-            compartments = identity_client.list_compartments(
-                compartment_id=credentials["tenancyId"]
-            ).data
-        except Exception as e:
-            print(f"Error getting compartments: {e}", file=sys.stderr)
-            return resources
-        
-        # Discover resources in each compartment
-        for compartment in compartments:
-            comp_id = compartment.id
-            comp_name = compartment.name
-            
-            # Compute instances
-            try:
-                instances = compute_client.list_instances(
-                    compartment_id=comp_id
-                ).data
-                for instance in instances:
-                    resources["compute_instances"].append({
-                        "id": instance.id,
-                        "display_name": instance.display_name,
-                        "shape": instance.shape,
-                        "state": instance.lifecycle_state,
-                        "compartment": comp_name
-                    })
-            except Exception as e:
-                print(f"Error discovering compute instances in {comp_name}: {e}", file=sys.stderr)
-            
-            # Block volumes
-            try:
-                volumes = blockstorage_client.list_volumes(
-                    compartment_id=comp_id
-                ).data
-                for volume in volumes:
-                    resources["block_volumes"].append({
-                        "id": volume.id,
-                        "display_name": volume.display_name,
-                        "size_gb": volume.size_in_gbs,
-                        "state": volume.lifecycle_state,
-                        "compartment": comp_name
-                    })
-            except Exception as e:
-                print(f"Error discovering block volumes in {comp_name}: {e}", file=sys.stderr)
-            
-            # Object storage buckets
-            try:
-                namespace = objectstorage_client.get_namespace().data
-                buckets = objectstorage_client.list_buckets(
-                    namespace_name=namespace,
-                    compartment_id=comp_id
-                ).data
-                for bucket in buckets:
-                    resources["object_storage_buckets"].append({
-                        "id": bucket.name,
-                        "display_name": bucket.name,
-                        "namespace": namespace,
-                        "compartment": comp_name
-                    })
-            except Exception as e:
-                print(f"Error discovering object storage buckets in {comp_name}: {e}", file=sys.stderr)
-            
-            # Autonomous databases
-            try:
-                adbs = database_client.list_autonomous_databases(
-                    compartment_id=comp_id
-                ).data
-                for adb in adbs:
-                    resources["autonomous_databases"].append({
-                        "id": adb.id,
-                        "display_name": adb.display_name,
-                        "cpu_core_count": adb.cpu_core_count,
-                        "data_storage_size_in_tbs": adb.data_storage_size_in_tbs,
-                        "compartment": comp_name
-                    })
-            except Exception as e:
-                print(f"Error discovering autonomous databases in {comp_name}: {e}", file=sys.stderr)
-            
-            # Load balancers
-            try:
-                lbs = loadbalancer_client.list_load_balancers(
-                    compartment_id=comp_id
-                ).data
-                for lb in lbs:
-                    resources["load_balancers"].append({
-                        "id": lb.id,
-                        "display_name": lb.display_name,
-                        "shape_name": lb.shape_name,
-                        "lifecycle_state": lb.lifecycle_state,
-                        "compartment": comp_name
-                    })
-            except Exception as e:
-                print(f"Error discovering load balancers in {comp_name}: {e}", file=sys.stderr)
-            
-            # VCNs
-            try:
-                vcns = vcn_client.list_vcns(
-                    compartment_id=comp_id
-                ).data
-                for vcn in vcns:
-                    resources["vcns"].append({
-                        "id": vcn.id,
-                        "display_name": vcn.display_name,
-                        "cidr_block": vcn.cidr_block,
-                        "lifecycle_state": vcn.lifecycle_state,
-                        "compartment": comp_name
-                    })
-            except Exception as e:
-                print(f"Error discovering VCNs in {comp_name}: {e}", file=sys.stderr)
-        
+        if resource_key == "compute_instances":
+            for instance in list_all(clients["compute"].list_instances, compartment_id=comp_id):
+                resources[resource_key].append(convert_instance(instance, comp_name))
+
+        elif resource_key == "block_volumes":
+            for volume in list_all(clients["blockstorage"].list_volumes, compartment_id=comp_id):
+                resources[resource_key].append(convert_volume(volume, comp_name))
+
+        elif resource_key == "object_storage_buckets":
+            for bucket in list_all(clients["object_storage"].list_buckets, namespace_name=namespace, compartment_id=comp_id):
+                resources[resource_key].append(convert_bucket(bucket.name, namespace, comp_name))
+
+        elif resource_key == "autonomous_databases":
+            for adb in list_all(clients["database"].list_autonomous_databases, compartment_id=comp_id):
+                resources[resource_key].append(convert_autonomous_database(adb, comp_name))
+
+        elif resource_key == "load_balancers":
+            for lb in list_all(clients["load_balancer"].list_load_balancers, compartment_id=comp_id):
+                resources[resource_key].append(convert_load_balancer(lb, comp_name))
+
+        elif resource_key == "vcns":
+            for vcn in list_all(clients["network"].list_vcns, compartment_id=comp_id):
+                resources[resource_key].append(convert_vcn(vcn, comp_name))
+
+    except Exception as e:
+        print(f"Error discovering {resource_key} in {comp_name}: {e}", file=sys.stderr)
+
+
+def discover_per_service(clients, tenancy_id, cache=None):
+    """Every resource type in every compartment"""
+    resources = empty_resources()
+
+    try:
+        compartments = get_compartments(clients, tenancy_id, cache)
+    except Exception as e:
+        print(f"Error getting compartments: {e}", file=sys.stderr)
         return resources
-        
+
+    namespace = clients["object_storage"].get_namespace().data
+
+    for comp_id, comp_name in compartments:
+        for resource_key in resources:
+            discover_compartment_type(clients, resources, resource_key, comp_id, comp_name, namespace)
+
+    return resources
+
+
+def discover_search(clients, tenancy_id):
+    """Resource Search for the inventory, per-service calls only where details are needed"""
+    resources = empty_resources()
+
+    details = oci.resource_search.models.StructuredSearchDetails(
+        type="Structured",
+        query=SEARCH_QUERY,
+        matching_context_type="NONE"
+    )
+
+    root = clients["identity"].get_compartment(compartment_id=tenancy_id).data
+    compartment_names = {root.id: root.name}
+    found = []
+
+    for summary in list_all(clients["search"].search_resources, details, limit=1000):
+        if summary.resource_type == "Compartment":
+            compartment_names[summary.identifier] = summary.display_name
+        elif summary.resource_type in SEARCH_TYPES:
+            found.append(summary)
+
+    # buckets are complete from the summary, other types need fields only
+    # the service list call returns, list them where search found any
+    namespace = None
+    detail_pairs = []
+    seen = set()
+    for summary in found:
+        resource_key = SEARCH_TYPES[summary.resource_type]
+        comp_name = compartment_names.get(summary.compartment_id, summary.compartment_id)
+
+        if resource_key == "object_storage_buckets":
+            if namespace is None:
+                namespace = clients["object_storage"].get_namespace().data
+            resources[resource_key].append(convert_bucket(summary.display_name, namespace, comp_name))
+
+        elif (resource_key, summary.compartment_id) not in seen:
+            seen.add((resource_key, summary.compartment_id))
+            detail_pairs.append((resource_key, summary.compartment_id, comp_name))
+
+    for resource_key, comp_id, comp_name in detail_pairs:
+        discover_compartment_type(clients, resources, resource_key, comp_id, comp_name, namespace)
+
+    return resources
+
+
+def discover_oci_resources(credentials, search=False, profile=None, cache=None):
+    """Discover OCI resources using Python SDK"""
+    try:
+        clients = create_clients(credentials, profile)
+        if search:
+            return discover_search(clients, credentials["tenancyId"])
+        return discover_per_service(clients, credentials["tenancyId"], cache)
+
     except Exception as e:
         print(f"Error in OCI discovery: {e}", file=sys.stderr)
         return {"error": str(e)}
 
+
+##########################################################################
+# Benchmark - both paths against a recorded tenancy fixture
+#
+# Fixture: {"tenancy": {"id", "name"}, "namespace": "...",
+#           "compartments": [{"id", "name"}],
+#           "resources": {resources key: [record dicts with compartment_id]}}
+##########################################################################
+def record_fixture(clients, tenancy_id):
+    """Record the raw list records of the tenancy into a fixture"""
+    root = clients["identity"].get_compartment(compartment_id=tenancy_id).data
+    compartments = get_compartments(clients, tenancy_id)
+    namespace = clients["object_storage"].get_namespace().data
+
+    calls = {
+        "compute_instances": lambda comp_id: list_all(clients["compute"].list_instances, compartment_id=comp_id),
+        "block_volumes": lambda comp_id: list_all(clients["blockstorage"].list_volumes, compartment_id=comp_id),
+        "object_storage_buckets": lambda comp_id: list_all(clients["object_storage"].list_buckets, namespace_name=namespace, compartment_id=comp_id),
+        "autonomous_databases": lambda comp_id: list_all(clients["database"].list_autonomous_databases, compartment_id=comp_id),
+        "load_balancers": lambda comp_id: list_all(clients["load_balancer"].list_load_balancers, compartment_id=comp_id),
+        "vcns": lambda comp_id: list_all(clients["network"].list_vcns, compartment_id=comp_id)
+    }
+
+    fixture = {
+        "tenancy": {"id": root.id, "name": root.name},
+        "namespace": namespace,
+        "compartments": [{"id": comp_id, "name": comp_name} for comp_id, comp_name in compartments if comp_id != root.id],
+        "resources": empty_resources()
+    }
+    for comp_id, comp_name in compartments:
+        for resource_key, call in calls.items():
+            try:
+                for record in call(comp_id):
+                    item = oci.util.to_dict(record)
+                    item["compartment_id"] = comp_id
+                    fixture["resources"][resource_key].append(item)
+            except Exception as e:
+                print(f"Error recording {resource_key} in {comp_name}: {e}", file=sys.stderr)
+    return fixture
+
+
+def synthetic_fixture(compartments=200, resources=2000, occupancy=0.1):
+    """Tenancy with resources spread over a fraction of the compartments"""
+    rnd = random.Random(1)
+    comps = [{"id": f"ocid1.compartment.oc1..c{i}", "name": f"compartment{i}"} for i in range(compartments)]
+    used = rnd.sample(comps, max(1, int(compartments * occupancy)))
+    fixture = {
+        "tenancy": {"id": "ocid1.tenancy.oc1..root", "name": "root"},
+        "namespace": "namespace",
+        "compartments": comps,
+        "resources": empty_resources()
+    }
+    keys = list(SEARCH_TYPES.values())
+    for i in range(resources):
+        resource_key = keys[i % len(keys)]
+        fixture["resources"][resource_key].append({
+            "id": f"ocid1.{resource_key}.oc1..r{i}",
+            "name": f"{resource_key}{i}",
+            "display_name": f"{resource_key}{i}",
+            "lifecycle_state": "AVAILABLE",
+            "shape": "VM.Standard.E4.Flex",
+            "shape_name": "flexible",
+            "size_in_gbs": 50,
+            "cpu_core_count": 1,
+            "data_storage_size_in_tbs": 1,
+            "cidr_block": "10.0.0.0/16",
+            "compartment_id": rnd.choice(used)["id"]
+        })
+    return fixture
+
+
+class FixtureClient:
+    """Serves SDK calls from a fixture, counting calls and simulating latency"""
+
+    def __init__(self, fixture, stats, latency, list_page_size=100, search_page_size=1000):
+        self.fixture = fixture
+        self.stats = stats
+        self.latency = latency
+        self.list_page_size = list_page_size
+        self.search_page_size = search_page_size
+        self.by_compartment = {}
+        for resource_key, records in fixture["resources"].items():
+            for record in records:
+                self.by_compartment.setdefault((resource_key, record["compartment_id"]), []).append(record)
+
+    def _call(self, name):
+        self.stats[name] = self.stats.get(name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _page(self, records, page, page_size, wrap_items=False):
+        start = int(page or 0)
+        data = [types.SimpleNamespace(**r) for r in records[start:start + page_size]]
+        if wrap_items:
+            data = types.SimpleNamespace(items=data)
+        more = start + page_size < len(records)
+        return types.SimpleNamespace(data=data, has_next_page=more, next_page=str(start + page_size) if more else None)
+
+    def _list(self, name, resource_key, compartment_id, page):
+        self._call(name)
+        return self._page(self.by_compartment.get((resource_key, compartment_id), []), page, self.list_page_size)
+
+    def get_compartment(self, compartment_id):
+        self._call("get_compartment")
+        return types.SimpleNamespace(data=types.SimpleNamespace(**self.fixture["tenancy"]))
+
+    def list_compartments(self, compartment_id, page=None, **kwargs):
+        self._call("list_compartments")
+        return self._page(self.fixture["compartments"], page, self.list_page_size)
+
+    def get_namespace(self):
+        self._call("get_namespace")
+        return types.SimpleNamespace(data=self.fixture["namespace"])
+
+    def list_instances(self, compartment_id, page=None):
+        return self._list("list_instances", "compute_instances", compartment_id, page)
+
+    def list_volumes(self, compartment_id, page=None):
+        return self._list("list_volumes", "block_volumes", compartment_id, page)
+
+    def list_buckets(self, namespace_name, compartment_id, page=None):
+        return self._list("list_buckets", "object_storage_buckets", compartment_id, page)
+
+    def list_autonomous_databases(self, compartment_id, page=None):
+        return self._list("list_autonomous_databases", "autonomous_databases", compartment_id, page)
+
+    def list_load_balancers(self, compartment_id, page=None):
+        return self._list("list_load_balancers", "load_balancers", compartment_id, page)
+
+    def list_vcns(self, compartment_id, page=None):
+        return self._list("list_vcns", "vcns", compartment_id, page)
+
+    def search_resources(self, search_details, limit=None, page=None):
+        self._call("search_resources")
+        search_types = {v: k for k, v in SEARCH_TYPES.items()}
+        summaries = [{
+            "resource_type": "Compartment",
+            "identifier": c["id"],
+            "display_name": c["name"],
+            "compartment_id": self.fixture["tenancy"]["id"]
+        } for c in self.fixture["compartments"]]
+        for resource_key, records in self.fixture["resources"].items():
+            summaries.extend({
+                "resource_type": search_types[resource_key],
+                "identifier": r.get("id") or r.get("name"),
+                "display_name": r.get("display_name") or r.get("name"),
+                "compartment_id": r["compartment_id"]
+            } for r in records)
+        return self._page(summaries, page, min(limit or self.search_page_size, self.search_page_size), wrap_items=True)
+
+
+def run_benchmark(fixture, latency=0.05):
+    tenancy_id = fixture["tenancy"]["id"]
+    results = {}
+
+    for name, discover in (("per-service", discover_per_service), ("search", discover_search)):
+        stats = {}
+        client = FixtureClient(fixture, stats, latency)
+        clients = {key: client for key in ("identity", "compute", "blockstorage", "object_storage", "database", "load_balancer", "network", "search")}
+        start = time.time()
+        resources = discover(clients, tenancy_id)
+        results[name] = (resources, sum(stats.values()), time.time() - start, stats)
+
+    def canonical(resources):
+        return {key: sorted(json.dumps(r, sort_keys=True) for r in items) for key, items in resources.items()}
+
+    total = sum(len(items) for items in fixture["resources"].values())
+    print(f"Compartments      : {len(fixture['compartments']) + 1}")
+    print(f"Resources         : {total}")
+    print(f"Latency per call  : {latency * 1000:.0f}ms")
+    for name, (resources, calls, elapsed, stats) in results.items():
+        print(f"{name:<18}: {calls} API calls, {elapsed:.2f}s")
+    print(f"Same resources    : {canonical(results['per-service'][0]) == canonical(results['search'][0])}")
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python3 oci_discovery.py <credentials_json>", file=sys.stderr)
-        sys.exit(1)
-    
+    parser = argparse.ArgumentParser(description='OCI resource discovery')
+    parser.add_argument('credentials', nargs='?', help='OCI credentials JSON string')
+    parser.add_argument('--search', action='store_true', help='Use Resource Search, list calls only for missing details')
+    parser.add_argument('--record', help='Record the tenancy into a benchmark fixture file')
+    parser.add_argument('--benchmark', help='Fixture file, or "synthetic", to compare both paths offline')
+    parser.add_argument('--latency', default=0.05, type=float, help='Simulated seconds per API call for --benchmark (default=0.05)')
+    parser.add_argument('--compartments', default=200, type=int, help='Synthetic compartments (default=200)')
+    parser.add_argument('--resources', default=2000, type=int, help='Synthetic resources (default=2000)')
+    parser.add_argument('--occupancy', default=0.1, type=float, help='Synthetic share of compartments holding resources (default=0.1)')
+    parser.add_argument('--call-profile', default='', help='Write the per call latency and count profile of the OCI API calls to this JSON file')
+    parser.add_argument('--call-profile-prom', default='', help='Write the call profile to this Prometheus text file, needs prometheus-client')
+    args = parser.parse_args()
+
     try:
-        credentials = json.loads(sys.argv[1])
-        resources = discover_oci_resources(credentials)
+        if args.benchmark:
+            if args.benchmark == "synthetic":
+                fixture = synthetic_fixture(args.compartments, args.resources, args.occupancy)
+            else:
+                with open(args.benchmark, 'r') as f:
+                    fixture = json.load(f)
+            run_benchmark(fixture, args.latency)
+            sys.exit(0)
+
+        if not args.credentials:
+            print("Usage: python3 oci_discovery.py <credentials_json>", file=sys.stderr)
+            sys.exit(1)
+
+        credentials = json.loads(args.credentials)
+
+        if args.record:
+            fixture = record_fixture(create_clients(credentials), credentials["tenancyId"])
+            with open(args.record, 'w') as f:
+                json.dump(fixture, f, default=str)
+            print(f"Recorded fixture to {args.record}", file=sys.stderr)
+            sys.exit(0)
+
+        profile = CallProfile() if args.call_profile or args.call_profile_prom else None
+        cache = CompartmentCache()
+        try:
+            resources = discover_oci_resources(credentials, args.search, profile, cache)
+        finally:
+            cache.close()
         print(json.dumps(resources, indent=2))
+        if profile:
+            profile.save(args.call_profile, args.call_profile_prom)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Per call profile of the OCI API calls a discovery run makes
+
+CallProfile - counts the calls, errors, throttles, retries and bytes received
+              and keeps a latency histogram per service, operation and region.
+              Every SDK call goes through base_client.call_api, instrument()
+              wraps it for one client and instrument_sdk() for every client
+              the process creates (showoci builds its own clients).
+
+    profile = CallProfile()
+    clients = ClientRegistry(config, profile=profile)
+    ...
+    profile.save("profile.json", "profile.prom")
+
+The JSON file lists every operation with its histogram, the Prometheus text
+file has the same numbers as oci_api_* metrics and needs prometheus-client.
+"""
+
+import sys
+import json
+import time
+import threading
+from urllib.parse import urlparse
+
+# upper bounds of the latency buckets in seconds, the last bucket is +Inf
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def region_of_endpoint(endpoint):
+    """us-ashburn-1 for https://iaas.us-ashburn-1.oraclecloud.com"""
+    labels = (urlparse(endpoint).hostname or "").split(".")
+    return labels[1] if len(labels) > 2 else "unknown"
+
+
+class OperationStats:
+    """Counters and latency histogram of one service, operation and region"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.throttled = 0
+        self.retries = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, seconds, status, size, retry):
+        self.calls += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.bytes += size
+        if retry:
+            self.retries += 1
+        if status == 429:
+            self.throttled += 1
+        elif status is None or status >= 400:
+            self.errors += 1
+
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def cumulative_buckets(self):
+        """(le, calls) pairs in the Prometheus form, counts include the lower buckets"""
+        total = 0
+        result = []
+        for bound, count in zip(list(LATENCY_BUCKETS) + [float("inf")], self.buckets):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else str(bound), total))
+        return result
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "throttled": self.throttled,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 3),
+            "avg_ms": round(self.seconds * 1000.0 / self.calls, 1) if self.calls else 0.0,
+            "max_ms": round(self.max_seconds * 1000.0, 1),
+            "latency_buckets": dict(self.cumulative_buckets())
+        }
+
+
+class CallProfile:
+    """API call statistics of a run, safe to record from discovery threads"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.started = time.time()
+        self.local = threading.local()
+        self.sdk_call_api = None
+
+    def instrument(self, base_client, service, region):
+        """Record every call of one SDK client"""
+        call_api = base_client.call_api
+
+        def call_api_profiled(*args, **kwargs):
+            return self.call(call_api, service, region, *args, **kwargs)
+
+        base_client.call_api = call_api_profiled
+
+    def instrument_sdk(self):
+        """Record the calls of every SDK client of the process until
+        restore_sdk(), service and region are read from the client"""
+        from oci.base_client import BaseClient
+        call_api = self.sdk_call_api = BaseClient.call_api
+        profile = self
+
+        def call_api_profiled(client, *args, **kwargs):
+            return profile.call(call_api, client.service, region_of_endpoint(client.endpoint), client, *args, **kwargs)
+
+        BaseClient.call_api = call_api_profiled
+
+    def restore_sdk(self):
+        if self.sdk_call_api is not None:
+            from oci.base_client import BaseClient
+            BaseClient.call_api = self.sdk_call_api
+            self.sdk_call_api = None
+
+    def call(self, call_api, service, region, *args, **kwargs):
+        """call_api(*args, **kwargs), recorded under its operation"""
+        operation = kwargs.get("operation_name") or self.operation_name(args, kwargs)
+        key = (service, operation, region)
+
+        # the SDK retry strategy and ThrottleBackoff repeat a failed call on
+        # the same thread, a call right after a failure of the same operation
+        # is a retry
+        retry = getattr(self.local, "failed", None) == key
+        start = time.time()
+        try:
+            response = call_api(*args, **kwargs)
+        except Exception as e:
+            self.local.failed = key
+            self.record(key, time.time() - start, getattr(e, "status", None), self.response_bytes(e), retry)
+            raise
+        self.local.failed = None
+        self.record(key, time.time() - start, getattr(response, "status", 200), self.response_bytes(response), retry)
+        return response
+
+    @staticmethod
+    def operation_name(args, kwargs):
+        """GET /instances when the SDK does not pass operation_name"""
+        args = [arg for arg in args if isinstance(arg, str)]
+        resource_path = kwargs.get("resource_path") or (args[0] if args else "")
+        method = kwargs.get("method") or (args[1] if len(args) > 1 else "")
+        return f"{method} {resource_path}".strip()
+
+    @staticmethod
+    def response_bytes(response):
+        headers = getattr(response, "headers", None) or {}
+        try:
+            return int(headers.get("content-length") or headers.get("Content-Length") or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def record(self, key, seconds, status, size=0, retry=False):
+        with self.lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = OperationStats()
+            stats.record(seconds, status, size, retry)
+
+    def to_dict(self):
+        """Operations slowest first by total time, with totals per service and region"""
+        with self.lock:
+            items = [(key, stats.to_dict()) for key, stats in self.stats.items()]
+
+        operations = []
+        services = {}
+        regions = {}
+        for (service, operation, region), stats in sorted(items, key=lambda item: item[1]["seconds"], reverse=True):
+            operations.append(dict(service=service, operation=operation, region=region, **stats))
+            for totals, name in ((services, service), (regions, region)):
+                total = totals.setdefault(name, {"calls": 0, "errors": 0, "throttled": 0, "retries": 0, "bytes": 0, "seconds": 0.0})
+                for field in total:
+                    total[field] += stats[field]
+
+        for totals in list(services.values()) + list(regions.values()):
+            totals["seconds"] = round(totals["seconds"], 3)
+
+        return {
+            "elapsed_seconds": round(time.time() - self.started, 3),
+            "calls": sum(stats["calls"] for _, stats in items),
+            "latency_buckets": [str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"],
+            "services": dict(sorted(services.items(), key=lambda item: item[1]["seconds"], reverse=True)),
+            "regions": regions,
+            "operations": operations
+        }
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def write_prometheus(self, path):
+        """Prometheus text file for the node exporter textfile collector, False
+        when prometheus-client is not installed"""
+        try:
+            from prometheus_client import CollectorRegistry, write_to_textfile
+            from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+        except ImportError:
+            print("prometheus-client is not installed, Prometheus profile not written", file=sys.stderr)
+            return False
+
+        profile = self
+
+        class Collector:
+            def collect(self):
+                labels = ["service", "operation", "region"]
+                counters = {field: CounterMetricFamily(f"oci_api_{field}", f"OCI API {text}", labels=labels) for field, text in (
+                    ("calls", "calls made"), ("errors", "calls failed"), ("throttled", "calls rejected with 429"),
+                    ("retries", "calls repeating a failed call"), ("bytes", "response bytes received"))}
+                latency = HistogramMetricFamily("oci_api_latency_seconds", "OCI API call latency", labels=labels)
+
+                with profile.lock:
+                    for key, stats in profile.stats.items():
+                        for field, counter in counters.items():
+                            counter.add_metric(list(key), getattr(stats, field))
+                        latency.add_metric(list(key), stats.cumulative_buckets(), stats.seconds)
+
+                yield from counters.values()
+                yield latency
+
+        registry = CollectorRegistry()
+        registry.register(Collector())
+        write_to_textfile(path, registry)
+        return True
+
+    def print_report(self, top=10, stream=sys.stderr):
+        profile = self.to_dict()
+        print(f"OCI API calls: {profile['calls']} in {profile['elapsed_seconds']:.1f}s", file=stream)
+        for op in profile["operations"][:top]:
+            print(f"  {op['service']:<16} {op['operation']:<36} {op['region']:<16} {op['calls']:>6} calls {op['seconds']:>8.1f}s avg {op['avg_ms']:.0f}ms max {op['max_ms']:.0f}ms"
+                  + (f" throttled {op['throttled']}" if op["throttled"] else "") + (f" errors {op['errors']}" if op["errors"] else ""), file=stream)
+
+    def save(self, json_path=None, prometheus_path=None):
+        """Write the requested profile files and print the slowest operations"""
+        if json_path:
+            self.write_json(json_path)
+        if prometheus_path:
+            self.write_prometheus(prometheus_path)
+        self.print_report()
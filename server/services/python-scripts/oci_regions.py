@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Region fan-out helpers for the Cloudedze OCI discovery scripts
+
+subscribed_regions - regions the tenancy is subscribed to, read once with the identity client
+RegionScope        - client set and resource lists of one region, records are tagged with the region
+scan_regions       - run a scan function for every region concurrently
+region_timing      - per region wall time, busy time and resource count, slowest first
+
+Compartments are tenancy wide, they are listed once and every region scans
+the same list. Each region gets its own ClientRegistry (the endpoints are
+regional) and appends to the shared resource lists, so the output is one
+document where every record carries "region".
+"""
+
+import sys
+import time
+import threading
+import concurrent.futures
+from oci_clients import ClientRegistry
+
+
+def parse_regions(value):
+    """--regions value, None for the config region only, "all" or a list of names"""
+    if not value:
+        return None
+    if value == "all":
+        return "all"
+    return [region.strip() for region in value.split(",") if region.strip()]
+
+
+def subscribed_regions(identity_client, tenancy_id, regions="all"):
+    """Ready region subscriptions, home region first, limited to regions unless "all" """
+    subscriptions = identity_client.list_region_subscriptions(tenancy_id).data
+    names = [s.region_name for s in sorted(subscriptions, key=lambda s: not s.is_home_region) if s.status == "READY"]
+
+    if regions != "all":
+        missing = [region for region in regions if region not in names]
+        if missing:
+            print(f"Not subscribed to {', '.join(missing)}, skipped", file=sys.stderr)
+        names = [name for name in names if name in regions]
+    return names
+
+
+def region_config(config, region):
+    """Copy of the config for another region"""
+    return dict(config, region=region)
+
+
+class RegionResourceList:
+    """Appends to a shared resource list, tagging each record with the region"""
+
+    def __init__(self, target, region):
+        self.target = target
+        self.region = region
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def append(self, record):
+        if isinstance(record, dict):
+            record = dict(record, region=self.region)
+        self.target.append(record)
+        with self.lock:
+            self.count += 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+
+class RegionScope:
+    """What one region is scanned with, tag=False keeps the records as they
+    are for single region scans"""
+
+    def __init__(self, region, clients, resources, tag=True):
+        self.region = region
+        self.clients = clients
+        self.resources = {key: RegionResourceList(value, region) for key, value in resources.items()} if tag else resources
+        self.lock = threading.Lock()
+        self.started = None
+        self.finished = None
+        self.busy = 0.0
+
+    @classmethod
+    def for_regions(cls, config, regions, resources, signer=None, pool_size=None, profile=None, limiter=None):
+        """One scope per region, the clients of all regions share the signer,
+        the call profile and the rate limiter (its endpoints are per region)"""
+        signer = signer if signer is not None else ClientRegistry(config).signer
+        return [cls(region, ClientRegistry(region_config(config, region), signer, pool_size, profile, limiter), resources) for region in regions]
+
+    def run(self, func, *args, **kwargs):
+        """Call func, its time counts as scan time of the region"""
+        start = time.time()
+        with self.lock:
+            if self.started is None:
+                self.started = start
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = time.time()
+            with self.lock:
+                self.busy += end - start
+                self.finished = max(self.finished or end, end)
+
+    def timing(self):
+        return {
+            "region": self.region,
+            "seconds": round((self.finished or 0) - (self.started or 0), 3),
+            "busy_seconds": round(self.busy, 3),
+            "resources": sum(len(records) for records in self.resources.values())
+        }
+
+
+def scan_regions(scopes, scan):
+    """Run scan(scope) for every region at the same time, errors of one region
+    are reported and do not stop the others"""
+    def run(scope):
+        try:
+            scope.run(scan, scope)
+        except Exception as e:
+            print(f"Error scanning region {scope.region}: {e}", file=sys.stderr)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(scopes))) as executor:
+        list(executor.map(run, scopes))
+
+
+def region_timing(scopes):
+    """Timing of every region, slowest first, also printed to stderr"""
+    timing = sorted((scope.timing() for scope in scopes), key=lambda t: t["seconds"], reverse=True)
+    for t in timing:
+        print(f"Region {t['region']}: {t['seconds']:.1f}s, busy {t['busy_seconds']:.1f}s, {t['resources']} resources", file=sys.stderr)
+    return timing
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Resource relationship graph of a Cloudedze OCI discovery
+
+RelationshipGraph - id indexed adjacency maps built in one pass over the
+                    resource records, every lookup is a dictionary lookup
+
+    graph = RelationshipGraph.build(resources)
+    graph.follow(instance_id, "vnic", "subnet", "vcn")   # VCNs of an instance
+    graph.sources(instance_id, "attached_to")            # its volumes
+    graph.to_dict()                                      # compact edge list
+
+Edges, the record fields they are read from:
+  instance    -vnic->        VNIC         compute_instances vnic_attachments
+  VNIC        -subnet->      subnet       compute_instances vnic_attachments
+  subnet      -vcn->         VCN          subnets vcn_id
+  volume      -attached_to-> instance     compute_instances volume_ids
+  boot volume -attached_to-> instance     compute_instances boot_volume_id
+  LB          -backend->     instance     load_balancers backends, the backend
+                                          IP is found in the private_ips of the
+                                          subnets in the VCN of the LB subnets
+  volume, boot volume, bucket -kms_key-> key   kms_key_id
+
+Private IPs overlap between VCNs (every default VCN is 10.0.0.0/16) and
+between regions, so a backend IP is only looked up in the VCNs of the load
+balancer subnets and in its region when the records carry one. A backend
+IP that is not found there, or is found in more than one of them, counts
+as unresolved and gets no edge.
+
+python oci_relationships.py --benchmark compares the graph against nested
+loop correlation on a synthetic inventory, tests/test_oci_relationships.py
+checks that both give the same answers.
+"""
+
+import sys
+import time
+
+
+class RelationshipGraph:
+    """Edges between resource OCIDs, outgoing and incoming per relation"""
+
+    def __init__(self):
+        self.edges = []
+        self.outgoing = {}
+        self.incoming = {}
+        self.unresolved_backends = 0
+
+    def add(self, source, relation, target):
+        if not source or not target:
+            return
+        self.edges.append((source, relation, target))
+        self.outgoing.setdefault(source, {}).setdefault(relation, []).append(target)
+        self.incoming.setdefault(target, {}).setdefault(relation, []).append(source)
+
+    @classmethod
+    def build(cls, resources):
+        """Graph of a resources dict as the discovery outputs it, subnets and
+        instances are read before the load balancers so backend IPs resolve"""
+        graph = cls()
+        subnet_vcns = {}
+        ip_vnics = {}
+        vnic_instances = {}
+
+        # (region, vcn_id, ip) -> VNIC, None when the key is not unique
+        for subnet in resources.get("subnets", []):
+            graph.add(subnet["id"], "vcn", subnet.get("vcn_id"))
+            vcn_key = (subnet.get("region"), subnet.get("vcn_id"))
+            subnet_vcns[subnet["id"]] = vcn_key
+            for ip, vnic_id in (subnet.get("private_ips") or {}).items():
+                key = vcn_key + (ip,)
+                ip_vnics[key] = vnic_id if ip_vnics.get(key, vnic_id) == vnic_id else None
+
+        for instance in resources.get("compute_instances", []):
+            instance_id = instance["id"]
+            for attachment in instance.get("vnic_attachments") or []:
+                graph.add(instance_id, "vnic", attachment["vnic_id"])
+                graph.add(attachment["vnic_id"], "subnet", attachment.get("subnet_id"))
+                vnic_instances[attachment["vnic_id"]] = instance_id
+            graph.add(instance.get("boot_volume_id"), "attached_to", instance_id)
+            for volume_id in instance.get("volume_ids") or []:
+                graph.add(volume_id, "attached_to", instance_id)
+
+        for lb in resources.get("load_balancers", []):
+            vcn_keys = {subnet_vcns[subnet_id] for subnet_id in lb.get("subnet_ids") or [] if subnet_id in subnet_vcns}
+            vcn_keys = {key for key in vcn_keys if key[0] == lb.get("region")}
+            for backend in lb.get("backends") or []:
+                vnic_ids = {ip_vnics.get(key + (backend.get("ip_address"),)) for key in vcn_keys}
+                instance_id = vnic_instances.get(vnic_ids.pop()) if len(vnic_ids) == 1 else None
+                if instance_id:
+                    graph.add(lb["id"], "backend", instance_id)
+                else:
+                    graph.unresolved_backends += 1
+
+        for key in ("block_volumes", "boot_volumes", "object_storage_buckets"):
+            for record in resources.get(key, []):
+                graph.add(record["id"], "kms_key", record.get("kms_key_id"))
+
+        return graph
+
+    def targets(self, source, relation):
+        return self.outgoing.get(source, {}).get(relation, [])
+
+    def sources(self, target, relation):
+        return self.incoming.get(target, {}).get(relation, [])
+
+    def follow(self, source, *relations):
+        """Resources reached from source through the relations in order"""
+        current = [source]
+        for relation in relations:
+            reached = {}
+            for resource_id in current:
+                for target in self.targets(resource_id, relation):
+                    reached[target] = True
+            current = list(reached)
+        return current
+
+    def to_dict(self):
+        """Edge list as [source, relation, target] triples with counts per relation"""
+        counts = {}
+        for _, relation, _ in self.edges:
+            counts[relation] = counts.get(relation, 0) + 1
+        return {
+            "edges": [list(edge) for edge in self.edges],
+            "counts": counts,
+            "unresolved_backends": self.unresolved_backends
+        }
+
+
+def synthetic_inventory(resources=50000):
+    """Inventory with the relationship fields of the discovery records, about
+    resources records in total"""
+    instances_count = max(1, resources * 2 // 7)
+    vcns = [{"id": f"vcn{i}"} for i in range(max(1, instances_count // 200))]
+    subnets = [{"id": f"subnet{i}", "vcn_id": vcns[i % len(vcns)]["id"], "private_ips": {}} for i in range(max(1, instances_count // 20))]
+    instances, volumes, boot_volumes, buckets, lbs = [], [], [], [], []
+
+    for i in range(instances_count):
+        subnet = subnets[i % len(subnets)]
+        subnet["private_ips"][f"10.{i // 65536}.{i // 256 % 256}.{i % 256}"] = f"vnic{i}"
+        volume_ids = [f"volume{i}", f"volume{i}b"] if i % 3 == 0 else [f"volume{i}"]
+        instances.append({"id": f"instance{i}", "boot_volume_id": f"boot{i}", "volume_ids": volume_ids,
+                          "vnic_attachments": [{"vnic_id": f"vnic{i}", "subnet_id": subnet["id"]}]})
+        boot_volumes.append({"id": f"boot{i}", "kms_key_id": f"key{i % 50}"})
+        volumes.extend({"id": volume_id, "kms_key_id": f"key{i % 50}" if i % 2 else None} for volume_id in volume_ids)
+
+    # the backends of a load balancer are instances in its subnet
+    for i in range(max(1, instances_count // 20)):
+        buckets.append({"id": f"ns:bucket{i}", "kms_key_id": f"key{i % 50}"})
+        s = i % len(subnets)
+        members = [n for n in (s + len(subnets) * (i // len(subnets) * 10 + k) for k in range(10)) if n < instances_count]
+        lbs.append({"id": f"lb{i}", "subnet_ids": [subnets[s]["id"]],
+                    "backends": [{"ip_address": f"10.{n // 65536}.{n // 256 % 256}.{n % 256}", "port": 80} for n in members]})
+
+    inventory = {"vcns": vcns, "subnets": subnets, "compute_instances": instances, "block_volumes": volumes,
+                 "boot_volumes": boot_volumes, "object_storage_buckets": buckets, "load_balancers": lbs}
+    return inventory, sum(len(records) for records in inventory.values())
+
+
+def nested_loop_vcns(inventory, instance):
+    """VCNs of an instance the way the consumer correlated them, a scan of the
+    subnets and VCNs per VNIC"""
+    result = []
+    for attachment in instance["vnic_attachments"]:
+        for subnet in inventory["subnets"]:
+            if subnet["id"] == attachment["subnet_id"]:
+                for vcn in inventory["vcns"]:
+                    if vcn["id"] == subnet["vcn_id"]:
+                        result.append(vcn["id"])
+    return result
+
+
+def nested_loop_volumes(inventory, instance_id):
+    """Volumes of an instance by scanning the instances and volumes"""
+    result = []
+    for instance in inventory["compute_instances"]:
+        if instance["id"] == instance_id:
+            for volume in inventory["block_volumes"]:
+                if volume["id"] in instance["volume_ids"]:
+                    result.append(volume["id"])
+    return result
+
+
+def run_benchmark(resources=50000, sample=200):
+    inventory, count = synthetic_inventory(resources)
+    instances = inventory["compute_instances"]
+
+    start = time.time()
+    graph = RelationshipGraph.build(inventory)
+    build_seconds = time.time() - start
+
+    start = time.time()
+    graph_answers = [(graph.follow(i["id"], "vnic", "subnet", "vcn"), sorted(graph.sources(i["id"], "attached_to")))
+                     for i in instances]
+    graph_seconds = time.time() - start
+
+    # the nested loops are too slow for every instance, time a sample and scale it
+    step = max(1, len(instances) // sample)
+    sampled = instances[::step]
+    start = time.time()
+    loop_answers = [(nested_loop_vcns(inventory, i), nested_loop_volumes(inventory, i["id"])) for i in sampled]
+    loop_seconds = (time.time() - start) * len(instances) / len(sampled)
+
+    boot_ids = {i["boot_volume_id"] for i in sampled}
+    same = all(vcns == graph_answers[n * step][0] and volumes == sorted(v for v in graph_answers[n * step][1] if v not in boot_ids)
+               for n, (vcns, volumes) in enumerate(loop_answers))
+
+    summary = graph.to_dict()
+    print(f"Inventory        : {count} resources, {len(instances)} instances, {len(summary['edges'])} edges")
+    print(f"Graph build      : {build_seconds:.3f}s")
+    print(f"Graph lookups    : {graph_seconds:.3f}s for VCNs and volumes of every instance")
+    print(f"Nested loops     : {loop_seconds:.1f}s estimated from {len(sampled)} instances, same answers {same}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Compare the relationship graph against nested loop correlation')
+    parser.add_argument('--benchmark', action='store_true', help='Run the benchmark')
+    parser.add_argument('--resources', default=50000, type=int, help='Synthetic inventory size (default=50000)')
+    parser.add_argument('--sample', default=200, type=int, help='Instances the nested loops are timed on (default=200)')
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        sys.exit(1)
+    run_benchmark(args.resources, args.sample)
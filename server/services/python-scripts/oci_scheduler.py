@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Discovery scheduling helpers for the Cloudedze OCI discovery scripts
+
+DiscoveryScheduler - runs tasks under a global worker budget and a per-endpoint limit
+ThrottleBackoff    - retries OCI calls rejected with HTTP 429, honouring retry-after
+AdaptiveRateLimiter - ThrottleBackoff with a token bucket per endpoint whose rate
+                     adapts to 429 responses (additive increase, multiplicative
+                     decrease), instrument() puts it under every call of a client
+SynchronizedList   - list whose append/extend can be called from many threads
+
+python oci_scheduler.py --benchmark runs a local HTTP endpoint that answers
+429 above a fixed rate and compares plain calls, ThrottleBackoff and
+AdaptiveRateLimiter against it, tests/test_oci_scheduler.py checks the
+limiter against the same endpoint.
+"""
+
+import sys
+import time
+import random
+import threading
+import concurrent.futures
+from collections import deque
+
+
+class DiscoveryScheduler:
+    """Two level scheduler, tasks are queued per endpoint and started while both
+    the global budget and the endpoint limit have room. Queued tasks never hold
+    a worker thread, so a busy endpoint does not starve the others."""
+
+    def __init__(self, max_workers=16, endpoint_limit=4, endpoint_limits=None):
+        self.max_workers = max(1, max_workers)
+        self.endpoint_limit = max(1, endpoint_limit)
+        self.endpoint_limits = endpoint_limits or {}
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        self.lock = threading.Lock()
+        self.queues = {}
+        self.order = deque()
+        self.running = 0
+        self.endpoint_running = {}
+
+    def submit(self, endpoint, func, *args, **kwargs):
+        future = concurrent.futures.Future()
+        with self.lock:
+            if endpoint not in self.queues:
+                self.queues[endpoint] = deque()
+                self.endpoint_running[endpoint] = 0
+                self.order.append(endpoint)
+            self.queues[endpoint].append((future, func, args, kwargs))
+            self._dispatch()
+        return future
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+    def _limit(self, endpoint):
+        return self.endpoint_limits.get(endpoint, self.endpoint_limit)
+
+    def _dispatch(self):
+        """Start queued tasks while there is room, called with the lock held"""
+        while self.running < self.max_workers:
+            task = self._next_task()
+            if task is None:
+                return
+            endpoint = task[0]
+            self.running += 1
+            self.endpoint_running[endpoint] += 1
+            self.executor.submit(self._run, *task)
+
+    def _next_task(self):
+        """Round robin over the endpoints that are below their limit"""
+        for _ in range(len(self.order)):
+            endpoint = self.order[0]
+            self.order.rotate(-1)
+            queue = self.queues[endpoint]
+            if queue and self.endpoint_running[endpoint] < self._limit(endpoint):
+                return (endpoint,) + queue.popleft()
+        return None
+
+    def _run(self, endpoint, future, func, args, kwargs):
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(func(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            with self.lock:
+                self.running -= 1
+                self.endpoint_running[endpoint] -= 1
+                self._dispatch()
+
+
+class ThrottleBackoff:
+    """Retry calls rejected with 429. The wait is shared per endpoint, so once
+    an endpoint throttles every thread calling it pauses, not only the caller."""
+
+    def __init__(self, max_retries=6, base_delay=1.0, max_delay=60.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lock = threading.Lock()
+        self.blocked_until = {}
+        self.throttled = 0
+
+    @staticmethod
+    def endpoint(func):
+        """Client class of a bound SDK method, e.g. ComputeClient"""
+        client = getattr(func, '__self__', None)
+        return type(client).__name__ if client is not None else getattr(func, '__name__', 'default')
+
+    def wrap(self, func):
+        def call(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+        return call
+
+    def call(self, func, *args, **kwargs):
+        return self.call_endpoint(self.endpoint(func), func, *args, **kwargs)
+
+    def call_endpoint(self, endpoint, func, *args, **kwargs):
+        attempt = 0
+        while True:
+            self._acquire(endpoint)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if getattr(e, 'status', None) != 429 or attempt >= self.max_retries:
+                    raise
+                self.throttle(endpoint, e, attempt)
+                attempt += 1
+                continue
+            self.succeeded(endpoint)
+            return result
+
+    def throttle(self, endpoint, error, attempt):
+        """Count a 429 of the endpoint and pause it, returns the seconds until the retry"""
+        delay = self.retry_delay(error, attempt)
+        with self.lock:
+            self.throttled += 1
+            self.blocked_until[endpoint] = max(self.blocked_until.get(endpoint, 0), time.time() + delay)
+        self._throttled(endpoint)
+        print(f"Throttled by {endpoint}, retrying in {delay:.1f}s", file=sys.stderr)
+        return delay
+
+    def retry_delay(self, error, attempt):
+        """Seconds to wait, the retry-after hint if present else jittered exponential backoff"""
+        headers = getattr(error, 'headers', None) or {}
+        for name in ('retry-after', 'Retry-After'):
+            if name in headers:
+                try:
+                    return min(self.max_delay, max(0.0, float(headers[name])))
+                except (TypeError, ValueError):
+                    break
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def reserve(self, endpoint):
+        """Seconds to wait before the next call of the endpoint, 0 when it may
+        start now. _acquire sleeps them, an event loop awaits them and asks again"""
+        with self.lock:
+            return max(0.0, self.blocked_until.get(endpoint, 0) - time.time())
+
+    def _acquire(self, endpoint):
+        while True:
+            delay = self.reserve(endpoint)
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def succeeded(self, endpoint):
+        pass
+
+    def _throttled(self, endpoint):
+        pass
+
+
+class AdaptiveRateLimiter(ThrottleBackoff):
+    """Token bucket per endpoint, calls wait for a token so an endpoint gets at
+    most its current rate of calls per second from all threads together.
+
+    Until the endpoint first throttles, each call that succeeds adds one call
+    per second so the rate doubles every second. After that a success raises
+    the rate a little, about `increase` calls per second for each second the
+    endpoint keeps up, a 429 multiplies it by `decrease`. Calls already in flight when the first 429 comes back see
+    the same overload, so the rate drops at most once per `cooldown` seconds.
+    Throttled calls are retried like ThrottleBackoff does."""
+
+    def __init__(self, rate=10.0, min_rate=0.5, max_rate=100.0, increase=1.0, decrease=0.5, cooldown=1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.initial_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.buckets = {}
+        self.sdk_call_api = None
+
+    def _bucket(self, endpoint):
+        """{rate, tokens, updated, decreased} of the endpoint, called with the lock held"""
+        bucket = self.buckets.get(endpoint)
+        if bucket is None:
+            bucket = self.buckets[endpoint] = {"rate": self.initial_rate, "tokens": 1.0, "updated": time.time(), "decreased": 0.0, "calls": 0, "throttled": 0}
+        return bucket
+
+    def reserve(self, endpoint):
+        delay = super().reserve(endpoint)
+        if delay > 0:
+            return delay
+
+        with self.lock:
+            bucket = self._bucket(endpoint)
+            now = time.time()
+
+            # up to one second of calls can be saved up
+            bucket["tokens"] = min(max(1.0, bucket["rate"]), bucket["tokens"] + (now - bucket["updated"]) * bucket["rate"])
+            bucket["updated"] = now
+            if bucket["tokens"] >= 1.0:
+                bucket["tokens"] -= 1.0
+                bucket["calls"] += 1
+                return 0.0
+            return (1.0 - bucket["tokens"]) / bucket["rate"]
+
+    def succeeded(self, endpoint):
+        with self.lock:
+            bucket = self._bucket(endpoint)
+            step = 1.0 if not bucket["throttled"] else self.increase / bucket["rate"]
+            bucket["rate"] = min(self.max_rate, bucket["rate"] + step)
+
+    def _throttled(self, endpoint):
+        with self.lock:
+            bucket = self._bucket(endpoint)
+            bucket["throttled"] += 1
+            now = time.time()
+            if now - bucket["decreased"] >= self.cooldown:
+                bucket["rate"] = max(self.min_rate, bucket["rate"] * self.decrease)
+                bucket["tokens"] = 0.0
+                bucket["decreased"] = now
+
+    def instrument(self, base_client, endpoint):
+        """Limit every call of one SDK client, the calls of all SDK methods go through call_api"""
+        call_api = base_client.call_api
+
+        def call_api_limited(*args, **kwargs):
+            return self.call_endpoint(endpoint, call_api, *args, **kwargs)
+
+        base_client.call_api = call_api_limited
+
+    def instrument_sdk(self):
+        """Limit the calls of every SDK client of the process until restore_sdk(),
+        the endpoint of a call is the region and service of its client"""
+        from oci.base_client import BaseClient
+        from oci_profile import region_of_endpoint
+        call_api = self.sdk_call_api = BaseClient.call_api
+        limiter = self
+
+        def call_api_limited(client, *args, **kwargs):
+            endpoint = f"{region_of_endpoint(client.endpoint)}/{client.service}"
+            return limiter.call_endpoint(endpoint, call_api, client, *args, **kwargs)
+
+        BaseClient.call_api = call_api_limited
+
+    def restore_sdk(self):
+        if self.sdk_call_api is not None:
+            from oci.base_client import BaseClient
+            BaseClient.call_api = self.sdk_call_api
+            self.sdk_call_api = None
+
+    def rates(self):
+        """{endpoint: {"rate", "calls", "throttled"}}, the current rate in calls per second"""
+        with self.lock:
+            return {endpoint: {"rate": round(bucket["rate"], 2), "calls": bucket["calls"], "throttled": bucket["throttled"]}
+                    for endpoint, bucket in sorted(self.buckets.items())}
+
+    def print_report(self, stream=sys.stderr):
+        rates = self.rates()
+        throttled = {endpoint: r for endpoint, r in rates.items() if r["throttled"]}
+        print(f"Rate limited {len(rates)} endpoints, {self.throttled} calls throttled", file=stream)
+        for endpoint, r in throttled.items():
+            print(f"  {endpoint:<40} {r['calls']:>6} calls, throttled {r['throttled']}, rate now {r['rate']:.1f}/s", file=stream)
+
+
+class SynchronizedList(list):
+    """List that can be appended to from discovery threads"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.lock = threading.Lock()
+
+    def append(self, item):
+        with self.lock:
+            super().append(item)
+
+    def extend(self, items):
+        with self.lock:
+            super().extend(items)
+
+
+##########################################################################
+# Benchmark - a local HTTP endpoint that answers 429 above its rate
+##########################################################################
+class HTTPStatusError(Exception):
+    """HTTP error carrying status and headers like oci.exceptions.ServiceError"""
+
+    def __init__(self, status, headers):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers
+
+
+def start_throttling_endpoint(capacity, latency, retry_after=None):
+    """HTTP server on localhost, every path accepts capacity calls per second
+    and answers the rest with 429, returns (server, url, stats)"""
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    lock = threading.Lock()
+    buckets = {}
+    stats = {"ok": 0, "throttled": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            with lock:
+                now = time.time()
+                tokens, updated = buckets.get(self.path, (capacity, now))
+                tokens = min(capacity, tokens + (now - updated) * capacity)
+                allowed = tokens >= 1.0
+                buckets[self.path] = (tokens - 1.0 if allowed else tokens, now)
+                stats["ok" if allowed else "throttled"] += 1
+
+            self.send_response(200 if allowed else 429)
+            if not allowed and retry_after is not None:
+                self.send_header("retry-after", str(retry_after))
+            self.send_header("content-length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}", stats
+
+
+def run_benchmark(workers=32, calls=25, endpoints=2, capacity=20.0, latency=0.02, retry_after=None, rate=10.0):
+    import urllib.request
+    import urllib.error
+
+    def get(url):
+        try:
+            with urllib.request.urlopen(url) as response:
+                return response.read()
+        except urllib.error.HTTPError as e:
+            raise HTTPStatusError(e.code, dict(e.headers))
+
+    modes = {
+        "plain": None,
+        "ThrottleBackoff": ThrottleBackoff(max_retries=10, base_delay=0.5),
+        "AdaptiveRateLimiter": AdaptiveRateLimiter(rate=rate, max_retries=10, base_delay=0.5)
+    }
+
+    print(f"Endpoint            : {endpoints} paths, {capacity:.0f} calls/s each, {latency * 1000:.0f}ms latency, retry-after {retry_after}")
+    print(f"Load                : {workers} threads x {calls} calls")
+    for name, limiter in modes.items():
+        server, url, stats = start_throttling_endpoint(capacity, latency, retry_after)
+        lost = []
+
+        def worker(i):
+            for j in range(calls):
+                path = f"/service{(i + j) % endpoints}"
+                try:
+                    if limiter:
+                        limiter.call_endpoint(path, get, url + path)
+                    else:
+                        get(url + path)
+                except Exception:
+                    lost.append(path)
+
+        start = time.time()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(worker, range(workers)))
+        elapsed = time.time() - start
+        server.shutdown()
+        server.server_close()
+
+        done = workers * calls - len(lost)
+        print(f"{name:<20}: {elapsed:6.2f}s, {done / elapsed:6.1f} calls/s, {stats['throttled']:>5} x 429, {len(lost)} calls lost")
+        if isinstance(limiter, AdaptiveRateLimiter):
+            print(f"{'':<22}rates now " + ", ".join(f"{endpoint} {r['rate']:.1f}/s" for endpoint, r in limiter.rates().items()))
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Compare throttle handling against a local endpoint that answers 429 above its rate')
+    parser.add_argument('--benchmark', action='store_true', help='Run the benchmark')
+    parser.add_argument('--workers', default=32, type=int, help='Threads calling the endpoint (default=32)')
+    parser.add_argument('--calls', default=25, type=int, help='Calls per thread (default=25)')
+    parser.add_argument('--endpoints', default=2, type=int, help='Service paths, each with its own rate (default=2)')
+    parser.add_argument('--capacity', default=20.0, type=float, help='Calls per second a path accepts (default=20)')
+    parser.add_argument('--latency', default=0.02, type=float, help='Seconds per call (default=0.02)')
+    parser.add_argument('--retry-after', default=None, type=float, help='retry-after seconds sent with 429 (default=none)')
+    parser.add_argument('--rate', default=10.0, type=float, help='Initial AdaptiveRateLimiter rate per endpoint (default=10)')
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        sys.exit(1)
+    run_benchmark(args.workers, args.calls, args.endpoints, args.capacity, args.latency, args.retry_after, args.rate)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Core resource discovery of oci-simple.py, shared with oci_worker.py
+
+discover()          - compute instances, block volumes, VCNs and subnets of
+                      every compartment, optionally in several regions, with
+                      the clients of a ClientRegistry so every call goes
+                      through its AdaptiveRateLimiter and CallProfile
+scan_compartments() - the list calls of those resource types per compartment
+
+    clients = ClientRegistry(config, limiter=AdaptiveRateLimiter())
+    result = discover(clients, config)
+
+oci-simple.py runs it once per process, the worker runs it for every job
+with the clients it keeps per credential.
+"""
+
+import sys
+from datetime import datetime
+from oci_stream import list_all
+from oci_regions import subscribed_regions, RegionScope, scan_regions, region_timing
+from oci_scheduler import SynchronizedList
+from oci_compartments import load_compartment_tree, DEFAULT_COMPARTMENT_DB, DEFAULT_COMPARTMENT_TTL
+
+RESOURCE_TYPES = ["compute_instances", "block_volumes", "vcns", "subnets"]
+
+
+def scan_compartments(clients, compartments, resources):
+    """Scan each compartment for basic resources"""
+    for compartment in compartments:
+        compartment_id = compartment.id
+        compartment_name = compartment.name
+
+        print(f"Scanning compartment: {compartment_name}", file=sys.stderr)
+
+        try:
+            # Compute Instances
+            instances = list_all(clients["compute"].list_instances, compartment_id=compartment_id)
+            for instance in instances:
+                shape_config_dict = None
+                if hasattr(instance, 'shape_config') and instance.shape_config:
+                    shape_config_dict = {
+                        "ocpus": getattr(instance.shape_config, 'ocpus', None),
+                        "memory_in_gbs": getattr(instance.shape_config, 'memory_in_gbs', None)
+                    }
+
+                resources["compute_instances"].append({
+                    "id": instance.id,
+                    "display_name": instance.display_name,
+                    "lifecycle_state": instance.lifecycle_state,
+                    "compartment_id": compartment_id,
+                    "compartment_name": compartment_name,
+                    "shape": instance.shape,
+                    "shape_config": shape_config_dict,
+                    "availability_domain": instance.availability_domain,
+                    "time_created": instance.time_created.isoformat() if instance.time_created else None
+                })
+
+            # Block Volumes
+            volumes = list_all(clients["blockstorage"].list_volumes, compartment_id=compartment_id)
+            for volume in volumes:
+                resources["block_volumes"].append({
+                    "id": volume.id,
+                    "display_name": volume.display_name,
+                    "lifecycle_state": volume.lifecycle_state,
+                    "compartment_id": compartment_id,
+                    "compartment_name": compartment_name,
+                    "size_in_gbs": volume.size_in_gbs,
+                    "availability_domain": volume.availability_domain,
+                    "time_created": volume.time_created.isoformat() if volume.time_created else None
+                })
+
+            # VCNs
+            vcns = list_all(clients["network"].list_vcns, compartment_id=compartment_id)
+            for vcn in vcns:
+                resources["vcns"].append({
+                    "id": vcn.id,
+                    "display_name": vcn.display_name,
+                    "lifecycle_state": vcn.lifecycle_state,
+                    "compartment_id": compartment_id,
+                    "compartment_name": compartment_name,
+                    "cidr_block": vcn.cidr_block,
+                    "time_created": vcn.time_created.isoformat() if vcn.time_created else None
+                })
+
+            # Subnets
+            subnets = list_all(clients["network"].list_subnets, compartment_id=compartment_id)
+            for subnet in subnets:
+                resources["subnets"].append({
+                    "id": subnet.id,
+                    "display_name": subnet.display_name,
+                    "lifecycle_state": subnet.lifecycle_state,
+                    "compartment_id": compartment_id,
+                    "compartment_name": compartment_name,
+                    "cidr_block": subnet.cidr_block,
+                    "availability_domain": subnet.availability_domain,
+                    "vcn_id": subnet.vcn_id,
+                    "time_created": subnet.time_created.isoformat() if subnet.time_created else None
+                })
+
+        except Exception as e:
+            print(f"Error scanning compartment {compartment_name}: {e}", file=sys.stderr)
+            continue
+
+
+def discover(clients, config, emitter=None, regions=None, compartment_db=DEFAULT_COMPARTMENT_DB,
+             compartment_ttl=DEFAULT_COMPARTMENT_TTL, profile=None):
+    """Result document of oci-simple.py. With an emitter the resources are
+    handed to it as they are read, regions scans those subscribed regions
+    at the same time and tags the records with their region"""
+
+    # Get compartments and the root compartment, from the cache while it is fresh
+    compartments = load_compartment_tree(clients["identity"], config["tenancy"], config["user"],
+                                         path=compartment_db, ttl=compartment_ttl).compartments
+
+    print(f"Found {len(compartments)} compartments to scan", file=sys.stderr)
+
+    resources = {resource_type: [] for resource_type in RESOURCE_TYPES}
+
+    # ndjson writes each resource as it is read instead of keeping it
+    if emitter:
+        resources = emitter.resources(resources)
+
+    # Scan each compartment for basic resources, in every region for regions
+    if regions:
+        if not emitter:
+            resources = {key: SynchronizedList() for key in resources}
+        scopes = RegionScope.for_regions(config, subscribed_regions(clients["identity"], config["tenancy"], regions), resources,
+                                         clients.signer, profile=profile, limiter=clients.limiter)
+        scan_regions(scopes, lambda scope: scan_compartments(scope.clients, compartments, scope.resources))
+    else:
+        scan_compartments(clients, compartments, resources)
+
+    # Calculate summary
+    total_resources = sum(len(resource_list) for resource_list in resources.values())
+    summary_by_service = {}
+    for service_type, resource_list in resources.items():
+        if resource_list:
+            summary_by_service[service_type] = len(resource_list)
+
+    result = {
+        "success": True,
+        "resources": resources,
+        "summary": {
+            "total_resources": total_resources,
+            "by_service": summary_by_service,
+            "compartments_scanned": len(compartments)
+        },
+        "metadata": {
+            "scan_time": datetime.now().isoformat(),
+            "region": config["region"],
+            "tenancy_id": config["tenancy"],
+            "provider": "oci"
+        }
+    }
+    if regions:
+        result["metadata"]["regions"] = [scope.region for scope in scopes]
+        result["metadata"]["region_timing"] = region_timing(scopes)
+
+    return result
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Local SQLite snapshot store for incremental OCI discovery
+
+Each scan scope (producer, tenancy and region) keeps the resources of its
+last scan - id, lifecycle_state, time_created, a content hash and the record -
+plus the Resource Search fingerprint of every (compartment, resource type)
+pair, so the next scan can fetch only the pairs that changed. The time of the
+last full scan is kept too, changes the search summaries do not show (shape
+or size) are picked up by a full rescan every DEFAULT_FULL_RESCAN_HOURS.
+"""
+
+import json
+import sqlite3
+import hashlib
+from datetime import datetime, timedelta
+
+DEFAULT_SNAPSHOT_DB = "oci-snapshots.db"
+DEFAULT_FULL_RESCAN_HOURS = 24
+
+
+def content_hash(record):
+    return hashlib.sha256(json.dumps(record, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def record_id(record):
+    """Resource id, records without one are keyed by content"""
+    return str(record.get("id") or content_hash(record))
+
+
+def compute_delta(previous, resources):
+    """Added, removed and changed records between two {resource_type: [records]} documents"""
+    delta = {"added": [], "removed": [], "changed": []}
+
+    for resource_type in sorted(set(previous) | set(resources)):
+        old = {record_id(r): r for r in previous.get(resource_type, [])}
+        new = {record_id(r): r for r in resources.get(resource_type, [])}
+
+        for rid, record in new.items():
+            if rid not in old:
+                delta["added"].append({"resource_type": resource_type, "id": rid, "resource": record})
+            elif content_hash(old[rid]) != content_hash(record):
+                delta["changed"].append({"resource_type": resource_type, "id": rid, "resource": record, "previous": old[rid]})
+
+        for rid, record in old.items():
+            if rid not in new:
+                delta["removed"].append({"resource_type": resource_type, "id": rid, "resource": record})
+
+    delta["counts"] = {key: len(delta[key]) for key in ("added", "removed", "changed")}
+    return delta
+
+
+class SnapshotStore:
+    def __init__(self, path=DEFAULT_SNAPSHOT_DB):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS resources (
+                scope TEXT NOT NULL,
+                resource_type TEXT NOT NULL,
+                id TEXT NOT NULL,
+                compartment_id TEXT,
+                lifecycle_state TEXT,
+                time_created TEXT,
+                content_hash TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (scope, resource_type, id)
+            );
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                scope TEXT NOT NULL,
+                compartment_id TEXT NOT NULL,
+                resource_type TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                PRIMARY KEY (scope, compartment_id, resource_type)
+            );
+            CREATE TABLE IF NOT EXISTS scans (
+                scope TEXT PRIMARY KEY,
+                scan_time TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS full_scans (
+                scope TEXT PRIMARY KEY,
+                scan_time TEXT NOT NULL
+            );
+        """)
+
+    def close(self):
+        self.db.close()
+
+    def last_scan(self, scope):
+        row = self.db.execute("SELECT scan_time FROM scans WHERE scope = ?", (scope,)).fetchone()
+        return row[0] if row else None
+
+    def last_full_scan(self, scope):
+        row = self.db.execute("SELECT scan_time FROM full_scans WHERE scope = ?", (scope,)).fetchone()
+        return row[0] if row else None
+
+    def full_rescan_due(self, scope, hours=DEFAULT_FULL_RESCAN_HOURS):
+        """True when the scope had no full scan in the last hours, hours 0 never forces one"""
+        if not hours:
+            return False
+        last = self.last_full_scan(scope)
+        return last is None or datetime.now() - datetime.fromisoformat(last) >= timedelta(hours=hours)
+
+    def load(self, scope):
+        """{resource_type: [records]} of the last scan"""
+        resources = {}
+        for resource_type, data in self.db.execute(
+                "SELECT resource_type, data FROM resources WHERE scope = ? ORDER BY rowid", (scope,)):
+            resources.setdefault(resource_type, []).append(json.loads(data))
+        return resources
+
+    def load_fingerprints(self, scope):
+        """{(compartment_id, resource_type): fingerprint} of the last scan"""
+        return {(compartment_id, resource_type): fingerprint for compartment_id, resource_type, fingerprint in self.db.execute(
+            "SELECT compartment_id, resource_type, fingerprint FROM fingerprints WHERE scope = ?", (scope,))}
+
+    def save(self, scope, resources, fingerprints=None, full=False):
+        """Replace the snapshot of the scope in one transaction, full records
+        the scan as a full scan"""
+        with self.db:
+            self.db.execute("DELETE FROM resources WHERE scope = ?", (scope,))
+            self.db.executemany(
+                "INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((scope, resource_type, record_id(r), r.get("compartment_id"), r.get("lifecycle_state"),
+                  r.get("time_created"), content_hash(r), json.dumps(r, default=str))
+                 for resource_type, records in resources.items() for r in records))
+
+            if fingerprints is not None:
+                self.db.execute("DELETE FROM fingerprints WHERE scope = ?", (scope,))
+                self.db.executemany(
+                    "INSERT INTO fingerprints VALUES (?, ?, ?, ?)",
+                    ((scope, compartment_id, resource_type, fingerprint)
+                     for (compartment_id, resource_type), fingerprint in fingerprints.items()))
+
+            scan_time = datetime.now().isoformat()
+            self.db.execute("INSERT OR REPLACE INTO scans VALUES (?, ?)", (scope, scan_time))
+            if full:
+                self.db.execute("INSERT OR REPLACE INTO full_scans VALUES (?, ?)", (scope, scan_time))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Shared paging and streaming helpers for the Cloudedze OCI discovery scripts
+
+list_all       - iterate every record of a paged OCI list call, one page in memory
+PagedResponse  - response stand-in whose .data iterates all pages
+NDJSONEmitter  - writes each converted resource as one JSON line as soon as it is appended
+
+NDJSON output lines:
+  {"type": "resource", "resource_type": "compute_instances", "data": {...}}
+  {"type": "result", "result": {"success": true, "summary": {...}, ...}}
+"""
+
+import json
+import sys
+import threading
+
+
+def list_all(list_func, *args, **kwargs):
+    """Yield every record of a paged OCI list call, following opc-next-page"""
+    kwargs = dict(kwargs)
+    while True:
+        response = list_func(*args, **kwargs)
+
+        # some services return a collection with the records under items
+        data = response.data
+        if hasattr(data, 'items') and not isinstance(data, (list, dict)):
+            data = data.items
+
+        for record in data:
+            yield record
+
+        if not response.has_next_page:
+            break
+        kwargs['page'] = response.next_page
+
+
+class PagedResponse:
+    """Response stand-in, .data iterates all pages lazily and len() counts what was read"""
+
+    def __init__(self, list_func, *args, **kwargs):
+        self.list_func = list_func
+        self.args = args
+        self.kwargs = kwargs
+        self.count = 0
+
+    @property
+    def data(self):
+        return self
+
+    def __iter__(self):
+        self.count = 0
+        for record in list_all(self.list_func, *self.args, **self.kwargs):
+            self.count += 1
+            yield record
+
+    def __len__(self):
+        return self.count
+
+
+def paginate(list_func, *args, **kwargs):
+    """Drop-in for client.list_x(...) where the caller reads .data"""
+    return PagedResponse(list_func, *args, **kwargs)
+
+
+class StreamedResourceList:
+    """List stand-in, appended resources are written out instead of kept"""
+
+    def __init__(self, emitter, resource_type):
+        self.emitter = emitter
+        self.resource_type = resource_type
+        self.count = 0
+
+    def append(self, resource):
+        self.emitter.emit(self, resource)
+
+    def extend(self, resources):
+        for resource in resources:
+            self.append(resource)
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+
+class NDJSONEmitter:
+    def __init__(self, stream=sys.stdout, flush_every=500):
+        self.stream = stream
+        self.flush_every = flush_every
+        self.pending = 0
+        self.lists = {}
+        self.lock = threading.Lock()
+
+    def resources(self, resources):
+        """Replace the empty lists of a resources dict with streamed lists"""
+        for resource_type in resources:
+            self.lists[resource_type] = StreamedResourceList(self, resource_type)
+        return dict(self.lists)
+
+    def emit(self, resource_list, resource):
+        line = json.dumps({"type": "resource", "resource_type": resource_list.resource_type, "data": resource}, default=str)
+
+        # discovery threads append concurrently, keep lines and counts whole
+        with self.lock:
+            self.stream.write(line + "\n")
+            resource_list.count += 1
+            self.pending += 1
+            if self.pending >= self.flush_every:
+                self.stream.flush()
+                self.pending = 0
+
+    def summary(self):
+        by_service = {name: len(items) for name, items in self.lists.items() if items}
+        return {"total_resources": sum(by_service.values()), "by_service": by_service}
+
+    def finish(self, result):
+        """Write the closing result line, resources were already streamed"""
+        result = {key: value for key, value in result.items() if key != "resources"}
+        self.stream.write(json.dumps({"type": "result", "result": result}, default=str) + "\n")
+        self.stream.flush()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Persistent OCI Discovery Worker for Cloudedze
+Keeps the OCI SDK imported and signed clients cached between jobs, the
+discovery itself is the one of oci-simple.py (oci_simple_discovery).
+
+Protocol: one JSON message per line on stdin/stdout, logs go to stderr.
+  -> {"id": "1", "operation": "health"}
+  <- {"id": "1", "type": "health", "status": "ready", ...}
+  -> {"id": "2", "operation": "validate" | "discover", "credentials": {...}}
+  <- {"id": "2", "type": "resources", "resource_type": "...", "items": [...]}  (discover only, streamed in batches)
+  <- {"id": "2", "type": "result", "result": {...}}
+  <- {"id": "2", "type": "error", "error": "..."}
+On start the worker writes {"type": "ready"} once the SDK is imported.
+"""
+
+import json
+import sys
+import os
+import time
+import hashlib
+import argparse
+import threading
+import subprocess
+import concurrent.futures
+from collections import OrderedDict
+import oci
+from oci_stream import StreamedResourceList
+from oci_clients import ClientRegistry
+from oci_scheduler import AdaptiveRateLimiter
+from oci_profile import CallProfile
+from oci_compartments import DEFAULT_COMPARTMENT_DB, DEFAULT_COMPARTMENT_TTL
+from oci_simple_discovery import discover
+
+MAX_CACHED_CLIENTS = 32
+RESOURCE_BATCH_SIZE = 500
+
+
+class OCIClientCache:
+    """ClientRegistry per credential fingerprint, least recently used evicted.
+    Each registry keeps the clients it created and has its own
+    AdaptiveRateLimiter, so a throttled tenancy slows only its own jobs."""
+
+    def __init__(self, max_entries=MAX_CACHED_CLIENTS, profile=None):
+        self.max_entries = max_entries
+        self.profile = profile
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(credentials):
+        """Stable hash of the fields that identify a signed client set"""
+        key = "|".join(str(credentials.get(field, "")) for field in ("tenancyId", "userId", "fingerprint", "region", "privateKey"))
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, credentials):
+        key = self.fingerprint(credentials)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+
+        clients = self._create_clients(credentials)
+
+        with self.lock:
+            self.entries[key] = clients
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return clients
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _create_clients(self, credentials):
+        """Clients are created on first use, the private key never touches disk"""
+        config = {
+            "user": credentials["userId"],
+            "fingerprint": credentials["fingerprint"],
+            "tenancy": credentials["tenancyId"],
+            "region": credentials["region"],
+            "key_content": credentials["privateKey"]
+        }
+        return ClientRegistry(config, profile=self.profile, limiter=AdaptiveRateLimiter())
+
+
+class JobEmitter:
+    """discover() emitter of one job, the resources are sent as
+    {"type": "resources"} messages of up to batch_size items of one type"""
+
+    def __init__(self, send, job_id, batch_size=RESOURCE_BATCH_SIZE):
+        self.send = send
+        self.job_id = job_id
+        self.batch_size = batch_size
+        self.lists = {}
+        self.batches = {}
+        self.lock = threading.Lock()
+
+    def resources(self, resources):
+        """Replace the empty lists of a resources dict with streamed lists"""
+        for resource_type in resources:
+            self.lists[resource_type] = StreamedResourceList(self, resource_type)
+        return dict(self.lists)
+
+    def emit(self, resource_list, resource):
+        with self.lock:
+            resource_list.count += 1
+            batch = self.batches.setdefault(resource_list.resource_type, [])
+            batch.append(resource)
+            if len(batch) < self.batch_size:
+                return
+            del self.batches[resource_list.resource_type]
+        self._send(resource_list.resource_type, batch)
+
+    def finish(self, result):
+        """Send what is left, returns the result without the streamed resources"""
+        with self.lock:
+            batches, self.batches = self.batches, {}
+        for resource_type, items in batches.items():
+            self._send(resource_type, items)
+        return {key: value for key, value in result.items() if key != "resources"}
+
+    def _send(self, resource_type, items):
+        self.send({"id": self.job_id, "type": "resources", "resource_type": resource_type, "items": items})
+
+
+class OCIDiscoveryWorker:
+    def __init__(self, max_jobs=4, output=sys.stdout, compartment_db=DEFAULT_COMPARTMENT_DB, compartment_ttl=DEFAULT_COMPARTMENT_TTL,
+                 profile=None):
+        self.output = output
+        self.output_lock = threading.Lock()
+        self.compartment_db = compartment_db
+        self.compartment_ttl = compartment_ttl
+        self.clients = OCIClientCache(profile=profile)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_jobs)
+        self.start_time = time.time()
+        self.jobs_completed = 0
+        self.jobs_running = 0
+        self.jobs_lock = threading.Lock()
+
+    def send(self, message):
+        line = json.dumps(message, default=str)
+        with self.output_lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def serve(self, input_stream=sys.stdin):
+        """Read jobs until stdin closes"""
+        self.send({"type": "ready", "pid": os.getpid(), "oci_sdk_version": oci.__version__})
+
+        for line in input_stream:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                message = json.loads(line)
+            except Exception as e:
+                self.send({"type": "error", "error": f"Invalid message: {e}"})
+                continue
+
+            # health is answered inline so it works while jobs are running
+            if message.get("operation") == "health":
+                self.send(self.health(message.get("id")))
+                continue
+
+            self.executor.submit(self.run_job, message)
+
+        self.executor.shutdown(wait=True)
+
+    def health(self, job_id=None):
+        with self.jobs_lock:
+            return {
+                "id": job_id,
+                "type": "health",
+                "status": "ready",
+                "pid": os.getpid(),
+                "uptime": round(time.time() - self.start_time, 3),
+                "jobs_running": self.jobs_running,
+                "jobs_completed": self.jobs_completed,
+                "cached_clients": len(self.clients)
+            }
+
+    def run_job(self, message):
+        job_id = message.get("id")
+        operation = message.get("operation", "discover")
+
+        with self.jobs_lock:
+            self.jobs_running += 1
+
+        try:
+            clients = self.clients.get(message["credentials"])
+
+            if operation == "validate":
+                result = validate(clients)
+            elif operation == "discover":
+                emitter = JobEmitter(self.send, job_id)
+                result = emitter.finish(discover(clients, clients.config, emitter,
+                                                 compartment_db=self.compartment_db, compartment_ttl=self.compartment_ttl))
+            else:
+                raise ValueError(f"Unknown operation {operation}")
+
+            self.send({"id": job_id, "type": "result", "result": result})
+
+        except Exception as e:
+            print(f"Job {job_id} failed: {e}", file=sys.stderr)
+            self.send({"id": job_id, "type": "error", "error": str(e)})
+
+        finally:
+            with self.jobs_lock:
+                self.jobs_running -= 1
+                self.jobs_completed += 1
+
+
+def validate(clients):
+    """Validate credentials with a single identity call"""
+    try:
+        clients["identity"].get_tenancy(tenancy_id=clients.config["tenancy"])
+        return {"success": True, "message": "Credentials validated successfully"}
+    except Exception as e:
+        return {"success": False, "error": f"Credential validation failed: {str(e)}"}
+
+
+def benchmark(credentials_file, operation, jobs):
+    """Compare one process per job (oci-simple.py) with jobs sent to a warm worker"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    with open(credentials_file, 'r') as f:
+        credentials = json.loads(f.read())
+
+    cold = []
+    for _ in range(jobs):
+        start = time.time()
+        subprocess.run(
+            [sys.executable, os.path.join(script_dir, "oci-simple.py"), "--credentials", credentials_file, "--operation", operation],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+        )
+        cold.append(time.time() - start)
+
+    start = time.time()
+    worker = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    worker.stdout.readline()
+    startup = time.time() - start
+
+    warm = []
+    for i in range(jobs):
+        start = time.time()
+        worker.stdin.write(json.dumps({"id": str(i), "operation": operation, "credentials": credentials}) + "\n")
+        worker.stdin.flush()
+        while True:
+            message = json.loads(worker.stdout.readline())
+            if message.get("type") in ("result", "error"):
+                break
+        warm.append(time.time() - start)
+
+    worker.stdin.close()
+    worker.wait()
+
+    def line(name, values):
+        return f"{name:<18}: first {values[0]:.2f}s, mean {sum(values) / len(values):.2f}s, min {min(values):.2f}s"
+
+    print(f"Operation         : {operation} x {jobs}")
+    print(line("Cold (per process)", cold))
+    print(f"Worker startup    : {startup:.2f}s")
+    print(line("Warm (worker)", warm))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Persistent OCI Discovery Worker')
+    parser.add_argument('--max-jobs', default=4, type=int, help='Jobs processed concurrently (default=4)')
+    parser.add_argument('--benchmark', action='store_true', help='Compare cold process and warm worker job latency')
+    parser.add_argument('--credentials', help='OCI credentials JSON file for --benchmark')
+    parser.add_argument('--operation', default='validate', choices=['validate', 'discover'], help='Operation for --benchmark')
+    parser.add_argument('--jobs', default=5, type=int, help='Jobs per path for --benchmark (default=5)')
+    parser.add_argument('--compartment-db', default=DEFAULT_COMPARTMENT_DB, help=f'Compartment tree cache shared by the scans (default={DEFAULT_COMPARTMENT_DB})')
+    parser.add_argument('--compartment-ttl', default=DEFAULT_COMPARTMENT_TTL, type=int, help=f'Seconds the cached compartment tree is used without listing the compartments, 0 lists them every scan (default={DEFAULT_COMPARTMENT_TTL})')
+    parser.add_argument('--call-profile', default='', help='Write the call profile of all jobs to this JSON file when stdin closes')
+    parser.add_argument('--call-profile-prom', default='', help='Write the call profile to this Prometheus text file, needs prometheus-client')
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        if not args.credentials:
+            parser.error("--benchmark requires --credentials")
+        benchmark(args.credentials, args.operation, args.jobs)
+        return
+
+    profile = CallProfile() if args.call_profile or args.call_profile_prom else None
+    OCIDiscoveryWorker(args.max_jobs, compartment_db=args.compartment_db, compartment_ttl=args.compartment_ttl, profile=profile).serve()
+    if profile:
+        profile.save(args.call_profile, args.call_profile_prom)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,22 +10,83 @@ import os
 import tempfile
 import argparse
 from datetime import datetime
+import hashlib
 import concurrent.futures
+import threading
 from threading import Thread
 import oci
 from oci.config import from_file
 from oci.signer import Signer
+from oci_stream import list_all, NDJSONEmitter
+from oci_scheduler import DiscoveryScheduler, AdaptiveRateLimiter, SynchronizedList
+from oci_snapshot import SnapshotStore, compute_delta, record_id, DEFAULT_SNAPSHOT_DB, DEFAULT_FULL_RESCAN_HOURS
+from oci_clients import ClientRegistry
+from oci_profile import CallProfile
+from oci_compartments import CompartmentCache, DEFAULT_COMPARTMENT_DB, DEFAULT_COMPARTMENT_TTL
+from oci_regions import parse_regions, subscribed_regions, RegionScope, region_timing
+from oci_relationships import RelationshipGraph
+from oci_async import AsyncDiscovery
 
 class CloudedzeShowOCI:
-    def __init__(self, config, credentials):
+    # Resource keys filled by each compartment discovery method
+    DISCOVERY_GROUPS = {
+        "compute": ["compute_instances", "images"],
+        "storage": ["block_volumes", "boot_volumes", "volume_groups", "backups", "object_storage_buckets"],
+        "network": ["vcns", "subnets", "security_lists", "route_tables", "internet_gateways", "nat_gateways",
+                    "service_gateways", "network_security_groups", "load_balancers"],
+        "database": ["autonomous_databases", "db_systems"],
+        "additional": ["functions", "containers", "kubernetes_clusters", "streams", "topics", "alarms", "budgets"],
+        "security": ["bastion_sessions", "certificates", "waas_policies"],
+        "developer": ["container_repositories", "api_gateways"]
+    }
+
+    # Resource Search types used to detect changes for incremental scans
+    SEARCH_TYPES = {
+        "Instance": "compute_instances",
+        "Image": "images",
+        "Volume": "block_volumes",
+        "BootVolume": "boot_volumes",
+        "VolumeGroup": "volume_groups",
+        "VolumeBackup": "backups",
+        "Bucket": "object_storage_buckets",
+        "Vcn": "vcns",
+        "Subnet": "subnets",
+        "SecurityList": "security_lists",
+        "RouteTable": "route_tables",
+        "InternetGateway": "internet_gateways",
+        "NatGateway": "nat_gateways",
+        "ServiceGateway": "service_gateways",
+        "NetworkSecurityGroup": "network_security_groups",
+        "LoadBalancer": "load_balancers",
+        "AutonomousDatabase": "autonomous_databases",
+        "DbSystem": "db_systems",
+        "FunctionsApplication": "functions",
+        "ContainerInstance": "containers",
+        "ClustersCluster": "kubernetes_clusters",
+        "Stream": "streams",
+        "OnsTopic": "topics",
+        "Alarm": "alarms",
+        "Bastion": "bastion_sessions",
+        "Certificate": "certificates",
+        "WaasPolicy": "waas_policies",
+        "ContainerRepo": "container_repositories",
+        "ApiGateway": "api_gateways"
+    }
+
+    # Resource Search summary fields in the fingerprints, a rename, retag or
+    # state change of a resource changes the fingerprint of its group
+    SEARCH_FINGERPRINT_FIELDS = ("identifier", "display_name", "lifecycle_state", "time_created", "availability_domain",
+                                 "defined_tags", "freeform_tags", "system_tags", "additional_details")
+
+    def __init__(self, config, credentials, emitter=None, max_workers=16, endpoint_workers=4, profile=None, api_rate=10.0,
+                 compartment_db=DEFAULT_COMPARTMENT_DB, compartment_ttl=DEFAULT_COMPARTMENT_TTL, compartment=None, compartment_recursive=False,
+                 relationships=False):
         self.config = config
         self.credentials = credentials
+        self.emitter = emitter
         self.tenancy_id = config["tenancy"]
         self.region = config["region"]
 
-        # Initialize core clients
-        self._init_clients()
-
         # Resource tracking
         self.resources = {
             "compute_instances": [],
@@ -67,189 +128,301 @@ class CloudedzeShowOCI:
             "application_dependencies": []
         }
 
-        # Compartment cache
+        # Stream resources as they are found instead of keeping them,
+        # otherwise keep them in lists the discovery threads can share
+        if self.emitter:
+            self.resources = self.emitter.resources(self.resources)
+        else:
+            self.resources = {key: SynchronizedList() for key in self.resources}
+
+        # Discovery tasks share a global worker budget, each service endpoint
+        # runs at most endpoint_workers of them. The calls of each region and
+        # client share a rate that adapts to 429s, throttled calls are retried
+        self.scheduler = DiscoveryScheduler(max_workers=max_workers, endpoint_limit=endpoint_workers)
+        self.limiter = AdaptiveRateLimiter(rate=api_rate)
+
+        # Service clients are created on first use with one shared signer, a
+        # client is called by at most endpoint_workers tasks at a time, with a
+        # profile every call is timed and counted
+        self.endpoint_workers = endpoint_workers
+        self.profile = profile
+        self.clients = ClientRegistry(config, pool_size=endpoint_workers, profile=profile, limiter=self.limiter)
+
+        # Regions to scan, each with its own clients, the config region by default
+        self.scopes = [RegionScope(self.region, self.clients, self.resources, tag=False)]
+        self.fan_out = False
+
+        # Compartment tree, shared with other scans through the cache file,
+        # optionally limited to one compartment (OCID, path or name)
+        self.compartment_db = compartment_db
+        self.compartment_ttl = compartment_ttl
+        self.compartment_filter = compartment
+        self.compartment_recursive = compartment_recursive
+        self.compartment_tree = None
         self.compartments = []
         self.compartment_map = {}
 
-    def _init_clients(self):
-        """Initialize all OCI service clients"""
+        # With relationships, attachments, private IPs and KMS keys are added
+        # to the records and the relationship graph is built from them after
+        # the discovery, it costs a call per subnet and bucket so it is opt-in
+        self.relationships = relationships
+        self.relationship_graph = None
+
+        # (compartment_id, group) of the discovery tasks that had an error, an
+        # incremental scan keeps their snapshot records and fingerprints out
+        self.task_state = threading.local()
+        self.failed_groups = set()
+        self.failed_lock = threading.Lock()
+
+    def discover_all_resources(self, regions=None):
+        """Main discovery method using parallel processing, in the config region
+        or in the subscribed regions given ("all" or names) at the same time"""
         try:
-            # Core clients
-            self.identity_client = oci.identity.IdentityClient(self.config)
-            self.compute_client = oci.core.ComputeClient(self.config)
-            self.blockstorage_client = oci.core.BlockstorageClient(self.config)
-            self.objectstorage_client = oci.object_storage.ObjectStorageClient(self.config)
-            self.database_client = oci.database.DatabaseClient(self.config)
-            self.load_balancer_client = oci.load_balancer.LoadBalancerClient(self.config)
-            self.virtual_network_client = oci.core.VirtualNetworkClient(self.config)
-
-            # Optional service clients (with error handling)
-            self._init_optional_clients()
-
-        except Exception as e:
-            print(f"Error initializing core clients: {e}", file=sys.stderr)
-            raise
+            # First, get all compartments, they are the same in every region
+            self._load_compartments()
 
-    def _init_optional_clients(self):
-        """Initialize optional service clients with error handling"""
-        try:
-            self.functions_client = oci.functions.FunctionsManagementClient(self.config)
-        except Exception:
-            self.functions_client = None
+            print(f"Found {len(self.compartments)} compartments to scan", file=sys.stderr)
 
-        try:
-            self.container_client = oci.container_instances.ContainerInstanceClient(self.config)
-        except Exception:
-            self.container_client = None
+            if regions:
+                self.fan_out = True
+                self.scopes = RegionScope.for_regions(
+                    self.config, subscribed_regions(self.clients["identity"], self.tenancy_id, regions),
+                    self.resources, self.clients.signer, self.endpoint_workers, self.profile, self.limiter)
 
-        try:
-            self.streaming_client = oci.streaming.StreamAdminClient(self.config)
-        except Exception:
-            self.streaming_client = None
+            # Queue every region x compartment x service task, the scheduler overlaps them
+            futures = []
+            for scope in self.scopes:
+                for compartment in self.compartments:
+                    futures.extend(self._discover_compartment_resources(compartment, scope=scope))
+            self._wait_for_discovery(futures)
 
-        try:
-            self.notification_client = oci.ons.NotificationControlPlaneClient(self.config)
-        except Exception:
-            self.notification_client = None
+            # Post-process and enrich data
+            self._enrich_resource_data()
 
-        try:
-            self.monitoring_client = oci.monitoring.MonitoringClient(self.config)
-        except Exception:
-            self.monitoring_client = None
+            return self._format_output()
 
-        try:
-            self.budget_client = oci.budget.BudgetClient(self.config)
-        except Exception:
-            self.budget_client = None
+        except Exception as e:
+            print(f"Error in resource discovery: {e}", file=sys.stderr)
+            raise
 
+    def discover_incremental(self, store, full_rescan_hours=DEFAULT_FULL_RESCAN_HOURS):
+        """Rescan only the compartment service groups whose Resource Search
+        summaries changed since the last snapshot, keep the snapshot records of
+        the others and add the delta against the snapshot to the output.
+        Everything is rescanned when the last full scan is full_rescan_hours
+        old, a group whose rescan had errors keeps its snapshot records and is
+        rescanned again next time."""
         try:
-            self.container_engine_client = oci.container_engine.ContainerEngineClient(self.config)
-        except Exception:
-            self.container_engine_client = None
+            self._load_compartments()
 
-        try:
-            self.artifacts_client = oci.artifacts.ArtifactsClient(self.config)
-        except Exception:
-            self.artifacts_client = None
+            scope = f"cloudedze:{self.tenancy_id}:{self.region}"
+            previous = store.load(scope)
+            previous_scan = store.last_scan(scope)
+            fingerprints = self._search_fingerprints()
+            full = not previous or fingerprints is None or store.full_rescan_due(scope, full_rescan_hours)
+            refresh = self._changed_groups(previous, store.load_fingerprints(scope), fingerprints, full)
+
+            print(f"Incremental scan since {previous_scan}: rescanning {len(refresh)} of "
+                  f"{len(self.compartments) * len(self.DISCOVERY_GROUPS)} compartment service groups"
+                  f"{' (full rescan)' if full else ''}", file=sys.stderr)
+
+            futures = []
+            for compartment in self.compartments:
+                groups = {group for compartment_id, group in refresh if compartment_id == compartment.id}
+                if groups:
+                    futures.extend(self._discover_compartment_resources(compartment, groups))
+            self._wait_for_discovery(futures)
+
+            # Snapshot records of the groups that were not rescanned are still
+            # current, the groups that failed keep the records they did not get.
+            # Records of compartments no longer in the tree are removed, a full
+            # rescan keeps only the records of failed groups
+            failed = set(self.failed_groups)
+            compartment_ids = {compartment.id for compartment in self.compartments}
+            for group, keys in self.DISCOVERY_GROUPS.items():
+                for key in keys:
+                    found = None
+                    for record in previous.get(key, []):
+                        pair = (record.get("compartment_id"), group)
+                        if pair[0] not in compartment_ids:
+                            continue
+                        if pair not in refresh and not full:
+                            self.resources[key].append(record)
+                        elif pair in failed:
+                            if found is None:
+                                found = {record_id(r) for r in self.resources[key]}
+                            if record_id(record) not in found:
+                                self.resources[key].append(record)
 
-        try:
-            self.apigateway_client = oci.apigateway.GatewayClient(self.config)
-        except Exception:
-            self.apigateway_client = None
+            self._enrich_resource_data()
 
-        try:
-            self.certificates_client = oci.certificates_management.CertificatesManagementClient(self.config)
-        except Exception:
-            self.certificates_client = None
+            # Without fingerprints a failed group differs from the next search and is rescanned
+            fingerprints = dict(fingerprints or {})
+            for compartment_id, group in failed:
+                for key in self.DISCOVERY_GROUPS[group]:
+                    fingerprints.pop((compartment_id, key), None)
+            if failed:
+                print(f"Incremental scan: {len(failed)} compartment service groups had errors, they are rescanned next time", file=sys.stderr)
+
+            delta = compute_delta(previous, self.resources)
+            store.save(scope, self.resources, fingerprints, full)
+
+            result = self._format_output()
+            result["delta"] = delta
+            result["incremental"] = {
+                "previous_scan": previous_scan,
+                "full_rescan": full,
+                "groups_rescanned": len(refresh),
+                "groups_failed": len(failed),
+                "groups_total": len(self.compartments) * len(self.DISCOVERY_GROUPS)
+            }
+            return result
 
-        try:
-            self.waas_client = oci.waas.WaasClient(self.config)
-        except Exception:
-            self.waas_client = None
+        except Exception as e:
+            print(f"Error in incremental resource discovery: {e}", file=sys.stderr)
+            raise
 
+    def _search_fingerprints(self):
+        """Hash of the Resource Search summaries per (compartment, resource key),
+        None when search is not available"""
         try:
-            self.bastion_client = oci.bastion.BastionClient(self.config)
-        except Exception:
-            self.bastion_client = None
+            search_client = self.clients["search"]
+            details = oci.resource_search.models.StructuredSearchDetails(
+                type="Structured",
+                query="query all resources",
+                matching_context_type="NONE"
+            )
 
-        try:
-            self.file_storage_client = oci.file_storage.FileStorageClient(self.config)
-        except Exception:
-            self.file_storage_client = None
+            entries = {}
+            for summary in self._list_all(search_client.search_resources, details, limit=1000):
+                key = self.SEARCH_TYPES.get(summary.resource_type)
+                if key:
+                    fields = {field: getattr(summary, field, None) for field in self.SEARCH_FINGERPRINT_FIELDS}
+                    entries.setdefault((summary.compartment_id, key), []).append(json.dumps(fields, sort_keys=True, default=str))
 
-        try:
-            self.vault_client = oci.vault.VaultsClient(self.config)
-        except Exception:
-            self.vault_client = None
+            return {
+                pair: hashlib.sha256("\n".join(sorted(values)).encode("utf-8")).hexdigest()
+                for pair, values in entries.items()
+            }
 
-    def discover_all_resources(self):
-        """Main discovery method using parallel processing"""
+        except Exception as e:
+            print(f"Resource Search unavailable, rescanning all compartments: {e}", file=sys.stderr)
+            return None
+
+    def _changed_groups(self, previous, old_fingerprints, fingerprints, full=False):
+        """(compartment_id, group) pairs to rescan, all of them when full"""
+        if full or not previous or fingerprints is None:
+            return {(compartment.id, group) for compartment in self.compartments for group in self.DISCOVERY_GROUPS}
+
+        key_groups = {key: group for group, keys in self.DISCOVERY_GROUPS.items() for key in keys}
+        refresh = set()
+        for compartment_id, key in set(old_fingerprints) | set(fingerprints):
+            if old_fingerprints.get((compartment_id, key)) != fingerprints.get((compartment_id, key)):
+                refresh.add((compartment_id, key_groups[key]))
+
+        # budgets are not indexed by Resource Search and live in the root compartment
+        searchable = set(self.SEARCH_TYPES.values())
+        for group, keys in self.DISCOVERY_GROUPS.items():
+            if any(key not in searchable for key in keys):
+                refresh.add((self.tenancy_id, group))
+
+        return refresh
+
+    def _wait_for_discovery(self, futures):
+        """Wait for all discoveries to complete"""
         try:
-            # First, get all compartments
-            self._load_compartments()
-
-            print(f"Found {len(self.compartments)} compartments to scan", file=sys.stderr)
-
-            # Use thread pool for parallel discovery
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                futures = []
-
-                for compartment in self.compartments:
-                    future = executor.submit(self._discover_compartment_resources, compartment)
-                    futures.append(future)
-
-                # Wait for all discoveries to complete
-                for future in concurrent.futures.as_completed(futures):
-                    try:
-                        future.result()
-                    except Exception as e:
-                        print(f"Error in compartment discovery: {e}", file=sys.stderr)
-
-            # Post-process and enrich data
-            self._enrich_resource_data()
-
-            return self._format_output()
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error in compartment discovery: {e}", file=sys.stderr)
+        finally:
+            self.scheduler.shutdown()
 
-        except Exception as e:
-            print(f"Error in resource discovery: {e}", file=sys.stderr)
-            raise
+        if self.limiter.throttled:
+            self.limiter.print_report()
+        self.clients.print_report()
 
     def _load_compartments(self):
-        """Load all compartments with caching"""
+        """Load all compartments and the root, from the compartment tree cache
+        while it is fresh"""
         try:
-            # Get all compartments
-            compartments_response = self.identity_client.list_compartments(
-                compartment_id=self.tenancy_id,
-                compartment_id_in_subtree=True,
-                access_level="ACCESSIBLE"
-            )
-
-            self.compartments = compartments_response.data
-
-            # Add root compartment
-            root_compartment = self.identity_client.get_compartment(
-                compartment_id=self.tenancy_id
-            ).data
-            self.compartments.append(root_compartment)
+            cache = CompartmentCache(self.compartment_db, self.compartment_ttl)
+            try:
+                self.compartment_tree = cache.load(self.clients["identity"], self.tenancy_id, self.config["user"])
+            finally:
+                cache.close()
 
             # Create compartment mapping
+            self.compartments = self.compartment_tree.compartments
             for comp in self.compartments:
                 self.compartment_map[comp.id] = comp.name
 
+            if self.compartment_filter:
+                self.compartments = self.compartment_tree.select(self.compartment_filter, self.compartment_recursive)
+                if not self.compartments:
+                    raise Exception(f"Compartment {self.compartment_filter} not found")
+
         except Exception as e:
             print(f"Error loading compartments: {e}", file=sys.stderr)
             raise
 
-    def _discover_compartment_resources(self, compartment):
-        """Discover all resources in a specific compartment"""
+    def _discover_compartment_resources(self, compartment, groups=None, scope=None):
+        """Queue the discovery of the resources in a specific compartment, all
+        groups unless given, in the region of scope (default the config
+        region), returns the futures"""
         compartment_id = compartment.id
         compartment_name = compartment.name
+        scope = scope or self.scopes[0]
 
         print(f"Scanning compartment: {compartment_name}", file=sys.stderr)
 
-        # Core resource discovery methods
+        # Core resource discovery methods and the service endpoint each one calls
         discovery_methods = [
-            self._discover_compute_resources,
-            self._discover_storage_resources,
-            self._discover_network_resources,
-            self._discover_database_resources,
-            self._discover_additional_services,
-            self._discover_security_resources,
-            self._discover_developer_services
+            ("compute", self._discover_compute_resources),
+            ("storage", self._discover_storage_resources),
+            ("network", self._discover_network_resources),
+            ("database", self._discover_database_resources),
+            ("additional", self._discover_additional_services),
+            ("security", self._discover_security_resources),
+            ("developer", self._discover_developer_services)
         ]
 
-        # Run discovery methods sequentially for this compartment
-        for method in discovery_methods:
-            try:
-                method(compartment_id, compartment_name)
-            except Exception as e:
-                print(f"Error in {method.__name__} for {compartment_name}: {e}", file=sys.stderr)
+        return [
+            self.scheduler.submit(f"{scope.region}/{endpoint}", self._run_discovery_method, endpoint, method, scope, compartment_id, compartment_name)
+            for endpoint, method in discovery_methods
+            if groups is None or endpoint in groups
+        ]
 
-    def _discover_compute_resources(self, compartment_id, compartment_name):
+    def _run_discovery_method(self, group, method, scope, compartment_id, compartment_name):
+        """Run one discovery method, errors are reported and do not stop the
+        scan, the group is marked failed when any of its calls failed"""
+        self.task_state.failed = False
+        try:
+            scope.run(method, scope, compartment_id, compartment_name)
+        except Exception as e:
+            self._discovery_error(f"Error in {method.__name__} for {compartment_name} in {scope.region}: {e}")
+        finally:
+            if self.task_state.failed:
+                with self.failed_lock:
+                    self.failed_groups.add((compartment_id, group))
+            self.task_state.failed = False
+
+    def _discovery_error(self, message):
+        """Report a failed discovery call of the running task"""
+        self.task_state.failed = True
+        print(message, file=sys.stderr)
+
+    def _list_all(self, list_func, *args, **kwargs):
+        """Page through a list call, the rate limiter under the clients retries throttled pages"""
+        return list_all(list_func, *args, **kwargs)
+
+    def _discover_compute_resources(self, scope, compartment_id, compartment_name):
         """Discover compute-related resources"""
         try:
             # Compute Instances
-            instances = self.compute_client.list_instances(compartment_id=compartment_id).data
+            instances = self._list_all(scope.clients["compute"].list_instances, compartment_id=compartment_id)
+            instance_records = []
             for instance in instances:
                 # Handle shape_config serialization
                 shape_config = getattr(instance, 'shape_config', None)
@@ -280,7 +453,7 @@ class CloudedzeShowOCI:
                         print(f"Error serializing source details: {e}", file=sys.stderr)
                         source_details_dict = {}
 
-                self.resources["compute_instances"].append({
+                instance_records.append({
                     "id": instance.id,
                     "display_name": instance.display_name,
                     "lifecycle_state": instance.lifecycle_state,
@@ -295,15 +468,19 @@ class CloudedzeShowOCI:
                     "freeform_tags": getattr(instance, 'freeform_tags', {})
                 })
 
+            if self.relationships and instance_records:
+                self._add_instance_attachments(scope, compartment_id, instance_records)
+            scope.resources["compute_instances"].extend(instance_records)
+
             # Images (limited for performance)
-            images = self.compute_client.list_images(
+            images = scope.clients["compute"].list_images(
                 compartment_id=compartment_id,
                 limit=50,
                 sort_by="TIMECREATED",
                 sort_order="DESC"
             ).data
             for image in images:
-                self.resources["images"].append({
+                scope.resources["images"].append({
                     "id": image.id,
                     "display_name": image.display_name,
                     "lifecycle_state": image.lifecycle_state,
@@ -315,15 +492,45 @@ class CloudedzeShowOCI:
                 })
 
         except Exception as e:
-            print(f"Error discovering compute resources in {compartment_name}: {e}", file=sys.stderr)
+            self._discovery_error(f"Error discovering compute resources in {compartment_name}: {e}")
+
+    def _add_instance_attachments(self, scope, compartment_id, instance_records):
+        """Add the attached VNICs, boot volume and volumes to the instance records,
+        one paged call per attachment type (boot volumes per availability domain)"""
+        try:
+            by_id = {record["id"]: record for record in instance_records}
+            for record in instance_records:
+                record["vnic_attachments"] = []
+                record["boot_volume_id"] = None
+                record["volume_ids"] = []
+
+            for attachment in self._list_all(scope.clients["compute"].list_vnic_attachments, compartment_id=compartment_id):
+                if attachment.instance_id in by_id and attachment.lifecycle_state == "ATTACHED":
+                    by_id[attachment.instance_id]["vnic_attachments"].append({
+                        "vnic_id": attachment.vnic_id,
+                        "subnet_id": attachment.subnet_id
+                    })
+
+            for attachment in self._list_all(scope.clients["compute"].list_volume_attachments, compartment_id=compartment_id):
+                if attachment.instance_id in by_id and attachment.lifecycle_state == "ATTACHED":
+                    by_id[attachment.instance_id]["volume_ids"].append(attachment.volume_id)
+
+            for availability_domain in sorted({record["availability_domain"] for record in instance_records if record["availability_domain"]}):
+                for attachment in self._list_all(scope.clients["compute"].list_boot_volume_attachments,
+                                                 availability_domain=availability_domain, compartment_id=compartment_id):
+                    if attachment.instance_id in by_id and attachment.lifecycle_state == "ATTACHED":
+                        by_id[attachment.instance_id]["boot_volume_id"] = attachment.boot_volume_id
+
+        except Exception as e:
+            self._discovery_error(f"Error discovering instance attachments in {compartment_id}: {e}")
 
-    def _discover_storage_resources(self, compartment_id, compartment_name):
+    def _discover_storage_resources(self, scope, compartment_id, compartment_name):
         """Discover storage-related resources"""
         try:
             # Block Volumes
-            volumes = self.blockstorage_client.list_volumes(compartment_id=compartment_id).data
+            volumes = self._list_all(scope.clients["blockstorage"].list_volumes, compartment_id=compartment_id)
             for volume in volumes:
-                self.resources["block_volumes"].append({
+                scope.resources["block_volumes"].append({
                     "id": volume.id,
                     "display_name": volume.display_name,
                     "lifecycle_state": volume.lifecycle_state,
@@ -331,15 +538,16 @@ class CloudedzeShowOCI:
                     "compartment_name": compartment_name,
                     "size_in_gbs": volume.size_in_gbs,
                     "availability_domain": volume.availability_domain,
+                    "kms_key_id": getattr(volume, 'kms_key_id', None),
                     "time_created": volume.time_created.isoformat() if volume.time_created else None,
                     "defined_tags": getattr(volume, 'defined_tags', {}),
                     "freeform_tags": getattr(volume, 'freeform_tags', {})
                 })
 
             # Boot Volumes
-            boot_volumes = self.blockstorage_client.list_boot_volumes(compartment_id=compartment_id).data
+            boot_volumes = self._list_all(scope.clients["blockstorage"].list_boot_volumes, compartment_id=compartment_id)
             for bv in boot_volumes:
-                self.resources["boot_volumes"].append({
+                scope.resources["boot_volumes"].append({
                     "id": bv.id,
                     "display_name": bv.display_name,
                     "lifecycle_state": bv.lifecycle_state,
@@ -347,13 +555,14 @@ class CloudedzeShowOCI:
                     "compartment_name": compartment_name,
                     "size_in_gbs": bv.size_in_gbs,
                     "availability_domain": bv.availability_domain,
+                    "kms_key_id": getattr(bv, 'kms_key_id', None),
                     "time_created": bv.time_created.isoformat() if bv.time_created else None
                 })
 
             # Volume Groups
-            volume_groups = self.blockstorage_client.list_volume_groups(compartment_id=compartment_id).data
+            volume_groups = self._list_all(scope.clients["blockstorage"].list_volume_groups, compartment_id=compartment_id)
             for vg in volume_groups:
-                self.resources["volume_groups"].append({
+                scope.resources["volume_groups"].append({
                     "id": vg.id,
                     "display_name": vg.display_name,
                     "lifecycle_state": vg.lifecycle_state,
@@ -364,9 +573,9 @@ class CloudedzeShowOCI:
                 })
 
             # Volume Backups
-            backups = self.blockstorage_client.list_volume_backups(compartment_id=compartment_id).data
+            backups = self._list_all(scope.clients["blockstorage"].list_volume_backups, compartment_id=compartment_id)
             for backup in backups:
-                self.resources["backups"].append({
+                scope.resources["backups"].append({
                     "id": backup.id,
                     "display_name": backup.display_name,
                     "lifecycle_state": backup.lifecycle_state,
@@ -378,13 +587,14 @@ class CloudedzeShowOCI:
                 })
 
             # Object Storage Buckets
-            namespace = self.objectstorage_client.get_namespace().data
-            buckets = self.objectstorage_client.list_buckets(
+            namespace = scope.clients["object_storage"].get_namespace().data
+            buckets = self._list_all(
+                scope.clients["object_storage"].list_buckets,
                 namespace_name=namespace,
                 compartment_id=compartment_id
-            ).data
+            )
             for bucket in buckets:
-                self.resources["object_storage_buckets"].append({
+                record = {
                     "id": f"{namespace}:{bucket.name}",
                     "name": bucket.name,
                     "namespace": namespace,
@@ -392,7 +602,16 @@ class CloudedzeShowOCI:
                     "compartment_name": compartment_name,
                     "time_created": bucket.time_created.isoformat() if bucket.time_created else None,
                     "etag": bucket.etag
-                })
+                }
+
+                # the bucket summary has no encryption key, it is only in get_bucket
+                if self.relationships:
+                    try:
+                        record["kms_key_id"] = scope.clients["object_storage"].get_bucket(namespace, bucket.name).data.kms_key_id
+                    except Exception as e:
+                        self._discovery_error(f"Error reading bucket {bucket.name}: {e}")
+
+                scope.resources["object_storage_buckets"].append(record)
 
             # File Systems (skip for now due to API requirements)
             # Note: File systems API requires availability_domain parameter
@@ -401,15 +620,15 @@ class CloudedzeShowOCI:
             pass
 
         except Exception as e:
-            print(f"Error discovering storage resources in {compartment_name}: {e}", file=sys.stderr)
+            self._discovery_error(f"Error discovering storage resources in {compartment_name}: {e}")
 
-    def _discover_network_resources(self, compartment_id, compartment_name):
+    def _discover_network_resources(self, scope, compartment_id, compartment_name):
         """Discover network-related resources"""
         try:
             # VCNs
-            vcns = self.virtual_network_client.list_vcns(compartment_id=compartment_id).data
+            vcns = self._list_all(scope.clients["network"].list_vcns, compartment_id=compartment_id)
             for vcn in vcns:
-                self.resources["vcns"].append({
+                scope.resources["vcns"].append({
                     "id": vcn.id,
                     "display_name": vcn.display_name,
                     "lifecycle_state": vcn.lifecycle_state,
@@ -422,9 +641,9 @@ class CloudedzeShowOCI:
                 })
 
             # Subnets
-            subnets = self.virtual_network_client.list_subnets(compartment_id=compartment_id).data
+            subnets = self._list_all(scope.clients["network"].list_subnets, compartment_id=compartment_id)
             for subnet in subnets:
-                self.resources["subnets"].append({
+                record = {
                     "id": subnet.id,
                     "display_name": subnet.display_name,
                     "lifecycle_state": subnet.lifecycle_state,
@@ -434,12 +653,22 @@ class CloudedzeShowOCI:
                     "availability_domain": subnet.availability_domain,
                     "vcn_id": subnet.vcn_id,
                     "time_created": subnet.time_created.isoformat() if subnet.time_created else None
-                })
+                }
+
+                # private IPs resolve load balancer backends to the VNIC and instance
+                if self.relationships:
+                    record["private_ips"] = {
+                        private_ip.ip_address: private_ip.vnic_id
+                        for private_ip in self._list_all(scope.clients["network"].list_private_ips, subnet_id=subnet.id)
+                        if private_ip.vnic_id
+                    }
+
+                scope.resources["subnets"].append(record)
 
             # Security Lists
-            security_lists = self.virtual_network_client.list_security_lists(compartment_id=compartment_id).data
+            security_lists = self._list_all(scope.clients["network"].list_security_lists, compartment_id=compartment_id)
             for sl in security_lists:
-                self.resources["security_lists"].append({
+                scope.resources["security_lists"].append({
                     "id": sl.id,
                     "display_name": sl.display_name,
                     "lifecycle_state": sl.lifecycle_state,
@@ -450,9 +679,9 @@ class CloudedzeShowOCI:
                 })
 
             # Route Tables
-            route_tables = self.virtual_network_client.list_route_tables(compartment_id=compartment_id).data
+            route_tables = self._list_all(scope.clients["network"].list_route_tables, compartment_id=compartment_id)
             for rt in route_tables:
-                self.resources["route_tables"].append({
+                scope.resources["route_tables"].append({
                     "id": rt.id,
                     "display_name": rt.display_name,
                     "lifecycle_state": rt.lifecycle_state,
@@ -463,9 +692,9 @@ class CloudedzeShowOCI:
                 })
 
             # Internet Gateways
-            internet_gateways = self.virtual_network_client.list_internet_gateways(compartment_id=compartment_id).data
+            internet_gateways = self._list_all(scope.clients["network"].list_internet_gateways, compartment_id=compartment_id)
             for ig in internet_gateways:
-                self.resources["internet_gateways"].append({
+                scope.resources["internet_gateways"].append({
                     "id": ig.id,
                     "display_name": ig.display_name,
                     "lifecycle_state": ig.lifecycle_state,
@@ -476,9 +705,9 @@ class CloudedzeShowOCI:
                 })
 
             # NAT Gateways
-            nat_gateways = self.virtual_network_client.list_nat_gateways(compartment_id=compartment_id).data
+            nat_gateways = self._list_all(scope.clients["network"].list_nat_gateways, compartment_id=compartment_id)
             for nat in nat_gateways:
-                self.resources["nat_gateways"].append({
+                scope.resources["nat_gateways"].append({
                     "id": nat.id,
                     "display_name": nat.display_name,
                     "lifecycle_state": nat.lifecycle_state,
@@ -489,9 +718,9 @@ class CloudedzeShowOCI:
                 })
 
             # Service Gateways
-            service_gateways = self.virtual_network_client.list_service_gateways(compartment_id=compartment_id).data
+            service_gateways = self._list_all(scope.clients["network"].list_service_gateways, compartment_id=compartment_id)
             for sg in service_gateways:
-                self.resources["service_gateways"].append({
+                scope.resources["service_gateways"].append({
                     "id": sg.id,
                     "display_name": sg.display_name,
                     "lifecycle_state": sg.lifecycle_state,
@@ -502,9 +731,9 @@ class CloudedzeShowOCI:
                 })
 
             # Network Security Groups
-            nsgs = self.virtual_network_client.list_network_security_groups(compartment_id=compartment_id).data
+            nsgs = self._list_all(scope.clients["network"].list_network_security_groups, compartment_id=compartment_id)
             for nsg in nsgs:
-                self.resources["network_security_groups"].append({
+                scope.resources["network_security_groups"].append({
                     "id": nsg.id,
                     "display_name": nsg.display_name,
                     "lifecycle_state": nsg.lifecycle_state,
@@ -515,9 +744,9 @@ class CloudedzeShowOCI:
                 })
 
             # Load Balancers
-            load_balancers = self.load_balancer_client.list_load_balancers(compartment_id=compartment_id).data
+            load_balancers = self._list_all(scope.clients["load_balancer"].list_load_balancers, compartment_id=compartment_id)
             for lb in load_balancers:
-                self.resources["load_balancers"].append({
+                scope.resources["load_balancers"].append({
                     "id": lb.id,
                     "display_name": lb.display_name,
                     "lifecycle_state": lb.lifecycle_state,
@@ -525,19 +754,25 @@ class CloudedzeShowOCI:
                     "compartment_name": compartment_name,
                     "shape_name": lb.shape_name,
                     "shape_details": getattr(lb, 'shape_details', None),
+                    "subnet_ids": getattr(lb, 'subnet_ids', None),
+                    "backends": [
+                        {"backend_set": name, "ip_address": backend.ip_address, "port": backend.port}
+                        for name, backend_set in (getattr(lb, 'backend_sets', None) or {}).items()
+                        for backend in backend_set.backends or []
+                    ],
                     "time_created": lb.time_created.isoformat() if lb.time_created else None
                 })
 
         except Exception as e:
-            print(f"Error discovering network resources in {compartment_name}: {e}", file=sys.stderr)
+            self._discovery_error(f"Error discovering network resources in {compartment_name}: {e}")
 
-    def _discover_database_resources(self, compartment_id, compartment_name):
+    def _discover_database_resources(self, scope, compartment_id, compartment_name):
         """Discover database-related resources"""
         try:
             # Autonomous Databases
-            autonomous_dbs = self.database_client.list_autonomous_databases(compartment_id=compartment_id).data
+            autonomous_dbs = self._list_all(scope.clients["database"].list_autonomous_databases, compartment_id=compartment_id)
             for adb in autonomous_dbs:
-                self.resources["autonomous_databases"].append({
+                scope.resources["autonomous_databases"].append({
                     "id": adb.id,
                     "display_name": adb.display_name,
                     "lifecycle_state": adb.lifecycle_state,
@@ -551,9 +786,9 @@ class CloudedzeShowOCI:
                 })
 
             # DB Systems
-            db_systems = self.database_client.list_db_systems(compartment_id=compartment_id).data
+            db_systems = self._list_all(scope.clients["database"].list_db_systems, compartment_id=compartment_id)
             for db_system in db_systems:
-                self.resources["db_systems"].append({
+                scope.resources["db_systems"].append({
                     "id": db_system.id,
                     "display_name": db_system.display_name,
                     "lifecycle_state": db_system.lifecycle_state,
@@ -565,17 +800,17 @@ class CloudedzeShowOCI:
                 })
 
         except Exception as e:
-            print(f"Error discovering database resources in {compartment_name}: {e}", file=sys.stderr)
+            self._discovery_error(f"Error discovering database resources in {compartment_name}: {e}")
 
-    def _discover_additional_services(self, compartment_id, compartment_name):
+    def _discover_additional_services(self, scope, compartment_id, compartment_name):
         """Discover additional OCI services"""
         try:
             # Functions
-            if self.functions_client:
+            if "functions" in scope.clients:
                 try:
-                    functions = self.functions_client.list_applications(compartment_id=compartment_id).data
+                    functions = self._list_all(scope.clients["functions"].list_applications, compartment_id=compartment_id)
                     for func in functions:
-                        self.resources["functions"].append({
+                        scope.resources["functions"].append({
                             "id": func.id,
                             "display_name": func.display_name,
                             "lifecycle_state": func.lifecycle_state,
@@ -584,17 +819,14 @@ class CloudedzeShowOCI:
                             "time_created": func.time_created.isoformat() if func.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering functions: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering functions: {e}")
 
             # Container Instances
-            if self.container_client:
+            if "container_instances" in scope.clients:
                 try:
-                    container_response = self.container_client.list_container_instances(compartment_id=compartment_id)
-                    containers = getattr(container_response, 'data', [])
-                    if hasattr(containers, 'items'):
-                        containers = containers.items
+                    containers = self._list_all(scope.clients["container_instances"].list_container_instances, compartment_id=compartment_id)
                     for container in containers:
-                        self.resources["containers"].append({
+                        scope.resources["containers"].append({
                             "id": container.id,
                             "display_name": container.display_name,
                             "lifecycle_state": container.lifecycle_state,
@@ -603,14 +835,14 @@ class CloudedzeShowOCI:
                             "time_created": container.time_created.isoformat() if container.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering container instances: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering container instances: {e}")
 
             # Kubernetes Clusters
-            if self.container_engine_client:
+            if "container_engine" in scope.clients:
                 try:
-                    clusters = self.container_engine_client.list_clusters(compartment_id=compartment_id).data
+                    clusters = self._list_all(scope.clients["container_engine"].list_clusters, compartment_id=compartment_id)
                     for cluster in clusters:
-                        self.resources["kubernetes_clusters"].append({
+                        scope.resources["kubernetes_clusters"].append({
                             "id": cluster.id,
                             "name": cluster.name,
                             "lifecycle_state": cluster.lifecycle_state,
@@ -620,14 +852,14 @@ class CloudedzeShowOCI:
                             "time_created": cluster.time_created.isoformat() if cluster.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering Kubernetes clusters: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering Kubernetes clusters: {e}")
 
             # Streaming
-            if self.streaming_client:
+            if "streaming" in scope.clients:
                 try:
-                    streams = self.streaming_client.list_streams(compartment_id=compartment_id).data
+                    streams = self._list_all(scope.clients["streaming"].list_streams, compartment_id=compartment_id)
                     for stream in streams:
-                        self.resources["streams"].append({
+                        scope.resources["streams"].append({
                             "id": stream.id,
                             "display_name": stream.name,
                             "lifecycle_state": stream.lifecycle_state,
@@ -636,14 +868,14 @@ class CloudedzeShowOCI:
                             "time_created": stream.time_created.isoformat() if stream.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering streams: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering streams: {e}")
 
             # Notifications
-            if self.notification_client:
+            if "notifications" in scope.clients:
                 try:
-                    topics = self.notification_client.list_topics(compartment_id=compartment_id).data
+                    topics = self._list_all(scope.clients["notifications"].list_topics, compartment_id=compartment_id)
                     for topic in topics:
-                        self.resources["topics"].append({
+                        scope.resources["topics"].append({
                             "id": topic.topic_id,
                             "display_name": topic.name,
                             "lifecycle_state": topic.lifecycle_state,
@@ -652,18 +884,18 @@ class CloudedzeShowOCI:
                             "time_created": topic.time_created.isoformat() if topic.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering notification topics: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering notification topics: {e}")
 
             # Monitoring Alarms
-            if self.monitoring_client:
+            if "monitoring" in scope.clients:
                 try:
-                    alarms = self.monitoring_client.list_alarms(compartment_id=compartment_id).data
+                    alarms = self._list_all(scope.clients["monitoring"].list_alarms, compartment_id=compartment_id)
                     for alarm in alarms:
                         # Handle missing time_created attribute
                         time_created = getattr(alarm, 'time_created', None)
                         time_created_str = time_created.isoformat() if time_created else None
 
-                        self.resources["alarms"].append({
+                        scope.resources["alarms"].append({
                             "id": alarm.id,
                             "display_name": alarm.display_name,
                             "lifecycle_state": alarm.lifecycle_state,
@@ -672,14 +904,14 @@ class CloudedzeShowOCI:
                             "time_created": time_created_str
                         })
                 except Exception as e:
-                    print(f"Error discovering monitoring alarms: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering monitoring alarms: {e}")
 
-            # Budgets
-            if self.budget_client:
+            # Budgets, they live in the root compartment
+            if compartment_id == self.tenancy_id and "budget" in scope.clients:
                 try:
-                    budgets = self.budget_client.list_budgets(compartment_id=compartment_id).data
+                    budgets = self._list_all(scope.clients["budget"].list_budgets, compartment_id=compartment_id)
                     for budget in budgets:
-                        self.resources["budgets"].append({
+                        scope.resources["budgets"].append({
                             "id": budget.id,
                             "display_name": budget.display_name,
                             "lifecycle_state": budget.lifecycle_state,
@@ -688,20 +920,20 @@ class CloudedzeShowOCI:
                             "time_created": budget.time_created.isoformat() if budget.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering budgets: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering budgets: {e}")
 
         except Exception as e:
-            print(f"Error discovering additional services in {compartment_name}: {e}", file=sys.stderr)
+            self._discovery_error(f"Error discovering additional services in {compartment_name}: {e}")
 
-    def _discover_security_resources(self, compartment_id, compartment_name):
+    def _discover_security_resources(self, scope, compartment_id, compartment_name):
         """Discover security-related resources"""
         try:
             # Bastion Sessions
-            if self.bastion_client:
+            if "bastion" in scope.clients:
                 try:
-                    bastions = self.bastion_client.list_bastions(compartment_id=compartment_id).data
+                    bastions = self._list_all(scope.clients["bastion"].list_bastions, compartment_id=compartment_id)
                     for bastion in bastions:
-                        self.resources["bastion_sessions"].append({
+                        scope.resources["bastion_sessions"].append({
                             "id": bastion.id,
                             "name": bastion.name,
                             "lifecycle_state": bastion.lifecycle_state,
@@ -710,17 +942,14 @@ class CloudedzeShowOCI:
                             "time_created": bastion.time_created.isoformat() if bastion.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering bastion sessions: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering bastion sessions: {e}")
 
             # Certificates
-            if self.certificates_client:
+            if "certificates" in scope.clients:
                 try:
-                    cert_response = self.certificates_client.list_certificates(compartment_id=compartment_id)
-                    certificates = getattr(cert_response, 'data', [])
-                    if hasattr(certificates, 'items'):
-                        certificates = certificates.items
+                    certificates = self._list_all(scope.clients["certificates"].list_certificates, compartment_id=compartment_id)
                     for cert in certificates:
-                        self.resources["certificates"].append({
+                        scope.resources["certificates"].append({
                             "id": cert.id,
                             "name": cert.name,
                             "lifecycle_state": cert.lifecycle_state,
@@ -729,14 +958,14 @@ class CloudedzeShowOCI:
                             "time_created": cert.time_created.isoformat() if cert.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering certificates: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering certificates: {e}")
 
             # WAAS Policies
-            if self.waas_client:
+            if "waas" in scope.clients:
                 try:
-                    waas_policies = self.waas_client.list_waas_policies(compartment_id=compartment_id).data
+                    waas_policies = self._list_all(scope.clients["waas"].list_waas_policies, compartment_id=compartment_id)
                     for policy in waas_policies:
-                        self.resources["waas_policies"].append({
+                        scope.resources["waas_policies"].append({
                             "id": policy.id,
                             "display_name": policy.display_name,
                             "lifecycle_state": policy.lifecycle_state,
@@ -745,7 +974,7 @@ class CloudedzeShowOCI:
                             "time_created": policy.time_created.isoformat() if policy.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering WAAS policies: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering WAAS policies: {e}")
 
             # Vault Secrets (skip for now due to API compatibility)
             # Note: Vault client API structure has changed
@@ -753,20 +982,17 @@ class CloudedzeShowOCI:
             pass
 
         except Exception as e:
-            print(f"Error discovering security resources in {compartment_name}: {e}", file=sys.stderr)
+            self._discovery_error(f"Error discovering security resources in {compartment_name}: {e}")
 
-    def _discover_developer_services(self, compartment_id, compartment_name):
+    def _discover_developer_services(self, scope, compartment_id, compartment_name):
         """Discover developer-related services"""
         try:
             # Container Repositories
-            if self.artifacts_client:
+            if "artifacts" in scope.clients:
                 try:
-                    repo_response = self.artifacts_client.list_container_repositories(compartment_id=compartment_id)
-                    repos = getattr(repo_response, 'data', [])
-                    if hasattr(repos, 'items'):
-                        repos = repos.items
+                    repos = self._list_all(scope.clients["artifacts"].list_container_repositories, compartment_id=compartment_id)
                     for repo in repos:
-                        self.resources["container_repositories"].append({
+                        scope.resources["container_repositories"].append({
                             "id": repo.id,
                             "display_name": repo.display_name,
                             "lifecycle_state": repo.lifecycle_state,
@@ -775,17 +1001,14 @@ class CloudedzeShowOCI:
                             "time_created": repo.time_created.isoformat() if repo.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering container repositories: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering container repositories: {e}")
 
             # API Gateways
-            if self.apigateway_client:
+            if "gateway" in scope.clients:
                 try:
-                    gateway_response = self.apigateway_client.list_gateways(compartment_id=compartment_id)
-                    gateways = getattr(gateway_response, 'data', [])
-                    if hasattr(gateways, 'items'):
-                        gateways = gateways.items
+                    gateways = self._list_all(scope.clients["gateway"].list_gateways, compartment_id=compartment_id)
                     for gateway in gateways:
-                        self.resources["api_gateways"].append({
+                        scope.resources["api_gateways"].append({
                             "id": gateway.id,
                             "display_name": gateway.display_name,
                             "lifecycle_state": gateway.lifecycle_state,
@@ -794,16 +1017,16 @@ class CloudedzeShowOCI:
                             "time_created": gateway.time_created.isoformat() if gateway.time_created else None
                         })
                 except Exception as e:
-                    print(f"Error discovering API gateways: {e}", file=sys.stderr)
+                    self._discovery_error(f"Error discovering API gateways: {e}")
 
         except Exception as e:
-            print(f"Error discovering developer services in {compartment_name}: {e}", file=sys.stderr)
+            self._discovery_error(f"Error discovering developer services in {compartment_name}: {e}")
 
     def _discover_identity_resources(self):
         """Discover identity resources (only for root compartment)"""
         try:
             # Users
-            users = self.identity_client.list_users(compartment_id=self.tenancy_id).data
+            users = self._list_all(self.clients["identity"].list_users, compartment_id=self.tenancy_id)
             for user in users:
                 self.resources["users"].append({
                     "id": user.id,
@@ -815,7 +1038,7 @@ class CloudedzeShowOCI:
                 })
 
             # Groups
-            groups = self.identity_client.list_groups(compartment_id=self.tenancy_id).data
+            groups = self._list_all(self.clients["identity"].list_groups, compartment_id=self.tenancy_id)
             for group in groups:
                 self.resources["groups"].append({
                     "id": group.id,
@@ -827,7 +1050,7 @@ class CloudedzeShowOCI:
                 })
 
             # Dynamic Groups
-            dynamic_groups = self.identity_client.list_dynamic_groups(compartment_id=self.tenancy_id).data
+            dynamic_groups = self._list_all(self.clients["identity"].list_dynamic_groups, compartment_id=self.tenancy_id)
             for dg in dynamic_groups:
                 self.resources["dynamic_groups"].append({
                     "id": dg.id,
@@ -839,7 +1062,7 @@ class CloudedzeShowOCI:
                 })
 
             # Policies
-            policies = self.identity_client.list_policies(compartment_id=self.tenancy_id).data
+            policies = self._list_all(self.clients["identity"].list_policies, compartment_id=self.tenancy_id)
             for policy in policies:
                 self.resources["policies"].append({
                     "id": policy.id,
@@ -862,12 +1085,16 @@ class CloudedzeShowOCI:
         self._add_resource_relationships()
 
     def _add_resource_relationships(self):
-        """Add relationships between resources"""
-        # This could include things like:
-        # - Which instances are in which subnets
-        # - Which volumes are attached to which instances
-        # - etc.
-        pass
+        """Build the relationship graph of the discovered resources in one pass,
+        streamed resources are not kept and carry their relationship fields only"""
+        if not self.relationships or self.emitter:
+            return
+
+        try:
+            self.relationship_graph = RelationshipGraph.build(self.resources)
+            print(f"Relationships: {len(self.relationship_graph.edges)} edges", file=sys.stderr)
+        except Exception as e:
+            print(f"Error building resource relationships: {e}", file=sys.stderr)
 
     def _format_output(self):
         """Format the final output"""
@@ -880,7 +1107,7 @@ class CloudedzeShowOCI:
             if resource_list:
                 summary_by_service[service_type] = len(resource_list)
 
-        return {
+        result = {
             "success": True,
             "resources": self.resources,
             "summary": {
@@ -896,13 +1123,53 @@ class CloudedzeShowOCI:
             }
         }
 
+        # Region fan-out, slow regions show up first in the timing
+        if self.fan_out:
+            result["metadata"]["regions"] = [scope.region for scope in self.scopes]
+            result["metadata"]["region_timing"] = region_timing(self.scopes)
+
+        # Call rate each endpoint ended with, lower than the start where it throttled
+        result["metadata"]["api_rates"] = self.limiter.rates()
+
+        # Edges as [source, relation, target], see oci_relationships
+        if self.relationship_graph:
+            result["relationships"] = self.relationship_graph.to_dict()
+
+        return result
+
 
 def main():
     parser = argparse.ArgumentParser(description='Enhanced OCI Resource Discovery for Cloudedze')
     parser.add_argument('--credentials', required=True, help='OCI credentials JSON file or JSON string')
     parser.add_argument('--operation', default='discover', help='Operation to perform (discover, validate)')
+    parser.add_argument('--format', default='json', choices=['json', 'ndjson'], help='Output format, ndjson streams one resource per line')
+    parser.add_argument('--workers', default=16, type=int, help='Discovery calls in flight across all services (default=16)')
+    parser.add_argument('--endpoint-workers', default=4, type=int, help='Discovery calls in flight per service endpoint (default=4)')
+    parser.add_argument('--incremental', action='store_true', help='Rescan only what changed since the last snapshot, output includes the delta')
+    parser.add_argument('--snapshot-db', default=DEFAULT_SNAPSHOT_DB, help=f'Snapshot database for --incremental (default={DEFAULT_SNAPSHOT_DB})')
+    parser.add_argument('--full-rescan-hours', default=DEFAULT_FULL_RESCAN_HOURS, type=float, help=f'With --incremental, rescan everything when the last full scan is this old, 0 never forces one (default={DEFAULT_FULL_RESCAN_HOURS})')
+    parser.add_argument('--regions', default='', help='Scan these subscribed regions at the same time, "all" or comma separated, records are tagged with region (default=config region)')
+    parser.add_argument('--api-rate', default=10.0, type=float, help='Initial OCI API calls per second per region and service (per service host with --engine async), adapts to 429 TooManyRequests (default=10)')
+    parser.add_argument('--compartment', default='', help='Scan only this compartment, OCID, path (i.e. "Adi / Sub") or name')
+    parser.add_argument('--compartment-recursive', action='store_true', help='With --compartment, also scan its sub compartments')
+    parser.add_argument('--compartment-db', default=DEFAULT_COMPARTMENT_DB, help=f'Compartment tree cache shared by the scans (default={DEFAULT_COMPARTMENT_DB})')
+    parser.add_argument('--compartment-ttl', default=DEFAULT_COMPARTMENT_TTL, type=int, help=f'Seconds the cached compartment tree is used without listing the compartments, 0 lists them every scan (default={DEFAULT_COMPARTMENT_TTL})')
+    parser.add_argument('--relationships', action='store_true', help='Read the attachments, private IPs and bucket encryption keys, one more call per subnet and bucket, and output the resource relationship graph')
+    parser.add_argument('--engine', default='threads', choices=['threads', 'async'], help='threads runs the SDK calls on the scheduler thread pool, async issues the signed REST calls from one event loop (default=threads)')
+    parser.add_argument('--connections', default=64, type=int, help='With --engine async, HTTP connections in total (default=64)')
+    parser.add_argument('--host-connections', default=16, type=int, help='With --engine async, HTTP connections per service host (default=16)')
+    parser.add_argument('--call-profile', default='', help='Write the per call latency and count profile of the OCI API calls to this JSON file')
+    parser.add_argument('--call-profile-prom', default='', help='Write the call profile to this Prometheus text file, needs prometheus-client')
 
     args = parser.parse_args()
+    if args.incremental and args.format == 'ndjson':
+        parser.error("--incremental needs the full resource set and does not support --format ndjson")
+    if args.incremental and args.regions:
+        parser.error("--incremental scans the config region only and does not support --regions")
+    if args.incremental and args.compartment:
+        parser.error("--incremental keeps a snapshot of the whole tenancy and does not support --compartment")
+    if args.engine == 'async' and (args.incremental or args.regions):
+        parser.error("--engine async scans the config region in full and does not support --incremental or --regions")
 
     try:
         # Parse credentials
@@ -932,21 +1199,45 @@ def main():
             print(f"Starting enhanced OCI discovery for tenancy {config['tenancy'][:20]}... in region {config['region']}", file=sys.stderr)
 
             # Create and run discovery service
-            discovery_service = CloudedzeShowOCI(config, credentials)
+            emitter = NDJSONEmitter() if args.format == 'ndjson' else None
+            profile = CallProfile() if args.call_profile or args.call_profile_prom else None
+            if args.engine == 'async' and args.operation != 'validate':
+                # Signed REST calls issued concurrently from one event loop, no SDK clients or thread pool
+                discovery_service = AsyncDiscovery(config, emitter, args.connections, args.host_connections,
+                                                   compartment=args.compartment or None, compartment_recursive=args.compartment_recursive,
+                                                   relationships=args.relationships, profile=profile, api_rate=args.api_rate,
+                                                   compartment_db=args.compartment_db, compartment_ttl=args.compartment_ttl)
+            else:
+                discovery_service = CloudedzeShowOCI(config, credentials, emitter, args.workers, args.endpoint_workers, profile, args.api_rate,
+                                                     args.compartment_db, args.compartment_ttl, args.compartment, args.compartment_recursive,
+                                                     args.relationships)
 
             if args.operation == 'validate':
                 # Just validate credentials
                 try:
-                    discovery_service.identity_client.get_tenancy(tenancy_id=config["tenancy"])
+                    discovery_service.clients["identity"].get_tenancy(tenancy_id=config["tenancy"])
                     result = {"success": True, "message": "Credentials validated successfully"}
                 except Exception as e:
                     result = {"success": False, "error": f"Credential validation failed: {str(e)}"}
+            elif args.incremental:
+                store = SnapshotStore(args.snapshot_db)
+                try:
+                    result = discovery_service.discover_incremental(store, args.full_rescan_hours)
+                finally:
+                    store.close()
+            elif args.engine == 'async':
+                result = discovery_service.run()
             else:
                 # Perform full discovery
-                result = discovery_service.discover_all_resources()
+                result = discovery_service.discover_all_resources(parse_regions(args.regions))
 
-            print(json.dumps(result, indent=2))
+            if emitter:
+                emitter.finish(result)
+            else:
+                print(json.dumps(result, indent=2))
             print(f"Discovery completed. Found {result.get('summary', {}).get('total_resources', 0)} total resources", file=sys.stderr)
+            if profile:
+                profile.save(args.call_profile, args.call_profile_prom)
 
         finally:
             # Clean up temporary key file
@@ -961,7 +1252,8 @@ def main():
             "error": str(e),
             "timestamp": datetime.now().isoformat()
         }
-        print(json.dumps(error_result, indent=2))
+        # ndjson consumers read the error as a single line
+        print(json.dumps(error_result, indent=None if args.format == 'ndjson' else 2))
         print(f"Discovery failed: {e}", file=sys.stderr)
         sys.exit(1)
 
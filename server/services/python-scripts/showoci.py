@@ -115,15 +115,21 @@
 ##########################################################################
 from __future__ import print_function
 from showoci_data import ShowOCIData
-from showoci_output import ShowOCIOutput, ShowOCISummary, ShowOCICSV
+from showoci_output import ShowOCIOutput, ShowOCISummary, ShowOCICSV, ShowOCIJSON, ShowOCIRenderer
 from showoci_service import ShowOCIFlags, ShowOCIService
+from showoci_replay import ShowOCIReplayService, ShowOCICacheError, load_cache_file, save_cache_file, get_cache_file_data
+from showoci_view import view_to_json
+from oci_profile import CallProfile
+from oci_scheduler import AdaptiveRateLimiter
 
 import json
 import sys
 import argparse
 import datetime
 import contextlib
+import gc
 import os
+import shlex
 import time
 
 version = "25.08.26"
@@ -156,13 +162,18 @@ if version != ShowOCIData.version or version != ShowOCIService.version or versio
 
 ##########################################################################
 # execute_extract
+#
+# argsList runs the extract with those arguments instead of sys.argv,
+# returns the completion message or None if the extract did not run
 ##########################################################################
-def execute_extract():
+def execute_extract(argsList=None):
 
     # get parset cmd
-    cmd = set_parser_arguments()
-    if cmd is None:
-        return
+    cmd = set_parser_arguments(argsList) if argsList else set_parser_arguments()
+    if not cmd:
+        if argsList:
+            print("\nError in showoci arguments: " + ' '.join(argsList))
+        return None
 
     # Start time
     start_time = time.time()
@@ -172,33 +183,69 @@ def execute_extract():
     flags = set_service_extract_flags(cmd)
 
     ############################################
-    # create data instance
+    # profile the OCI API calls if requested
+    ############################################
+    profile = None
+    if (cmd.apiprofile or cmd.apiprom) and not cmd.cachein:
+        profile = CallProfile()
+        profile.instrument_sdk()
+
+    ############################################
+    # rate limit the OCI API calls if requested
     ############################################
-    data = ShowOCIData(flags)
+    limiter = None
+    if cmd.apirate and not cmd.cachein:
+        limiter = AdaptiveRateLimiter(rate=cmd.apirate)
+        limiter.instrument_sdk()
+
+    ############################################
+    # create data instance, from cache file if requested
+    ############################################
+    if cmd.cachein:
+        try:
+            service = ShowOCIReplayService(flags, load_cache_file(cmd.cachein))
+        except (OSError, ShowOCICacheError) as e:
+            print("\nError in loading cache file: " + str(e))
+            return None
+        data = ShowOCIData(flags, service)
+    else:
+        try:
+            data = ShowOCIData(flags)
+        except BaseException:
+            restore_sdk_calls(limiter, profile)
+            raise
     if flags.excludelist:
-        return
+        restore_sdk_calls(limiter, profile)
+        return None
 
     ############################################
     # output and summary instances
     ############################################
-    output = ShowOCIOutput()
-    summary = ShowOCISummary()
+    renderer = ShowOCIRenderer()
+    if cmd.noscreen:
+        renderer = ShowOCIRenderer("none")
+    elif cmd.screenfile:
+        renderer = ShowOCIRenderer("file", cmd.screenfile)
+
+    output = ShowOCIOutput(renderer)
+    summary = ShowOCISummary(renderer)
     csv = ShowOCICSV(start_time_str)
 
     ############################################
     # print showoci config
     ############################################
-    cmdline = ' '.join(x for x in sys.argv[1:])
+    cmdline = ' '.join(x for x in (argsList if argsList else sys.argv[1:]))
     showoci_config = data.get_showoci_config(cmdline, start_time_str)
     output.print_showoci_config(showoci_config['data'])
 
     ############################################
     # load oci data to cache
     ############################################
-    output.print_header('Load OCI data to Memory', 1)
+    output.print_header('Load OCI data from cache ' + cmd.cachein if cmd.cachein else 'Load OCI data to Memory', 1)
 
     if not data.load_service_data():
-        return
+        close_extract(cmd, data, summary, csv, renderer, profile, limiter)
+        return None
 
     ############################################
     # Get Tenancy details from file
@@ -208,10 +255,13 @@ def execute_extract():
     ############################################
     # if print service data to file or screen
     ############################################
-    if cmd.servicefile or cmd.servicescr:
-        if cmd.servicefile:
-            if cmd.servicefile.name:
-                print_to_json_file(output, cmd.servicefile.name, data.get_service_data(), "Service Data")
+    if cmd.servicefile or cmd.servicefileb or cmd.servicescr:
+        if cmd.servicefile or cmd.servicefileb:
+            if cmd.servicefile and cmd.servicefile.name:
+                print_to_json_file(output, cmd.servicefile.name, get_cache_file_data(data.get_service_data()), "Service Data")
+            if cmd.servicefileb:
+                save_cache_file(cmd.servicefileb, data.get_service_data(), binary=True)
+                output.print_header("Service Data exported to " + cmd.servicefileb, 0)
 
         elif cmd.servicescr:
             print(json.dumps(data.get_service_data(), indent=4, sort_keys=False))
@@ -221,7 +271,24 @@ def execute_extract():
         # process the data into data json
         ############################################
         output.print_header("Start Processing Data", 1)
-        extracted_data = data.process_oci_data()
+
+        # JSON file is written block by block while the data is processed
+        json_file = None
+        json_outfile = cmd.sjoutfile if cmd.sjoutfile else cmd.joutfile
+        if json_outfile and json_outfile.name:
+            json_file = ShowOCIJSON(json_outfile.name, cmd.jcompact)
+            json_file.write_blocks(data.data)
+
+        if cmd.joutfile and json_file and not cmd.sjoutfile:
+
+            # JSON file only - summarize each block when written, keep the blocks only for CSV
+            def write_block(block):
+                json_file.write_block(block)
+                summary.add_summary_block(block)
+
+            extracted_data = data.process_oci_data(write_block, keep_blocks=bool(cmd.csv))
+        else:
+            extracted_data = data.process_oci_data(json_file.write_block if json_file else None)
 
         ############################################
         # if JSON and screen
@@ -231,19 +298,23 @@ def execute_extract():
             output.print_data(extracted_data)
             summary.print_summary(extracted_data)
 
-            # Add summary to JSON and print to JSON file
+            # Add summary to JSON and close the JSON file
             extracted_data.append({'summary': summary.get_summary_json()})
-            if cmd.sjoutfile.name:
-                print_to_json_file(output, cmd.sjoutfile.name, extracted_data, "JSON Data")
+            if json_file:
+                json_file.write_block(extracted_data[-1])
+                json_file.close()
+                output.print_header("JSON Data exported to " + json_file.file_name, 0)
 
         ############################################
         # JSON File only
         ############################################
         elif cmd.joutfile:
-            if cmd.joutfile.name:
-                summary.print_summary(extracted_data)
+            if json_file:
+                summary.print_summary_total()
                 extracted_data.append({'summary': summary.get_summary_json()})
-                print_to_json_file(output, cmd.joutfile.name, extracted_data, "JSON Data")
+                json_file.write_block(extracted_data[-1])
+                json_file.close()
+                output.print_header("JSON Data exported to " + json_file.file_name, 0)
 
         ############################################
         # JSON to screen only
@@ -251,7 +322,7 @@ def execute_extract():
         elif cmd.joutscr:
             summary.print_summary(extracted_data)
             extracted_data.append({'summary': summary.get_summary_json()})
-            print(json.dumps(extracted_data, indent=4, sort_keys=False))
+            print(json.dumps(extracted_data, indent=4, sort_keys=False, default=view_to_json))
 
         ############################################
         # print summary only
@@ -272,7 +343,7 @@ def execute_extract():
         ############################################
         if cmd.csv:
             csv.csv_tags_to_cols = not cmd.csv_notagstocols
-            csv.generate_csv(extracted_data, cmd.csv, tenancy, not cmd.csv_nodate, cmd.csvcol)
+            csv.generate_csv(extracted_data, cmd.csv, tenancy, not cmd.csv_nodate, cmd.csvcol, cmd.csv_delta, cmd.csv_format)
 
     ############################################
     # print completion
@@ -290,15 +361,75 @@ def execute_extract():
     if data.get_service_dbsystem_maintenance():
         output.print_header("DB System Maintenance", 0)
         for alert in data.get_service_dbsystem_maintenance():
-            print(alert)
+            renderer.print(alert)
 
     # calculate elapsed
     end_time_str = str(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     elapsed = time.time() - start_time
     str_elapsed = " - Elapsed " + '{:02d}:{:02d}:{:02d}'.format(round(elapsed // 3600), (round(elapsed % 3600 // 60)), round(elapsed % 60))
 
+    # throttled endpoints and the rate they ended with
+    if limiter and limiter.throttled:
+        limiter.print_report()
+
+    # write the API call profile
+    if profile:
+        profile.save(cmd.apiprofile, cmd.apiprom)
+        output.print_header("API call profile exported to " + ', '.join(x for x in (cmd.apiprofile, cmd.apiprom) if x), 0)
+
     # print completion
     output.print_header("Completed " + complete_message + " at " + end_time_str + str_elapsed, 0)
+    close_extract(cmd, data, summary, csv, renderer, profile, limiter)
+    return complete_message
+
+
+##########################################################################
+# close_extract - release the data of the run and the files argparse
+# opened, so runs in one process do not keep the previous run in memory,
+# the SDK calls of the next run are not profiled or limited by this run
+##########################################################################
+def close_extract(cmd, data, summary, csv, renderer, profile=None, limiter=None):
+
+    restore_sdk_calls(limiter, profile)
+
+    data.close()
+    summary.close()
+    csv.close()
+    renderer.close()
+
+    for outfile in (cmd.joutfile, cmd.sjoutfile, cmd.servicefile):
+        if outfile and not outfile.closed:
+            outfile.close()
+
+
+##########################################################################
+# restore_sdk_calls - remove the rate limiter and call profile from the
+# SDK clients, in the reverse order they were installed
+##########################################################################
+def restore_sdk_calls(*instruments):
+
+    for instrument in instruments:
+        if instrument:
+            instrument.restore_sdk()
+
+
+##########################################################################
+# run_extracts - library entry point, run many extracts in this process
+#
+# each run is a showoci argument list or string (i.e. one per tenancy
+# profile "-t tenant1 -a -noscreen -csv tenant1"), runs sequentially with
+# the data of a run released before the next starts, returns the
+# completion message of each run
+##########################################################################
+def run_extracts(runs):
+
+    results = []
+    for run in runs:
+        argsList = shlex.split(run) if isinstance(run, str) else list(run)
+        results.append(execute_extract(argsList))
+        gc.collect()
+
+    return results
 
 
 ##########################################################################
@@ -356,6 +487,8 @@ def set_parser_arguments(argsList=[]):
     parser.add_argument('-excludelist', action='store_true', default=False, dest='excludelist', help='Generate Exclude List for -exclude command')
     parser.add_argument('-noparallel', action='store_true', default=False, dest='skip_threads', help='Do not run in parallel processing (Threads).')
     parser.add_argument('-threads', default=8, dest='threads', type=int, help='Threads Processes when running with Threads (default=8).')
+    parser.add_argument('-parallelproc', action='store_true', default=False, dest='parallel_process', help='Process regions and compartments in parallel processes, pool sized by -threads.')
+    parser.add_argument('-verifyindex', action='store_true', default=False, dest='verify_index', help='Compare indexed cache lookups with linear search (slow, for troubleshooting).')
     parser.add_argument('-nobackups', action='store_true', default=False, dest='skip_backups', help='Do not process backups.')
     parser.add_argument('-skipdbhomes', action='store_true', default=False, dest='skip_dbhomes', help='Do not process Database Homes and below.')
     parser.add_argument('-readtimeout', default=20, dest='readtimeout', type=int, help='Timeout for REST API Connection (default=20).')
@@ -379,22 +512,32 @@ def set_parser_arguments(argsList=[]):
     parser.add_argument('-csv', default="", dest='csv', help="Output to CSV files, Input as file header.")
     parser.add_argument('-csvcol', default="", dest='csvcol', help="Extract define tags as columns for Compute in CSV.")
     parser.add_argument('-csv_nodate', action='store_true', default=False, dest='csv_nodate', help='Do not add date field to the CSV.')
+    parser.add_argument('-csv_format', default="csv", choices=['csv', 'parquet', 'arrow'], dest='csv_format', help="CSV output file format, parquet and arrow are typed and need pyarrow (default=csv).")
+    parser.add_argument('-csv_delta', default="", dest='csv_delta', help="Also write _delta.csv files with the rows added, changed or removed since the CSV export in this directory (csv format only).")
     parser.add_argument('-csv_notagstocols', action='store_true', default=False, dest='csv_notagstocols', help='Do not Convert Tags to Columns in CSV Extract.')
     parser.add_argument('-jf', type=argparse.FileType('w'), dest='joutfile', help="Output to file (JSON format).")
     parser.add_argument('-js', action='store_true', default=False, dest='joutscr', help="Output to screen (JSON format).")
     parser.add_argument('-sjf', type=argparse.FileType('w'), dest='sjoutfile', help="Output to screen (nice format) and JSON File.")
+    parser.add_argument('-noscreen', action='store_true', default=False, dest='noscreen', help="Do not render the nice output and summary, for -jf, -csv only runs.")
+    parser.add_argument('-screenf', default="", dest='screenfile', help="Write the nice output and summary to file instead of screen.")
+    parser.add_argument('-jcompact', action='store_true', default=False, dest='jcompact', help="Write -jf/-sjf JSON without indentation, file names ending .gz are gzip compressed.")
     parser.add_argument('-cachef', type=argparse.FileType('w'), dest='servicefile', help="Output Cache to file (JSON format).")
+    parser.add_argument('-cacheb', default="", dest='servicefileb', help="Output Cache to file (compact binary format, msgpack and zstd when installed).")
     parser.add_argument('-caches', action='store_true', default=False, dest='servicescr', help="Output Cache to screen (JSON format).")
+    parser.add_argument('-apirate', default=0, dest='apirate', type=float, help='Limit OCI API calls per second per region and service starting at this rate, adapts to 429 TooManyRequests and retries them (default=0 no limit).')
+    parser.add_argument('-apiprof', default="", dest='apiprofile', help="Output the OCI API call counts and latency per service, operation and region to file (JSON format), not with -parallelproc.")
+    parser.add_argument('-apiprom', default="", dest='apiprom', help="Output the OCI API call profile to file (Prometheus text format), needs prometheus-client.")
+    parser.add_argument('-cachein', default="", dest='cachein', help="Input Cache from file written by -cachef or -cacheb, skips loading from OCI.")
     parser.add_argument('--version', action='version', version='%(prog)s ' + version)
 
     if not argsList:
         result = parser.parse_args()
     else:
-        with contextlib.redirect_stdout(os.devnull):
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
             try:
                 result = parser.parse_args(args=argsList)
                 return result
-            except Exception:
+            except (Exception, SystemExit):
                 return False
 
     result = parser.parse_args()
@@ -489,6 +632,12 @@ def set_service_extract_flags(cmd):
     if cmd.threads:
         prm.threads = cmd.threads
 
+    if cmd.parallel_process:
+        prm.parallel_process = True
+
+    if cmd.verify_index:
+        prm.verify_index = True
+
     if cmd.exclude:
         prm.exclude = str(cmd.exclude).split(",")
 
@@ -559,7 +708,7 @@ def set_service_extract_flags(cmd):
 def print_to_json_file(output, file_name, data, header):
 
     with open(file_name, 'w') as outfile:
-        json.dump(data, outfile, indent=4, sort_keys=False)
+        json.dump(data, outfile, indent=4, sort_keys=False, default=view_to_json)
 
     output.print_header(header + " exported to " + file_name, 0)
 
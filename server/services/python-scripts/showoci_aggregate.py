@@ -0,0 +1,270 @@
+##########################################################################
+# showoci_aggregate.py
+#
+# Supports Python 3 and above
+#
+# coding: utf-8
+##########################################################################
+# ShowOCIAggregator class - keyed counters for ShowOCISummary
+#
+# ShowOCISummary used to append one {'type', 'size'} dict per resource and
+# group the list by type for the compartment, then group the grouped
+# pieces again for the region and the tenancy total. The aggregator adds
+# each size to a counter of its type and rolls the compartment counters
+# up into the region and total counters when the compartment is closed,
+# so every level is summed once from the level below.
+#
+# The sums are added in the same order as the group by did, the summary
+# JSON is identical. A type summed from int sizes only stays int.
+#
+# vectorized=True buffers the sizes of a compartment and sums them with
+# numpy.bincount when the compartment is closed, numpy is optional.
+#
+# Run this file directly to benchmark against append and group by:
+#    python3 showoci_aggregate.py [-resources 100000]
+# tests/test_showoci_aggregate.py checks the summary JSON is the same.
+##########################################################################
+from __future__ import print_function
+import sys
+
+
+class ShowOCIAggregator(object):
+
+    ############################################
+    # Init
+    ############################################
+    def __init__(self, vectorized=False):
+
+        self.numpy = None
+        if vectorized:
+            try:
+                import numpy
+                self.numpy = numpy
+            except ImportError:
+                pass
+
+        self.reset()
+
+    ##########################################################################
+    # reset - clear all levels
+    ##########################################################################
+    def reset(self):
+
+        # type -> size of the open compartment, region and tenancy, the
+        # vectorized path buffers the compartment in buffer_*
+        self.open_region()
+        self.total = {}
+
+    ##########################################################################
+    # open a compartment, drops what a failed compartment left
+    ##########################################################################
+    def open_compartment(self):
+
+        self.compartment = {}
+        self.buffer_types = []
+        self.buffer_sizes = []
+        self.buffer_float = set()
+
+    ##########################################################################
+    # open a region, drops what a failed region left
+    ##########################################################################
+    def open_region(self):
+
+        self.open_compartment()
+        self.region = {}
+
+    ##########################################################################
+    # add size to the counter of the type in the open compartment
+    ##########################################################################
+    def add(self, type_name, size):
+
+        if self.numpy:
+            self.buffer_types.append(type_name)
+            self.buffer_sizes.append(size)
+            if size.__class__ is float:
+                self.buffer_float.add(type_name)
+        else:
+            self.compartment[type_name] = self.compartment.get(type_name, 0) + size
+
+    ##########################################################################
+    # True if the open compartment has data
+    ##########################################################################
+    def has_data(self):
+        return bool(self.compartment or self.buffer_types)
+
+    ##########################################################################
+    # close the compartment, add it to the region (if in_region) and total
+    # and return its summary rows
+    ##########################################################################
+    def close_compartment(self, in_region=True):
+
+        if self.buffer_types:
+            self.__flush_buffer()
+
+        counters = self.compartment
+        self.compartment = {}
+
+        levels = (self.region, self.total) if in_region else (self.total,)
+        for level in levels:
+            for type_name, size in counters.items():
+                level[type_name] = level.get(type_name, 0) + size
+
+        return self.rows(counters)
+
+    ##########################################################################
+    # close the region and return its summary rows
+    ##########################################################################
+    def close_region(self):
+
+        counters = self.region
+        self.region = {}
+        return self.rows(counters)
+
+    ##########################################################################
+    # summary rows of the tenancy
+    ##########################################################################
+    def get_total(self):
+        return self.rows(self.total)
+
+    ##########################################################################
+    # counters to summary rows, in the order the types were first added
+    ##########################################################################
+    @staticmethod
+    def rows(counters):
+        return [{'type': type_name, 'size': size} for type_name, size in counters.items()]
+
+    ##########################################################################
+    # sum the buffered sizes per type with bincount, bincount adds the
+    # weights in order like the counters do
+    ##########################################################################
+    def __flush_buffer(self):
+
+        codes = {}
+        keys = [codes.setdefault(type_name, len(codes)) for type_name in self.buffer_types]
+        sums = self.numpy.bincount(keys, weights=self.buffer_sizes, minlength=len(codes))
+
+        for type_name, code in codes.items():
+            size = float(sums[code])
+            self.compartment[type_name] = size if type_name in self.buffer_float else int(size)
+
+        self.buffer_types = []
+        self.buffer_sizes = []
+        self.buffer_float = set()
+
+
+##########################################################################
+# Benchmark
+##########################################################################
+def synthetic_summary_data(resources=100000, regions=9, compartments=400):
+    """showoci extract blocks with compute instances, volumes and backups"""
+
+    shapes = ["VM.Standard.E4.Flex", "VM.Standard3.Flex", "BM.Standard2.52", "VM.Standard.A1.Flex"]
+    per_compartment = max(1, -(-resources // (regions * compartments * 4)))
+    data = []
+    for r in range(regions):
+        region_data = []
+        for c in range(compartments):
+            instances = []
+            for i in range(per_compartment):
+                n = (r * compartments + c) * per_compartment + i
+                shape = shapes[n % len(shapes)]
+                instances.append({
+                    'lifecycle_state': "STOPPED" if n % 7 == 0 else "RUNNING",
+                    'sum_info': "Compute - " + ("Windows" if n % 5 == 0 else "Linux"),
+                    'sum_shape': shape,
+                    'shape_ocpu': float(n % 16 + 1) / 2,
+                    'image_os': "Windows" if n % 5 == 0 else "Oracle Linux",
+                    'boot_volume': [{'sum_info': "Compute - Block Storage (GB)", 'sum_size_gb': str(47.5 + n % 3)}],
+                    'block_volume': [{'sum_info': "Compute - Block Storage (GB)", 'sum_size_gb': str(100 * (n % 4 + 1) + 0.1)}]
+                })
+            backups = [{'sum_info': "Compute - Block Storage Backup (GB)", 'sum_size_gb': str(12.3 * (i + 1))} for i in range(per_compartment)]
+            region_data.append({
+                'path': "compartment" + str(c),
+                'compute': {'instances': instances, 'volume_backup': backups}
+            })
+        data.append({'type': "region", 'region': "region" + str(r), 'data': region_data})
+    return data, regions * compartments * per_compartment * 4
+
+
+##########################################################################
+# summary JSON of the previous implementation, one dict per size grouped
+# per level, the reference the counters must match
+##########################################################################
+def group_by(rows):
+    d = {}
+    for row in rows:
+        if row['type'] not in d:
+            d[row['type']] = row['size']
+        else:
+            d[row['type']] += row['size']
+    return [{'type': k, 'size': v} for k, v in d.items()]
+
+
+def summary_group_by(data):
+    """get_summary_json of synthetic_summary_data summed by append and group by"""
+
+    result = {'data': [], 'regions_totals': {}, 'total': []}
+    for block in data:
+        region_total = []
+        for cdata in block['data']:
+            rows = []
+            for instance in cdata['compute']['instances']:
+                prefix = "Stopped " if instance['lifecycle_state'] == "STOPPED" else ""
+                rows.append({'type': prefix + instance['sum_info'] + " - " + instance['sum_shape'], 'size': float(1)})
+                rows.append({'type': 'Total ' + prefix + 'OCPUs - Compute - All', 'size': float(instance['shape_ocpu'])})
+                if instance['image_os'] == "Windows":
+                    rows.append({'type': 'Total ' + prefix + 'OCPUs - Compute - Windows', 'size': float(instance['shape_ocpu'])})
+                for obj in instance['boot_volume'] + instance['block_volume']:
+                    rows.append({'type': obj['sum_info'], 'size': float(obj['sum_size_gb'])})
+            for obj in cdata['compute']['volume_backup']:
+                rows.append({'type': obj['sum_info'], 'size': float(obj['sum_size_gb'])})
+            rows = group_by(rows)
+            result['total'].extend(rows)
+            region_total.extend(rows)
+            result['data'].append({'region': block['region'], 'compartment_name': cdata['path'], 'summary': rows})
+        result['regions_totals'][block['region']] = group_by(region_total)
+    result['total'] = group_by(result['total'])
+    return result
+
+
+def run_benchmark(resources=100000, regions=9, compartments=400):
+    import time
+    import json
+    from showoci_output import ShowOCISummary, ShowOCIRenderer
+
+    data, count = synthetic_summary_data(resources, regions, compartments)
+
+    def summarize(vectorized):
+        summary = ShowOCISummary(ShowOCIRenderer("none"), vectorized)
+        start = time.time()
+        summary.print_summary(data)
+        elapsed = time.time() - start
+        return elapsed, summary.get_summary_json()
+
+    start = time.time()
+    group_by_json = summary_group_by(data)
+    group_by_elapsed = time.time() - start
+    counters_elapsed, counters_json = summarize(False)
+    numpy_elapsed, numpy_json = summarize(True)
+
+    def same(a, b):
+        return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
+
+    print("Resources         : " + str(count) + " in " + str(regions) + " regions x " + str(compartments) + " compartments")
+    print("Append + group by : " + '{:.3f}'.format(group_by_elapsed) + "s")
+    print("Counters          : " + '{:.3f}'.format(counters_elapsed) + "s, same summary " + str(same(group_by_json, counters_json)))
+    if ShowOCIAggregator(True).numpy:
+        print("Counters numpy    : " + '{:.3f}'.format(numpy_elapsed) + "s, same summary " + str(same(group_by_json, numpy_json)))
+    else:
+        print("Counters numpy    : numpy is not installed")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Benchmark ShowOCIAggregator against append and group by')
+    parser.add_argument('-resources', default=100000, dest='resources', type=int, help='Number of synthetic resources (default=100000).')
+    parser.add_argument('-regions', default=9, dest='regions', type=int, help='Number of regions (default=9).')
+    parser.add_argument('-compartments', default=400, dest='compartments', type=int, help='Number of compartments (default=400).')
+    cmd = parser.parse_args()
+    run_benchmark(cmd.resources, cmd.regions, cmd.compartments)
+    sys.exit(0)
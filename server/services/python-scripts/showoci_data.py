@@ -16,8 +16,22 @@
 ##########################################################################
 from __future__ import print_function
 from showoci_service import ShowOCIService, ShowOCIFlags
+from showoci_index import ShowOCIIndex
+from showoci_view import ShowOCIView, ShowOCIViewFields
+import multiprocessing
 import sys
 
+# ShowOCIData instance used by the forked compartment workers
+_parallel_data = None
+
+
+##########################################################################
+# process one (region, compartment) shard in a forked worker
+##########################################################################
+def _process_compartment_shard(shard):
+    region_name, compartment = shard
+    return _parallel_data.process_compartment_shard(region_name, compartment)
+
 
 class ShowOCIData(object):
     version = "25.08.26"
@@ -27,31 +41,96 @@ class ShowOCIData(object):
     # OCI resources and run searches
     ###########################################
     service = None
+    index = None
     error = 0
     error_array = []
 
     # OCI Processed data
     data = []
 
+    ############################################
+    # Output keys of the processed resources that
+    # are views of the cached item (showoci_view)
+    ############################################
+    view_compute_instances = ShowOCIViewFields(
+        ['id', 'name', 'sum_info', 'sum_shape', 'availability_domain', 'fault_domain', 'time_maintenance_reboot_due', 'image', 'image_id',
+         'image_os', 'shape', 'shape_ocpu', 'shape_memory_gb', 'shape_storage_tb', 'shape_gpu_description', 'shape_gpus',
+         'shape_local_disk_description', 'shape_local_disks', 'shape_max_vnic_attachments', 'shape_networking_bandwidth_in_gbps',
+         'shape_processor_description', 'shape_baseline_ocpu_utilization', 'shape_local_disks_total_size_in_gbs', 'display_name', 'compartment_name',
+         'compartment_path', 'compartment_id', 'lifecycle_state', 'console_id', 'console', 'time_created', 'agent_is_management_disabled',
+         'agent_is_monitoring_disabled', 'are_all_plugins_disabled', 'agent_plugin_config', 'agent_plugin_status', 'defined_tags', 'freeform_tags',
+         'metadata', 'extended_metadata', 'is_live_migration_preferred', 'recovery_action', 'launch_boot_volume_type', 'launch_firmware',
+         'launch_network_type', 'launch_remote_data_volume_type', 'launch_is_pv_encryption_in_transit_enabled',
+         'launch_is_consistent_volume_naming_enabled', 'are_legacy_imds_endpoints_disabled', 'platform_type', 'platform_is_secure_boot_enabled',
+         'platform_is_trusted_platform_module_enabled', 'platform_is_measured_boot_enabled', 'platform_is_memory_encryption_enabled',
+         'capacity_reservation_id', 'dedicated_vm_host_id', 'ipxe_script', 'launch_mode', 'is_cross_numa_node', 'licensing_configs', 'logs'],
+        derived=['name', 'sum_info', 'sum_shape', 'time_maintenance_reboot_due', 'logs'])
+
+    view_database_db_systems = ShowOCIViewFields(
+        ['id', 'name', 'shape', 'shape_ocpu', 'shape_memory_gb', 'shape_storage_tb', 'display_name', 'lifecycle_state', 'sum_info',
+         'sum_info_storage', 'sum_size_gb', 'database_edition', 'database_edition_short', 'license_model', 'database_version', 'availability_domain',
+         'cpu_core_count', 'node_count', 'version', 'version_only', 'version_date', 'host', 'domain', 'data_subnet_id', 'data_subnet',
+         'data_subnet_name', 'data_vcn_name', 'backup_subnet_id', 'backup_subnet', 'backup_subnet_name', 'backup_vcn_name', 'scan_dns', 'scan_ips',
+         'data_storage_size_in_gbs', 'reco_storage_size_in_gb', 'sparse_diskgroup', 'storage_management', 'vip_ips', 'zone_id', 'scan_dns_name',
+         'compartment_name', 'compartment_path', 'compartment_id', 'cluster_name', 'time_created', 'defined_tags', 'freeform_tags', 'listener_port',
+         'last_maintenance_run', 'next_maintenance_run', 'maintenance_window', 'nsg_ids', 'nsg_ids_names', 'backup_network_nsg_ids',
+         'backup_network_nsg_ids_names', 'fault_domains', 'memory_size_in_gbs', 'storage_volume_performance_mode', 'time_zone', 'kms_key_id',
+         'kms_key_name', 'os_version', 'disk_redundancy', 'point_in_time_data_disk_clone_timestamp', 'patches', 'db_homes', 'db_nodes'],
+        renames={'sum_size_gb': 'data_storage_size_in_gbs', 'database_version': 'version', 'version_only': 'version', 'host': 'hostname', 'scan_dns': 'scan_dns_record_id'},
+        derived=['name', 'sum_info', 'sum_info_storage', 'version', 'kms_key_name', 'patches', 'db_homes', 'db_nodes'])
+
+    view_object_storage_buckets = ShowOCIViewFields(
+        ['name', 'objects', 'time_created', 'size', 'sum_size_gb', 'sum_info', 'count', 'preauthenticated_requests', 'object_lifecycle',
+         'compartment_id', 'compartment_name', 'compartment_path', 'region_name', 'namespace_name', 'public_access_type', 'storage_tier',
+         'object_events_enabled', 'kms_key_id', 'kms_key_name', 'object_lifecycle_policy_etag', 'replication_enabled', 'is_read_only', 'versioning',
+         'auto_tiering', 'id', 'defined_tags', 'freeform_tags', 'error_message', 'archival_state', 'logs'],
+        renames={'objects': 'approximate_count', 'size': 'approximate_size', 'sum_size_gb': 'size_gb'},
+        derived=['sum_info', 'kms_key_name', 'logs'])
+
     ############################################
     # Init
     ############################################
-    def __init__(self, flags):
+    def __init__(self, flags, service=None):
 
         # check if not instance fo ShowOCIFlags
         if not isinstance(flags, ShowOCIFlags):
             raise TypeError("flags must be Flags class")
 
-        # initiate service object
-        self.service = ShowOCIService(flags)
+        # initiate service object, a prepared service (i.e. cache replay) can be passed
+        self.service = service if service is not None else ShowOCIService(flags)
+
+        # initiate cache index, verify compares each lookup with the linear search
+        self.index = ShowOCIIndex(self.service, getattr(flags, 'verify_index', False))
 
-        # Initiate data list everytime class is instantiated
+        # process regions and compartments in a process pool sized by -threads
+        self.parallel_process = getattr(flags, 'parallel_process', False) and not flags.skip_threads
+
+        # Initiate data list and errors everytime class is instantiated
         self.data = []
+        self.error = 0
+        self.error_array = []
 
         # if exclude list requested
         if flags.excludelist:
             self.service.generate_exclude_list()
 
+    ############################################
+    # close - release the processed data, the
+    # indexes and the service cache of this run
+    ############################################
+    def close(self):
+
+        self.data = []
+        self.error_array = []
+        if self.index:
+            self.index.invalidate()
+        if self.service is not None:
+            # cleared in place, the service lists may be shared on the class
+            if isinstance(getattr(self.service, 'data', None), dict):
+                self.service.data.clear()
+            if isinstance(getattr(self.service, 'error_array', None), list):
+                del self.service.error_array[:]
+
     ############################################
     # get service data
     ############################################
@@ -71,33 +150,41 @@ class ShowOCIData(object):
     ############################################
     def load_service_data(self):
 
+        # cache is repopulated, indexes must be rebuilt
+        self.index.invalidate()
         return self.service.load_service_data()
 
     ##########################################################################
     # process_oci_data
+    #
+    # block_handler is called with every block as soon as it is processed,
+    # i.e. to write it to file, with keep_blocks=False the blocks are not
+    # kept in self.data so each region can be released once handled
     ##########################################################################
-    def process_oci_data(self):
+    def process_oci_data(self, block_handler=None, keep_blocks=True):
 
         try:
+            self.block_handler = block_handler
+            self.keep_blocks = keep_blocks or block_handler is None
 
             # run identity
             identity_data = {'type': "identity", 'data': self.service.get_identity()}
-            self.data.append(identity_data)
+            self.__add_block(identity_data)
 
             # run on budgets module
             if self.service.flags.read_budgets:
                 budgets_data = {'type': "budgets", 'data': self.service.get_budgets()}
-                self.data.append(budgets_data)
+                self.__add_block(budgets_data)
 
             # run on announcement module
             if self.service.flags.read_announcement:
                 announcement_data = {'type': "announcement", 'data': self.service.get_announcement()}
-                self.data.append(announcement_data)
+                self.__add_block(announcement_data)
 
             # run on security_scores module
             if self.service.flags.read_security:
                 security_scores_data = {'type': "security_scores", 'data': self.service.get_security_scores()}
-                self.data.append(security_scores_data)
+                self.__add_block(security_scores_data)
 
             # run on compartments
             if self.service.flags.is_loop_on_compartments:
@@ -105,30 +192,39 @@ class ShowOCIData(object):
                 # pointer to Tenancy in cache
                 tenancy = self.service.get_tenancy()
 
-                # run on each subscribed region
-                for region_name in tenancy['list_region_subscriptions']:
+                # check if filter by region
+                region_names = [x for x in tenancy['list_region_subscriptions'] if self.service.oci_region_name_filter(x)]
 
-                    # check if filter by region
-                    if not self.service.oci_region_name_filter(region_name):
-                        continue
+                # process all region and compartment shards in parallel processes
+                region_shards = {}
+                if self.parallel_process:
+                    region_shards = self.__get_oci_regions_data_parallel(region_names)
+
+                # run on each subscribed region
+                for region_name in region_names:
 
                     # limits services which regional but not compartment
                     limits_data = []
                     if self.service.flags.read_limits:
                         limits_data = self.__get_limits_main(region_name)
 
-                    # execute the region
-                    value = self.__get_oci_region_data(region_name)
+                    # execute the region or merge the parallel results
+                    if region_name in region_shards:
+                        value = self.__merge_oci_region_shards(region_name, region_shards[region_name])
+                    else:
+                        value = self.__get_oci_region_data(region_name)
 
                     # if data returns, add to the json
                     if value or limits_data:
                         region_data = ({'type': "region", 'region': region_name, 'data': value, 'limits': limits_data})
-                        self.data.append(region_data)
+                        self.__add_block(region_data)
 
             # Append Error Array
             self.error_array += self.service.error_array
+            self.error_array += self.index.error_array
+            self.error += self.index.error
             error_data = {'type': "errors", 'data': self.error_array}
-            self.data.append(error_data)
+            self.__add_block(error_data)
 
             # return the json data
             return self.data
@@ -136,6 +232,17 @@ class ShowOCIData(object):
         except Exception as e:
             raise Exception("Error in process_oci_data: " + str(e))
 
+    ##########################################################################
+    # add processed block
+    ##########################################################################
+    def __add_block(self, block):
+
+        if self.block_handler:
+            self.block_handler(block)
+
+        if self.keep_blocks:
+            self.data.append(block)
+
     ##########################################################################
     # Print version
     ##########################################################################
@@ -250,194 +357,10 @@ class ShowOCIData(object):
             print("\nProcessing...")
             for compartment in compartments:
 
-                #  check if to skip ManagedCompartmentForPaaS
-                if compartment['name'] == "ManagedCompartmentForPaaS" and not self.service.flags.read_ManagedCompartmentForPaaS:
-                    continue
-
-                print("    Compartment " + compartment['path'] + "...")
-                data = {
-                    'compartment_id': compartment['id'],
-                    'compartment_name': compartment['name'],
-                    'compartment': compartment['name'],
-                    'path': compartment['path']
-                }
-                has_data = False
-
-                # run on network module
-                if self.service.flags.read_network:
-                    value = self.__get_core_network_main(region_name, compartment)
-                    if value:
-                        if len(value) > 0:
-                            data['network'] = value
-                            has_data = True
-
-                # run on compute and block storage
-                if self.service.flags.read_compute:
-                    value = self.__get_core_compute_main(region_name, compartment)
-                    if value:
-                        if len(value) > 0:
-                            data['compute'] = value
-                            has_data = True
-
-                # run on database
-                if self.service.flags.read_database:
-                    value = self.__get_database_main(region_name, compartment)
-                    if value:
-                        if len(value) > 0:
-                            data['database'] = value
-                            has_data = True
-
-                # run on file_storage
-                if self.service.flags.read_file_storage:
-                    value = self.__get_file_storage_main(region_name, compartment)
-                    if value:
-                        if len(value) > 0:
-                            data['file_storage'] = value
-                            has_data = True
-
-                # run on object storage
-                if self.service.flags.read_object_storage:
-                    value = self.__get_object_storage_main(region_name, compartment)
-                    if value:
-                        if len(value) > 0:
-                            data['object_storage'] = value
-                            has_data = True
-
-                # run on Load Balancer
-                if self.service.flags.read_load_balancer:
-                    value = self.__get_load_balancer_main(region_name, compartment)
-                    if value:
-                        if len(value) > 0:
-                            data['load_balancer'] = value
-                            has_data = True
-
-                # run on Network Load Balancer
-                if self.service.flags.read_load_balancer:
-                    value = self.__get_load_balancer_network_main(region_name, compartment)
-                    if value:
-                        if len(value) > 0:
-                            data['network_load_balancer'] = value
-                            has_data = True
-
-                # run on Resource Management
-                if self.service.flags.read_resource_management:
-                    value = self.__get_resource_management_main(region_name, compartment)
-                    if value:
-                        if len(value) > 0:
-                            data['resource_management'] = value
-                            has_data = True
-
-                # run on fsdr use the Resource Management flag
-                if self.service.flags.read_resource_management:
-                    value = self.__get_fsdr_main(region_name, compartment)
-                    if value:
-                        if len(value) > 0:
-                            data['fsdr'] = value
-                            has_data = True
-
-                # email
-                if self.service.flags.read_email_distribution:
-                    value = self.__get_email_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['email'] = value
-                            has_data = True
-
-                # container
-                if self.service.flags.read_containers:
-                    value = self.__get_container_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['containers'] = value
-                            has_data = True
-
-                # streams queues
-                if self.service.flags.read_streams_queues:
-                    value = self.__get_streams_queues_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['streams_queues'] = value
-                            has_data = True
-
-                # monitoring
-                if self.service.flags.read_monitoring_notifications:
-                    value = self.__get_monitoring_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['monitoring'] = value
-                            has_data = True
-
-                # notifications
-                if self.service.flags.read_monitoring_notifications:
-                    value = self.__get_notifications_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['notifications'] = value
-                            has_data = True
-
-                # edge services
-                if self.service.flags.read_edge:
-                    value = self.__get_load_edge_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['edge_services'] = value
-                            has_data = True
-
-                # quotas services
-                if self.service.flags.read_limits:
-                    value = self.__get_quotas_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['quotas'] = value
-                            has_data = True
-
-                # paas native services
-                if self.service.flags.read_paas_native:
-                    value = self.__get_paas_native_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['paas_services'] = value
-                            has_data = True
-
-                # security and logging services
-                if self.service.flags.read_security:
-                    value = self.__get_security_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['security'] = value
-                            has_data = True
-
-                # data ai
-                if self.service.flags.read_data_ai:
-                    value = self.__get_data_ai_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['data_ai'] = value
-                            has_data = True
-
-                if self.service.flags.read_function:
-                    value = self.__get_functions_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['functions'] = value
-                            has_data = True
-
-                if self.service.flags.read_api:
-                    value = self.__get_apigateway_main(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['apigateways'] = value
-                            has_data = True
-
-                if self.service.flags.read_announcement:
-                    value = self.__get_announcement_detailed(region_name, compartment)
-                    if value is not None:
-                        if len(value) > 0:
-                            data['announcement_detailed'] = value
-                            has_data = True
+                data = self.__get_oci_compartment_data(region_name, compartment)
 
                 # add the data to main Variable
-                if has_data:
+                if data:
                     ret_var.append(data)
 
             print("")
@@ -448,13 +371,290 @@ class ShowOCIData(object):
         except Exception as e:
             self.__print_error(e)
 
+    ##########################################################################
+    # run on Region in parallel processes, return shard results per region
+    ##########################################################################
+    def __get_oci_regions_data_parallel(self, region_names):
+
+        global _parallel_data
+
+        # workers inherit the loaded cache, fork is required
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            print("\nParallel processing requires fork, processing sequentially")
+            return {}
+
+        compartments = self.service.get_compartments()
+        shards = [(region_name, compartment) for region_name in region_names for compartment in compartments]
+        if not shards:
+            return {}
+
+        processes = max(1, self.service.flags.threads)
+        chunksize = max(1, len(shards) // (processes * 4))
+        print("\nProcessing " + str(len(region_names)) + " Regions x " + str(len(compartments)) + " Compartments using " + str(processes) + " processes...")
+
+        _parallel_data = self
+        try:
+            with multiprocessing.get_context('fork').Pool(processes=processes) as pool:
+                results = pool.map(_process_compartment_shard, shards, chunksize)
+        finally:
+            _parallel_data = None
+
+        # group the results by region, pool.map keeps the shard order
+        region_shards = {region_name: [] for region_name in region_names}
+        for shard, result in zip(shards, results):
+            region_shards[shard[0]].append(result)
+
+        return region_shards
+
+    ##########################################################################
+    # process one compartment shard, called from the forked worker
+    ##########################################################################
+    def process_compartment_shard(self, region_name, compartment):
+
+        error_start = self.error
+        errors_start = len(self.error_array)
+        service_errors_start = len(self.service.error_array)
+        index_error_start = self.index.error
+        index_errors_start = len(self.index.error_array)
+
+        try:
+            data = self.__get_oci_compartment_data(region_name, compartment)
+        except Exception as e:
+            self.__print_error(e)
+            data = None
+
+        return {
+            'data': data,
+            'error': self.error - error_start,
+            'error_array': self.error_array[errors_start:],
+            'service_error_array': self.service.error_array[service_errors_start:],
+            'index_error': self.index.error - index_error_start,
+            'index_error_array': self.index.error_array[index_errors_start:]
+        }
+
+    ##########################################################################
+    # merge the shard results of a region in compartment order
+    ##########################################################################
+    def __merge_oci_region_shards(self, region_name, shards):
+
+        ret_var = []
+        print("\nProcessing Region " + region_name)
+
+        for shard in shards:
+            self.error += shard['error']
+            self.error_array += shard['error_array']
+            self.service.error_array += shard['service_error_array']
+            self.index.error += shard['index_error']
+            self.index.error_array += shard['index_error_array']
+
+            if shard['data']:
+                ret_var.append(shard['data'])
+
+        return ret_var
+
+    ##########################################################################
+    # run on Compartment, return None if no data
+    ##########################################################################
+    def __get_oci_compartment_data(self, region_name, compartment):
+
+        #  check if to skip ManagedCompartmentForPaaS
+        if compartment['name'] == "ManagedCompartmentForPaaS" and not self.service.flags.read_ManagedCompartmentForPaaS:
+            return None
+
+        print("    Compartment " + compartment['path'] + "...")
+        data = {
+            'compartment_id': compartment['id'],
+            'compartment_name': compartment['name'],
+            'compartment': compartment['name'],
+            'path': compartment['path']
+        }
+        has_data = False
+
+        # run on network module
+        if self.service.flags.read_network:
+            value = self.__get_core_network_main(region_name, compartment)
+            if value:
+                if len(value) > 0:
+                    data['network'] = value
+                    has_data = True
+
+        # run on compute and block storage
+        if self.service.flags.read_compute:
+            value = self.__get_core_compute_main(region_name, compartment)
+            if value:
+                if len(value) > 0:
+                    data['compute'] = value
+                    has_data = True
+
+        # run on database
+        if self.service.flags.read_database:
+            value = self.__get_database_main(region_name, compartment)
+            if value:
+                if len(value) > 0:
+                    data['database'] = value
+                    has_data = True
+
+        # run on file_storage
+        if self.service.flags.read_file_storage:
+            value = self.__get_file_storage_main(region_name, compartment)
+            if value:
+                if len(value) > 0:
+                    data['file_storage'] = value
+                    has_data = True
+
+        # run on object storage
+        if self.service.flags.read_object_storage:
+            value = self.__get_object_storage_main(region_name, compartment)
+            if value:
+                if len(value) > 0:
+                    data['object_storage'] = value
+                    has_data = True
+
+        # run on Load Balancer
+        if self.service.flags.read_load_balancer:
+            value = self.__get_load_balancer_main(region_name, compartment)
+            if value:
+                if len(value) > 0:
+                    data['load_balancer'] = value
+                    has_data = True
+
+        # run on Network Load Balancer
+        if self.service.flags.read_load_balancer:
+            value = self.__get_load_balancer_network_main(region_name, compartment)
+            if value:
+                if len(value) > 0:
+                    data['network_load_balancer'] = value
+                    has_data = True
+
+        # run on Resource Management
+        if self.service.flags.read_resource_management:
+            value = self.__get_resource_management_main(region_name, compartment)
+            if value:
+                if len(value) > 0:
+                    data['resource_management'] = value
+                    has_data = True
+
+        # run on fsdr use the Resource Management flag
+        if self.service.flags.read_resource_management:
+            value = self.__get_fsdr_main(region_name, compartment)
+            if value:
+                if len(value) > 0:
+                    data['fsdr'] = value
+                    has_data = True
+
+        # email
+        if self.service.flags.read_email_distribution:
+            value = self.__get_email_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['email'] = value
+                    has_data = True
+
+        # container
+        if self.service.flags.read_containers:
+            value = self.__get_container_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['containers'] = value
+                    has_data = True
+
+        # streams queues
+        if self.service.flags.read_streams_queues:
+            value = self.__get_streams_queues_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['streams_queues'] = value
+                    has_data = True
+
+        # monitoring
+        if self.service.flags.read_monitoring_notifications:
+            value = self.__get_monitoring_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['monitoring'] = value
+                    has_data = True
+
+        # notifications
+        if self.service.flags.read_monitoring_notifications:
+            value = self.__get_notifications_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['notifications'] = value
+                    has_data = True
+
+        # edge services
+        if self.service.flags.read_edge:
+            value = self.__get_load_edge_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['edge_services'] = value
+                    has_data = True
+
+        # quotas services
+        if self.service.flags.read_limits:
+            value = self.__get_quotas_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['quotas'] = value
+                    has_data = True
+
+        # paas native services
+        if self.service.flags.read_paas_native:
+            value = self.__get_paas_native_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['paas_services'] = value
+                    has_data = True
+
+        # security and logging services
+        if self.service.flags.read_security:
+            value = self.__get_security_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['security'] = value
+                    has_data = True
+
+        # data ai
+        if self.service.flags.read_data_ai:
+            value = self.__get_data_ai_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['data_ai'] = value
+                    has_data = True
+
+        if self.service.flags.read_function:
+            value = self.__get_functions_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['functions'] = value
+                    has_data = True
+
+        if self.service.flags.read_api:
+            value = self.__get_apigateway_main(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['apigateways'] = value
+                    has_data = True
+
+        if self.service.flags.read_announcement:
+            value = self.__get_announcement_detailed(region_name, compartment)
+            if value is not None:
+                if len(value) > 0:
+                    data['announcement_detailed'] = value
+                    has_data = True
+
+        # return the data if any service returned value
+        if has_data:
+            return data
+        return None
+
     ##########################################################################
     # Print Network VCN NAT
     ##########################################################################
     def __get_core_network_vcn_nat(self, vcn_id):
         data = []
         try:
-            list_nat_gateways = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_NAT, 'vcn_id', vcn_id)
+            list_nat_gateways = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_NAT, 'vcn_id', vcn_id)
             for arr in list_nat_gateways:
                 value = {'id': arr['id'],
                          'name': arr['name'],
@@ -482,7 +682,7 @@ class ShowOCIData(object):
     def __get_core_network_vcn_igw(self, vcn_id):
         data = []
         try:
-            list_igws = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_IGW, 'vcn_id', vcn_id)
+            list_igws = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_IGW, 'vcn_id', vcn_id)
             for arr in list_igws:
                 value = {'id': arr['id'],
                          'name': arr['name'],
@@ -517,7 +717,7 @@ class ShowOCIData(object):
         data = []
         try:
 
-            list_service_gateways = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_SGW, 'vcn_id', vcn_id)
+            list_service_gateways = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_SGW, 'vcn_id', vcn_id)
             for arr in list_service_gateways:
                 value = {'id': arr['id'],
                          'name': arr['name'],
@@ -558,23 +758,23 @@ class ShowOCIData(object):
             drg_id = drg_attachment['drg_id']
 
             # get DRG name
-            drg = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_DRG, 'id', drg_id)
+            drg = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_DRG, 'id', drg_id)
             if drg:
                 name = drg['name']
                 retStr = drg['name']
 
             # check if IPSEC
-            list_ip_sec_connections = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_IPS, 'drg_id', drg_id)
+            list_ip_sec_connections = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_IPS, 'drg_id', drg_id)
             if len(list_ip_sec_connections) > 0:
                 retStr += " + IPSEC (" + str(len(list_ip_sec_connections)) + ")"
 
             # check if Virtual Circuits
-            list_virtual_circuits = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VC, 'drg_id', drg_id)
+            list_virtual_circuits = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VC, 'drg_id', drg_id)
             if len(list_virtual_circuits) > 0:
                 retStr += " + Fastconnect (" + str(len(list_virtual_circuits)) + ")"
 
             # Check Remote Peering
-            rpcs = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_RPC, 'drg_id', drg_id)
+            rpcs = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_RPC, 'drg_id', drg_id)
             if len(rpcs) > 0:
                 retStr += " + Remote Peering (" + str(len(rpcs)) + ")"
 
@@ -597,7 +797,7 @@ class ShowOCIData(object):
         data = []
         try:
 
-            list_drg_attachments = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DRG_AT, 'vcn_id', vcn_id)
+            list_drg_attachments = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DRG_AT, 'vcn_id', vcn_id)
             for da in list_drg_attachments:
                 val, display_name, route_table = self.__get_core_network_vcn_drg_details(da)
                 value = {'id': da['id'],
@@ -626,7 +826,7 @@ class ShowOCIData(object):
     def __get_core_network_vcn_local_peering(self, vcn_id):
         data = []
         try:
-            local_peering_gateways = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_LPG, 'vcn_id', vcn_id)
+            local_peering_gateways = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_LPG, 'vcn_id', vcn_id)
             for lpg in local_peering_gateways:
                 routestr = ""
                 route_table = ""
@@ -666,33 +866,33 @@ class ShowOCIData(object):
     def __get_core_network_vcn_subnets(self, vcn_id):
         data = []
         try:
-            subnets = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_SUBNET, 'vcn_id', vcn_id)
+            subnets = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_SUBNET, 'vcn_id', vcn_id)
             if not subnets:
                 return data
 
             for subnet in subnets:
 
                 # get the list of private_ips
-                private_ips = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_SUBNET_PIP, 'subnet_id', subnet['id'])
+                private_ips = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_SUBNET_PIP, 'subnet_id', subnet['id'])
 
                 # get the list of security lists
                 sec_lists = []
                 if 'security_list_ids' in subnet:
                     for s in subnet['security_list_ids']:
-                        sl = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_SLIST, 'id', s)
+                        sl = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_SLIST, 'id', s)
                         if sl:
                             sec_lists.append(sl['name'])
 
                 # Get the route and dhcp options
                 route_name = ""
                 if 'route_table_id' in subnet:
-                    route_name_arr = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_ROUTE, 'id', subnet['route_table_id'])
+                    route_name_arr = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_ROUTE, 'id', subnet['route_table_id'])
                     if route_name_arr:
                         route_name = route_name_arr['name']
 
                 dhcp_options = ""
                 if 'dhcp_options_id' in subnet:
-                    dhcp_options_arr = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_DHCP, 'id', subnet['dhcp_options_id'])
+                    dhcp_options_arr = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_DHCP, 'id', subnet['dhcp_options_id'])
                     if dhcp_options_arr:
                         dhcp_options = dhcp_options_arr['name']
 
@@ -730,7 +930,7 @@ class ShowOCIData(object):
     # __get_core_network_vcn_vlans
     ##########################################################################
     def __get_core_network_vcn_dns_resolver(self, vcn_id):
-        resolvers = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DNS_RESOLVERS, 'vcn_id', vcn_id)
+        resolvers = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DNS_RESOLVERS, 'vcn_id', vcn_id)
         return resolvers
 
     ##########################################################################
@@ -740,7 +940,7 @@ class ShowOCIData(object):
     def __get_core_network_vcn_vlans(self, vcn_id):
         data = []
         try:
-            vlans = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VLAN, 'vcn_id', vcn_id)
+            vlans = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VLAN, 'vcn_id', vcn_id)
             if not vlans:
                 return data
 
@@ -750,14 +950,14 @@ class ShowOCIData(object):
                 nsgs = []
                 if 'nsg_ids' in vlan:
                     for nsg in vlan['nsg_ids']:
-                        nsg_obj = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', nsg)
+                        nsg_obj = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', nsg)
                         if nsg_obj:
                             nsgs.append(nsg_obj['name'])
 
                 # Get the route and dhcp options
                 route_name = ""
                 if 'route_table_id' in vlan:
-                    route_name_arr = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_ROUTE, 'id', vlan['route_table_id'])
+                    route_name_arr = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_ROUTE, 'id', vlan['route_table_id'])
                     if route_name_arr:
                         route_name = route_name_arr['name']
 
@@ -795,7 +995,7 @@ class ShowOCIData(object):
     def __get_core_network_vcn_security_lists(self, vcn_id):
         data = []
         try:
-            sec_lists = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_SLIST, 'vcn_id', vcn_id)
+            sec_lists = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_SLIST, 'vcn_id', vcn_id)
             for sl in sec_lists:
                 data.append({
                     'id': sl['id'],
@@ -821,7 +1021,7 @@ class ShowOCIData(object):
     def __get_core_network_vcn_security_groups(self, vcn_id):
         data = []
         try:
-            nsgs = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'vcn_id', vcn_id)
+            nsgs = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'vcn_id', vcn_id)
             for nsg in nsgs:
                 value = {
                     'id': nsg['id'],
@@ -845,7 +1045,7 @@ class ShowOCIData(object):
                         # source
                         #########################################################################
                         if valsec['source_type'] == "NETWORK_SECURITY_GROUP":
-                            result = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', valsec['source'])
+                            result = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', valsec['source'])
                             if result:
                                 valsec['source_name'] = result['name']
                                 valsec['desc'] = valsec['desc'].replace(self.service.C_NETWORK_NSG_REPTEXT, result['name'].ljust(17))
@@ -859,7 +1059,7 @@ class ShowOCIData(object):
                         # Destination
                         #########################################################################
                         if valsec['destination_type'] == "NETWORK_SECURITY_GROUP":
-                            result = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', valsec['destination'])
+                            result = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', valsec['destination'])
                             if result:
                                 valsec['destination_name'] = result['name']
                                 valsec['desc'] = valsec['desc'].replace(self.service.C_NETWORK_NSG_REPTEXT, result['name'].ljust(17))
@@ -935,7 +1135,7 @@ class ShowOCIData(object):
             # if servicegateway - get the service and sgw name
             if network_dest == "servicegateway":
                 network_dest = "SGW"
-                result = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_SGW, 'id', network_ocid)
+                result = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_SGW, 'id', network_ocid)
                 if result:
                     network_dest = "SGW" + " " + result['name']
 
@@ -959,7 +1159,7 @@ class ShowOCIData(object):
     def __get_core_network_vcn_route_tables(self, vcn_id):
         data = []
         try:
-            route_tables = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_ROUTE, 'vcn_id', vcn_id)
+            route_tables = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_ROUTE, 'vcn_id', vcn_id)
 
             for rt in route_tables:
                 route_rules = []
@@ -995,7 +1195,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            dhcp_options = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DHCP, 'vcn_id', vcn_id)
+            dhcp_options = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DHCP, 'vcn_id', vcn_id)
 
             for dhcp in dhcp_options:
                 data.append({
@@ -1021,7 +1221,7 @@ class ShowOCIData(object):
 
         vcn_data = []
         try:
-            vcns = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VCN, 'region_name', region_name, 'compartment_id', compartment['id'])
+            vcns = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VCN, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for vcn in vcns:
 
@@ -1086,7 +1286,7 @@ class ShowOCIData(object):
     def __get_core_network_cpe(self, region_name, compartment):
         data = []
         try:
-            cpes = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_CPE, 'region_name', region_name, 'compartment_id', compartment['id'])
+            cpes = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_CPE, 'region_name', region_name, 'compartment_id', compartment['id'])
             return cpes
 
         except Exception as e:
@@ -1099,7 +1299,7 @@ class ShowOCIData(object):
     def __get_core_network_firewall(self, region_name, compartment):
         data = []
         try:
-            nfw = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_FIREWALL, 'region_name', region_name, 'compartment_id', compartment['id'])
+            nfw = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_FIREWALL, 'region_name', region_name, 'compartment_id', compartment['id'])
             return nfw
 
         except Exception as e:
@@ -1112,7 +1312,7 @@ class ShowOCIData(object):
     def __get_core_network_firewall_policies(self, region_name, compartment):
         data = []
         try:
-            nfw = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_FIREWALL_POLICY, 'region_name', region_name, 'compartment_id', compartment['id'])
+            nfw = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_FIREWALL_POLICY, 'region_name', region_name, 'compartment_id', compartment['id'])
             return nfw
 
         except Exception as e:
@@ -1126,7 +1326,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            drgs = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DRG, 'region_name', region_name, 'compartment_id', compartment['id'])
+            drgs = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DRG, 'region_name', region_name, 'compartment_id', compartment['id'])
             for drg in drgs:
                 drg_id = drg['id']
                 val = {
@@ -1141,17 +1341,17 @@ class ShowOCIData(object):
                     'freeform_tags': drg['freeform_tags'],
                     'region_name': drg['region_name'],
                     'drg_route_tables': drg['drg_route_tables'],
-                    'ip_sec_connections': self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_IPS, 'drg_id', drg_id),
-                    'virtual_circuits': self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VC, 'drg_id', drg_id),
-                    'remote_peerings': self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_RPC, 'drg_id', drg_id),
+                    'ip_sec_connections': self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_IPS, 'drg_id', drg_id),
+                    'virtual_circuits': self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VC, 'drg_id', drg_id),
+                    'remote_peerings': self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_RPC, 'drg_id', drg_id),
                     'vcns': []
                 }
 
                 # Add VCNs
-                drg_attachments = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DRG_AT, 'drg_id', drg_id)
+                drg_attachments = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DRG_AT, 'drg_id', drg_id)
                 for da in drg_attachments:
                     if da['vcn_id']:
-                        vcn = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_VCN, 'id', da['vcn_id'])
+                        vcn = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_VCN, 'id', da['vcn_id'])
                         if vcn:
                             vcn['drg_route_table_id'] = da['drg_route_table_id']
                             vcn['drg_route_table'] = self.__get_core_network_drg_route(da['drg_route_table_id'])
@@ -1172,7 +1372,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_core_network_drg_route(self, drg_route_table_id):
         try:
-            route = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_DRG_RT, 'id', drg_route_table_id)
+            route = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_DRG_RT, 'id', drg_route_table_id)
             if route:
                 if 'display_name' in route:
                     return route['display_name']
@@ -1188,7 +1388,7 @@ class ShowOCIData(object):
     def __get_core_network_drg_name(self, drg_id):
         try:
             # get DRG name
-            drg = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_DRG, 'id', drg_id)
+            drg = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_DRG, 'id', drg_id)
             if drg:
                 return "DRG - " + drg['name'] + " (" + drg['redundancy'] + ")"
             return ""
@@ -1203,7 +1403,7 @@ class ShowOCIData(object):
     def __get_core_network_cpe_name(self, cpe_id):
         try:
             # get DRG name
-            cpe = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_CPE, 'id', cpe_id)
+            cpe = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_CPE, 'id', cpe_id)
             if cpe:
                 return "CPE - " + cpe['name']
 
@@ -1216,7 +1416,7 @@ class ShowOCIData(object):
     def __get_core_network_vcn_name(self, vcn_id):
         try:
             # get DRG name
-            vcn = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_VCN, 'id', vcn_id)
+            vcn = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_VCN, 'id', vcn_id)
             if vcn:
                 return vcn['name']
 
@@ -1229,7 +1429,7 @@ class ShowOCIData(object):
     def __get_core_network_rpc_name(self, rpc_id):
         try:
             # get DRG name
-            rpc = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_RPC, 'id', rpc_id)
+            rpc = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_RPC, 'id', rpc_id)
             if rpc:
                 if 'name' in rpc:
                     return rpc['name']
@@ -1244,7 +1444,7 @@ class ShowOCIData(object):
     def __get_core_network_subnet_name(self, subnet_id):
         try:
 
-            subnet = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_SUBNET, 'id', subnet_id)
+            subnet = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_SUBNET, 'id', subnet_id)
             if subnet:
                 return (subnet['name'] + " " + subnet['cidr_block'] + ", VCN (" + subnet['vcn_name'] + ")")
             else:
@@ -1273,7 +1473,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            rpcs = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_RPC, 'region_name', region_name, 'compartment_id', compartment['id'])
+            rpcs = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_RPC, 'region_name', region_name, 'compartment_id', compartment['id'])
             for rpc in rpcs:
                 drg_name = self.__get_core_network_drg_name(rpc['drg_id'])
                 main_data = {
@@ -1309,7 +1509,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_ip_sec_connections = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_IPS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_ip_sec_connections = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_IPS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for ips in list_ip_sec_connections:
                 drg = self.__get_core_network_drg_name(ips['drg_id'])
@@ -1352,7 +1552,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_virtual_circuits = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VC, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_virtual_circuits = self.index.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VC, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for vc in list_virtual_circuits:
                 drg = self.__get_core_network_drg_name(vc['drg_id'])
@@ -1397,7 +1597,7 @@ class ShowOCIData(object):
                 }
 
                 # find Attachment for the Virtual Circuit
-                drg_attachment = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_DRG_AT, 'virtual_cirtcuit_id', vc['id'])
+                drg_attachment = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_DRG_AT, 'virtual_cirtcuit_id', vc['id'])
                 if drg_attachment:
                     main_data['drg_route_table_id'] = drg_attachment['drg_route_table_id']
                     main_data['drg_route_table'] = self.__get_core_network_drg_route(drg_attachment['drg_route_table_id'])
@@ -1415,7 +1615,7 @@ class ShowOCIData(object):
 
     def __get_core_network_local_peering(self, local_peering_id):
         try:
-            result = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_LPG, 'id', local_peering_id)
+            result = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_LPG, 'id', local_peering_id)
             if result:
                 if 'name' in result:
                     return result['name']
@@ -1429,7 +1629,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_core_network_route(self, route_table_id):
         try:
-            route = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_ROUTE, 'id', route_table_id)
+            route = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_ROUTE, 'id', route_table_id)
             if route:
                 if 'name' in route:
                     return route['name']
@@ -1444,7 +1644,7 @@ class ShowOCIData(object):
     def __get_core_network_private_ip(self, private_ip_id):
 
         try:
-            result = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_PRIVATEIP, 'id', private_ip_id)
+            result = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_PRIVATEIP, 'id', private_ip_id)
             if result:
                 if 'name' in result:
                     return result['name']
@@ -1528,7 +1728,7 @@ class ShowOCIData(object):
             encrypted = ""
 
             # get block volume
-            bv = self.service.search_unique_item(self.service.C_BLOCK, self.service.C_BLOCK_BOOT, 'id', bva['boot_volume_id'])
+            bv = self.index.search_unique_item(self.service.C_BLOCK, self.service.C_BLOCK_BOOT, 'id', bva['boot_volume_id'])
             if bv:
 
                 # check if different compartment
@@ -1584,7 +1784,7 @@ class ShowOCIData(object):
             encrypted = ""
 
             # get block volume
-            bv = self.service.search_unique_item(self.service.C_BLOCK, self.service.C_BLOCK_VOL, 'id', bva['volume_id'])
+            bv = self.index.search_unique_item(self.service.C_BLOCK, self.service.C_BLOCK_VOL, 'id', bva['volume_id'])
             if bv:
 
                 # check if different compartment
@@ -1639,7 +1839,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            backups = self.service.search_multi_items(self.service.C_BLOCK, service_name, 'region_name', region_name, 'compartment_id', compartment['id'])
+            backups = self.index.search_multi_items(self.service.C_BLOCK, service_name, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for backup in backups:
                 value = {}
@@ -1686,8 +1886,8 @@ class ShowOCIData(object):
 
         data = []
         try:
-            volumes = self.service.search_multi_items(self.service.C_BLOCK, self.service.C_BLOCK_VOL, 'region_name', region_name, 'compartment_id', compartment['id'])
-            volattc = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_VOLUME_ATTACH, 'region_name', region_name)
+            volumes = self.index.search_multi_items(self.service.C_BLOCK, self.service.C_BLOCK_VOL, 'region_name', region_name, 'compartment_id', compartment['id'])
+            volattc = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_VOLUME_ATTACH, 'region_name', region_name)
 
             # loop on volumes
             for vol in volumes:
@@ -1741,8 +1941,8 @@ class ShowOCIData(object):
 
         data = []
         try:
-            volumes = self.service.search_multi_items(self.service.C_BLOCK, self.service.C_BLOCK_BOOT, 'region_name', region_name, 'compartment_id', compartment['id'])
-            volattc = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_BOOT_VOL_ATTACH, 'region_name', region_name)
+            volumes = self.index.search_multi_items(self.service.C_BLOCK, self.service.C_BLOCK_BOOT, 'region_name', region_name, 'compartment_id', compartment['id'])
+            volattc = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_BOOT_VOL_ATTACH, 'region_name', region_name)
 
             # loop on volumes
             for vol in volumes:
@@ -1797,7 +1997,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            volgroups = self.service.search_multi_items(self.service.C_BLOCK, self.service.C_BLOCK_VOLGRP, 'region_name', region_name, 'compartment_id', compartment['id'])
+            volgroups = self.index.search_multi_items(self.service.C_BLOCK, self.service.C_BLOCK_VOLGRP, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for vplgrp in volgroups:
                 value = {
@@ -1815,11 +2015,11 @@ class ShowOCIData(object):
                 }
 
                 for vol_id in vplgrp['volume_ids']:
-                    vol = self.service.search_unique_item(self.service.C_BLOCK, self.service.C_BLOCK_VOL, 'id', vol_id)
+                    vol = self.index.search_unique_item(self.service.C_BLOCK, self.service.C_BLOCK_VOL, 'id', vol_id)
 
                     # if Not a volume, try boot volume
                     if vol is None:
-                        vol = self.service.search_unique_item(self.service.C_BLOCK, self.service.C_BLOCK_BOOT, 'id', vol_id)
+                        vol = self.index.search_unique_item(self.service.C_BLOCK, self.service.C_BLOCK_BOOT, 'id', vol_id)
 
                     # if None continue
                     if vol is None:
@@ -1848,7 +2048,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            instances = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_INST, 'region_name', region_name, 'compartment_id', compartment['id'])
+            instances = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_INST, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for instance in instances:
 
@@ -1869,70 +2069,16 @@ class ShowOCIData(object):
                 if 'Flex' in instance['shape']:
                     sum_flex = "." + str(int(instance['shape_ocpu']))
 
-                inst = {
-                    'id': instance['id'],
+                inst = ShowOCIView(instance, self.view_compute_instances, {
                     'name': instance['shape'] + " - " + instance['display_name'] + " - " + instance['lifecycle_state'],
                     'sum_info': 'Compute',
                     'sum_shape': str(instance['shape'].replace("Flex", "F") + sum_flex).ljust(22, ' ')[0:21] + " - " + sum_shape,
-                    'availability_domain': instance['availability_domain'],
-                    'fault_domain': instance['fault_domain'],
                     'time_maintenance_reboot_due': str(instance['time_maintenance_reboot_due']),
-                    'image': instance['image'], 'image_id': instance['image_id'],
-                    'image_os': instance['image_os'],
-                    'shape': instance['shape'],
-                    'shape_ocpu': instance['shape_ocpu'],
-                    'shape_memory_gb': instance['shape_memory_gb'],
-                    'shape_storage_tb': instance['shape_storage_tb'],
-                    'shape_gpu_description': instance['shape_gpu_description'],
-                    'shape_gpus': instance['shape_gpus'],
-                    'shape_local_disk_description': instance['shape_local_disk_description'],
-                    'shape_local_disks': instance['shape_local_disks'],
-                    'shape_max_vnic_attachments': instance['shape_max_vnic_attachments'],
-                    'shape_networking_bandwidth_in_gbps': instance['shape_networking_bandwidth_in_gbps'],
-                    'shape_processor_description': instance['shape_processor_description'],
-                    'shape_baseline_ocpu_utilization': instance['shape_baseline_ocpu_utilization'],
-                    'shape_local_disks_total_size_in_gbs': instance['shape_local_disks_total_size_in_gbs'],
-                    'display_name': instance['display_name'],
-                    'compartment_name': instance['compartment_name'],
-                    'compartment_path': instance['compartment_path'],
-                    'compartment_id': instance['compartment_id'],
-                    'lifecycle_state': instance['lifecycle_state'],
-                    'console_id': instance['console_id'], 'console': instance['console'],
-                    'time_created': instance['time_created'],
-                    'agent_is_management_disabled': instance['agent_is_management_disabled'],
-                    'agent_is_monitoring_disabled': instance['agent_is_monitoring_disabled'],
-                    'are_all_plugins_disabled': instance['are_all_plugins_disabled'],
-                    'agent_plugin_config': instance['agent_plugin_config'],
-                    'agent_plugin_status': instance['agent_plugin_status'],
-                    'defined_tags': instance['defined_tags'],
-                    'freeform_tags': instance['freeform_tags'],
-                    'metadata': instance['metadata'],
-                    'extended_metadata': instance['extended_metadata'],
-                    'is_live_migration_preferred': instance['is_live_migration_preferred'],
-                    'recovery_action': instance['recovery_action'],
-                    'launch_boot_volume_type': instance['launch_boot_volume_type'],
-                    'launch_firmware': instance['launch_firmware'],
-                    'launch_network_type': instance['launch_network_type'],
-                    'launch_remote_data_volume_type': instance['launch_remote_data_volume_type'],
-                    'launch_is_pv_encryption_in_transit_enabled': instance['launch_is_pv_encryption_in_transit_enabled'],
-                    'launch_is_consistent_volume_naming_enabled': instance['launch_is_consistent_volume_naming_enabled'],
-                    'are_legacy_imds_endpoints_disabled': instance['are_legacy_imds_endpoints_disabled'],
-                    'platform_type': instance['platform_type'],
-                    'platform_is_secure_boot_enabled': instance['platform_is_secure_boot_enabled'],
-                    'platform_is_trusted_platform_module_enabled': instance['platform_is_trusted_platform_module_enabled'],
-                    'platform_is_measured_boot_enabled': instance['platform_is_measured_boot_enabled'],
-                    'platform_is_memory_encryption_enabled': instance['platform_is_memory_encryption_enabled'],
-                    'capacity_reservation_id': instance['capacity_reservation_id'],
-                    'dedicated_vm_host_id': instance['dedicated_vm_host_id'],
-                    'ipxe_script': instance['ipxe_script'],
-                    'launch_mode': instance['launch_mode'],
-                    'is_cross_numa_node': instance['is_cross_numa_node'],
-                    'licensing_configs': instance['licensing_configs'],
                     'logs': self.service.get_logging_log(instance['id'])
-                }
+                })
 
                 # boot volumes attachments
-                boot_vol_attachement = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_BOOT_VOL_ATTACH, 'instance_id', instance['id'])
+                boot_vol_attachement = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_BOOT_VOL_ATTACH, 'instance_id', instance['id'])
 
                 bv = []
                 for bva in boot_vol_attachement:
@@ -1943,7 +2089,7 @@ class ShowOCIData(object):
                 inst['boot_volume'] = bv
 
                 # Volumes attachements
-                block_vol_attaches = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_VOLUME_ATTACH, 'instance_id', instance['id'])
+                block_vol_attaches = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_VOLUME_ATTACH, 'instance_id', instance['id'])
 
                 bvol = []
                 for bvola in block_vol_attaches:
@@ -1955,7 +2101,7 @@ class ShowOCIData(object):
                 inst['block_volume'] = bvol
 
                 # vnic attachements
-                vnicas = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_VNIC_ATTACH, 'instance_id', instance['id'])
+                vnicas = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_VNIC_ATTACH, 'instance_id', instance['id'])
 
                 vnicdata = []
                 fqdn = ""
@@ -2006,7 +2152,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            images = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_IMAGES, 'region_name', region_name, 'compartment_id', compartment['id'])
+            images = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_IMAGES, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for image in images:
                 value = {'id': image['id'],
@@ -2036,7 +2182,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            array = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_CAPACITY_RESERVATION, 'region_name', region_name, 'compartment_id', compartment['id'])
+            array = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_CAPACITY_RESERVATION, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for arr in array:
                 value = {'id': arr['id'],
@@ -2071,7 +2217,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            configs = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_INST_CONFIG, 'region_name', region_name, 'compartment_id', compartment['id'])
+            configs = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_INST_CONFIG, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for config in configs:
 
@@ -2104,7 +2250,7 @@ class ShowOCIData(object):
         data = []
         try:
 
-            pools = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_INST_POOL, 'region_name', region_name, 'compartment_id', compartment['id'])
+            pools = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_INST_POOL, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for pool in pools:
                 value = {'id': pool['id'], 'availability_domains': pool['availability_domains'],
@@ -2127,7 +2273,7 @@ class ShowOCIData(object):
         data = []
         try:
 
-            autos = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_AUTOSCALING, 'region_name', region_name, 'compartment_id', compartment['id'])
+            autos = self.index.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_AUTOSCALING, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for auto in autos:
                 value = {'id': auto['id'],
@@ -2279,7 +2425,7 @@ class ShowOCIData(object):
                 # get db server name
                 dbserver_info = ""
                 if db_node['db_server_id']:
-                    dbserver = self.service.search_unique_item(self.service.C_DATABASE, self.service.C_DATABASE_EXACC_DBSERVERS, 'id', db_node['db_server_id'])
+                    dbserver = self.index.search_unique_item(self.service.C_DATABASE, self.service.C_DATABASE_EXACC_DBSERVERS, 'id', db_node['db_server_id'])
                     if dbserver:
                         value['db_server_name'] = dbserver['display_name']
                         dbserver_info = " (" + dbserver['display_name'] + ")"
@@ -2533,7 +2679,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_exas = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXADATA, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_exas = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXADATA, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for dbs in list_exas:
                 config_str = ' D' + dbs['compute_count'] + 'S' + dbs['storage_count'] if dbs['compute_count'] else ""
@@ -2591,7 +2737,7 @@ class ShowOCIData(object):
                     'adb_clusters': self.__get_database_adb_dedicated(region_name, compartment, dbs['id'])
                 }
 
-                list_vms = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXADATA_VMS, 'region_name', region_name, 'cloud_exadata_infrastructure_id', dbs['id'])
+                list_vms = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXADATA_VMS, 'region_name', region_name, 'cloud_exadata_infrastructure_id', dbs['id'])
                 if list_vms:
                     for vm in list_vms:
                         db_nodes = self.__get_database_db_nodes(vm['db_nodes'])
@@ -2680,7 +2826,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_exas = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXACC, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_exas = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXACC, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for dbs in list_exas:
                 config_str = ' D' + dbs['compute_count'] + 'S' + dbs['activated_storage_count'] if dbs['compute_count'] else ""
@@ -2734,7 +2880,7 @@ class ShowOCIData(object):
                     'name': dbs['display_name'] + " - " + dbs['shape'] + config_str + " - " + dbs['lifecycle_state']
                 }
 
-                list_vms = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXACC_VMS, 'region_name', region_name, 'exadata_infrastructure_id', dbs['id'])
+                list_vms = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXACC_VMS, 'region_name', region_name, 'exadata_infrastructure_id', dbs['id'])
                 if list_vms:
                     for vm in list_vms:
                         db_nodes = self.__get_database_db_nodes(vm['db_nodes'])
@@ -2791,7 +2937,7 @@ class ShowOCIData(object):
         try:
 
             # Fetch the vmclusters
-            vms = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXACC_ADB_VMS, 'region_name', region_name, 'exadata_infrastructure_id', infra_id)
+            vms = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXACC_ADB_VMS, 'region_name', region_name, 'exadata_infrastructure_id', infra_id)
             for vm in vms:
                 vmval = {
                     'id': vm['id'],
@@ -2838,13 +2984,13 @@ class ShowOCIData(object):
                 }
 
                 # fetch the containers
-                containers = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_D_CONTAINERS, 'autonomous_vm_cluster_id', vm['id'])
+                containers = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_D_CONTAINERS, 'autonomous_vm_cluster_id', vm['id'])
                 for ct in containers:
                     ct['name'] = ct['display_name'] + " (" + ct['lifecycle_state'] + "), " + ct['db_version'] + ", Patch Model : " + ct['patch_model']
                     ct['databases'] = []
 
                     # Add Databases
-                    databases = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_DATABASE, 'autonomous_container_database_id', ct['id'])
+                    databases = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_DATABASE, 'autonomous_container_database_id', ct['id'])
                     for arr in databases:
                         db = self.__get_database_adb_database_info(arr)
                         db['sum_info'] = "Autonomous Database Dedicated " + str(db['db_workload']) + " (" + db['compute_model'] + "s) - " + vm['license_model']
@@ -2872,78 +3018,19 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_db_systems = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_DBSYSTEMS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_db_systems = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_DBSYSTEMS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for dbs in list_db_systems:
-                value = {
-                    'id': dbs['id'],
+                value = ShowOCIView(dbs, self.view_database_db_systems, {
                     'name': dbs['display_name'] + " - " + dbs['shape'] + " - " + dbs['lifecycle_state'],
-                    'shape': dbs['shape'],
-                    'shape_ocpu': dbs['shape_ocpu'],
-                    'shape_memory_gb': dbs['shape_memory_gb'],
-                    'shape_storage_tb': dbs['shape_storage_tb'],
-                    'display_name': dbs['display_name'],
-                    'lifecycle_state': dbs['lifecycle_state'],
                     'sum_info': 'Database ' + dbs['database_edition_short'] + " - " + dbs['shape'] + " - " + dbs['license_model'],
                     'sum_info_storage': 'Database - Storage (GB)',
-                    'sum_size_gb': dbs['data_storage_size_in_gbs'],
-                    'database_edition': dbs['database_edition'],
-                    'database_edition_short': dbs['database_edition_short'],
-                    'license_model': dbs['license_model'],
-                    'database_version': dbs['version'],
-                    'availability_domain': dbs['availability_domain'],
-                    'cpu_core_count': dbs['cpu_core_count'],
-                    'node_count': dbs['node_count'],
                     'version': (dbs['version'] + " - ") if dbs['version'] != "None" else "" + ((dbs['database_edition'] + " - ") if dbs['database_edition'] != "None" else "") + dbs['license_model'],
-                    'version_only': dbs['version'],
-                    'version_date': dbs['version_date'],
-                    'host': dbs['hostname'],
-                    'domain': dbs['domain'],
-                    'data_subnet_id': dbs['data_subnet_id'],
-                    'data_subnet': dbs['data_subnet'],
-                    'data_subnet_name': dbs['data_subnet_name'],
-                    'data_vcn_name': dbs['data_vcn_name'],
-                    'backup_subnet_id': dbs['backup_subnet_id'],
-                    'backup_subnet': dbs['backup_subnet'],
-                    'backup_subnet_name': dbs['backup_subnet_name'],
-                    'backup_vcn_name': dbs['backup_vcn_name'],
-                    'scan_dns': dbs['scan_dns_record_id'],
-                    'scan_ips': dbs['scan_ips'],
-                    'data_storage_size_in_gbs': dbs['data_storage_size_in_gbs'],
-                    'reco_storage_size_in_gb': dbs['reco_storage_size_in_gb'],
-                    'sparse_diskgroup': dbs['sparse_diskgroup'],
-                    'storage_management': dbs['storage_management'],
-                    'vip_ips': dbs['vip_ips'],
-                    'zone_id': dbs['zone_id'],
-                    'scan_dns_name': dbs['scan_dns_name'],
-                    'compartment_name': dbs['compartment_name'],
-                    'compartment_path': dbs['compartment_path'],
-                    'compartment_id': dbs['compartment_id'],
-                    'cluster_name': dbs['cluster_name'],
-                    'time_created': dbs['time_created'],
-                    'defined_tags': dbs['defined_tags'],
-                    'freeform_tags': dbs['freeform_tags'],
-                    'listener_port': dbs['listener_port'],
-                    'last_maintenance_run': dbs['last_maintenance_run'],
-                    'next_maintenance_run': dbs['next_maintenance_run'],
-                    'maintenance_window': dbs['maintenance_window'],
-                    'nsg_ids': dbs['nsg_ids'],
-                    'nsg_ids_names': dbs['nsg_ids_names'],
-                    'backup_network_nsg_ids': dbs['backup_network_nsg_ids'],
-                    'backup_network_nsg_ids_names': dbs['backup_network_nsg_ids_names'],
-                    'fault_domains': dbs['fault_domains'],
-                    'memory_size_in_gbs': dbs['memory_size_in_gbs'],
-                    'storage_volume_performance_mode': dbs['storage_volume_performance_mode'],
-                    'time_zone': dbs['time_zone'],
-                    'kms_key_id': dbs['kms_key_id'],
                     'kms_key_name': self.__get_vault_key_name(dbs['kms_key_id']),
-                    'os_version': dbs['os_version'],
-                    'disk_redundancy': dbs['disk_redundancy'],
-                    'point_in_time_data_disk_clone_timestamp': dbs['point_in_time_data_disk_clone_timestamp'],
                     'patches': self.__get_database_db_patches(dbs['patches']),
                     'db_homes': self.__get_database_db_homes(dbs['db_homes']),
                     'db_nodes': self.__get_database_db_nodes(dbs['db_nodes'])
-                }
+                })
 
                 if dbs['data_storage_size_in_gbs']:
                     value['data'] = str(dbs['data_storage_size_in_gbs']) + "GB - " + str(dbs['data_storage_percentage']) + "%" + (" - " + dbs['storage_management'] if dbs['storage_management'] else "") + (" - Reco: " + dbs['reco_storage_size_in_gb'] + "GB" if dbs['reco_storage_size_in_gb'] else "")
@@ -2964,7 +3051,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_db_backups = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_BACKUPS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_db_backups = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_BACKUPS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for backup in list_db_backups:
                 ssize = ""
@@ -3163,7 +3250,7 @@ class ShowOCIData(object):
             # get the nsg names
             if dbs['nsg_ids']:
                 for nsg in dbs['nsg_ids']:
-                    nsg_obj = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', nsg)
+                    nsg_obj = self.index.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', nsg)
                     if nsg_obj:
                         value['nsg_names'].append(nsg_obj['name'])
 
@@ -3180,7 +3267,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_autos = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_DATABASE, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_autos = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_DATABASE, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for dbs in list_autos:
 
@@ -3202,10 +3289,10 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_exascale_vaults = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXASCALE_VAULT, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_exascale_vaults = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXASCALE_VAULT, 'region_name', region_name, 'compartment_id', compartment['id'])
             for vault in list_exascale_vaults:
 
-                list_vms = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXASCALE_VMS, 'region_name', region_name, 'exascale_db_storage_vault_id', vault['id'])
+                list_vms = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXASCALE_VMS, 'region_name', region_name, 'exascale_db_storage_vault_id', vault['id'])
                 if list_vms:
                     for vm in list_vms:
                         db_nodes = self.__get_database_db_nodes(vm['db_nodes'])
@@ -3234,7 +3321,7 @@ class ShowOCIData(object):
         try:
 
             # Fetch the vmclusters
-            vms = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_D_VMS, 'region_name', region_name, 'cloud_exadata_infrastructure_id', infra_id)
+            vms = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_D_VMS, 'region_name', region_name, 'cloud_exadata_infrastructure_id', infra_id)
             for vm in vms:
                 vmval = {
                     'id': vm['id'],
@@ -3292,13 +3379,13 @@ class ShowOCIData(object):
                     'containers': []}
 
                 # fetch the containers
-                containers = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_D_CONTAINERS, 'cloud_autonomous_vm_cluster_id', vm['id'])
+                containers = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_D_CONTAINERS, 'cloud_autonomous_vm_cluster_id', vm['id'])
                 for ct in containers:
                     ct['name'] = ct['display_name'] + " (" + ct['lifecycle_state'] + "), " + ct['db_version'] + ", Patch Model : " + ct['patch_model']
                     ct['databases'] = []
 
                     # Add Databases
-                    databases = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_DATABASE, 'autonomous_container_database_id', ct['id'])
+                    databases = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_DATABASE, 'autonomous_container_database_id', ct['id'])
                     for arr in databases:
                         db = self.__get_database_adb_database_info(arr)
                         db['sum_info'] = "Autonomous Database Dedicated " + str(db['db_workload']) + " (" + db['compute_model'] + "s) - " + vm['license_model']
@@ -3326,7 +3413,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_tables = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_NOSQL, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_tables = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_NOSQL, 'region_name', region_name, 'compartment_id', compartment['id'])
             if list_tables:
                 data = list_tables
             return data
@@ -3342,12 +3429,12 @@ class ShowOCIData(object):
 
         data = []
         try:
-            mysql = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_MYSQL, 'region_name', region_name, 'compartment_id', compartment['id'])
+            mysql = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_MYSQL, 'region_name', region_name, 'compartment_id', compartment['id'])
             if mysql:
                 for dbs in mysql:
 
                     # Add backup
-                    backups = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_MYSQL_BACKUPS, 'region_name', region_name, 'db_system_id', dbs['id'])
+                    backups = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_MYSQL_BACKUPS, 'region_name', region_name, 'db_system_id', dbs['id'])
                     if backups:
                         dbs['backups'] = backups
 
@@ -3370,12 +3457,12 @@ class ShowOCIData(object):
 
         data = []
         try:
-            backups = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_MYSQL_BACKUPS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            backups = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_MYSQL_BACKUPS, 'region_name', region_name, 'compartment_id', compartment['id'])
             if backups:
                 for bck in backups:
 
                     # check if db_system_id exist, if exist skip
-                    dbs = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_MYSQL, 'region_name', region_name, 'id', bck['db_system_id'])
+                    dbs = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_MYSQL, 'region_name', region_name, 'id', bck['db_system_id'])
                     if dbs:
                         continue
 
@@ -3393,12 +3480,12 @@ class ShowOCIData(object):
 
         data = []
         try:
-            pg = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_POSTGRESQL, 'region_name', region_name, 'compartment_id', compartment['id'])
+            pg = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_POSTGRESQL, 'region_name', region_name, 'compartment_id', compartment['id'])
             if pg:
                 for dbs in pg:
 
                     # Add backup
-                    backups = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_POSTGRESQL_BACKUPS, 'region_name', region_name, 'db_system_id', dbs['id'])
+                    backups = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_POSTGRESQL_BACKUPS, 'region_name', region_name, 'db_system_id', dbs['id'])
                     if backups:
                         dbs['backups'] = backups
 
@@ -3421,12 +3508,12 @@ class ShowOCIData(object):
 
         data = []
         try:
-            backups = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_POSTGRESQL_BACKUPS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            backups = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_POSTGRESQL_BACKUPS, 'region_name', region_name, 'compartment_id', compartment['id'])
             if backups:
                 for bck in backups:
 
                     # check if db_system_id exist, if exist skip
-                    dbs = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_POSTGRESQL, 'region_name', region_name, 'id', bck['db_system_id'])
+                    dbs = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_POSTGRESQL, 'region_name', region_name, 'id', bck['db_system_id'])
                     if dbs:
                         continue
 
@@ -3444,7 +3531,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            database_software_images = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_SOFTWARE_IMAGES, 'region_name', region_name, 'compartment_id', compartment['id'])
+            database_software_images = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_SOFTWARE_IMAGES, 'region_name', region_name, 'compartment_id', compartment['id'])
             return database_software_images
 
         except Exception as e:
@@ -3482,7 +3569,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            database_gg_deployments = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_GG_DEPLOYMENTS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            database_gg_deployments = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_GG_DEPLOYMENTS, 'region_name', region_name, 'compartment_id', compartment['id'])
             return database_gg_deployments
 
         except Exception as e:
@@ -3496,7 +3583,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            data = self.service.search_multi_items(self.service.C_ANNOUNCEMENT, self.service.C_ANNOUNCEMENT_DETAILED, 'region_name', region_name, 'compartment_id', compartment['id'])
+            data = self.index.search_multi_items(self.service.C_ANNOUNCEMENT, self.service.C_ANNOUNCEMENT_DETAILED, 'region_name', region_name, 'compartment_id', compartment['id'])
             return data
 
         except Exception as e:
@@ -3510,7 +3597,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            database_gg_db_registrations = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_GG_DB_REGISTRATION, 'region_name', region_name, 'compartment_id', compartment['id'])
+            database_gg_db_registrations = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_GG_DB_REGISTRATION, 'region_name', region_name, 'compartment_id', compartment['id'])
             return database_gg_db_registrations
 
         except Exception as e:
@@ -3593,25 +3680,25 @@ class ShowOCIData(object):
                     return_data['goldengate'] = data
 
             # external CDB
-            data = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXTERNAL_CDB, 'region_name', region_name, 'compartment_id', compartment['id'])
+            data = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXTERNAL_CDB, 'region_name', region_name, 'compartment_id', compartment['id'])
             if data:
                 if len(data) > 0:
                     return_data['db_external_cdb'] = data
 
             # external PDB
-            data = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXTERNAL_PDB, 'region_name', region_name, 'compartment_id', compartment['id'])
+            data = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXTERNAL_PDB, 'region_name', region_name, 'compartment_id', compartment['id'])
             if data:
                 if len(data) > 0:
                     return_data['db_external_pdb'] = data
 
             # external Non-PDB
-            data = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXTERNAL_NONPDB, 'region_name', region_name, 'compartment_id', compartment['id'])
+            data = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXTERNAL_NONPDB, 'region_name', region_name, 'compartment_id', compartment['id'])
             if data:
                 if len(data) > 0:
                     return_data['db_external_nonpdb'] = data
 
             # Data Safe
-            data = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_DATASAFE, 'region_name', region_name, 'compartment_id', compartment['id'])
+            data = self.index.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_DATASAFE, 'region_name', region_name, 'compartment_id', compartment['id'])
             if data and len(data) > 0:
 
                 # add resource name
@@ -3637,7 +3724,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            mount_targets = self.service.search_multi_items(self.service.C_FILE_STORAGE, self.service.C_FILE_STORAGE_MOUNTS, 'export_set_id', export_set_id)
+            mount_targets = self.index.search_multi_items(self.service.C_FILE_STORAGE, self.service.C_FILE_STORAGE_MOUNTS, 'export_set_id', export_set_id)
             for mt in mount_targets:
                 val = {'id': mt['id'],
                        'mount': str(mt['display_name']) + ", Subnet: " + self.service.get_network_subnet(mt['subnet_id'], True),
@@ -3687,7 +3774,7 @@ class ShowOCIData(object):
 
         try:
             data = []
-            exports = self.service.search_multi_items(self.service.C_FILE_STORAGE, self.service.C_FILE_STORAGE_EXPORTS, 'file_system_id', file_system_id)
+            exports = self.index.search_multi_items(self.service.C_FILE_STORAGE, self.service.C_FILE_STORAGE_EXPORTS, 'file_system_id', file_system_id)
 
             for export in exports:
                 dataval = {
@@ -3729,7 +3816,7 @@ class ShowOCIData(object):
     def __get_file_storage_main(self, region_name, compartment):
         data = []
         try:
-            file_systems = self.service.search_multi_items(self.service.C_FILE_STORAGE, self.service.C_FILE_STORAGE_FILESYSTEMS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            file_systems = self.index.search_multi_items(self.service.C_FILE_STORAGE, self.service.C_FILE_STORAGE_FILESYSTEMS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             # handle file systems
             for fs in file_systems:
@@ -3771,54 +3858,28 @@ class ShowOCIData(object):
         data = []
         try:
 
-            buckets = self.service.search_multi_items(self.service.C_OS, self.service.C_OS_BUCKETS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            buckets = self.index.search_multi_items(self.service.C_OS, self.service.C_OS_BUCKETS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             # tbd buckets size
             for bucket in buckets:
-                value = {'name': bucket['name'],
-                         'objects': bucket['approximate_count'],
-                         'time_created': bucket['time_created'],
-                         'size': bucket['approximate_size'],
-                         'sum_size_gb': bucket['size_gb'],
-                         'sum_info': 'Object Storage - Buckets (GB)',
-                         'count': bucket['count'],
-                         'preauthenticated_requests': bucket['preauthenticated_requests'],
-                         'object_lifecycle': bucket['object_lifecycle'],
-                         'compartment_id': bucket['compartment_id'],
-                         'compartment_name': bucket['compartment_name'],
-                         'compartment_path': bucket['compartment_path'],
-                         'region_name': bucket['region_name'],
-                         'namespace_name': bucket['namespace_name'],
-                         'public_access_type': bucket['public_access_type'],
-                         'storage_tier': bucket['storage_tier'],
-                         'object_events_enabled': bucket['object_events_enabled'],
-                         'kms_key_id': bucket['kms_key_id'],
-                         'kms_key_name': self.__get_vault_key_name(bucket['kms_key_id']),
-                         'object_lifecycle_policy_etag': bucket['object_lifecycle_policy_etag'],
-                         'replication_enabled': bucket['replication_enabled'],
-                         'is_read_only': bucket['is_read_only'],
-                         'versioning': bucket['versioning'],
-                         'auto_tiering': bucket['auto_tiering'],
-                         'id': bucket['id'],
-                         'defined_tags': bucket['defined_tags'],
-                         'freeform_tags': bucket['freeform_tags'],
-                         'error_message': bucket['error_message'],
-                         'archival_state': bucket['archival_state'],
-                         'logs': self.service.get_logging_log(bucket['name'])
-                         }
+                value = ShowOCIView(bucket, self.view_object_storage_buckets, {
+                    'sum_info': 'Object Storage - Buckets (GB)',
+                    'kms_key_name': self.__get_vault_key_name(bucket['kms_key_id']),
+                    'logs': self.service.get_logging_log(bucket['name'])
+                })
 
-                replication_enabled = ", Replication" if value['replication_enabled'] == "True" else ""
-                object_events_enabled = ", Events" if value['object_events_enabled'] == "True" else ""
-                is_read_only = ", ReadOnly" if value['is_read_only'] == "True" else ""
+                replication_enabled = ", Replication" if bucket['replication_enabled'] == "True" else ""
+                object_events_enabled = ", Events" if bucket['object_events_enabled'] == "True" else ""
+                is_read_only = ", ReadOnly" if bucket['is_read_only'] == "True" else ""
                 log_enabled = ", Log Enabled" if value['logs'] else ""
-                versioning = ", Versioning" if value['versioning'] == "Enabled" else ""
-                object_lifecycle = ", LifeCycle: " + value['object_lifecycle'] if value['object_lifecycle'] else ""
-                auto_tiering = ", AutoTier" if value['auto_tiering'] != "Disabled" else ""
+                versioning = ", Versioning" if bucket['versioning'] == "Enabled" else ""
+                object_lifecycle = ", LifeCycle: " + bucket['object_lifecycle'] if bucket['object_lifecycle'] else ""
+                auto_tiering = ", AutoTier" if bucket['auto_tiering'] != "Disabled" else ""
 
                 value['desc'] = (
                     bucket['name'].ljust(30)[0:30] + " - " +
-                    value['objects'] + " Objs , " +
-                    value['size'] + "GB (Approx)" +
+                    bucket['approximate_count'] + " Objs , " +
+                    bucket['approximate_size'] + "GB (Approx)" +
                     log_enabled + auto_tiering + versioning + replication_enabled + is_read_only + object_events_enabled +
                     object_lifecycle
                 )
@@ -3868,7 +3929,7 @@ class ShowOCIData(object):
         data = []
         try:
 
-            backendsets = self.service.search_multi_items(self.service.C_LB, self.service.C_LB_BACKEND_SETS, 'load_balancer_id', load_balancer_id)
+            backendsets = self.index.search_multi_items(self.service.C_LB, self.service.C_LB_BACKEND_SETS, 'load_balancer_id', load_balancer_id)
 
             for bs in backendsets:
                 dataval = bs
@@ -3970,7 +4031,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            load_balancers = self.service.search_multi_items(self.service.C_LB, self.service.C_LB_LOAD_BALANCERS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            load_balancers = self.index.search_multi_items(self.service.C_LB, self.service.C_LB_LOAD_BALANCERS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for load_balance_obj in load_balancers:
                 dataval = {
@@ -3995,7 +4056,7 @@ class ShowOCIData(object):
         data = []
         try:
 
-            backendsets = self.service.search_multi_items(self.service.C_LB, self.service.C_LB_NETWORK_BACKEND_SETS, 'load_balancer_id', load_balancer_id)
+            backendsets = self.index.search_multi_items(self.service.C_LB, self.service.C_LB_NETWORK_BACKEND_SETS, 'load_balancer_id', load_balancer_id)
 
             for bs in backendsets:
                 dataval = bs
@@ -4071,7 +4132,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            load_balancers = self.service.search_multi_items(self.service.C_LB, self.service.C_LB_NETWORK_LOAD_BALANCERS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            load_balancers = self.index.search_multi_items(self.service.C_LB, self.service.C_LB_NETWORK_LOAD_BALANCERS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             for load_balance_obj in load_balancers:
                 dataval = {'sum_info': "Network Load Balancer",
@@ -4091,7 +4152,7 @@ class ShowOCIData(object):
     def __get_resource_management_main(self, region_name, compartment):
         data = []
         try:
-            stacks = self.service.search_multi_items(self.service.C_ORM, self.service.C_ORM_STACKS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            stacks = self.index.search_multi_items(self.service.C_ORM, self.service.C_ORM_STACKS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             # query the stacks
             for stack in stacks:
@@ -4121,8 +4182,8 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_email_main(self, region_name, compartment):
         try:
-            senders = self.service.search_multi_items(self.service.C_EMAIL, self.service.C_EMAIL_SENDERS, 'region_name', region_name, 'compartment_id', compartment['id'])
-            suppressions = self.service.search_multi_items(self.service.C_EMAIL, self.service.C_EMAIL_SUPPRESSIONS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            senders = self.index.search_multi_items(self.service.C_EMAIL, self.service.C_EMAIL_SENDERS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            suppressions = self.index.search_multi_items(self.service.C_EMAIL, self.service.C_EMAIL_SUPPRESSIONS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             if not senders and not suppressions:
                 return
@@ -4160,7 +4221,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_container_main(self, region_name, compartment):
         try:
-            containers = self.service.search_multi_items(self.service.C_CONTAINER, self.service.C_CONTAINER_CLUSTERS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            containers = self.index.search_multi_items(self.service.C_CONTAINER, self.service.C_CONTAINER_CLUSTERS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             data = []
             if containers:
@@ -4204,7 +4265,7 @@ class ShowOCIData(object):
                            'vcn_name': self.__get_core_network_vcn_name(container['vcn_id'])}
 
                     # add the node pools
-                    nodes = self.service.search_multi_items(self.service.C_CONTAINER, self.service.C_CONTAINER_NODE_POOLS, 'cluster_id', container['id'])
+                    nodes = self.index.search_multi_items(self.service.C_CONTAINER, self.service.C_CONTAINER_NODE_POOLS, 'cluster_id', container['id'])
                     for np in nodes:
                         nval = {
                             'id': np['id'],
@@ -4242,8 +4303,8 @@ class ShowOCIData(object):
     def __get_streams_queues_main(self, region_name, compartment):
         try:
             data = {}
-            streams = self.service.search_multi_items(self.service.C_STREAMS, self.service.C_STREAMS_STREAMS, 'region_name', region_name, 'compartment_id', compartment['id'])
-            queues = self.service.search_multi_items(self.service.C_STREAMS, self.service.C_STREAMS_QUEUES, 'region_name', region_name, 'compartment_id', compartment['id'])
+            streams = self.index.search_multi_items(self.service.C_STREAMS, self.service.C_STREAMS_STREAMS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            queues = self.index.search_multi_items(self.service.C_STREAMS, self.service.C_STREAMS_QUEUES, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             # if streams add it
             if streams:
@@ -4264,7 +4325,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_functions_main(self, region_name, compartment):
         try:
-            functions_apps = self.service.search_multi_items(self.service.C_FUNCTION, self.service.C_FUNCTION_APPLICATIONS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            functions_apps = self.index.search_multi_items(self.service.C_FUNCTION, self.service.C_FUNCTION_APPLICATIONS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             data = []
             if functions_apps:
@@ -4308,7 +4369,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_apigateway_main(self, region_name, compartment):
         try:
-            apigs = self.service.search_multi_items(self.service.C_API, self.service.C_API_GATEWAYS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            apigs = self.index.search_multi_items(self.service.C_API, self.service.C_API_GATEWAYS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             data = []
             if apigs:
@@ -4316,7 +4377,7 @@ class ShowOCIData(object):
                     val = ap
 
                     # deployments
-                    apidep = self.service.search_multi_items(self.service.C_API, self.service.C_API_DEPLOYMENT, 'region_name', region_name, 'gateway_id', val['id'])
+                    apidep = self.index.search_multi_items(self.service.C_API, self.service.C_API_DEPLOYMENT, 'region_name', region_name, 'gateway_id', val['id'])
                     if apidep:
                         for apid in apidep:
                             vald = apid
@@ -4337,7 +4398,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_fsdr_main(self, region_name, compartment):
         try:
-            fsdr = self.service.search_multi_items(self.service.C_FSDR, self.service.C_FSDR_PROTECTION_GROUPS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            fsdr = self.index.search_multi_items(self.service.C_FSDR, self.service.C_FSDR_PROTECTION_GROUPS, 'region_name', region_name, 'compartment_id', compartment['id'])
             return fsdr
 
         except Exception as e:
@@ -4349,12 +4410,12 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_monitoring_main(self, region_name, compartment):
         try:
-            alarms = self.service.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_ALARMS, 'region_name', region_name, 'compartment_id', compartment['id'])
-            events = self.service.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_EVENTS, 'region_name', region_name, 'compartment_id', compartment['id'])
-            agents = self.service.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_AGENTS, 'region_name', region_name, 'compartment_id', compartment['id'])
-            advisor_recommendations = self.service.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_ADVISOR_RECOMMENDATIONS, 'region_name', region_name, 'compartment_id', compartment['id'])
-            advisor_resource_actions = self.service.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_ADVISOR_RESOURCE_ACTIONS, 'region_name', region_name, 'compartment_id', compartment['id'])
-            db_managements = self.service.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_DB_MANAGEMENT, 'region_name', region_name, 'compartment_id', compartment['id'])
+            alarms = self.index.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_ALARMS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            events = self.index.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_EVENTS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            agents = self.index.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_AGENTS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            advisor_recommendations = self.index.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_ADVISOR_RECOMMENDATIONS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            advisor_resource_actions = self.index.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_ADVISOR_RESOURCE_ACTIONS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            db_managements = self.index.search_multi_items(self.service.C_MONITORING, self.service.C_MONITORING_DB_MANAGEMENT, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             data = {}
             # if events add it
@@ -4409,7 +4470,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_notification_topic_name(self, topic_id):
         try:
-            topic = self.service.search_unique_item(self.service.C_NOTIFICATIONS, self.service.C_NOTIFICATIONS_TOPICS, 'topic_id', topic_id)
+            topic = self.index.search_unique_item(self.service.C_NOTIFICATIONS, self.service.C_NOTIFICATIONS_TOPICS, 'topic_id', topic_id)
             if topic:
                 if topic['description'] != 'None':
                     return topic['name'] + " - " + topic['description']
@@ -4425,7 +4486,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_streaming_stream_name(self, stream_id):
         try:
-            stream = self.service.search_unique_item(self.service.C_STREAMS, self.service.C_STREAMS_STREAMS, 'id', stream_id)
+            stream = self.index.search_unique_item(self.service.C_STREAMS, self.service.C_STREAMS_STREAMS, 'id', stream_id)
             if stream:
                 return stream['name']
             return stream_id
@@ -4438,7 +4499,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_function_name(self, function_id):
         try:
-            function = self.service.search_unique_item(self.service.C_FUNCTION, self.service.C_FUNCTION_FUNCTIONS, 'id', function_id)
+            function = self.index.search_unique_item(self.service.C_FUNCTION, self.service.C_FUNCTION_FUNCTIONS, 'id', function_id)
             if function:
                 return function['display_name']
             return function_id
@@ -4451,7 +4512,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_notifications_main(self, region_name, compartment):
         try:
-            topics = self.service.search_multi_items(self.service.C_NOTIFICATIONS, self.service.C_NOTIFICATIONS_TOPICS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            topics = self.index.search_multi_items(self.service.C_NOTIFICATIONS, self.service.C_NOTIFICATIONS_TOPICS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             data = []
             if topics:
@@ -4468,7 +4529,7 @@ class ShowOCIData(object):
                            'compartment_path': topic['compartment_path'],
                            'compartment_id': topic['compartment_id'],
                            'region_name': topic['region_name'],
-                           'subscriptions': self.service.search_multi_items(self.service.C_NOTIFICATIONS, self.service.C_NOTIFICATIONS_SUBSCRIPTIONS, 'topic_id', topic['topic_id'])
+                           'subscriptions': self.index.search_multi_items(self.service.C_NOTIFICATIONS, self.service.C_NOTIFICATIONS_SUBSCRIPTIONS, 'topic_id', topic['topic_id'])
                            }
 
                     data.append(val)
@@ -4484,12 +4545,12 @@ class ShowOCIData(object):
     def __get_load_edge_main(self, region_name, compartment):
 
         try:
-            healthcheck_http = self.service.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_HEALTHCHECK_HTTP, 'region_name', region_name, 'compartment_id', compartment['id'])
-            healthcheck_ping = self.service.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_HEALTHCHECK_PING, 'region_name', region_name, 'compartment_id', compartment['id'])
-            dns_zone = self.service.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_DNS_ZONE, 'region_name', region_name, 'compartment_id', compartment['id'])
-            dns_steering = self.service.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_DNS_STEERING, 'region_name', region_name, 'compartment_id', compartment['id'])
-            waas_policies = self.service.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_WAAS_POLICIES, 'region_name', region_name, 'compartment_id', compartment['id'])
-            waf = self.service.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_WAF, 'region_name', region_name, 'compartment_id', compartment['id'])
+            healthcheck_http = self.index.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_HEALTHCHECK_HTTP, 'region_name', region_name, 'compartment_id', compartment['id'])
+            healthcheck_ping = self.index.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_HEALTHCHECK_PING, 'region_name', region_name, 'compartment_id', compartment['id'])
+            dns_zone = self.index.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_DNS_ZONE, 'region_name', region_name, 'compartment_id', compartment['id'])
+            dns_steering = self.index.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_DNS_STEERING, 'region_name', region_name, 'compartment_id', compartment['id'])
+            waas_policies = self.index.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_WAAS_POLICIES, 'region_name', region_name, 'compartment_id', compartment['id'])
+            waf = self.index.search_multi_items(self.service.C_EDGE, self.service.C_EDGE_WAF, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             data = {}
             if len(healthcheck_http) > 0 or len(healthcheck_ping) > 0:
@@ -4518,7 +4579,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_limits_main(self, region_name):
         try:
-            limits = self.service.search_multi_items(self.service.C_LIMITS, self.service.C_LIMITS_SERVICES, 'region_name', region_name)
+            limits = self.index.search_multi_items(self.service.C_LIMITS, self.service.C_LIMITS_SERVICES, 'region_name', region_name)
 
             if limits:
                 return limits
@@ -4534,7 +4595,7 @@ class ShowOCIData(object):
     ##########################################################################
     def __get_quotas_main(self, region_name, compartment):
         try:
-            quotas = self.service.search_multi_items(self.service.C_LIMITS, self.service.C_LIMITS_QUOTAS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            quotas = self.index.search_multi_items(self.service.C_LIMITS, self.service.C_LIMITS_QUOTAS, 'region_name', region_name, 'compartment_id', compartment['id'])
 
             if quotas:
                 return quotas
@@ -4552,37 +4613,37 @@ class ShowOCIData(object):
             paas_services = {}
 
             # oic
-            oic = self.service.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_OIC, 'region_name', region_name, 'compartment_id', compartment['id'])
+            oic = self.index.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_OIC, 'region_name', region_name, 'compartment_id', compartment['id'])
             if oic:
                 paas_services['oic'] = oic
 
             # oac
-            oac = self.service.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_OAC, 'region_name', region_name, 'compartment_id', compartment['id'])
+            oac = self.index.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_OAC, 'region_name', region_name, 'compartment_id', compartment['id'])
             if oac:
                 paas_services['oac'] = oac
 
             # oce
-            oce = self.service.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_OCE, 'region_name', region_name, 'compartment_id', compartment['id'])
+            oce = self.index.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_OCE, 'region_name', region_name, 'compartment_id', compartment['id'])
             if oce:
                 paas_services['oce'] = oce
 
             # oce
-            vb = self.service.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_VB, 'region_name', region_name, 'compartment_id', compartment['id'])
+            vb = self.index.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_VB, 'region_name', region_name, 'compartment_id', compartment['id'])
             if vb:
                 paas_services['vb'] = vb
 
             # ocvs
-            ocvs = self.service.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_OCVS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            ocvs = self.index.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_OCVS, 'region_name', region_name, 'compartment_id', compartment['id'])
             if ocvs:
                 paas_services['ocvs'] = ocvs
 
             # devops
-            devops = self.service.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_DEVOPS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            devops = self.index.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_DEVOPS, 'region_name', region_name, 'compartment_id', compartment['id'])
             if devops:
                 paas_services['devops'] = devops
 
             # opensearch
-            open_search = self.service.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_OPEN_SEARCH, 'region_name', region_name, 'compartment_id', compartment['id'])
+            open_search = self.index.search_multi_items(self.service.C_PAAS_NATIVE, self.service.C_PAAS_NATIVE_OPEN_SEARCH, 'region_name', region_name, 'compartment_id', compartment['id'])
             if open_search:
                 paas_services['open_search'] = open_search
 
@@ -4600,7 +4661,7 @@ class ShowOCIData(object):
         data = ""
         try:
             if key_id:
-                key = self.service.search_unique_item(self.service.C_SECURITY, self.service.C_SECURITY_KEYS, 'id', key_id)
+                key = self.index.search_unique_item(self.service.C_SECURITY, self.service.C_SECURITY_KEYS, 'id', key_id)
                 if key:
                     data = key['name']
             return data
@@ -4617,65 +4678,65 @@ class ShowOCIData(object):
             security_services = {}
 
             # cloud guard Main
-            cg = self.service.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_CLOUD_GUARD, 'region_name', region_name, 'compartment_id', compartment['id'])
+            cg = self.index.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_CLOUD_GUARD, 'region_name', region_name, 'compartment_id', compartment['id'])
             if cg:
                 security_services['cloud_guard'] = cg
 
             # bastions
-            bs = self.service.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_BASTION, 'region_name', region_name, 'compartment_id', compartment['id'])
+            bs = self.index.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_BASTION, 'region_name', region_name, 'compartment_id', compartment['id'])
             if bs:
                 security_services['bastions'] = bs
 
             # logging
-            log = self.service.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_LOGGING, 'region_name', region_name, 'compartment_id', compartment['id'])
+            log = self.index.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_LOGGING, 'region_name', region_name, 'compartment_id', compartment['id'])
             if log:
                 security_services['logging'] = log
 
             # logging unified agents
-            logua = self.service.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_LOGGING_UA, 'region_name', region_name, 'compartment_id', compartment['id'])
+            logua = self.index.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_LOGGING_UA, 'region_name', region_name, 'compartment_id', compartment['id'])
             if log:
                 security_services['logging_unified_agents'] = logua
 
             # kms_vaults
-            vaults = self.service.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_VAULTS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            vaults = self.index.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_VAULTS, 'region_name', region_name, 'compartment_id', compartment['id'])
             if vaults:
                 security_services['kms_vaults'] = vaults
 
             # kms_keys
-            keys = self.service.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_KEYS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            keys = self.index.search_multi_items(self.service.C_SECURITY, self.service.C_SECURITY_KEYS, 'region_name', region_name, 'compartment_id', compartment['id'])
             if keys:
                 security_services['kms_keys'] = keys
 
             # certificate
-            certificates = self.service.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_CERTIFICATES, 'region_name', region_name, 'compartment_id', compartment['id'])
+            certificates = self.index.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_CERTIFICATES, 'region_name', region_name, 'compartment_id', compartment['id'])
             if certificates:
                 for crt in certificates:
-                    assoc = self.service.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_ASSOCIATIONS, 'region_name', region_name, 'certificates_resource_id', crt['id'])
+                    assoc = self.index.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_ASSOCIATIONS, 'region_name', region_name, 'certificates_resource_id', crt['id'])
                     if assoc:
                         crt['associated_resource_ids'] = ','.join(x['associated_resource_id'] for x in assoc)
                         crt['associated_resource_names'] = ','.join(self.service.get_resource_name_by_id(x['associated_resource_id']) for x in assoc)
                 security_services['certificates'] = certificates
 
             # certificate associations
-            certificate_associations = self.service.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_ASSOCIATIONS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            certificate_associations = self.index.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_ASSOCIATIONS, 'region_name', region_name, 'compartment_id', compartment['id'])
             if certificate_associations:
                 security_services['certificate_associations'] = certificate_associations
 
             # certificate ca bundle
-            certificate_ca_bundles = self.service.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_CA_BUNDLES, 'region_name', region_name, 'compartment_id', compartment['id'])
+            certificate_ca_bundles = self.index.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_CA_BUNDLES, 'region_name', region_name, 'compartment_id', compartment['id'])
             if certificate_ca_bundles:
                 for crt in certificate_ca_bundles:
-                    assoc = self.service.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_ASSOCIATIONS, 'region_name', region_name, 'certificates_resource_id', crt['id'])
+                    assoc = self.index.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_ASSOCIATIONS, 'region_name', region_name, 'certificates_resource_id', crt['id'])
                     if assoc:
                         crt['associated_resource_ids'] = ','.join(x['associated_resource_id'] for x in assoc)
                         crt['associated_resource_names'] = ','.join(self.service.get_resource_name_by_id(x['associated_resource_id']) for x in assoc)
                 security_services['certificate_ca_bundles'] = certificate_ca_bundles
 
             # certificate authorities
-            certificate_authorities = self.service.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_AUTHORITIES, 'region_name', region_name, 'compartment_id', compartment['id'])
+            certificate_authorities = self.index.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_AUTHORITIES, 'region_name', region_name, 'compartment_id', compartment['id'])
             if certificate_authorities:
                 for crt in certificate_authorities:
-                    assoc = self.service.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_ASSOCIATIONS, 'region_name', region_name, 'certificates_resource_id', crt['id'])
+                    assoc = self.index.search_multi_items(self.service.C_CERTIFICATE, self.service.C_CERTIFICATE_ASSOCIATIONS, 'region_name', region_name, 'certificates_resource_id', crt['id'])
                     if assoc:
                         crt['associated_resource_ids'] = ','.join(x['associated_resource_id'] for x in assoc)
                         crt['associated_resource_names'] = ','.join(self.service.get_resource_name_by_id(x['associated_resource_id']) for x in assoc)
@@ -4695,47 +4756,47 @@ class ShowOCIData(object):
             data_ai = {}
 
             # oda
-            oda = self.service.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_ODA, 'region_name', region_name, 'compartment_id', compartment['id'])
+            oda = self.index.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_ODA, 'region_name', region_name, 'compartment_id', compartment['id'])
             if oda:
                 data_ai['oda'] = oda
 
             # bds
-            bds = self.service.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_BDS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            bds = self.index.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_BDS, 'region_name', region_name, 'compartment_id', compartment['id'])
             if bds:
                 data_ai['bds'] = bds
 
             # data science
-            ds = self.service.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_SCIENCE, 'region_name', region_name, 'compartment_id', compartment['id'])
+            ds = self.index.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_SCIENCE, 'region_name', region_name, 'compartment_id', compartment['id'])
             if ds:
                 data_ai['data_science'] = ds
 
             # Data Flow
-            df = self.service.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_FLOW, 'region_name', region_name, 'compartment_id', compartment['id'])
+            df = self.index.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_FLOW, 'region_name', region_name, 'compartment_id', compartment['id'])
             if df:
                 data_ai['data_flow'] = df
 
             # Data Catalog
-            dc = self.service.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_CATALOG, 'region_name', region_name, 'compartment_id', compartment['id'])
+            dc = self.index.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_CATALOG, 'region_name', region_name, 'compartment_id', compartment['id'])
             if dc:
                 data_ai['data_catalog'] = dc
 
             # Data Integration
-            di = self.service.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_DI, 'region_name', region_name, 'compartment_id', compartment['id'])
+            di = self.index.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_DI, 'region_name', region_name, 'compartment_id', compartment['id'])
             if di:
                 data_ai['data_integration'] = di
 
             # Gen AI
-            genai = self.service.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_GENAI, 'region_name', region_name, 'compartment_id', compartment['id'])
+            genai = self.index.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_GENAI, 'region_name', region_name, 'compartment_id', compartment['id'])
             if genai:
                 data_ai['genai'] = genai
 
             # Gen AI Agent
-            genai_agent = self.service.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_GENAI_AGENT, 'region_name', region_name, 'compartment_id', compartment['id'])
+            genai_agent = self.index.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_GENAI_AGENT, 'region_name', region_name, 'compartment_id', compartment['id'])
             if genai_agent:
                 data_ai['genai_agent'] = genai_agent
 
             # Gen AI Agent KB
-            genai_agent_kb = self.service.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_GENAI_AGENT_KB, 'region_name', region_name, 'compartment_id', compartment['id'])
+            genai_agent_kb = self.index.search_multi_items(self.service.C_DATA_AI, self.service.C_DATA_AI_GENAI_AGENT_KB, 'region_name', region_name, 'compartment_id', compartment['id'])
             if genai_agent_kb:
                 data_ai['genai_agent_kb'] = genai_agent_kb
 
@@ -0,0 +1,254 @@
+##########################################################################
+# showoci_index.py
+#
+# Supports Python 3 and above
+#
+# coding: utf-8
+##########################################################################
+# ShowOCIIndex class - hash indexes over the ShowOCIService cache
+#
+# ShowOCIData looks up cache items with search_multi_items and
+# search_unique_item once per region x compartment x service, each call
+# is a linear scan of the cache list. ShowOCIIndex keeps the same call
+# signature but answers from composite key hash indexes which are built
+# lazily per (main_key, sub_key, key fields) on first use.
+#
+# Run this file directly to benchmark against the linear search:
+#    python3 showoci_index.py [-resources 100000]
+##########################################################################
+from __future__ import print_function
+import sys
+
+
+class ShowOCIIndex(object):
+
+    ############################################
+    # Init
+    ############################################
+    def __init__(self, service, verify=False):
+
+        # service holds the cache in service.data and the linear search
+        self.service = service
+
+        # compare every indexed result against the linear search
+        self.verify = verify
+
+        self.error = 0
+        self.error_array = []
+
+        # (main_key, sub_key, keys) -> (cache list, {values: [items]})
+        self.indexes = {}
+
+    ##########################################################################
+    # invalidate all indexes, called when the cache is reloaded
+    ##########################################################################
+    def invalidate(self):
+        self.indexes = {}
+
+    ##########################################################################
+    # return the index for the cache list and key fields, build if needed
+    ##########################################################################
+    def __get_index(self, main_key, sub_key, keys):
+
+        if main_key not in self.service.data:
+            return None
+        if sub_key not in self.service.data[main_key]:
+            return None
+
+        array = self.service.data[main_key][sub_key]
+        index_key = (main_key, sub_key, keys)
+
+        # rebuild if the cache list was replaced since the index was built
+        entry = self.indexes.get(index_key)
+        if entry is not None and entry[0] is array:
+            if entry[1] is None:
+                raise KeyError(keys)
+            return entry[1]
+
+        # an item without a key field raises KeyError like the linear search,
+        # the list is then not indexed and the linear search answers
+        index = {}
+        try:
+            for item in array:
+                value = tuple(item[key] for key in keys)
+                bucket = index.get(value)
+                if bucket is None:
+                    index[value] = [item]
+                else:
+                    bucket.append(item)
+
+        except KeyError:
+            self.indexes[index_key] = (array, None)
+            raise
+
+        self.indexes[index_key] = (array, index)
+        return index
+
+    ##########################################################################
+    # lookup the bucket for the key/value pairs, None if not indexed
+    ##########################################################################
+    def __lookup(self, main_key, sub_key, key1, value1, key2, value2):
+
+        if key2:
+            index = self.__get_index(main_key, sub_key, (key1, key2))
+            value = (value1, value2)
+        else:
+            index = self.__get_index(main_key, sub_key, (key1,))
+            value = (value1,)
+
+        if index is None:
+            return None
+        return index.get(value, [])
+
+    ##########################################################################
+    # search multi items, same result as ShowOCIService.search_multi_items
+    ##########################################################################
+    def search_multi_items(self, main_key, sub_key, key1, value1, key2=None, value2=None):
+
+        try:
+            bucket = self.__lookup(main_key, sub_key, key1, value1, key2, value2)
+            result = [] if bucket is None else list(bucket)
+
+        except (TypeError, KeyError):
+            # unhashable search value or item without the key field, use the linear search
+            return self.service.search_multi_items(main_key, sub_key, key1, value1, key2, value2)
+
+        if self.verify:
+            linear = self.service.search_multi_items(main_key, sub_key, key1, value1, key2, value2)
+            if not self.__same_items(result, linear):
+                self.__add_mismatch("search_multi_items", main_key, sub_key, key1, value1, key2, value2)
+                return linear
+
+        return result
+
+    ##########################################################################
+    # search unique item, same result as ShowOCIService.search_unique_item
+    ##########################################################################
+    def search_unique_item(self, main_key, sub_key, key1, value1, key2=None, value2=None):
+
+        try:
+            bucket = self.__lookup(main_key, sub_key, key1, value1, key2, value2)
+            result = bucket[0] if bucket else None
+
+        except (TypeError, KeyError):
+            # unhashable search value or item without the key field, use the linear search
+            return self.service.search_unique_item(main_key, sub_key, key1, value1, key2, value2)
+
+        if self.verify:
+            linear = self.service.search_unique_item(main_key, sub_key, key1, value1, key2, value2)
+            if not (result is linear or (not result and not linear)):
+                self.__add_mismatch("search_unique_item", main_key, sub_key, key1, value1, key2, value2)
+                return linear
+
+        return result
+
+    ##########################################################################
+    # compare two result lists by item identity and order
+    ##########################################################################
+    def __same_items(self, list1, list2):
+
+        if not list1 and not list2:
+            return True
+        if len(list1) != len(list2):
+            return False
+        return all(a is b for a, b in zip(list1, list2))
+
+    ##########################################################################
+    # record verify mismatch
+    ##########################################################################
+    def __add_mismatch(self, caller_function, main_key, sub_key, key1, value1, key2, value2):
+
+        search = main_key + ":" + sub_key + " " + str(key1) + "=" + str(value1)
+        if key2:
+            search += " " + str(key2) + "=" + str(value2)
+
+        print("\nError in ShowOCIIndex:" + caller_function + ": index mismatch " + search)
+        self.error += 1
+        self.error_array.append({
+            'class': "ShowOCIIndex",
+            'function': caller_function,
+            'compartment': "",
+            'error': "index mismatch " + search,
+            'is_warning': str(False)
+        })
+
+
+##########################################################################
+# Benchmark - synthetic cache, index vs linear search
+##########################################################################
+class ShowOCIIndexBenchmarkService(object):
+
+    def __init__(self, data):
+        self.data = data
+
+    def search_multi_items(self, main_key, sub_key, key1, value1, key2=None, value2=None):
+        if main_key not in self.data or sub_key not in self.data[main_key]:
+            return []
+        array = self.data[main_key][sub_key]
+        if key2:
+            return [x for x in array if x[key1] == value1 and x[key2] == value2]
+        return [x for x in array if x[key1] == value1]
+
+    def search_unique_item(self, main_key, sub_key, key1, value1, key2=None, value2=None):
+        result = self.search_multi_items(main_key, sub_key, key1, value1, key2, value2)
+        return result[0] if result else None
+
+
+def run_benchmark(resources=100000, regions=9, compartments=400):
+    import time
+
+    sub_keys = ['instances', 'volumes', 'vnics', 'subnets']
+    per_list = resources // len(sub_keys)
+    data = {'core': {}}
+    for sub_key in sub_keys:
+        data['core'][sub_key] = [{
+            'id': sub_key + "." + str(i),
+            'region_name': "region" + str(i % regions),
+            'compartment_id': "compartment" + str(i % compartments),
+            'vcn_id': "vcn" + str(i % (compartments * 4))
+        } for i in range(per_list)]
+
+    service = ShowOCIIndexBenchmarkService(data)
+    index = ShowOCIIndex(service)
+
+    # same access pattern as ShowOCIData - region x compartment x service
+    # plus one id and one vcn lookup per compartment
+    def run(searcher, region_count):
+        found = 0
+        for r in range(region_count):
+            for c in range(compartments):
+                for sub_key in sub_keys:
+                    found += len(searcher.search_multi_items('core', sub_key, 'region_name', "region" + str(r), 'compartment_id', "compartment" + str(c)))
+                found += len(searcher.search_multi_items('core', 'subnets', 'vcn_id', "vcn" + str(c)))
+                if searcher.search_unique_item('core', 'instances', 'id', "instances." + str(c)):
+                    found += 1
+        return found
+
+    # the linear path is too slow to run in full, time a sample of regions
+    sample_regions = 1
+    start = time.time()
+    linear_found = run(service, sample_regions)
+    linear_elapsed = (time.time() - start) * regions / sample_regions
+
+    start = time.time()
+    index_found = run(index, regions)
+    index_elapsed = time.time() - start
+
+    lookups = regions * compartments * (len(sub_keys) + 2)
+    print("Resources         : " + str(per_list * len(sub_keys)))
+    print("Lookups           : " + str(lookups))
+    print("Linear (estimated): " + '{:.2f}'.format(linear_elapsed) + "s from " + str(sample_regions) + " of " + str(regions) + " regions")
+    print("Index             : " + '{:.2f}'.format(index_elapsed) + "s")
+    print("Speedup           : " + '{:.0f}'.format(linear_elapsed / max(index_elapsed, 0.000001)) + "x")
+    print("Found             : linear " + str(linear_found) + " per sample, index " + str(index_found) + " total")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Benchmark ShowOCIIndex against the linear cache search')
+    parser.add_argument('-resources', default=100000, dest='resources', type=int, help='Number of synthetic resources (default=100000).')
+    parser.add_argument('-regions', default=9, dest='regions', type=int, help='Number of regions (default=9).')
+    parser.add_argument('-compartments', default=400, dest='compartments', type=int, help='Number of compartments (default=400).')
+    cmd = parser.parse_args()
+    run_benchmark(cmd.resources, cmd.regions, cmd.compartments)
+    sys.exit(0)
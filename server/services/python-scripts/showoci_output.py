@@ -14,11 +14,115 @@
 # ShowOCIOutput class, ShowOCISummary class
 # accept data as JSON format and print nice output
 #
+# ShowOCIRenderer class - buffered target of the nice output
+#
+# ShowOCISummary sums with ShowOCIAggregator from showoci_aggregate.py
+#
 # ShowOCICSV class - accept data as JSON and write CSV output files.
+#
+# ShowOCIColumnar class - typed Parquet or Arrow files from the CSV rows
 ##########################################################################
 from __future__ import print_function
 import csv
+import decimal
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
 import sys
+from showoci_aggregate import ShowOCIAggregator
+from showoci_view import view_to_json
+
+
+##########################################################################
+# class ShowOCIRenderer
+# collects the printed lines and writes them to the target in large
+# chunks instead of one write per print
+#
+# target stdout - sys.stdout (looked up on flush, so redirect still works)
+#        file   - file_name
+#        memory - kept in memory, read with get_value()
+#        none   - nothing is rendered, ShowOCIOutput and ShowOCISummary
+#                 skip the formatting, errors are still printed
+##########################################################################
+class ShowOCIRenderer(object):
+
+    ############################################
+    # Init
+    ############################################
+    def __init__(self, target="stdout", file_name="", buffer_size=1024 * 1024):
+
+        if target not in ("stdout", "file", "memory", "none"):
+            raise ValueError("Unknown renderer target " + str(target))
+
+        self.target = target
+        self.enabled = target != "none"
+        self.buffer_size = buffer_size
+        self.lines = []
+        self.size = 0
+        self.stream = None
+
+        if target == "file":
+            self.stream = open(file_name, 'w')
+        elif target == "memory":
+            self.stream = io.StringIO()
+
+    ##########################################################################
+    # print - same arguments as the print function
+    ##########################################################################
+    def print(self, *args, sep=" ", end="\n"):
+
+        if not self.enabled:
+            return
+
+        line = (args[0] if len(args) == 1 and isinstance(args[0], str) else sep.join(str(x) for x in args)) + end
+        self.lines.append(line)
+        self.size += len(line)
+
+        if self.size >= self.buffer_size:
+            self.flush()
+
+    ##########################################################################
+    # print error - flush first so the error stays in place, never suppressed
+    ##########################################################################
+    def print_error(self, *args):
+
+        self.flush()
+        if self.target == "file" or self.target == "memory":
+            self.stream.write(" ".join(str(x) for x in args) + "\n")
+        print(*args)
+
+    ##########################################################################
+    # flush the collected lines to the target
+    ##########################################################################
+    def flush(self):
+
+        if not self.lines:
+            return
+
+        stream = self.stream if self.stream else sys.stdout
+        stream.write("".join(self.lines))
+        self.lines = []
+        self.size = 0
+
+    ##########################################################################
+    # rendered text of memory target
+    ##########################################################################
+    def get_value(self):
+
+        self.flush()
+        return self.stream.getvalue() if self.target == "memory" else ""
+
+    ##########################################################################
+    # flush and close file target
+    ##########################################################################
+    def close(self):
+
+        self.flush()
+        if self.target == "file":
+            self.stream.close()
 
 
 class ShowOCIOutput(object):
@@ -35,8 +139,9 @@ class ShowOCIOutput(object):
     ############################################
     # Init
     ############################################
-    def __init__(self):
-        pass
+    def __init__(self, renderer=None):
+        self.renderer = renderer if renderer else ShowOCIRenderer()
+        self.print = self.renderer.print
 
     ##########################################################################
     # Print header centered
@@ -45,12 +150,13 @@ class ShowOCIOutput(object):
         options = {0: 95, 1: 60, 2: 40, 3: 85}
         chars = int(options[category])
         if topBorder:
-            print("")
-            print('#' * chars)
+            self.print("")
+            self.print('#' * chars)
         if printText:
-            print("#" + name.center(chars - 2, " ") + "#")
+            self.print("#" + name.center(chars - 2, " ") + "#")
         if bottomBorder:
-            print('#' * chars)
+            self.print('#' * chars)
+        self.renderer.flush()
 
     ##########################################################################
     # list_to_str
@@ -74,6 +180,10 @@ class ShowOCIOutput(object):
 
     def print_data(self, data, print_version=False):
         try:
+            # nothing rendered, skip the formatting
+            if not self.renderer.enabled:
+                return
+
             has_data = False
             for d in data:
                 if 'type' in d:
@@ -118,12 +228,14 @@ class ShowOCIOutput(object):
                         has_data = True
 
                     else:
-                        print("Error Unknown Type in JSON file...")
+                        self.print("Error Unknown Type in JSON file...")
 
             # if no data - print message
             if not has_data:
-                print("")
-                print("*** Data not found, please check your execution flags ***")
+                self.print("")
+                self.print("*** Data not found, please check your execution flags ***")
+
+            self.renderer.flush()
 
         except Exception as e:
             raise Exception("Error in self.__print_main: " + str(e.args))
@@ -134,43 +246,44 @@ class ShowOCIOutput(object):
     def print_showoci_config(self, data):
         try:
             self.print_header(data['program'], 1)
-            print("Author          : " + data['author'])
-            print("Contributors    : " + data['contributors'])
-            print("Disclaimer      : " + data['disclaimer1'])
-            print("                : " + data['disclaimer2'])
-            print("Machine         : " + data['machine'])
-            print("Python Version  : " + data['python'])
+            self.print("Author          : " + data['author'])
+            self.print("Contributors    : " + data['contributors'])
+            self.print("Disclaimer      : " + data['disclaimer1'])
+            self.print("                : " + data['disclaimer2'])
+            self.print("Machine         : " + data['machine'])
+            self.print("Python Version  : " + data['python'])
             if data['use_instance_principals']:
-                print("Authentication  : Instance Principals")
+                self.print("Authentication  : Instance Principals")
             elif data['use_delegation_token']:
-                print("Authentication  : Instance Principals with Delegation Token")
-                print("Config File     : " + data['config_file'])
-                print("Config Profile  : " + data['config_profile'])
+                self.print("Authentication  : Instance Principals with Delegation Token")
+                self.print("Config File     : " + data['config_file'])
+                self.print("Config Profile  : " + data['config_profile'])
             elif data['use_security_token']:
-                print("Authentication  : Config File with Security Token")
-                print("Config File     : " + data['config_file'])
-                print("Config Profile  : " + data['config_profile'])
+                self.print("Authentication  : Config File with Security Token")
+                self.print("Config File     : " + data['config_file'])
+                self.print("Config Profile  : " + data['config_profile'])
             else:
-                print("Authentication  : Config File")
-                print("Config File     : " + data['config_file'])
-                print("Config Profile  : " + data['config_profile'])
-            print("Date/Time       : " + data['datetime'])
-            print("API Conn Timeout: " + str(data['connection_timeout']))
-            print("API Read Timeout: " + str(data['read_timeout']))
-            print("Command Line    : " + data['cmdline'])
-            print("Showoci Version : " + data['version'])
-            print("OCI SDK Version : " + data['oci_sdk_version'])
+                self.print("Authentication  : Config File")
+                self.print("Config File     : " + data['config_file'])
+                self.print("Config Profile  : " + data['config_profile'])
+            self.print("Date/Time       : " + data['datetime'])
+            self.print("API Conn Timeout: " + str(data['connection_timeout']))
+            self.print("API Read Timeout: " + str(data['read_timeout']))
+            self.print("Command Line    : " + data['cmdline'])
+            self.print("Showoci Version : " + data['version'])
+            self.print("OCI SDK Version : " + data['oci_sdk_version'])
             if 'proxy' in data:
-                print("Proxy           : " + data['proxy'])
+                self.print("Proxy           : " + data['proxy'])
             if 'override_tenant_id' in data:
                 if data['override_tenant_id']:
-                    print("Override id     : " + data['override_tenant_id'])
+                    self.print("Override id     : " + data['override_tenant_id'])
             if 'joutfile' in data:
-                print("JSON Out        : " + data['joutfile'])
+                self.print("JSON Out        : " + data['joutfile'])
             if 'threads' in data:
-                print("Running Threads : " + str(data['threads']))
+                self.print("Running Threads : " + str(data['threads']))
 
-            print("")
+            self.print("")
+            self.renderer.flush()
 
         except Exception as e:
             raise Exception("Error in print_showoci_config: " + str(e.args))
@@ -189,9 +302,9 @@ class ShowOCIOutput(object):
         caller_function = sys._getframe(2).f_code.co_name + ":" + sys._getframe(1).f_code.co_name
 
         if isinstance(e, KeyError):
-            print("\nError in " + classname + ":" + caller_function + ":" + msg + ": KeyError " + str(e.args))
+            self.renderer.print_error("\nError in " + classname + ":" + caller_function + ":" + msg + ": KeyError " + str(e.args))
         else:
-            print("\nError in " + classname + ":" + caller_function + ":" + msg + ": " + str(e))
+            self.renderer.print_error("\nError in " + classname + ":" + caller_function + ":" + msg + ": " + str(e))
 
         self.error += 1
 
@@ -202,11 +315,11 @@ class ShowOCIOutput(object):
         try:
 
             self.print_header("Tenancy", 0)
-            print("Name        : " + tenancy['name'])
-            print("Tenant Id   : " + tenancy['id'])
-            print("Home Region : " + tenancy['home_region_key'])
-            print("Subs Region : " + tenancy['subscribe_regions'])
-            print("")
+            self.print("Name        : " + tenancy['name'])
+            self.print("Tenant Id   : " + tenancy['id'])
+            self.print("Home Region : " + tenancy['home_region_key'])
+            self.print("Subs Region : " + tenancy['subscribe_regions'])
+            self.print("")
 
         except Exception as e:
             self.__print_error("__print_identity_tenancy", e)
@@ -222,26 +335,26 @@ class ShowOCIOutput(object):
             for user in users:
                 last_login = "" if user['last_successful_login_time'] == "None" else ", Last Login = " + user['last_successful_login_time'][0:10]
                 mfa_enabled = "" if user['is_mfa_activated'] == "False" else ", MFA Enabled"
-                print(self.taba + user['name'] + mfa_enabled + last_login)
-                print(self.tabs + "Groups     : " + user['groups'])
+                self.print(self.taba + user['name'] + mfa_enabled + last_login)
+                self.print(self.tabs + "Groups     : " + user['groups'])
 
                 if 'api_keys' in user:
                     for arr in user['api_keys']:
-                        print(self.tabs + "API Keys   : " + arr['id'][-47:] + " (" + arr['lifecycle_state'] + ")")
+                        self.print(self.tabs + "API Keys   : " + arr['id'][-47:] + " (" + arr['lifecycle_state'] + ")")
 
                 if 'auth_token' in user:
                     for arr in user['auth_token']:
-                        print(self.tabs + "Auth Token : " + arr['description'] + " (" + arr['lifecycle_state'] + ")")
+                        self.print(self.tabs + "Auth Token : " + arr['description'] + " (" + arr['lifecycle_state'] + ")")
 
                 if 'secret_keys' in user:
                     for arr in user['secret_keys']:
-                        print(self.tabs + "Secret Key : " + arr['display_name'] + " (" + arr['lifecycle_state'] + ")")
+                        self.print(self.tabs + "Secret Key : " + arr['display_name'] + " (" + arr['lifecycle_state'] + ")")
 
                 if 'smtp_creds' in user:
                     for arr in user['smtp_creds']:
-                        print(self.tabs + "Secret Key : " + arr['description'] + " (" + arr['lifecycle_state'] + ")")
+                        self.print(self.tabs + "Secret Key : " + arr['description'] + " (" + arr['lifecycle_state'] + ")")
 
-                print("")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_identity_users", e)
@@ -258,12 +371,12 @@ class ShowOCIOutput(object):
             self.print_header("Identity Domains", 2)
 
             for domain in domains:
-                print(self.taba + domain['display_name'] + " - " + domain['description'] + " - Created: " + domain['time_created'])
-                print(self.tabs + "Compartment : " + domain['compartment_path'])
-                print(self.tabs + "URL         : " + domain['url'])
-                print(self.tabs + "License     : " + domain['license_type'])
-                print(self.tabs + "Type        : " + domain['type'])
-                print("")
+                self.print(self.taba + domain['display_name'] + " - " + domain['description'] + " - Created: " + domain['time_created'])
+                self.print(self.tabs + "Compartment : " + domain['compartment_path'])
+                self.print(self.tabs + "URL         : " + domain['url'])
+                self.print(self.tabs + "License     : " + domain['license_type'])
+                self.print(self.tabs + "Type        : " + domain['type'])
+                self.print("")
 
             for domain in domains:
                 if 'users' in domain and domain['users']:
@@ -315,7 +428,7 @@ class ShowOCIOutput(object):
                 o_auth2_client_credentials = ", OAuth: " + str(len(user['o_auth2_client_credentials'])) if user['o_auth2_client_credentials'] else ""
                 db_credentials = ", DBCred: " + str(len(user['db_credentials'])) if user['db_credentials'] else ""
 
-                print(self.taba + (username + family_given_name).ljust(ljust_value) + last_login + mfa_enabled + api_keys + roles + customer_secret_keys + auth_tokens + smtp_credentials + o_auth2_client_credentials + db_credentials + groups)
+                self.print(self.taba + (username + family_given_name).ljust(ljust_value) + last_login + mfa_enabled + api_keys + roles + customer_secret_keys + auth_tokens + smtp_credentials + o_auth2_client_credentials + db_credentials + groups)
 
         except Exception as e:
             self.__print_error("__print_identity_domains_users", e)
@@ -329,9 +442,9 @@ class ShowOCIOutput(object):
             self.print_header(header, 2)
 
             for val in groups:
-                print(self.taba + val['display_name'] + " (" + val['ext_group']['description'] + ")")
+                self.print(self.taba + val['display_name'] + " (" + val['ext_group']['description'] + ")")
                 if val['members']:
-                    print(self.tabs + "Users    : " + ', '.join(x['name'] for x in val['members']))
+                    self.print(self.tabs + "Users    : " + ', '.join(x['name'] for x in val['members']))
 
         except Exception as e:
             self.__print_error("__print_identity_domains_groups", e)
@@ -345,9 +458,9 @@ class ShowOCIOutput(object):
             self.print_header(header, 2)
 
             for val in groups:
-                print(self.taba + val['display_name'] + " (" + val['description'] + ")")
-                print(self.tabs + "Rule    : " + val['matching_rule'])
-                print("")
+                self.print(self.taba + val['display_name'] + " (" + val['description'] + ")")
+                self.print(self.tabs + "Rule    : " + val['matching_rule'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_identity_domains_dynamic_groups", e)
@@ -361,10 +474,10 @@ class ShowOCIOutput(object):
             self.print_header(header, 2)
 
             for val in nets:
-                print(self.taba + val['name'] + " (" + val['description'] + ")")
+                self.print(self.taba + val['name'] + " (" + val['description'] + ")")
                 for ip in val['ip_addresses']:
-                    print(self.tabs + "Address: " + ip['value'] + ", " + ip['type'] + ", " + ip['version'])
-                print("")
+                    self.print(self.tabs + "Address: " + ip['value'] + ", " + ip['type'] + ", " + ip['version'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_identity_domains_network_perimeters", e)
@@ -379,9 +492,9 @@ class ShowOCIOutput(object):
 
             for val in idps:
                 if val['enabled'] == "True":
-                    print(self.taba + val['partner_name'] + ", Type: " + val['type'] + ", Desc: " + val['description'])
+                    self.print(self.taba + val['partner_name'] + ", Type: " + val['type'] + ", Desc: " + val['description'])
                     for ig in val['jit_user_prov_group_mappings']:
-                        print(self.tabs + "Group Map : " + ig['value'] + " - " + ig['idp_group'] + " - " + ig['ref'])
+                        self.print(self.tabs + "Group Map : " + ig['value'] + " - " + ig['idp_group'] + " - " + ig['ref'])
 
         except Exception as e:
             self.__print_error("__print_identity_domains_idps", e)
@@ -395,25 +508,25 @@ class ShowOCIOutput(object):
             self.print_header(header, 2)
 
             for val in policies:
-                print(self.taba + val['id'])
-                print(self.tabs + "Name: " + val['name'])
+                self.print(self.taba + val['id'])
+                self.print(self.tabs + "Name: " + val['name'])
                 if val['policy_type']['value']:
-                    print(self.tabs + "Type: " + val['policy_type']['value'])
+                    self.print(self.tabs + "Type: " + val['policy_type']['value'])
                 if val['description']:
-                    print(self.tabs + "Desc: " + val['description'])
+                    self.print(self.tabs + "Desc: " + val['description'])
                 for rl in val['rules']:
-                    print(self.tabs + "Rule: " + rl['name'] + " - " + rl['value'])
-                    print(self.tabs + "      Position  : " + rl['position'])
+                    self.print(self.tabs + "Rule: " + rl['name'] + " - " + rl['value'])
+                    self.print(self.tabs + "      Position  : " + rl['position'])
                     for rt in rl['rule_return']:
-                        print(self.tabs + "      Rule Ret  : " + rt['name'] + " - " + rt['value'])
+                        self.print(self.tabs + "      Rule Ret  : " + rt['name'] + " - " + rt['value'])
                     if rl['condition_group']:
                         cn = rl['condition_group']
                         if 'name' in cn and 'description' in cn:
-                            print(self.tabs + "      Condition : " + cn['name'] + " - " + cn['description'])
+                            self.print(self.tabs + "      Condition : " + cn['name'] + " - " + cn['description'])
                         if 'attribute_name' in cn and 'operator' in cn and 'attribute_value' in cn:
                             if cn['attribute_name'] or cn['operator'] or cn['attribute_value']:
-                                print(self.tabs + "      Attribute : " + cn['attribute_name'] + " - " + cn['operator'] + " - " + cn['attribute_value'])
-                print("")
+                                self.print(self.tabs + "      Attribute : " + cn['attribute_name'] + " - " + cn['operator'] + " - " + cn['attribute_value'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_identity_domains_policies", e)
@@ -427,7 +540,7 @@ class ShowOCIOutput(object):
             self.print_header("Groups", 2)
 
             for group in groups:
-                print(self.taba + group['name'].ljust(18, " ") + " : " + group['users'])
+                self.print(self.taba + group['name'].ljust(18, " ") + " : " + group['users'])
 
         except Exception as e:
             self.__print_error("__print_identity_groups", e)
@@ -447,11 +560,11 @@ class ShowOCIOutput(object):
                 if not policies:
                     continue
 
-                print("\nCompartment " + c['compartment_path'] + ":")
+                self.print("\nCompartment " + c['compartment_path'] + ":")
                 for policy in policies:
-                    print("")
-                    print(self.taba + policy['name'] + ":")
-                    print(self.tabs + "\n    ".join(policy['statements']))
+                    self.print("")
+                    self.print(self.taba + policy['name'] + ":")
+                    self.print(self.tabs + "\n    ".join(policy['statements']))
 
         except Exception as e:
             self.__print_error("__print_identity_policies", e)
@@ -471,10 +584,10 @@ class ShowOCIOutput(object):
                 if not tags:
                     continue
 
-                print("\nCompartment " + c['compartment_path'] + ":")
+                self.print("\nCompartment " + c['compartment_path'] + ":")
                 for tag in tags:
                     retired = " Retired " if tag['is_retired'] == "True" else ""
-                    print(self.taba + tag['name'] + retired + " (" + tag['lifecycle_state'] + "), " + tag['description'])
+                    self.print(self.taba + tag['name'] + retired + " (" + tag['lifecycle_state'] + "), " + tag['description'])
 
         except Exception as e:
             self.__print_error("__print_identity_tag_namespace", e)
@@ -492,18 +605,18 @@ class ShowOCIOutput(object):
             self.print_header("identity providers", 2)
 
             for ip in identity_providers:
-                print(self.taba + ip['name'])
-                print(self.tabs + "Desc      : " + ip['description'])
-                print(self.tabs + "Type      : " + ip['product_type'])
-                print(self.tabs + "Protocol  : " + ip['protocol'])
-                print(self.tabs + "Redirect  : " + ip['redirect_url'])
-                print(self.tabs + "Metadata  : " + ip['metadata_url'])
+                self.print(self.taba + ip['name'])
+                self.print(self.tabs + "Desc      : " + ip['description'])
+                self.print(self.tabs + "Type      : " + ip['product_type'])
+                self.print(self.tabs + "Protocol  : " + ip['protocol'])
+                self.print(self.tabs + "Redirect  : " + ip['redirect_url'])
+                self.print(self.tabs + "Metadata  : " + ip['metadata_url'])
 
                 for map in providers_mapping:
                     if map['provider_id'] == ip['id'] and map['oci_group_name']:
-                        print(self.tabs + "Group Map : " + map['provider_group_name'] + " <-> " + map['oci_group_name'])
-                print("")
-            print("")
+                        self.print(self.tabs + "Group Map : " + map['provider_group_name'] + " <-> " + map['oci_group_name'])
+                self.print("")
+            self.print("")
 
         except Exception as e:
             self.__print_error("__print_identity_providers", e)
@@ -519,10 +632,10 @@ class ShowOCIOutput(object):
             self.print_header("Dynamic Groups", 2)
 
             for dg in dynamic_groups:
-                print(self.taba + dg['name'])
-                print(self.tabs + "Desc      :" + dg['description'])
-                print(self.tabs + "Rules     :" + dg['matching_rule'])
-            print("")
+                self.print(self.taba + dg['name'])
+                self.print(self.tabs + "Desc      :" + dg['description'])
+                self.print(self.tabs + "Rules     :" + dg['matching_rule'])
+            self.print("")
 
         except Exception as e:
             self.__print_error("__print_identity_dynamic_groups", e)
@@ -538,13 +651,13 @@ class ShowOCIOutput(object):
             self.print_header("Network Sources", 2)
 
             for ns in network_sources:
-                print(self.taba + ns['name'])
-                print(self.tabs + "Desc      : " + ns['description'])
-                print(self.tabs + "Services  : " + ", ".join(ns['services']))
-                print(self.tabs + "Public IPs: " + ", ".join(ns['public_source_list']))
-                print(self.tabs + "VCN IPs   : " + ", ".join(x['ip_ranges'] for x in ns['virtual_source_list']))
+                self.print(self.taba + ns['name'])
+                self.print(self.tabs + "Desc      : " + ns['description'])
+                self.print(self.tabs + "Services  : " + ", ".join(ns['services']))
+                self.print(self.tabs + "Public IPs: " + ", ".join(ns['public_source_list']))
+                self.print(self.tabs + "VCN IPs   : " + ", ".join(x['ip_ranges'] for x in ns['virtual_source_list']))
 
-            print("")
+            self.print("")
 
         except Exception as e:
             self.__print_error("__print_network_sources", e)
@@ -559,10 +672,10 @@ class ShowOCIOutput(object):
             self.print_header("Cost Tracking Tags", 2)
 
             for tag in tags:
-                print(self.taba + tag['tag_namespace_name'] + "." + tag['name'])
-                print(self.tabs + "Desc      :" + tag['description'])
-                print(self.tabs + "Created   :" + tag['time_created'][0:16])
-                print("")
+                self.print(self.taba + tag['tag_namespace_name'] + "." + tag['name'])
+                self.print(self.tabs + "Desc      :" + tag['description'])
+                self.print(self.tabs + "Created   :" + tag['time_created'][0:16])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_identity_cost_tracking_tags", e)
@@ -617,20 +730,20 @@ class ShowOCIOutput(object):
     def __print_core_network_vcn_subnet(self, subnets, vcn_compartment):
         try:
             for subnet in subnets:
-                print("")
-                print(self.tabs + "Subnet " + subnet['subnet'] + self.__print_core_network_vcn_compartment(vcn_compartment, subnet['compartment_name']))
-                print(self.tabs + self.tabs + "Name    : " + subnet['name'])
-                print(self.tabs + self.tabs + "DNS     : " + subnet['dns'])
-                print(self.tabs + self.tabs + "DHCP    : " + subnet['dhcp_options'])
-                print(self.tabs + self.tabs + "Route   : " + subnet['route'])
-                print(self.tabs + self.tabs + "Prv IPs : " + str(len(subnet['private_ips'])) + " Private IPs Allocated")
+                self.print("")
+                self.print(self.tabs + "Subnet " + subnet['subnet'] + self.__print_core_network_vcn_compartment(vcn_compartment, subnet['compartment_name']))
+                self.print(self.tabs + self.tabs + "Name    : " + subnet['name'])
+                self.print(self.tabs + self.tabs + "DNS     : " + subnet['dns'])
+                self.print(self.tabs + self.tabs + "DHCP    : " + subnet['dhcp_options'])
+                self.print(self.tabs + self.tabs + "Route   : " + subnet['route'])
+                self.print(self.tabs + self.tabs + "Prv IPs : " + str(len(subnet['private_ips'])) + " Private IPs Allocated")
                 for s in subnet['security_list']:
-                    print(self.tabs + self.tabs + "Sec List: " + s)
+                    self.print(self.tabs + self.tabs + "Sec List: " + s)
 
                 # print logs
                 if 'logs' in subnet:
                     for index, log in enumerate(subnet['logs'], start=1):
-                        print(self.tabs + self.tabs + "Log " + str(index) + "   : " + log['name'] + " - " + log['source_service'])
+                        self.print(self.tabs + self.tabs + "Log " + str(index) + "   : " + log['name'] + " - " + log['source_service'])
 
         except Exception as e:
             self.__print_error("__print_core_network_vcn_subnet", e)
@@ -642,11 +755,11 @@ class ShowOCIOutput(object):
     def __print_core_network_vcn_vlan(self, vlans, vcn_compartment):
         try:
             for vlan in vlans:
-                print("")
-                print(self.tabs + "VLAN " + vlan['vlan'] + self.__print_core_network_vcn_compartment(vcn_compartment, vlan['compartment_name']))
-                print(self.tabs + self.tabs + "Route   : " + vlan['route'])
+                self.print("")
+                self.print(self.tabs + "VLAN " + vlan['vlan'] + self.__print_core_network_vcn_compartment(vcn_compartment, vlan['compartment_name']))
+                self.print(self.tabs + self.tabs + "Route   : " + vlan['route'])
                 for s in vlan['nsg']:
-                    print(self.tabs + self.tabs + "NSG     : " + s)
+                    self.print(self.tabs + self.tabs + "NSG     : " + s)
 
         except Exception as e:
             self.__print_error("__print_core_network_vcn_vlan", e)
@@ -658,11 +771,11 @@ class ShowOCIOutput(object):
     def __print_core_network_vcn_dhcp_options(self, dhcp_options, vcn_compartment):
         try:
             for dhcp in dhcp_options:
-                print("")
-                print(self.tabs + "DHCP Options: " + dhcp['name'] + self.__print_core_network_vcn_compartment(vcn_compartment, dhcp['compartment_name']))
+                self.print("")
+                self.print(self.tabs + "DHCP Options: " + dhcp['name'] + self.__print_core_network_vcn_compartment(vcn_compartment, dhcp['compartment_name']))
 
                 for opt in dhcp['opt']:
-                    print(self.tabs + self.tabs + opt)
+                    self.print(self.tabs + self.tabs + opt)
 
         except Exception as e:
             self.__print_error("__print_core_network_vcn_dhcp_options", e)
@@ -676,13 +789,13 @@ class ShowOCIOutput(object):
             if not sec_lists:
                 return
             for sl in sec_lists:
-                print("")
-                print(self.tabs + "Sec List    : " + str(sl['name']) + self.__print_core_network_vcn_compartment(vcn_compartment, sl['compartment_name']))
+                self.print("")
+                self.print(self.tabs + "Sec List    : " + str(sl['name']) + self.__print_core_network_vcn_compartment(vcn_compartment, sl['compartment_name']))
                 if len(sl['sec_rules']) == 0:
-                    print(self.tabs + "            : Empty.")
+                    self.print(self.tabs + "            : Empty.")
 
                 for slr in sl['sec_rules']:
-                    print(self.tabs + self.tabs + slr['desc'])
+                    self.print(self.tabs + self.tabs + slr['desc'])
 
         except Exception as e:
             self.__print_error("__print_core_network_vcn_security_lists", e)
@@ -696,13 +809,13 @@ class ShowOCIOutput(object):
             if not sec_groups:
                 return
             for sl in sec_groups:
-                print("")
-                print(self.tabs + "Sec Group   : " + str(sl['name']) + self.__print_core_network_vcn_compartment(vcn_compartment, sl['compartment_name']))
+                self.print("")
+                self.print(self.tabs + "Sec Group   : " + str(sl['name']) + self.__print_core_network_vcn_compartment(vcn_compartment, sl['compartment_name']))
                 if len(sl['sec_rules']) == 0:
-                    print(self.tabs + "            : Empty or no Permission.")
+                    self.print(self.tabs + "            : Empty or no Permission.")
 
                 for slr in sl['sec_rules']:
-                    print(self.tabs + self.tabs + slr['desc'])
+                    self.print(self.tabs + self.tabs + slr['desc'])
 
         except Exception as e:
             self.__print_error("__print_core_network_vcn_security_groups", e)
@@ -717,17 +830,17 @@ class ShowOCIOutput(object):
                 return
 
             for rt in route_tables:
-                print("")
-                print(self.tabs + "Route Table : " + rt['name'] + self.__print_core_network_vcn_compartment(vcn_compartment, rt['compartment_name']))
+                self.print("")
+                self.print(self.tabs + "Route Table : " + rt['name'] + self.__print_core_network_vcn_compartment(vcn_compartment, rt['compartment_name']))
 
                 if 'route_rules' not in rt:
-                    print(self.tabs + self.tabs + "Route   : Empty.")
+                    self.print(self.tabs + self.tabs + "Route   : Empty.")
                 else:
                     if len(rt['route_rules']) == 0:
-                        print(self.tabs + self.tabs + "Route   : Empty.")
+                        self.print(self.tabs + self.tabs + "Route   : Empty.")
                     else:
                         for rl in rt['route_rules']:
-                            print(self.tabs + self.tabs + "Route   : " + str(rl['desc']))
+                            self.print(self.tabs + self.tabs + "Route   : " + str(rl['desc']))
 
         except Exception as e:
             self.__print_error("__print_core_network_vcn_route_tables", e)
@@ -743,28 +856,28 @@ class ShowOCIOutput(object):
 
             self.print_header("VCNs", 2)
             for vcn in vcns:
-                print(self.taba + "VCN    " + vcn['name'])
+                self.print(self.taba + "VCN    " + vcn['name'])
                 vcn_compartment = vcn['compartment_name']
 
                 if 'igw' in vcn['data']:
                     for igwloop in vcn['data']['igw']:
-                        print(self.tabs + "Internet GW : " + igwloop['name'] + self.__print_core_network_vcn_compartment(vcn_compartment, igwloop['compartment_name']))
+                        self.print(self.tabs + "Internet GW : " + igwloop['name'] + self.__print_core_network_vcn_compartment(vcn_compartment, igwloop['compartment_name']))
 
                 if 'sgw' in vcn['data']:
                     for sgwloop in vcn['data']['sgw']:
-                        print(self.tabs + "Service GW  : " + sgwloop['name'] + sgwloop['transit'] + " - " + sgwloop['services'] + self.__print_core_network_vcn_compartment(vcn_compartment, sgwloop['compartment_name']))
+                        self.print(self.tabs + "Service GW  : " + sgwloop['name'] + sgwloop['transit'] + " - " + sgwloop['services'] + self.__print_core_network_vcn_compartment(vcn_compartment, sgwloop['compartment_name']))
 
                 if 'nat' in vcn['data']:
                     for natloop in vcn['data']['nat']:
-                        print(self.tabs + "NAT GW      : " + natloop['name'] + self.__print_core_network_vcn_compartment(vcn_compartment, natloop['compartment_name']))
+                        self.print(self.tabs + "NAT GW      : " + natloop['name'] + self.__print_core_network_vcn_compartment(vcn_compartment, natloop['compartment_name']))
 
                 if 'drg_attached' in vcn['data']:
                     for drgloop in vcn['data']['drg_attached']:
-                        print(self.tabs + "DRG Attached: " + drgloop['name'] + self.__print_core_network_vcn_compartment(vcn_compartment, drgloop['compartment_name']))
+                        self.print(self.tabs + "DRG Attached: " + drgloop['name'] + self.__print_core_network_vcn_compartment(vcn_compartment, drgloop['compartment_name']))
 
                 if 'local_peering' in vcn['data']:
                     for lpeer in vcn['data']['local_peering']:
-                        print(self.tabs + "Local Peer  : " + lpeer['name'] + " ---> " + lpeer['peer_name'] + self.__print_core_network_vcn_compartment(vcn_compartment, lpeer['compartment_name']))
+                        self.print(self.tabs + "Local Peer  : " + lpeer['name'] + " ---> " + lpeer['peer_name'] + self.__print_core_network_vcn_compartment(vcn_compartment, lpeer['compartment_name']))
 
                 if 'subnets' in vcn['data']:
                     self.__print_core_network_vcn_subnet(vcn['data']['subnets'], vcn_compartment)
@@ -787,7 +900,7 @@ class ShowOCIOutput(object):
                 if 'dns_resolvers' in vcn['data']:
                     self.__print_core_network_dns_resolver(vcn['data']['dns_resolvers'])
 
-                print("")
+                self.print("")
 
         except BaseException as e:
             self.__print_error("__print_core_network_vcn", e)
@@ -803,37 +916,37 @@ class ShowOCIOutput(object):
 
             self.print_header("DRGs", 2)
             for drg in drgs:
-                print(self.taba + "DRG   Name      : " + drg['name'] + ", Redundant: " + drg['redundancy'])
+                self.print(self.taba + "DRG   Name      : " + drg['name'] + ", Redundant: " + drg['redundancy'])
 
                 for index, arr in enumerate(drg['ip_sec_connections'], start=1):
                     drg_route_table = ", DRG Route: " + arr['drg_route_table'] if arr['drg_route_table'] else ""
-                    print(self.tabs + "      IPSEC " + str(index) + "   : " + arr['name'] + " (" + arr['tunnels_status'] + ")" + drg_route_table)
+                    self.print(self.tabs + "      IPSEC " + str(index) + "   : " + arr['name'] + " (" + arr['tunnels_status'] + ")" + drg_route_table)
                     if 'logs' in arr:
                         for log in arr['logs']:
-                            print(self.tabs + self.tabs + "Log : " + log['name'] + " - " + log['source_service'])
+                            self.print(self.tabs + self.tabs + "Log : " + log['name'] + " - " + log['source_service'])
 
                 for index, arr in enumerate(drg['virtual_circuits'], start=1):
                     drg_route_table = ", DRG Route: " + arr['drg_route_table'] if arr['drg_route_table'] else ""
-                    print(self.tabs + "      VC " + str(index) + "      : " + arr['name'] + " (" + arr['bgp_session_state'] + ")" + drg_route_table)
+                    self.print(self.tabs + "      VC " + str(index) + "      : " + arr['name'] + " (" + arr['bgp_session_state'] + ")" + drg_route_table)
                     if 'logs' in arr:
                         for log in arr['logs']:
-                            print(self.tabs + self.tabs + "Log : " + log['name'] + " - " + log['source_service'])
+                            self.print(self.tabs + self.tabs + "Log : " + log['name'] + " - " + log['source_service'])
 
                 for index, arr in enumerate(drg['remote_peerings'], start=1):
                     drg_route_table = ", DRG Route: " + arr['drg_route_table'] if arr['drg_route_table'] else ""
-                    print(self.tabs + "      RPC " + str(index) + "     : " + arr['name'] + " (" + arr['peering_status'] + ")" + drg_route_table)
+                    self.print(self.tabs + "      RPC " + str(index) + "     : " + arr['name'] + " (" + arr['peering_status'] + ")" + drg_route_table)
 
                 for index, arr in enumerate(drg['vcns'], start=1):
                     drg_route_table = ", DRG Route: " + arr['drg_route_table'] if arr['drg_route_table'] else ""
                     route_table = ", Route Table: " + arr['route_table'] if arr['route_table'] else ""
-                    print(self.tabs + "      VCN " + str(index) + "     : " + arr['name'] + drg_route_table + route_table)
+                    self.print(self.tabs + "      VCN " + str(index) + "     : " + arr['name'] + drg_route_table + route_table)
 
                 for rt in drg['drg_route_tables']:
-                    print("")
-                    print(self.tabs + "      DRG Route : " + rt['display_name'] + ", is_ecmp_enabled: " + rt['is_ecmp_enabled'])
+                    self.print("")
+                    self.print(self.tabs + "      DRG Route : " + rt['display_name'] + ", is_ecmp_enabled: " + rt['is_ecmp_enabled'])
                     for index, arr in enumerate(rt['route_rules'], start=1):
-                        print(self.tabs + "         Rule " + str(index) + " : " + arr['name'])
-                print("")
+                        self.print(self.tabs + "         Rule " + str(index) + " : " + arr['name'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_core_network_drg", e)
@@ -849,19 +962,19 @@ class ShowOCIOutput(object):
 
             self.print_header("Remote Peering", 2)
             for rpc in rpcs:
-                print(self.taba + "RPC   Name   : " + rpc['name'])
-                print(self.tabs + "      DRG    : " + rpc['drg'])
+                self.print(self.taba + "RPC   Name   : " + rpc['name'])
+                self.print(self.tabs + "      DRG    : " + rpc['drg'])
 
                 # if peer has name if not id
                 if rpc['peer_rfc_name']:
-                    print(self.tabs + "      Peer   : " + rpc['peer_rfc_name'] + " - " + rpc['peer_region_name'])
+                    self.print(self.tabs + "      Peer   : " + rpc['peer_rfc_name'] + " - " + rpc['peer_region_name'])
                 else:
-                    print(self.tabs + "      PeerId : " + rpc['peer_id'])
-                    print(self.tabs + "      Region : " + rpc['peer_region_name'])
+                    self.print(self.tabs + "      PeerId : " + rpc['peer_id'])
+                    self.print(self.tabs + "      Region : " + rpc['peer_region_name'])
 
-                print(self.tabs + "      Status : " + rpc['peering_status'])
+                self.print(self.tabs + "      Status : " + rpc['peering_status'])
                 if rpc['is_cross_tenancy_peering'] == "True":
-                    print(self.tabs + "       Tenant: Cross Tenant: " + rpc['peer_tenancy_id'])
+                    self.print(self.tabs + "       Tenant: Cross Tenant: " + rpc['peer_tenancy_id'])
 
         except Exception as e:
             self.__print_error("__print_core_network_vcn", e)
@@ -878,7 +991,7 @@ class ShowOCIOutput(object):
 
             self.print_header("CPEs", 2)
             for cpe in cpes:
-                print(self.taba + "CPE    " + cpe['name'])
+                self.print(self.taba + "CPE    " + cpe['name'])
 
         except Exception as e:
             self.__print_error("__print_core_network_cpe", e)
@@ -896,9 +1009,9 @@ class ShowOCIOutput(object):
             self.print_header("Network Firewalls", 2)
 
             for arr in nfws:
-                print(self.taba + arr['name'] + " - " + arr['availability_domain'] + " - " + arr['ipv4_address'] + " - " + arr['lifecycle_state'])
-                print(self.tabs + "Subnet: " + arr['subnet_name'])
-                print(self.tabs + "Policy: " + arr['network_firewall_policy_name'])
+                self.print(self.taba + arr['name'] + " - " + arr['availability_domain'] + " - " + arr['ipv4_address'] + " - " + arr['lifecycle_state'])
+                self.print(self.tabs + "Subnet: " + arr['subnet_name'])
+                self.print(self.tabs + "Policy: " + arr['network_firewall_policy_name'])
 
         except Exception as e:
             self.__print_error("__print_core_network_firewall", e)
@@ -916,7 +1029,7 @@ class ShowOCIOutput(object):
             self.print_header("Network Firewalls Policies", 2)
 
             for arr in nfws:
-                print(self.taba + arr['display_name'] + " - " + arr['lifecycle_state'])
+                self.print(self.taba + arr['display_name'] + " - " + arr['lifecycle_state'])
 
         except Exception as e:
             self.__print_error("__print_core_network_firewall_policies", e)
@@ -933,16 +1046,16 @@ class ShowOCIOutput(object):
             for rs in resolvers:
                 if not rs['endpoints']:
                     continue
-                print("")
-                print(self.tabs + "DNS Resolver : " + rs['display_name'] + (" ( Protected )" if rs['is_protected'] else ""))
+                self.print("")
+                self.print(self.tabs + "DNS Resolver : " + rs['display_name'] + (" ( Protected )" if rs['is_protected'] else ""))
 
                 # get end points
                 for t in rs['endpoints']:
-                    print(self.tabs + self.tabs + "Endpoint : " + t['endpoint_type'] + " - " + t['name'] + ", " + ("Forwarding: " + t['forwarding_address'] if t['is_forwarding'] else "Listening: " + t['listening_address']))
+                    self.print(self.tabs + self.tabs + "Endpoint : " + t['endpoint_type'] + " - " + t['name'] + ", " + ("Forwarding: " + t['forwarding_address'] if t['is_forwarding'] else "Listening: " + t['listening_address']))
 
                 # get rules
                 for t in rs['rules']:
-                    print(self.tabs + self.tabs + "Rule     : " + t['action'] + ": " + t['source_endpoint_name'] +
+                    self.print(self.tabs + self.tabs + "Rule     : " + t['action'] + ": " + t['source_endpoint_name'] +
                           (": Domains: " + t['qname_cover_conditions'] if t['qname_cover_conditions'] else "") +
                           (": IPs: " + t['client_address_conditions'] if t['client_address_conditions'] else "") +
                           ", Dest = " + t['destination_addresses'])
@@ -962,18 +1075,18 @@ class ShowOCIOutput(object):
             self.print_header("IPSec", 2)
             for ips in ipsecs:
 
-                print(self.taba + "IPSEC  : " + ips['name'])
-                print(self.tabs + "DRG    : " + ips['drg'])
-                print(self.tabs + "CPE    : " + ips['cpe'])
+                self.print(self.taba + "IPSEC  : " + ips['name'])
+                self.print(self.tabs + "DRG    : " + ips['drg'])
+                self.print(self.tabs + "CPE    : " + ips['cpe'])
                 # get tunnel status
                 for t in ips['tunnels']:
-                    print(self.tabs + "Tunnel : " + t['display_name'].ljust(12) + " - " + t['status'] + ", " + t['routing'] + ", VPN: " + t['vpn_ip'] + ", CPE: " + t['cpe_ip'] + ", " + t['status_date'])
+                    self.print(self.tabs + "Tunnel : " + t['display_name'].ljust(12) + " - " + t['status'] + ", " + t['routing'] + ", VPN: " + t['vpn_ip'] + ", CPE: " + t['cpe_ip'] + ", " + t['status_date'])
                     if t['bgp_info']:
-                        print(self.tabs + "       : " + t['bgp_info'])
+                        self.print(self.tabs + "       : " + t['bgp_info'])
 
                 if ips['routes']:
-                    print(self.tabs + "Routes : " + "\n    Static : ".join(ips['routes']))
-                print("")
+                    self.print(self.tabs + "Routes : " + "\n    Static : ".join(ips['routes']))
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_core_network_ipsec", e)
@@ -990,14 +1103,14 @@ class ShowOCIOutput(object):
             self.print_header("Virtual Circuits (FC)", 2)
             for vc in virtual_circuit:
 
-                print(self.taba + "VC      : " + vc['name'] + " - " + vc['bandwidth_shape_name'] + " - " + vc['lifecycle_state'])
-                print(self.tabs + "DRG     : " + vc['drg'])
-                print(self.tabs + "BGP     : " + vc['bgp_management'] + " - " + vc['bgp_session_state'] + " - Cust ASN:" + vc['customer_bgp_asn'] + " - Ora ASN:" + vc['oracle_bgp_asn'])
-                print(self.tabs + "PROVIDER: " + vc['provider_name'] + " - " + vc['provider_service_name'] + " - " + vc['provider_state'] + " - " + vc['service_type'])
+                self.print(self.taba + "VC      : " + vc['name'] + " - " + vc['bandwidth_shape_name'] + " - " + vc['lifecycle_state'])
+                self.print(self.tabs + "DRG     : " + vc['drg'])
+                self.print(self.tabs + "BGP     : " + vc['bgp_management'] + " - " + vc['bgp_session_state'] + " - Cust ASN:" + vc['customer_bgp_asn'] + " - Ora ASN:" + vc['oracle_bgp_asn'])
+                self.print(self.tabs + "PROVIDER: " + vc['provider_name'] + " - " + vc['provider_service_name'] + " - " + vc['provider_state'] + " - " + vc['service_type'])
                 # get tunnel status
                 for t in vc['cross_connect_mappings']:
-                    print(self.tabs + "CCMAP   : Cust : " + str(t['customer_bgp_peering_ip']) + " - Ora : " + str(t['oracle_bgp_peering_ip']) + " - VLAN " + str(t['vlan']))
-                print("")
+                    self.print(self.tabs + "CCMAP   : Cust : " + str(t['customer_bgp_peering_ip']) + " - Ora : " + str(t['oracle_bgp_peering_ip']) + " - VLAN " + str(t['vlan']))
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_core_network_virtual_circuit", e)
@@ -1035,33 +1148,33 @@ class ShowOCIOutput(object):
 
         try:
             for bs in backendset:
-                print("")
+                self.print("")
                 if 'desc' in bs:
-                    print(self.tabs + "backendSet : " + bs['desc'])
+                    self.print(self.tabs + "backendSet : " + bs['desc'])
                 if 'status' in bs:
-                    print(self.tabs + self.tabs + "Status : " + bs['status'])
+                    self.print(self.tabs + self.tabs + "Status : " + bs['status'])
 
                 # list of backends
                 if 'backends' in bs:
                     for backend in bs['backends']:
-                        print(self.tabs + self.tabs + "Backend: " + backend['desc'])
+                        self.print(self.tabs + self.tabs + "Backend: " + backend['desc'])
 
                 if 'health_check' in bs:
                     health = bs['health_check']
-                    print(self.tabs + self.tabs + "H.Chk  : " + health['desc1'])
-                    print(self.tabs + self.tabs + "         " + health['desc2'])
+                    self.print(self.tabs + self.tabs + "H.Chk  : " + health['desc1'])
+                    self.print(self.tabs + self.tabs + "         " + health['desc2'])
 
                 if 'session_persistence' in bs:
                     if bs['session_persistence']:
-                        print(self.tabs + self.tabs + "Cookie : " + bs['session_persistence']['desc'])
+                        self.print(self.tabs + self.tabs + "Cookie : " + bs['session_persistence']['desc'])
 
                 if 'lb_cookie_session_persistence_configuration' in bs:
                     if bs['lb_cookie_session_persistence_configuration']:
-                        print(self.tabs + self.tabs + "LCookie: " + bs['lb_cookie_session_persistence_configuration']['desc'])
+                        self.print(self.tabs + self.tabs + "LCookie: " + bs['lb_cookie_session_persistence_configuration']['desc'])
 
                 if 'ssl_cert' in bs:
                     if bs['ssl_cert']:
-                        print(self.tabs + self.tabs + "Cert   : " + bs['ssl_cert']['desc'])
+                        self.print(self.tabs + self.tabs + "Cert   : " + bs['ssl_cert']['desc'])
 
         except Exception as e:
             self.__print_error("__print_load_balancer_backendset", e)
@@ -1073,53 +1186,53 @@ class ShowOCIOutput(object):
     def __print_load_balancer_details(self, load_balance_obj):
         try:
             lb = load_balance_obj
-            print(self.taba + "Name       : " + lb['name'])
-            print(self.tabs + "Status     : " + lb['status'])
+            self.print(self.taba + "Name       : " + lb['name'])
+            self.print(self.tabs + "Status     : " + lb['status'])
 
             # subnets
             if 'subnets' in lb:
                 for subnet in lb['subnets']:
-                    print(self.tabs + "Subnet     : " + subnet)
+                    self.print(self.tabs + "Subnet     : " + subnet)
 
             if 'nsg_names' in lb:
                 if lb['nsg_names']:
-                    print(self.tabs + "SecGrp     : " + lb['nsg_names'])
+                    self.print(self.tabs + "SecGrp     : " + lb['nsg_names'])
 
             # ip_addresses
             if 'ips' in lb:
                 for ip in lb['ips']:
-                    print(self.tabs + "IP         : " + ip)
+                    self.print(self.tabs + "IP         : " + ip)
 
             # listeners
             if 'listeners' in lb:
                 if not lb['listeners']:
-                    print(self.tabs + "Listener   : None")
+                    self.print(self.tabs + "Listener   : None")
                 for listener in lb['listeners']:
-                    print(self.tabs + "Listener   : " + listener['desc'])
+                    self.print(self.tabs + "Listener   : " + listener['desc'])
                     if listener['path_route_set_name']:
-                        print(self.tabs + "           : Paths: " + listener['path_route_set_name'])
+                        self.print(self.tabs + "           : Paths: " + listener['path_route_set_name'])
                     if listener['rule_set_names']:
-                        print(self.tabs + "           : Rules: " + self.list_to_str(listener['rule_set_names']))
+                        self.print(self.tabs + "           : Rules: " + self.list_to_str(listener['rule_set_names']))
                     if listener['hostname_names']:
-                        print(self.tabs + "           : Hosts: " + self.list_to_str(listener['hostname_names']))
-                print("")
+                        self.print(self.tabs + "           : Hosts: " + self.list_to_str(listener['hostname_names']))
+                self.print("")
 
             # Path route set
             if 'path_route' in lb:
                 for prs in lb['path_route']:
-                    print(self.tabs + "Path Route : " + prs['name'])
+                    self.print(self.tabs + "Path Route : " + prs['name'])
                     if 'path_routes' in prs:
                         for p in prs['path_routes']:
-                            print(self.tabs + "           : Backendset: " + str(p['backend_set_name']) + ',  Path: ' + p['path'])
+                            self.print(self.tabs + "           : Backendset: " + str(p['backend_set_name']) + ',  Path: ' + p['path'])
 
             # Hostnames
             if 'hostnames' in lb:
                 for hostname in lb['hostnames']:
-                    print(self.tabs + "Hostname   : " + hostname)
+                    self.print(self.tabs + "Hostname   : " + hostname)
 
             if 'rule_sets' in lb:
                 for rs in lb['rule_sets']:
-                    print(self.tabs + "RuleSet    : " + rs['name'] + ": " + self.list_to_str(rs['items'], 'action'))
+                    self.print(self.tabs + "RuleSet    : " + rs['name'] + ": " + self.list_to_str(rs['items'], 'action'))
 
         except Exception as e:
             self.__print_error("__print_load_balancer_details", e)
@@ -1133,27 +1246,27 @@ class ShowOCIOutput(object):
             lb = load_balance_obj
             sym = lb['is_symmetric_hash_enabled'] if lb['is_symmetric_hash_enabled'] else "False"
             prsv = lb['is_preserve_source_destination'] if lb['is_preserve_source_destination'] else "False"
-            print(self.taba + "Name       : " + lb['name'])
-            print(self.tabs + "Status     : " + lb['status'])
-            print(self.tabs + "Subnet     : " + lb['subnet_name'])
-            print(self.tabs + "Flags      : is_symmetric_hash_enabled = " + sym + ", is_preserve_source_destination = " + prsv)
+            self.print(self.taba + "Name       : " + lb['name'])
+            self.print(self.tabs + "Status     : " + lb['status'])
+            self.print(self.tabs + "Subnet     : " + lb['subnet_name'])
+            self.print(self.tabs + "Flags      : is_symmetric_hash_enabled = " + sym + ", is_preserve_source_destination = " + prsv)
 
             if 'nsg_names' in lb:
                 if lb['nsg_names']:
-                    print(self.tabs + "SecGrp     : " + lb['nsg_names'])
+                    self.print(self.tabs + "SecGrp     : " + lb['nsg_names'])
 
             # ip_addresses
             if 'ips' in lb:
                 for ip in lb['ips']:
-                    print(self.tabs + "IP         : " + ip)
+                    self.print(self.tabs + "IP         : " + ip)
 
             # listeners
             if 'listeners' in lb:
                 if not lb['listeners']:
-                    print(self.tabs + "Listener   : None")
+                    self.print(self.tabs + "Listener   : None")
                 for listener in lb['listeners']:
-                    print(self.tabs + "Listener   : " + listener['desc'])
-                print("")
+                    self.print(self.tabs + "Listener   : " + listener['desc'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_load_balancer_network_details", e)
@@ -1176,12 +1289,12 @@ class ShowOCIOutput(object):
                 # print logs
                 if 'logs' in load_balance_obj:
                     for index, log in enumerate(load_balance_obj['logs'], start=1):
-                        print(self.tabs + "Log " + str(index) + "      : " + log['name'])
+                        self.print(self.tabs + "Log " + str(index) + "      : " + log['name'])
 
                 if 'backendset' in load_balance_obj:
                     self.__print_load_balancer_backendset(load_balance_obj['backendset'])
 
-                print("")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_load_balancer_main", e)
@@ -1204,7 +1317,7 @@ class ShowOCIOutput(object):
                 if 'backendset' in load_balance_obj:
                     self.__print_load_balancer_backendset(load_balance_obj['backendset'])
 
-                print("")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_load_balancer_network_main", e)
@@ -1216,10 +1329,10 @@ class ShowOCIOutput(object):
 
         try:
             for mt in mount_targets:
-                print(self.tabs + "Mount     : " + mt['mount'])
+                self.print(self.tabs + "Mount     : " + mt['mount'])
 
                 for ip in mt['private_ip_ids']:
-                    print(self.tabs + "Mount IP  : " + ip)
+                    self.print(self.tabs + "Mount IP  : " + ip)
 
         except Exception as e:
             self.__print_error("__print_file_storage_mount_target", e)
@@ -1232,9 +1345,9 @@ class ShowOCIOutput(object):
         try:
             for export in exports:
                 if 'path' in export:
-                    print(self.tabs + "Export    : " + export['path'])
+                    self.print(self.tabs + "Export    : " + export['path'])
                 if 'exportset' in export:
-                    print(self.tabs + "ExportSet : " + export['exportset'])
+                    self.print(self.tabs + "ExportSet : " + export['exportset'])
 
                 # Mount Target
                 self.__print_file_storage_mount_target(export['mount_target'])
@@ -1256,15 +1369,15 @@ class ShowOCIOutput(object):
             # print details
             for fs in file_systems:
                 if 'filesystem' in fs:
-                    print(self.taba + fs['filesystem'])
+                    self.print(self.taba + fs['filesystem'])
                 self.__print_file_storage_exports(fs['exports'])
 
                 # snapshots
                 if 'snapshots' in fs:
                     for snap in fs['snapshots']:
-                        print(self.tabs + "Snap  : " + snap)
+                        self.print(self.tabs + "Snap  : " + snap)
 
-                print("")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_file_storage_main", e)
@@ -1275,115 +1388,115 @@ class ShowOCIOutput(object):
     def __print_database_db_exadata_vmcluster(self, vmclusters):
         try:
             for vm in vmclusters:
-                print("")
+                self.print("")
 
                 if 'display_name' in vm:
-                    print(self.tabs + "VMCLSTR   : " + str(vm['display_name']) + " (" + vm['lifecycle_state'] + ")")
+                    self.print(self.tabs + "VMCLSTR   : " + str(vm['display_name']) + " (" + vm['lifecycle_state'] + ")")
 
                 if 'cluster_name' in vm:
                     if vm['cluster_name']:
-                        print(self.tabs + "Cluster   : " + vm['cluster_name'])
+                        self.print(self.tabs + "Cluster   : " + vm['cluster_name'])
 
                 if 'cpu_core_count' in vm:
-                    print(self.tabs + "Cores     : " + str(vm['cpu_core_count']))
+                    self.print(self.tabs + "Cores     : " + str(vm['cpu_core_count']))
 
                 if 'total_e_cpu_count' in vm:
-                    print(self.tabs + "Tot ECPUs : " + str(vm['total_e_cpu_count']))
+                    self.print(self.tabs + "Tot ECPUs : " + str(vm['total_e_cpu_count']))
 
                 if 'enabled_e_cpu_count' in vm:
-                    print(self.tabs + "Enab ECPUs: " + str(vm['enabled_e_cpu_count']))
+                    self.print(self.tabs + "Enab ECPUs: " + str(vm['enabled_e_cpu_count']))
 
                 if 'memory_size_in_gbs' in vm:
-                    print(self.tabs + "Memory GB : " + str(vm['memory_size_in_gbs']))
+                    self.print(self.tabs + "Memory GB : " + str(vm['memory_size_in_gbs']))
 
                 if 'vm_file_system_storage_in_gbs' in vm:
-                    print(self.tabs + "FS GB     : " + str(vm['vm_file_system_storage_in_gbs']))
+                    self.print(self.tabs + "FS GB     : " + str(vm['vm_file_system_storage_in_gbs']))
 
                 if 'node_count' in vm:
                     if vm['node_count']:
-                        print(self.tabs + "Nodes     : " + str(vm['node_count']))
+                        self.print(self.tabs + "Nodes     : " + str(vm['node_count']))
 
                 if 'domain' in vm:
                     if vm['domain']:
-                        print(self.tabs + "Domain    : " + vm['domain'])
+                        self.print(self.tabs + "Domain    : " + vm['domain'])
 
                 if 'data_subnet' in vm:
                     if vm['data_subnet']:
-                        print(self.tabs + "DataSub   : " + vm['data_subnet'])
+                        self.print(self.tabs + "DataSub   : " + vm['data_subnet'])
 
                 if 'backup_subnet' in vm:
                     if vm['backup_subnet']:
-                        print(self.tabs + "BackSub   : " + vm['backup_subnet'])
+                        self.print(self.tabs + "BackSub   : " + vm['backup_subnet'])
 
                 if 'scan_dns' in vm:
                     if vm['scan_dns']:
-                        print(self.tabs + "Scan      : " + vm['scan_dns_name'])
+                        self.print(self.tabs + "Scan      : " + vm['scan_dns_name'])
 
                 if 'scan_ips' in vm:
                     for ip in vm['scan_ips']:
-                        print(self.tabs + "Scan Ips  : " + ip)
+                        self.print(self.tabs + "Scan Ips  : " + ip)
 
                 if 'vip_ips' in vm:
                     for ip in vm['vip_ips']:
-                        print(self.tabs + "VIP Ips   : " + ip)
+                        self.print(self.tabs + "VIP Ips   : " + ip)
 
                 if 'listener_port' in vm:
-                    print(self.tabs + "Port      : " + vm['listener_port'])
+                    self.print(self.tabs + "Port      : " + vm['listener_port'])
 
                 if 'gi_version' in vm:
                     if vm['gi_version']:
                         if 'gi_version_date' in vm:
-                            print(self.tabs + "Grid Ver  : " + vm['gi_version'] + "  " + vm['gi_version_date'])
+                            self.print(self.tabs + "Grid Ver  : " + vm['gi_version'] + "  " + vm['gi_version_date'])
                         else:
-                            print(self.tabs + "Grid Ver  : " + vm['gi_version'])
+                            self.print(self.tabs + "Grid Ver  : " + vm['gi_version'])
 
                 if 'system_version' in vm:
                     if vm['system_version']:
                         if 'system_version_date' in vm:
-                            print(self.tabs + "Sys Ver   : " + vm['system_version'] + "  " + vm['system_version_date'])
+                            self.print(self.tabs + "Sys Ver   : " + vm['system_version'] + "  " + vm['system_version_date'])
                         else:
-                            print(self.tabs + "Sys Ver   : " + vm['system_version'])
+                            self.print(self.tabs + "Sys Ver   : " + vm['system_version'])
 
                 if 'data_storage_percentage' in vm:
-                    print(self.tabs + "Data      : " + vm['data_storage_percentage'] + "%, Sparse: " + vm['is_sparse_diskgroup_enabled'] + ", Local Backup: " + vm['is_local_backup_enabled'])
+                    self.print(self.tabs + "Data      : " + vm['data_storage_percentage'] + "%, Sparse: " + vm['is_sparse_diskgroup_enabled'] + ", Local Backup: " + vm['is_local_backup_enabled'])
 
                 if 'patches' in vm:
                     for p in vm['patches']:
-                        print(self.tabs + "Patches   : " + p)
+                        self.print(self.tabs + "Patches   : " + p)
 
                 # db nodes
                 for index, db_node in enumerate(vm['db_nodes'], start=1):
-                    print(self.tabs + "DB Node " + str(index) + " : " + db_node['desc'])
+                    self.print(self.tabs + "DB Node " + str(index) + " : " + db_node['desc'])
                     if 'nsg_names' in db_node:
                         if db_node['nsg_names']:
-                            print(self.tabs + "          : SecGrp : " + db_node['nsg_names'])
+                            self.print(self.tabs + "          : SecGrp : " + db_node['nsg_names'])
 
                     if 'time_maintenance_window_start' in db_node:
                         if db_node['maintenance_type'] != "None":
-                            print(self.tabs + self.tabs + "        Maintenance: " + db_node['maintenance_type'] + "  " + db_node['time_maintenance_window_start'][0:16] + " - " + db_node['time_maintenance_window_end'][0:16])
+                            self.print(self.tabs + self.tabs + "        Maintenance: " + db_node['maintenance_type'] + "  " + db_node['time_maintenance_window_start'][0:16] + " - " + db_node['time_maintenance_window_end'][0:16])
 
                 # db homes
                 for db_home in vm['db_homes']:
-                    print(self.tabs + "Home      : " + db_home['home'])
+                    self.print(self.tabs + "Home      : " + db_home['home'])
 
                     # patches
                     for p in db_home['patches']:
-                        print(self.tabs + self.tabs + "   PT : " + p)
+                        self.print(self.tabs + self.tabs + "   PT : " + p)
 
                     # databases
                     for db in db_home['databases']:
                         pdbs = ", PDBS: " + self.list_to_str(db['pdbs'], 'name')
-                        print(self.tabs + self.tabs + "   DB : " + db['name'] + pdbs)
+                        self.print(self.tabs + self.tabs + "   DB : " + db['name'] + pdbs)
 
                         # print data guard
                         for dg in db['dataguard']:
-                            print(self.tabs + self.tabs + "        " + dg['name'])
+                            self.print(self.tabs + self.tabs + "        " + dg['name'])
 
                         # print backups
                         for backup in db['backups']:
-                            print(self.tabs + self.tabs + "        " + backup['name'] + " - " + backup['time'] + " - DB Size " + backup['size'])
+                            self.print(self.tabs + self.tabs + "        " + backup['name'] + " - " + backup['time'] + " - DB Size " + backup['size'])
 
-                    print(self.tabs + "          : " + '-' * 90)
+                    self.print(self.tabs + "          : " + '-' * 90)
 
         except Exception as e:
             self.__print_error("__print_database_db_exadata_vmcluster", e)
@@ -1395,73 +1508,73 @@ class ShowOCIOutput(object):
 
         try:
             for dbs in list_exadata:
-                print("")
+                self.print("")
 
-                print(self.taba + "ExaCS     : " + dbs['name'])
-                print(self.tabs + "Created   : " + dbs['time_created'][0:16])
-                print(self.tabs + "AD        : " + dbs['availability_domain'])
+                self.print(self.taba + "ExaCS     : " + dbs['name'])
+                self.print(self.tabs + "Created   : " + dbs['time_created'][0:16])
+                self.print(self.tabs + "AD        : " + dbs['availability_domain'])
 
                 if 'compute_count' in dbs:
                     if dbs['compute_count'] != "None":
-                        print(self.tabs + "VM Hosts  : " + str(dbs['compute_count']))
+                        self.print(self.tabs + "VM Hosts  : " + str(dbs['compute_count']))
 
                 if 'storage_count' in dbs:
                     if dbs['storage_count'] != "None" and dbs['total_storage_size_in_gbs'] != "None":
-                        print(self.tabs + "Storage   : Hosts = " + str(dbs['storage_count']) + ", Total = " + str(dbs['total_storage_size_in_gbs']) + "GB")
+                        self.print(self.tabs + "Storage   : Hosts = " + str(dbs['storage_count']) + ", Total = " + str(dbs['total_storage_size_in_gbs']) + "GB")
 
                 if 'maintenance_window' in dbs:
                     if dbs['maintenance_window']:
-                        print(self.tabs + "Maint     : Window : " + dbs['maintenance_window']['display'])
+                        self.print(self.tabs + "Maint     : Window : " + dbs['maintenance_window']['display'])
 
                 if 'last_maintenance_run' in dbs:
                     if dbs['last_maintenance_run']:
-                        print(self.tabs + "Maint     : Last   : " + dbs['last_maintenance_run']['description'])
-                        print(self.tabs + "                   : " + dbs['last_maintenance_run']['maintenance_display'])
+                        self.print(self.tabs + "Maint     : Last   : " + dbs['last_maintenance_run']['description'])
+                        self.print(self.tabs + "                   : " + dbs['last_maintenance_run']['maintenance_display'])
 
                 if 'next_maintenance_run' in dbs:
                     if dbs['next_maintenance_run']:
-                        print(self.tabs + "Maint     : Next   : " + dbs['next_maintenance_run']['description'])
-                        print(self.tabs + "                   : " + dbs['next_maintenance_run']['maintenance_display'])
+                        self.print(self.tabs + "Maint     : Next   : " + dbs['next_maintenance_run']['description'])
+                        self.print(self.tabs + "                   : " + dbs['next_maintenance_run']['maintenance_display'])
                         if dbs['next_maintenance_run']['maintenance_alert']:
-                            print(self.tabs + "            Alert  : " + dbs['next_maintenance_run']['maintenance_alert'])
+                            self.print(self.tabs + "            Alert  : " + dbs['next_maintenance_run']['maintenance_alert'])
 
-                print("")
+                self.print("")
                 for index, srv in enumerate(dbs['db_servers'], start=1):
-                    print(self.tabs + "DB Srv " + str(index) + "  : " + srv['desc'])
+                    self.print(self.tabs + "DB Srv " + str(index) + "  : " + srv['desc'])
 
                 # vmclusters
                 self.__print_database_db_exadata_vmcluster(dbs['vm_clusters'])
 
                 # ADB-D Clusters
                 for vm in dbs['adb_clusters']:
-                    print("")
-                    print(self.tabs + "ADB-D VMCLUSTER: " + str(vm['display_name']) + " (" + vm['lifecycle_state'] + ")")
-                    print(self.tabs + "AD             : " + vm['availability_domain'])
-                    print(self.tabs + "Cores          : " + str(vm['cpu_core_count']))
-                    print(self.tabs + "Nodes          : " + str(vm['node_count']))
-                    print(self.tabs + "Domain         : " + vm['domain'])
-                    print(self.tabs + "Subnet         : " + vm['subnet_name'])
-                    print("")
+                    self.print("")
+                    self.print(self.tabs + "ADB-D VMCLUSTER: " + str(vm['display_name']) + " (" + vm['lifecycle_state'] + ")")
+                    self.print(self.tabs + "AD             : " + vm['availability_domain'])
+                    self.print(self.tabs + "Cores          : " + str(vm['cpu_core_count']))
+                    self.print(self.tabs + "Nodes          : " + str(vm['node_count']))
+                    self.print(self.tabs + "Domain         : " + vm['domain'])
+                    self.print(self.tabs + "Subnet         : " + vm['subnet_name'])
+                    self.print("")
 
                     # containers
                     for ct in vm['containers']:
-                        print(self.tabs + "Container      : " + ct['name'])
+                        self.print(self.tabs + "Container      : " + ct['name'])
 
                         # databases
                         for db in ct['databases']:
-                            print(self.tabs + self.taba + "ADB-D DB   : " + db['name'])
-                            print(self.tabs + self.tabs + "Size       : " + str(db['cpu_core_count']) + " OCPUs, " + str(db['data_storage_size_in_tbs']) + "TB Storage")
-                            print(self.tabs + self.tabs + "Created    : " + db['time_created'])
-                            print(self.tabs + self.tabs + "DataSafe   : " + db['data_safe_status'])
-                            print(self.tabs + self.tabs + "Maintenance: " + db['time_maintenance_begin'][0:16] + " - " + db['time_maintenance_end'][0:16])
+                            self.print(self.tabs + self.taba + "ADB-D DB   : " + db['name'])
+                            self.print(self.tabs + self.tabs + "Size       : " + str(db['cpu_core_count']) + " OCPUs, " + str(db['data_storage_size_in_tbs']) + "TB Storage")
+                            self.print(self.tabs + self.tabs + "Created    : " + db['time_created'])
+                            self.print(self.tabs + self.tabs + "DataSafe   : " + db['data_safe_status'])
+                            self.print(self.tabs + self.tabs + "Maintenance: " + db['time_maintenance_begin'][0:16] + " - " + db['time_maintenance_end'][0:16])
                             if db['is_data_guard_enabled']:
-                                print(self.tabs + self.tabs + "Data Guard : Lag In Second: " + db['standby_lag_time_in_seconds'] + ", lifecycle: " + db['standby_lifecycle_state'] + ",  Last Switch: " + db['time_of_last_switchover'][0:16] + ",  Last Failover: " + db['time_of_last_switchover'][0:16])
+                                self.print(self.tabs + self.tabs + "Data Guard : Lag In Second: " + db['standby_lag_time_in_seconds'] + ", lifecycle: " + db['standby_lifecycle_state'] + ",  Last Switch: " + db['time_of_last_switchover'][0:16] + ",  Last Failover: " + db['time_of_last_switchover'][0:16])
 
                             # print backups
                             if db['backups']:
                                 for backup in db['backups']:
-                                    print(self.tabs + self.tabs + "         " + backup['name'] + " - " + backup['time'])
-                            print("")
+                                    self.print(self.tabs + self.tabs + "         " + backup['name'] + " - " + backup['time'])
+                            self.print("")
 
         except Exception as e:
             self.__print_error("__print_database_db_exadata_infra", e)
@@ -1473,15 +1586,15 @@ class ShowOCIOutput(object):
 
         try:
             for dbs in list_exascale:
-                print("")
+                self.print("")
 
-                print(self.taba + "Exascale  : Vault : " + dbs['display_name'] + " - " + dbs['lifecycle_state'])
-                print(self.tabs + "Created   : " + dbs['time_created'][0:16])
-                print(self.tabs + "AD        : " + dbs['availability_domain'])
-                print(self.tabs + "Total GB  : " + dbs['total_size_in_gbs'])
-                print(self.tabs + "Available : " + dbs['available_size_in_gbs'])
-                print(self.tabs + "Flash %   : " + dbs['additional_flash_cache_in_percent'])
-                print(self.tabs + "Clusters  : " + dbs['vm_cluster_count'])
+                self.print(self.taba + "Exascale  : Vault : " + dbs['display_name'] + " - " + dbs['lifecycle_state'])
+                self.print(self.tabs + "Created   : " + dbs['time_created'][0:16])
+                self.print(self.tabs + "AD        : " + dbs['availability_domain'])
+                self.print(self.tabs + "Total GB  : " + dbs['total_size_in_gbs'])
+                self.print(self.tabs + "Available : " + dbs['available_size_in_gbs'])
+                self.print(self.tabs + "Flash %   : " + dbs['additional_flash_cache_in_percent'])
+                self.print(self.tabs + "Clusters  : " + dbs['vm_cluster_count'])
 
                 # vmclusters
                 self.__print_database_db_exadata_vmcluster(dbs['vm_clusters'])
@@ -1496,149 +1609,149 @@ class ShowOCIOutput(object):
 
         try:
             for dbs in list_exadata:
-                print("")
+                self.print("")
 
-                print(self.taba + "ExaCC          : " + dbs['name'])
-                print(self.tabs + "Created        : " + dbs['time_created'][0:16])
+                self.print(self.taba + "ExaCC          : " + dbs['name'])
+                self.print(self.tabs + "Created        : " + dbs['time_created'][0:16])
 
                 if 'cpus_enabled' in dbs:
                     if dbs['cpus_enabled'] != "None":
-                        print(self.tabs + "CPU Enabled    : " + dbs['cpus_enabled'] + " out of " + dbs['max_cpu_count'])
+                        self.print(self.tabs + "CPU Enabled    : " + dbs['cpus_enabled'] + " out of " + dbs['max_cpu_count'])
 
                 if 'memory_size_in_gbs' in dbs:
                     if dbs['memory_size_in_gbs'] != "None":
-                        print(self.tabs + "Memory in GB   : " + dbs['memory_size_in_gbs'] + " out of " + dbs['max_memory_in_gbs'])
+                        self.print(self.tabs + "Memory in GB   : " + dbs['memory_size_in_gbs'] + " out of " + dbs['max_memory_in_gbs'])
 
                 if 'db_node_storage_size_in_gbs' in dbs:
                     if dbs['db_node_storage_size_in_gbs'] != "None":
-                        print(self.tabs + "Node Storage GB: " + dbs['db_node_storage_size_in_gbs'] + " out of " + dbs['max_db_node_storage_in_g_bs'])
+                        self.print(self.tabs + "Node Storage GB: " + dbs['db_node_storage_size_in_gbs'] + " out of " + dbs['max_db_node_storage_in_g_bs'])
 
                 if 'data_storage_size_in_tbs' in dbs:
                     if dbs['data_storage_size_in_tbs'] != "None":
-                        print(self.tabs + "Data Storage TB: " + dbs['data_storage_size_in_tbs'] + " out of " + dbs['max_data_storage_in_t_bs'])
+                        self.print(self.tabs + "Data Storage TB: " + dbs['data_storage_size_in_tbs'] + " out of " + dbs['max_data_storage_in_t_bs'])
 
-                print(self.tabs + "Compute Count  : " + dbs['compute_count'])
-                print(self.tabs + "Storage        : Hosts = " + str(dbs['storage_count']) + ", Additional = " + dbs['additional_storage_count'] + ", Activated = " + dbs['activated_storage_count'])
-                print(self.tabs + "Control Plane  : " + str(dbs['cloud_control_plane_server1']) + ", " + dbs['cloud_control_plane_server2'])
-                print(self.tabs + "Network CIDR   : Admin CIDR = " + str(dbs['admin_network_cidr']) + ", Netmask = " + dbs['netmask'] + ", Gateway = " + dbs['gateway'] + ", Infiniband = " + str(dbs['infini_band_network_cidr']))
-                print(self.tabs + "Network Proxy  : Proxy = " + dbs['corporate_proxy'])
-                print(self.tabs + "Network DNS    : DNS = " + dbs['dns_server'] + ", NTP = " + dbs['ntp_server'])
+                self.print(self.tabs + "Compute Count  : " + dbs['compute_count'])
+                self.print(self.tabs + "Storage        : Hosts = " + str(dbs['storage_count']) + ", Additional = " + dbs['additional_storage_count'] + ", Activated = " + dbs['activated_storage_count'])
+                self.print(self.tabs + "Control Plane  : " + str(dbs['cloud_control_plane_server1']) + ", " + dbs['cloud_control_plane_server2'])
+                self.print(self.tabs + "Network CIDR   : Admin CIDR = " + str(dbs['admin_network_cidr']) + ", Netmask = " + dbs['netmask'] + ", Gateway = " + dbs['gateway'] + ", Infiniband = " + str(dbs['infini_band_network_cidr']))
+                self.print(self.tabs + "Network Proxy  : Proxy = " + dbs['corporate_proxy'])
+                self.print(self.tabs + "Network DNS    : DNS = " + dbs['dns_server'] + ", NTP = " + dbs['ntp_server'])
 
                 if 'maintenance_window' in dbs:
                     if dbs['maintenance_window']:
-                        print(self.tabs + "Maintenance    : Window : " + dbs['maintenance_window']['display'])
+                        self.print(self.tabs + "Maintenance    : Window : " + dbs['maintenance_window']['display'])
 
                 if 'last_maintenance_run' in dbs:
                     if dbs['last_maintenance_run']:
-                        print(self.tabs + "Maintenance    : Last   : " + dbs['last_maintenance_run']['description'])
-                        print(self.tabs + "                        : " + dbs['last_maintenance_run']['maintenance_display'])
+                        self.print(self.tabs + "Maintenance    : Last   : " + dbs['last_maintenance_run']['description'])
+                        self.print(self.tabs + "                        : " + dbs['last_maintenance_run']['maintenance_display'])
 
                 if 'next_maintenance_run' in dbs:
                     if dbs['next_maintenance_run']:
-                        print(self.tabs + "Maintenance    : Next   : " + dbs['next_maintenance_run']['description'])
-                        print(self.tabs + "                        : " + dbs['next_maintenance_run']['maintenance_display'])
+                        self.print(self.tabs + "Maintenance    : Next   : " + dbs['next_maintenance_run']['description'])
+                        self.print(self.tabs + "                        : " + dbs['next_maintenance_run']['maintenance_display'])
                         if dbs['next_maintenance_run']['maintenance_alert']:
-                            print(self.tabs + "                 Alert  : " + dbs['next_maintenance_run']['maintenance_alert'])
+                            self.print(self.tabs + "                 Alert  : " + dbs['next_maintenance_run']['maintenance_alert'])
 
-                print("")
+                self.print("")
                 for index, srv in enumerate(dbs['db_servers'], start=1):
-                    print(self.tabs + "DB Server " + str(index) + "    : " + srv['desc'])
+                    self.print(self.tabs + "DB Server " + str(index) + "    : " + srv['desc'])
 
                 # clusters
                 num = 0
                 for vm in dbs['vm_clusters']:
-                    print("")
+                    self.print("")
                     num += 1
 
                     if 'display_name' in vm:
-                        print(self.tabs + "VM Cluster " + str(num) + "   : " + str(vm['display_name']) + " (" + vm['lifecycle_state'] + ")")
+                        self.print(self.tabs + "VM Cluster " + str(num) + "   : " + str(vm['display_name']) + " (" + vm['lifecycle_state'] + ")")
 
                     if 'cpus_enabled' in vm:
-                        print(self.tabs + "Cores          : " + str(vm['cpus_enabled']))
+                        self.print(self.tabs + "Cores          : " + str(vm['cpus_enabled']))
 
                     if 'shape' in vm:
                         if vm['shape']:
-                            print(self.tabs + "Shape          : " + str(vm['shape']))
+                            self.print(self.tabs + "Shape          : " + str(vm['shape']))
 
                     if 'gi_version' in vm:
                         if vm['gi_version']:
-                            print(self.tabs + "Grid Ver       : " + vm['gi_version'] + "  " + vm['gi_version_date'])
+                            self.print(self.tabs + "Grid Ver       : " + vm['gi_version'] + "  " + vm['gi_version_date'])
 
                     if 'system_version' in vm:
                         if vm['system_version']:
-                            print(self.tabs + "Sys Ver        : " + vm['system_version'] + "  " + vm['system_version_date'])
+                            self.print(self.tabs + "Sys Ver        : " + vm['system_version'] + "  " + vm['system_version_date'])
 
                     if 'license_model' in vm:
                         if vm['license_model']:
-                            print(self.tabs + "License        : " + vm['license_model'])
+                            self.print(self.tabs + "License        : " + vm['license_model'])
 
                     if 'data_storage_size_in_tbs' in vm:
-                        print(self.tabs + "Data TB        : " + vm['data_storage_size_in_tbs'] + ", Sparse: " + vm['is_sparse_diskgroup_enabled'] + ", Local Backup: " + vm['is_local_backup_enabled'])
+                        self.print(self.tabs + "Data TB        : " + vm['data_storage_size_in_tbs'] + ", Sparse: " + vm['is_sparse_diskgroup_enabled'] + ", Local Backup: " + vm['is_local_backup_enabled'])
 
                     if 'patches' in vm:
                         for p in vm['patches']:
-                            print(self.tabs + "Patches        : " + p)
+                            self.print(self.tabs + "Patches        : " + p)
 
                     # db nodes
                     for index, db_node in enumerate(vm['db_nodes'], start=1):
-                        print(self.tabs + "DB Node " + str(index) + "      : " + db_node['desc'])
+                        self.print(self.tabs + "DB Node " + str(index) + "      : " + db_node['desc'])
                         if 'nsg_names' in db_node:
                             if db_node['nsg_names']:
-                                print(self.tabs + "        : SecGrp : " + db_node['nsg_names'])
+                                self.print(self.tabs + "        : SecGrp : " + db_node['nsg_names'])
 
                         if 'time_maintenance_window_start' in db_node:
                             if db_node['maintenance_type'] != "None":
-                                print(self.tabs + self.tabs + "          Maintenance: " + db_node['maintenance_type'] + "  " + db_node['time_maintenance_window_start'][0:16] + " - " + db_node['time_maintenance_window_end'][0:16])
+                                self.print(self.tabs + self.tabs + "          Maintenance: " + db_node['maintenance_type'] + "  " + db_node['time_maintenance_window_start'][0:16] + " - " + db_node['time_maintenance_window_end'][0:16])
 
                     # db homes
                     for db_home in vm['db_homes']:
-                        print(self.tabs + "Home           : " + db_home['home'])
+                        self.print(self.tabs + "Home           : " + db_home['home'])
 
                         # patches
                         for p in db_home['patches']:
-                            print(self.tabs + self.tabs + "        PT : " + p)
+                            self.print(self.tabs + self.tabs + "        PT : " + p)
 
                         # databases
                         for db in db_home['databases']:
                             pdbs = ", PDBS: " + self.list_to_str(db['pdbs'], 'name')
-                            print(self.tabs + self.tabs + "        DB : " + db['name'] + pdbs)
+                            self.print(self.tabs + self.tabs + "        DB : " + db['name'] + pdbs)
 
                             # print data guard
                             for dg in db['dataguard']:
-                                print(self.tabs + self.tabs + "             " + dg['name'])
+                                self.print(self.tabs + self.tabs + "             " + dg['name'])
 
                             # print backups
                             for backup in db['backups']:
-                                print(self.tabs + self.tabs + "             " + backup['name'] + " - " + backup['time'] + " - DB Size " + backup['size'])
+                                self.print(self.tabs + self.tabs + "             " + backup['name'] + " - " + backup['time'] + " - DB Size " + backup['size'])
 
-                        print(self.tabs + "               : " + '-' * 90)
+                        self.print(self.tabs + "               : " + '-' * 90)
 
                 # ADB-D Clusters
                 for vm in dbs['adb_clusters']:
-                    print("")
-                    print(self.tabs + "ADB-D VMCLUSTER: " + str(vm['display_name']) + " (" + vm['lifecycle_state'] + ")")
-                    print(self.tabs + "OCPUs Enabled  : " + str(vm['ocpus_enabled']))
-                    print("")
+                    self.print("")
+                    self.print(self.tabs + "ADB-D VMCLUSTER: " + str(vm['display_name']) + " (" + vm['lifecycle_state'] + ")")
+                    self.print(self.tabs + "OCPUs Enabled  : " + str(vm['ocpus_enabled']))
+                    self.print("")
 
                     # containers
                     for ct in vm['containers']:
-                        print(self.tabs + "Container      : " + ct['name'])
+                        self.print(self.tabs + "Container      : " + ct['name'])
 
                         # databases
                         for db in ct['databases']:
-                            print(self.tabs + self.taba + "ADB-D DB   : " + db['name'])
-                            print(self.tabs + self.tabs + "Size       : " + str(db['cpu_core_count']) + " OCPUs, " + str(db['data_storage_size_in_tbs']) + "TB Storage")
-                            print(self.tabs + self.tabs + "Created    : " + db['time_created'])
-                            print(self.tabs + self.tabs + "DataSafe   : " + db['data_safe_status'])
-                            print(self.tabs + self.tabs + "Maintenance: " + db['time_maintenance_begin'][0:16] + " - " + db['time_maintenance_end'][0:16])
+                            self.print(self.tabs + self.taba + "ADB-D DB   : " + db['name'])
+                            self.print(self.tabs + self.tabs + "Size       : " + str(db['cpu_core_count']) + " OCPUs, " + str(db['data_storage_size_in_tbs']) + "TB Storage")
+                            self.print(self.tabs + self.tabs + "Created    : " + db['time_created'])
+                            self.print(self.tabs + self.tabs + "DataSafe   : " + db['data_safe_status'])
+                            self.print(self.tabs + self.tabs + "Maintenance: " + db['time_maintenance_begin'][0:16] + " - " + db['time_maintenance_end'][0:16])
                             if db['is_data_guard_enabled']:
-                                print(self.tabs + self.tabs + "Data Guard : Lag In Second: " + db['standby_lag_time_in_seconds'] + ", lifecycle: " + db['standby_lifecycle_state'] + ",  Last Switch: " + db['time_of_last_switchover'][0:16] + ",  Last Failover: " + db['time_of_last_switchover'][0:16])
+                                self.print(self.tabs + self.tabs + "Data Guard : Lag In Second: " + db['standby_lag_time_in_seconds'] + ", lifecycle: " + db['standby_lifecycle_state'] + ",  Last Switch: " + db['time_of_last_switchover'][0:16] + ",  Last Failover: " + db['time_of_last_switchover'][0:16])
 
                             # print backups
                             if db['backups']:
                                 for backup in db['backups']:
-                                    print(self.tabs + self.tabs + "         " + backup['name'] + " - " + backup['time'])
-                            print("")
+                                    self.print(self.tabs + self.tabs + "         " + backup['name'] + " - " + backup['time'])
+                            self.print("")
 
         except Exception as e:
             self.__print_error("__print_database_db_exacc_infra", e)
@@ -1649,86 +1762,86 @@ class ShowOCIOutput(object):
 
     def __print_database_db_system_details(self, dbs):
         try:
-            print(self.taba + "DBaaS   : " + dbs['name'] + " - " + dbs['version'] + " " + dbs['version_date'])
-            print(self.tabs + "Created : " + dbs['time_created'][0:16])
-            print(self.tabs + "AD      : " + dbs['availability_domain'] + ", " + dbs['fault_domains'])
+            self.print(self.taba + "DBaaS   : " + dbs['name'] + " - " + dbs['version'] + " " + dbs['version_date'])
+            self.print(self.tabs + "Created : " + dbs['time_created'][0:16])
+            self.print(self.tabs + "AD      : " + dbs['availability_domain'] + ", " + dbs['fault_domains'])
 
             if 'cpu_core_count' in dbs:
-                print(self.tabs + "Cores   : " + str(dbs['cpu_core_count']))
+                self.print(self.tabs + "Cores   : " + str(dbs['cpu_core_count']))
 
             if 'node_count' in dbs:
                 if dbs['node_count']:
-                    print(self.tabs + "Nodes   : " + str(dbs['node_count']))
+                    self.print(self.tabs + "Nodes   : " + str(dbs['node_count']))
 
             if 'host' in dbs:
-                print(self.tabs + "Host    : " + dbs['host'])
+                self.print(self.tabs + "Host    : " + dbs['host'])
 
             if 'license_model' in dbs:
-                print(self.tabs + "License : " + dbs['license_model'])
+                self.print(self.tabs + "License : " + dbs['license_model'])
 
             if 'domain' in dbs:
                 if dbs['domain']:
-                    print(self.tabs + "Domain  : " + dbs['domain'])
+                    self.print(self.tabs + "Domain  : " + dbs['domain'])
 
             if 'cluster_name' in dbs:
                 if dbs['cluster_name']:
-                    print(self.tabs + "Cluster : " + dbs['cluster_name'])
+                    self.print(self.tabs + "Cluster : " + dbs['cluster_name'])
 
             if 'database_edition' in dbs:
                 if dbs['database_edition']:
-                    print(self.tabs + "Edition : " + dbs['database_edition'])
+                    self.print(self.tabs + "Edition : " + dbs['database_edition'])
 
             if 'data' in dbs:
                 if dbs['data']:
-                    print(self.tabs + "Data    : " + dbs['data'])
+                    self.print(self.tabs + "Data    : " + dbs['data'])
 
             if 'data_subnet' in dbs:
-                print(self.tabs + "DataSub : " + dbs['data_subnet'])
+                self.print(self.tabs + "DataSub : " + dbs['data_subnet'])
 
             if 'backup_subnet' in dbs:
                 if dbs['backup_subnet']:
-                    print(self.tabs + "BackSub : " + dbs['backup_subnet'])
+                    self.print(self.tabs + "BackSub : " + dbs['backup_subnet'])
 
             if 'scan_dns' in dbs:
                 if dbs['scan_dns']:
-                    print(self.tabs + "Scan    : " + dbs['scan_dns_name'])
+                    self.print(self.tabs + "Scan    : " + dbs['scan_dns_name'])
 
             if 'scan_ips' in dbs:
                 for ip in dbs['scan_ips']:
-                    print(self.tabs + "Scan Ips: " + ip)
+                    self.print(self.tabs + "Scan Ips: " + ip)
 
             if 'vip_ips' in dbs:
                 for ip in dbs['vip_ips']:
-                    print(self.tabs + "VIP Ips : " + ip)
+                    self.print(self.tabs + "VIP Ips : " + ip)
 
             if 'listener_port' in dbs:
-                print(self.tabs + "Port    : " + dbs['listener_port'])
+                self.print(self.tabs + "Port    : " + dbs['listener_port'])
 
             if 'cluster_name' in dbs:
                 if dbs['cluster_name']:
-                    print(self.tabs + "Cluster : " + dbs['cluster_name'])
+                    self.print(self.tabs + "Cluster : " + dbs['cluster_name'])
 
             if 'patches' in dbs:
                 for p in dbs['patches']:
-                    print(self.tabs + "Patches : " + p)
+                    self.print(self.tabs + "Patches : " + p)
 
             if 'maintenance_window' in dbs:
                 if dbs['maintenance_window']:
-                    print(self.tabs + "Maint   : Window : " + dbs['maintenance_window']['display'])
+                    self.print(self.tabs + "Maint   : Window : " + dbs['maintenance_window']['display'])
 
             if 'last_maintenance_run' in dbs:
                 if dbs['last_maintenance_run']:
-                    print(self.tabs + "Maint   : Last   : " + dbs['last_maintenance_run']['description'])
-                    print(self.tabs + "                 : " + dbs['last_maintenance_run']['maintenance_display'])
+                    self.print(self.tabs + "Maint   : Last   : " + dbs['last_maintenance_run']['description'])
+                    self.print(self.tabs + "                 : " + dbs['last_maintenance_run']['maintenance_display'])
 
             if 'next_maintenance_run' in dbs:
                 if dbs['next_maintenance_run']:
-                    print(self.tabs + "Maint   : Next   : " + dbs['next_maintenance_run']['description'])
-                    print(self.tabs + "                 : " + dbs['next_maintenance_run']['maintenance_display'])
+                    self.print(self.tabs + "Maint   : Next   : " + dbs['next_maintenance_run']['description'])
+                    self.print(self.tabs + "                 : " + dbs['next_maintenance_run']['maintenance_display'])
                     if dbs['next_maintenance_run']['maintenance_alert']:
-                        print(self.tabs + "          Alert  : " + dbs['next_maintenance_run']['maintenance_alert'])
+                        self.print(self.tabs + "          Alert  : " + dbs['next_maintenance_run']['maintenance_alert'])
 
-            print(self.tabs + "        : " + '-' * 90)
+            self.print(self.tabs + "        : " + '-' * 90)
 
         except Exception as e:
             self.__print_error("__print_database_db_system_details", e)
@@ -1740,45 +1853,45 @@ class ShowOCIOutput(object):
 
         try:
             for dbs in list_db_systems:
-                print("")
+                self.print("")
 
                 # db systems
                 self.__print_database_db_system_details(dbs)
 
                 # db nodes
                 for db_node in dbs['db_nodes']:
-                    print(self.tabs + "Node    : " + db_node['desc'] + ", Software Size: " + db_node['software_storage_size_in_gb'] + "GB")
+                    self.print(self.tabs + "Node    : " + db_node['desc'] + ", Software Size: " + db_node['software_storage_size_in_gb'] + "GB")
                     if 'nsg_names' in db_node:
                         if db_node['nsg_names']:
-                            print(self.tabs + "        : SecGrp : " + db_node['nsg_names'])
+                            self.print(self.tabs + "        : SecGrp : " + db_node['nsg_names'])
 
                     if 'time_maintenance_window_start' in db_node:
                         if db_node['maintenance_type'] != "None":
-                            print(self.tabs + self.tabs + "      Maintenance: " + db_node['maintenance_type'] + "  " + db_node['time_maintenance_window_start'][0:16] + " - " + db_node['time_maintenance_window_end'][0:16])
+                            self.print(self.tabs + self.tabs + "      Maintenance: " + db_node['maintenance_type'] + "  " + db_node['time_maintenance_window_start'][0:16] + " - " + db_node['time_maintenance_window_end'][0:16])
 
                 # db homes
                 for db_home in dbs['db_homes']:
-                    print(self.tabs + "Home    : " + db_home['home'])
+                    self.print(self.tabs + "Home    : " + db_home['home'])
 
                     # patches
                     for p in db_home['patches']:
-                        print(self.tabs + self.tabs + " PT : " + p)
+                        self.print(self.tabs + self.tabs + " PT : " + p)
 
                     for p in db_home['patches_history']:
-                        print(self.tabs + self.tabs + " PTH: " + p)
+                        self.print(self.tabs + self.tabs + " PTH: " + p)
 
                     # databases
                     for db in db_home['databases']:
                         pdbs = ", PDBS: " + self.list_to_str(db['pdbs'], 'name')
-                        print(self.tabs + self.tabs + " DB : " + db['name'] + pdbs)
+                        self.print(self.tabs + self.tabs + " DB : " + db['name'] + pdbs)
 
                         # print data guard
                         for dg in db['dataguard']:
-                            print(self.tabs + self.tabs + "      " + dg['name'])
+                            self.print(self.tabs + self.tabs + "      " + dg['name'])
 
                         # print backups
                         for backup in db['backups']:
-                            print(self.tabs + self.tabs + "      " + backup['name'] + " - " + backup['time'] + " - DB Size " + backup['size'])
+                            self.print(self.tabs + self.tabs + "      " + backup['name'] + " - " + backup['time'] + " - DB Size " + backup['size'])
 
         except Exception as e:
             self.__print_error("__print_database_db_system", e)
@@ -1790,32 +1903,32 @@ class ShowOCIOutput(object):
     def __print_database_db_autonomous(self, dbs):
         try:
             for db in dbs:
-                print(self.taba + "ADB-S      : " + db['name'])
+                self.print(self.taba + "ADB-S      : " + db['name'])
                 if 'cpu_core_count' in db:
-                    print(self.tabs + "Size       : " + str(db['compute_count']) + " " + db['compute_model'] + ", " + str(db['data_storage_size_in_tbs']) + "TB Storage")
+                    self.print(self.tabs + "Size       : " + str(db['compute_count']) + " " + db['compute_model'] + ", " + str(db['data_storage_size_in_tbs']) + "TB Storage")
                 if 'time_created' in db:
-                    print(self.tabs + "Created    : " + db['time_created'])
+                    self.print(self.tabs + "Created    : " + db['time_created'])
                 if 'whitelisted_ips' in db:
                     if db['whitelisted_ips']:
-                        print(self.tabs + "Allowed IPs: " + db['whitelisted_ips'])
+                        self.print(self.tabs + "Allowed IPs: " + db['whitelisted_ips'])
                 if 'private_endpoint' in db:
                     if db['private_endpoint']:
-                        print(self.tabs + "Private EP : " + db['private_endpoint'] + ", Subnet: " + db['subnet_name'])
+                        self.print(self.tabs + "Private EP : " + db['private_endpoint'] + ", Subnet: " + db['subnet_name'])
                 if 'nsg_names' in db:
                     for nsg in db['nsg_names']:
-                        print(self.tabs + "           : Network Security Group: " + nsg)
+                        self.print(self.tabs + "           : Network Security Group: " + nsg)
                 if 'data_safe_status' in db:
-                    print(self.tabs + "DataSafe   : " + db['data_safe_status'])
+                    self.print(self.tabs + "DataSafe   : " + db['data_safe_status'])
                 if 'time_maintenance_begin' in db:
-                    print(self.tabs + "Maintenance: " + db['time_maintenance_begin'][0:16] + " - " + db['time_maintenance_end'][0:16])
+                    self.print(self.tabs + "Maintenance: " + db['time_maintenance_begin'][0:16] + " - " + db['time_maintenance_end'][0:16])
                 if db['is_data_guard_enabled']:
-                    print(self.tabs + "Data Guard : Lag In Second: " + db['standby_lag_time_in_seconds'] + ", lifecycle: " + db['standby_lifecycle_state'] + ",  Last Switch: " + db['time_of_last_switchover'][0:16] + ",  Last Failover: " + db['time_of_last_switchover'][0:16])
+                    self.print(self.tabs + "Data Guard : Lag In Second: " + db['standby_lag_time_in_seconds'] + ", lifecycle: " + db['standby_lifecycle_state'] + ",  Last Switch: " + db['time_of_last_switchover'][0:16] + ",  Last Failover: " + db['time_of_last_switchover'][0:16])
 
                 # print backups
                 if db['backups']:
                     for backup in db['backups']:
-                        print(self.tabs + self.tabs + "         " + backup['name'] + " - " + backup['time'])
-                print("")
+                        self.print(self.tabs + self.tabs + "         " + backup['name'] + " - " + backup['time'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_database_db_autonomous", e)
@@ -1828,9 +1941,9 @@ class ShowOCIOutput(object):
         try:
             for backup in backups:
                 if backup['standalone']:
-                    print(self.taba + "Name    : " + backup['name'] + " - " + backup['time'] + " - " + backup['size'] + " - " + backup["availability_domain"])
-                    print(self.tabs + "Shape   : " + backup['shape'] + ", Edition: " + backup["database_edition"] + ", Version: " + backup["version"])
-                    print("")
+                    self.print(self.taba + "Name    : " + backup['name'] + " - " + backup['time'] + " - " + backup['size'] + " - " + backup["availability_domain"])
+                    self.print(self.tabs + "Shape   : " + backup['shape'] + ", Edition: " + backup["database_edition"] + ", Version: " + backup["version"])
+                    self.print("")
 
         except Exception as e:
             self.__print_error("__print_database_standalone_backups", e)
@@ -1842,9 +1955,9 @@ class ShowOCIOutput(object):
     def __print_database_software_images(self, dbs):
         try:
             for db in dbs:
-                print(self.taba + "Name    : " + db['display_name'] + " - " + db['patch_set'] + " - " + db['image_shape_family'] + " - " + db['image_type'])
-                print(self.tabs + "Created : " + db['time_created'][0:16] + " (" + db['lifecycle_state'] + ")")
-                print("")
+                self.print(self.taba + "Name    : " + db['display_name'] + " - " + db['patch_set'] + " - " + db['image_shape_family'] + " - " + db['image_type'])
+                self.print(self.tabs + "Created : " + db['time_created'][0:16] + " (" + db['lifecycle_state'] + ")")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_database_software_images", e)
@@ -1855,11 +1968,11 @@ class ShowOCIOutput(object):
     def __print_database_external(self, dbs):
         try:
             for db in dbs:
-                print(self.taba + "Name      : " + db['display_name'] + " - " + db['db_unique_name'] + " - " + db['database_configuration'])
-                print(self.tabs + "Created   : " + db['time_created'][0:16] + " (" + db['lifecycle_state'] + ")")
-                print(self.tabs + "DB Manage : " + db['database_management_status'] + ", " + db['database_management_license_model'])
-                print(self.tabs + "DB Version: " + db['database_version'] + ", " + db['database_edition'])
-                print("")
+                self.print(self.taba + "Name      : " + db['display_name'] + " - " + db['db_unique_name'] + " - " + db['database_configuration'])
+                self.print(self.tabs + "Created   : " + db['time_created'][0:16] + " (" + db['lifecycle_state'] + ")")
+                self.print(self.tabs + "DB Manage : " + db['database_management_status'] + ", " + db['database_management_license_model'])
+                self.print(self.tabs + "DB Version: " + db['database_version'] + ", " + db['database_edition'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_database_external", e)
@@ -1871,28 +1984,28 @@ class ShowOCIOutput(object):
         try:
             for db in dbs:
                 cfg = db['global_config']
-                print(self.taba + "Global    : " + cfg['data_safe_nat_gateway_ip_address'] + ", Enabled: " + cfg['is_enabled'] + ", State: " + cfg['lifecycle_state'] + ", Time Enabled: " + cfg['time_enabled'])
-                print("")
+                self.print(self.taba + "Global    : " + cfg['data_safe_nat_gateway_ip_address'] + ", Enabled: " + cfg['is_enabled'] + ", State: " + cfg['lifecycle_state'] + ", Time Enabled: " + cfg['time_enabled'])
+                self.print("")
 
                 for target in db['targets']:
-                    print(self.taba + "Target    : " + target['display_name'] + " - " + target['description'] + " - " + target['database_type'] + " - " + target['infrastructure_type'])
-                    print(self.tabs + "Created   : " + target['time_created'][0:16] + " (" + target['lifecycle_state'] + ")")
+                    self.print(self.taba + "Target    : " + target['display_name'] + " - " + target['description'] + " - " + target['database_type'] + " - " + target['infrastructure_type'])
+                    self.print(self.tabs + "Created   : " + target['time_created'][0:16] + " (" + target['lifecycle_state'] + ")")
                     if target['lifecycle_details']:
-                        print(self.tabs + "Details   : " + target['lifecycle_details'][0:130] + "...")
+                        self.print(self.tabs + "Details   : " + target['lifecycle_details'][0:130] + "...")
                     for trg in target['associated_resource_ids']:
-                        print(self.tabs + "Assoc Id  : " + trg)
+                        self.print(self.tabs + "Assoc Id  : " + trg)
                     for trg in target['associated_resource_names']:
-                        print(self.tabs + "Assoc Name: " + trg)
-                    print("")
+                        self.print(self.tabs + "Assoc Name: " + trg)
+                    self.print("")
 
                 for target in db['private_endpoints']:
-                    print(self.taba + "End Point : " + target['display_name'] + " - " + target['description'] + " - " + target['lifecycle_state'] + " - " + target['time_created'])
-                    print(self.tabs + "Subnet    : " + target['subnet_name'])
-                    print("")
+                    self.print(self.taba + "End Point : " + target['display_name'] + " - " + target['description'] + " - " + target['lifecycle_state'] + " - " + target['time_created'])
+                    self.print(self.tabs + "Subnet    : " + target['subnet_name'])
+                    self.print("")
 
                 for target in db['on_prem_connectors']:
-                    print(self.taba + "On Prem   : " + target['display_name'] + " - " + target['description'] + " - " + target['lifecycle_state'] + " - " + target['time_created'])
-                    print("")
+                    self.print(self.taba + "On Prem   : " + target['display_name'] + " - " + target['description'] + " - " + target['lifecycle_state'] + " - " + target['time_created'])
+                    self.print("")
 
         except Exception as e:
             self.__print_error("__print_datasafe", e)
@@ -1904,10 +2017,10 @@ class ShowOCIOutput(object):
     def __print_database_nosql(self, dbs):
         try:
             for db in dbs:
-                print(self.taba + "Table   : " + db['name'])
-                print(self.tabs + "Created : " + db['time_created'][0:16] + " (" + db['lifecycle_state'] + ")")
-                print(self.tabs + "Limits  : max_read_units: " + str(db['max_read_units']) + ", max_write_units: " + str(db['max_read_units']) + ", max_storage_in_g_bs: " + str(db['max_storage_in_g_bs']))
-                print("")
+                self.print(self.taba + "Table   : " + db['name'])
+                self.print(self.tabs + "Created : " + db['time_created'][0:16] + " (" + db['lifecycle_state'] + ")")
+                self.print(self.tabs + "Limits  : max_read_units: " + str(db['max_read_units']) + ", max_write_units: " + str(db['max_read_units']) + ", max_storage_in_g_bs: " + str(db['max_storage_in_g_bs']))
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_database_nosql", e)
@@ -1919,20 +2032,20 @@ class ShowOCIOutput(object):
     def __print_database_mysql(self, dbs):
         try:
             for db in dbs:
-                print(self.taba + "MYSQL   : " + db['display_name'] + " - " + db['description'] + " (" + db['mysql_version'] + ") - " + db['shape_name'])
-                print(self.tabs + "AD      : " + db['availability_domain'] + " - " + db['fault_domain'])
-                print(self.tabs + "Created : " + db['time_created'][0:16] + " (" + db['lifecycle_state'] + "), AutoBackup = " + db['backup_is_enabled'])
-                print(self.tabs + "Subnet  : " + db['subnet_name'])
-                print(self.tabs + "Size    : " + db['data_storage_size_in_gbs'] + "gb")
+                self.print(self.taba + "MYSQL   : " + db['display_name'] + " - " + db['description'] + " (" + db['mysql_version'] + ") - " + db['shape_name'])
+                self.print(self.tabs + "AD      : " + db['availability_domain'] + " - " + db['fault_domain'])
+                self.print(self.tabs + "Created : " + db['time_created'][0:16] + " (" + db['lifecycle_state'] + "), AutoBackup = " + db['backup_is_enabled'])
+                self.print(self.tabs + "Subnet  : " + db['subnet_name'])
+                self.print(self.tabs + "Size    : " + db['data_storage_size_in_gbs'] + "gb")
 
                 # Endpoints
                 for ep in db['endpoints']:
-                    print(self.tabs + "endpoint: " + str(ep['ip_address']) + ":" + ep['port'] + ", Modes: " + ep['modes'] + " (" + ep['status'] + ")")
+                    self.print(self.tabs + "endpoint: " + str(ep['ip_address']) + ":" + ep['port'] + ", Modes: " + ep['modes'] + " (" + ep['status'] + ")")
                 if db['backups']:
-                    print(self.tabs + "Backups : ")
+                    self.print(self.tabs + "Backups : ")
                     for backup in db['backups']:
-                        print(self.tabs + self.tabs + "      " + backup['display_name'] + " - " + backup['time_created'] + " - " + backup['backup_size_in_gbs'] + "gb" + " - " + backup['data_storage_size_in_gbs'] + "gb" + " - " + backup['backup_type'])
-                print("")
+                        self.print(self.tabs + self.tabs + "      " + backup['display_name'] + " - " + backup['time_created'] + " - " + backup['backup_size_in_gbs'] + "gb" + " - " + backup['data_storage_size_in_gbs'] + "gb" + " - " + backup['backup_type'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_database_mysql", e)
@@ -1944,7 +2057,7 @@ class ShowOCIOutput(object):
     def __print_database_mysql_standalone_backups(self, backups):
         try:
             for backup in backups:
-                print(self.tabs + self.tabs + "      " + backup['display_name'] + " - " + backup['time_created'] + " - " + backup['backup_size_in_gbs'] + "gb" + " - " + backup['data_storage_size_in_gbs'] + "gb" + " - " + backup['backup_type'])
+                self.print(self.tabs + self.tabs + "      " + backup['display_name'] + " - " + backup['time_created'] + " - " + backup['backup_size_in_gbs'] + "gb" + " - " + backup['data_storage_size_in_gbs'] + "gb" + " - " + backup['backup_type'])
 
         except Exception as e:
             self.__print_error("__print_database_mysql_standalone_backups", e)
@@ -1956,18 +2069,18 @@ class ShowOCIOutput(object):
     def __print_database_postgresql(self, dbs):
         try:
             for db in dbs:
-                print(self.taba + "PostgreSQL : " + db['display_name'] + " - (" + db['db_version'] + ") - " + db['shape_full'])
-                print(self.tabs + "AD         : " + db['storage_availability_domain'])
-                print(self.tabs + "Created    : " + db['time_created'][0:16] + " (" + db['lifecycle_state'] + ")")
-                print(self.tabs + "Subnet     : " + db['network_subnet_name'])
-                print(self.tabs + "IOPS       : " + db['storage_iops'])
-                print(self.tabs + "Admin      : " + db['admin_username'])
+                self.print(self.taba + "PostgreSQL : " + db['display_name'] + " - (" + db['db_version'] + ") - " + db['shape_full'])
+                self.print(self.tabs + "AD         : " + db['storage_availability_domain'])
+                self.print(self.tabs + "Created    : " + db['time_created'][0:16] + " (" + db['lifecycle_state'] + ")")
+                self.print(self.tabs + "Subnet     : " + db['network_subnet_name'])
+                self.print(self.tabs + "IOPS       : " + db['storage_iops'])
+                self.print(self.tabs + "Admin      : " + db['admin_username'])
 
                 if db['backups']:
-                    print(self.tabs + "Backups    : ")
+                    self.print(self.tabs + "Backups    : ")
                     for backup in db['backups']:
-                        print(self.tabs + self.tabs + "         " + backup['display_name'] + " - " + backup['time_created'] + " - " + backup['backup_size'] + "gb" + " - " + backup['source_type'])
-                print("")
+                        self.print(self.tabs + self.tabs + "         " + backup['display_name'] + " - " + backup['time_created'] + " - " + backup['backup_size'] + "gb" + " - " + backup['source_type'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_database_postgresql", e)
@@ -1979,7 +2092,7 @@ class ShowOCIOutput(object):
     def __print_database_postgresql_standalone_backups(self, backups):
         try:
             for backup in backups:
-                print(self.tabs + self.tabs + backup['display_name'] + " - " + backup['time_created'] + " - " + backup['backup_size'] + "gb" + " - " + backup['source_type'])
+                self.print(self.tabs + self.tabs + backup['display_name'] + " - " + backup['time_created'] + " - " + backup['backup_size'] + "gb" + " - " + backup['source_type'])
 
         except Exception as e:
             self.__print_error("__print_database_postgresql", e)
@@ -1992,23 +2105,23 @@ class ShowOCIOutput(object):
         try:
             if 'gg_deployments' in goldengates:
                 for db in goldengates['gg_deployments']:
-                    print(self.taba + "GG      : " + db['display_name'] + " - " + db['description'] + " (" + db['lifecycle_state'] + ") - " + db['license_model'])
-                    print(self.tabs + "OCPU    : " + db['cpu_core_count'] + ", Auto Scale: " + db['is_auto_scaling_enabled'] + ", Is Latest Version: " + db['is_latest_version'])
-                    print(self.tabs + "Created : " + db['time_created'][0:16] + ", Updated: " + db['time_updated'][0:16])
-                    print(self.tabs + "Subnet  : " + db['subnet_name'])
-                    print(self.tabs + "IPs     : Private: " + db['private_ip_address'] + ", Public: " + db['public_ip_address'])
-                    print(self.tabs + "FQDN    : " + db['fqdn'])
-                    print(self.tabs + "URL     : " + db['deployment_url'])
-                    print("")
+                    self.print(self.taba + "GG      : " + db['display_name'] + " - " + db['description'] + " (" + db['lifecycle_state'] + ") - " + db['license_model'])
+                    self.print(self.tabs + "OCPU    : " + db['cpu_core_count'] + ", Auto Scale: " + db['is_auto_scaling_enabled'] + ", Is Latest Version: " + db['is_latest_version'])
+                    self.print(self.tabs + "Created : " + db['time_created'][0:16] + ", Updated: " + db['time_updated'][0:16])
+                    self.print(self.tabs + "Subnet  : " + db['subnet_name'])
+                    self.print(self.tabs + "IPs     : Private: " + db['private_ip_address'] + ", Public: " + db['public_ip_address'])
+                    self.print(self.tabs + "FQDN    : " + db['fqdn'])
+                    self.print(self.tabs + "URL     : " + db['deployment_url'])
+                    self.print("")
 
             if 'gg_db_registration' in goldengates:
                 for db in goldengates['gg_db_registration']:
-                    print(self.taba + "DB Reg  : " + db['display_name'] + " - " + db['description'] + " (" + db['lifecycle_state'] + ")")
-                    print(self.tabs + "Created : " + db['time_created'][0:16] + ", Updated: " + db['time_updated'][0:16])
+                    self.print(self.taba + "DB Reg  : " + db['display_name'] + " - " + db['description'] + " (" + db['lifecycle_state'] + ")")
+                    self.print(self.tabs + "Created : " + db['time_created'][0:16] + ", Updated: " + db['time_updated'][0:16])
                     if db['subnet_name']:
-                        print(self.tabs + "Subnet  : " + db['subnet_name'])
-                    print(self.tabs + "FQDN    : " + db['fqdn'])
-                    print("")
+                        self.print(self.tabs + "Subnet  : " + db['subnet_name'])
+                    self.print(self.tabs + "FQDN    : " + db['fqdn'])
+                    self.print("")
 
         except Exception as e:
             self.__print_error("__print_database_goldengate", e)
@@ -2026,67 +2139,67 @@ class ShowOCIOutput(object):
             if 'exadata_infrastructure' in list_databases:
                 self.print_header("Exadata Infrastructure", 2)
                 self.__print_database_db_exadata_infra(list_databases['exadata_infrastructure'])
-                print("")
+                self.print("")
 
             if 'exacc_infrastructure' in list_databases:
                 self.print_header("ExaCC Infrastructure", 2)
                 self.__print_database_db_exacc_infra(list_databases['exacc_infrastructure'])
-                print("")
+                self.print("")
 
             if 'exascale' in list_databases:
                 self.print_header("Exascale", 2)
                 self.__print_database_db_exascale(list_databases['exascale'])
-                print("")
+                self.print("")
 
             if 'db_system' in list_databases:
                 self.print_header("Databases DB Base", 2)
                 self.__print_database_db_system(list_databases['db_system'])
-                print("")
+                self.print("")
 
             if 'db_all_backups' in list_databases:
                 self.print_header("Databases Standalone Backups", 2)
                 self.__print_database_standalone_backups(list_databases['db_all_backups'])
-                print("")
+                self.print("")
 
             if 'autonomous_dedicated' in list_databases:
                 self.print_header("Autonomous Dedicated", 2)
                 self.__print_database_db_autonomous_dedicated(list_databases['autonomous_dedicated'])
-                print("")
+                self.print("")
 
             if 'autonomous' in list_databases:
                 self.print_header("Autonomous databases", 2)
                 self.__print_database_db_autonomous(list_databases['autonomous'])
-                print("")
+                self.print("")
 
             if 'mysql' in list_databases:
                 self.print_header("MYSQL databases", 2)
                 self.__print_database_mysql(list_databases['mysql'])
-                print("")
+                self.print("")
 
             if 'mysql_standalone_backups' in list_databases:
                 self.print_header("MYSQL Standalone Backups", 2)
                 self.__print_database_mysql_standalone_backups(list_databases['mysql_standalone_backups'])
-                print("")
+                self.print("")
 
             if 'postgresql' in list_databases:
                 self.print_header("PostgreSQL databases", 2)
                 self.__print_database_postgresql(list_databases['postgresql'])
-                print("")
+                self.print("")
 
             if 'postgresql_standalone_backups' in list_databases:
                 self.print_header("PostgreSQL Standalone Backups", 2)
                 self.__print_database_postgresql_standalone_backups(list_databases['postgresql_standalone_backups'])
-                print("")
+                self.print("")
 
             if 'goldengate' in list_databases:
                 self.print_header("Golden Gate", 2)
                 self.__print_database_goldengate(list_databases['goldengate'])
-                print("")
+                self.print("")
 
             if 'nosql' in list_databases:
                 self.print_header("NOSQL Tables", 2)
                 self.__print_database_nosql(list_databases['nosql'])
-                print("")
+                self.print("")
 
             if 'software_images' in list_databases:
                 self.print_header("Database Software Images", 2)
@@ -2122,7 +2235,7 @@ class ShowOCIOutput(object):
             self.print_header("Object Storage", 2)
 
             for obj in objects:
-                print(self.taba + obj['desc'])
+                self.print(self.taba + obj['desc'])
 
         except Exception as e:
             self.__print_error("__print_object_storage_main", e)
@@ -2139,15 +2252,15 @@ class ShowOCIOutput(object):
             self.print_header("EMails", 2)
 
             if 'senders' in emails:
-                print(self.taba + "Approved Senders:")
+                self.print(self.taba + "Approved Senders:")
                 for val in emails['senders']:
-                    print(self.tabs + str(val))
-                print("")
+                    self.print(self.tabs + str(val))
+                self.print("")
 
             if 'supp_list' in emails:
-                print(self.taba + "Suppression List:")
+                self.print(self.taba + "Suppression List:")
                 for val in emails['supp_list']:
-                    print(self.tabs + str(val))
+                    self.print(self.tabs + str(val))
 
         except Exception as e:
             self.__print_error("__print_email_main", e)
@@ -2166,19 +2279,19 @@ class ShowOCIOutput(object):
                     self.print_header("Streams", 2)
 
                     for ct in sq["streams"]:
-                        print(self.taba + ct['name'] + ", partitions (" + ct['partitions'] + "), Created: " + ct['time_created'][0:16])
-                        print(self.tabs + "URL   : " + str(ct['messages_endpoint']))
-                        print("")
+                        self.print(self.taba + ct['name'] + ", partitions (" + ct['partitions'] + "), Created: " + ct['time_created'][0:16])
+                        self.print(self.tabs + "URL   : " + str(ct['messages_endpoint']))
+                        self.print("")
 
             if "queues" in sq:
                 if sq["queues"]:
                     self.print_header("Queues", 2)
 
                     for ct in sq["queues"]:
-                        print(self.taba + ct['name'] + ", Created: " + ct['time_created'][0:16])
-                        print(self.tabs + "URL   : " + str(ct['messages_endpoint']))
-                        print(self.tabs + "Params: Retention (Sec): " + str(ct['retention_in_seconds']) + ", Visibility: " + str(ct['visibility_in_seconds']) + ", Timeout: " + str(ct['timeout_in_seconds']) + ", Dead Letter Delivery Count: " + str(ct['dead_letter_queue_delivery_count']))
-                        print("")
+                        self.print(self.taba + ct['name'] + ", Created: " + ct['time_created'][0:16])
+                        self.print(self.tabs + "URL   : " + str(ct['messages_endpoint']))
+                        self.print(self.tabs + "Params: Retention (Sec): " + str(ct['retention_in_seconds']) + ", Visibility: " + str(ct['visibility_in_seconds']) + ", Timeout: " + str(ct['timeout_in_seconds']) + ", Dead Letter Delivery Count: " + str(ct['dead_letter_queue_delivery_count']))
+                        self.print("")
 
         except Exception as e:
             self.__print_error("__print_streams_queues_main", e)
@@ -2195,15 +2308,15 @@ class ShowOCIOutput(object):
             self.print_header("Full Stack Disaster Recovery (FSDR)", 2)
 
             for dr in drs:
-                print(self.taba + dr['display_name'] + " (" + dr['role'] + ":" + dr['lifecycle_state'] + "), Created: " + dr['time_created'])
-                print(self.tabs + "Peer Region  : " + dr['peer_region'])
+                self.print(self.taba + dr['display_name'] + " (" + dr['role'] + ":" + dr['lifecycle_state'] + "), Created: " + dr['time_created'])
+                self.print(self.tabs + "Peer Region  : " + dr['peer_region'])
                 if dr['lifecycle_sub_state']:
-                    print(self.tabs + "Sub State    : " + dr['lifecycle_sub_state'])
+                    self.print(self.tabs + "Sub State    : " + dr['lifecycle_sub_state'])
                 if dr['log_location']:
-                    print(self.tabs + "Log Location : " + dr['log_location'])
+                    self.print(self.tabs + "Log Location : " + dr['log_location'])
                 for member in dr['members']:
-                    print(self.tabs + "member       : " + member['member_id'] + " - " + member['member_type'])
-                print("")
+                    self.print(self.tabs + "member       : " + member['member_id'] + " - " + member['member_type'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_fsdr", e)
@@ -2220,16 +2333,16 @@ class ShowOCIOutput(object):
             self.print_header("Function Applications", 2)
 
             for ct in functions:
-                print(self.taba + ct['display_name'] + ", Created: " + ct['time_created'] + " - " + ct['shape'])
+                self.print(self.taba + ct['display_name'] + ", Created: " + ct['time_created'] + " - " + ct['shape'])
                 if ct['subnets']:
                     for sub in ct['subnets']:
-                        print(self.tabs + self.tabs + "Subnet: " + sub)
+                        self.print(self.tabs + self.tabs + "Subnet: " + sub)
                 if ct['network_security_group_names']:
-                    print(self.tabs + self.tabs + "NSG   : " + ct['network_security_group_names'])
+                    self.print(self.tabs + self.tabs + "NSG   : " + ct['network_security_group_names'])
                 for fun in ct['functions']:
-                    print(self.tabs + self.tabs + "FN    : " + fun['display_name'] + " - " + fun['image'])
+                    self.print(self.tabs + self.tabs + "FN    : " + fun['display_name'] + " - " + fun['image'])
 
-                print("")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_functions_main", e)
@@ -2246,18 +2359,18 @@ class ShowOCIOutput(object):
             self.print_header("API Gateways", 2)
 
             for ct in apigatways:
-                print(self.taba + ct['display_name'] + ", " + ct['endpoint_type'] + ", Created: " + ct['time_created'][0:16])
-                print(self.tabs2 + "Host      : " + ct['hostname'])
-                print(self.tabs2 + "Subnet    : " + ct['subnet_name'])
+                self.print(self.taba + ct['display_name'] + ", " + ct['endpoint_type'] + ", Created: " + ct['time_created'][0:16])
+                self.print(self.tabs2 + "Host      : " + ct['hostname'])
+                self.print(self.tabs2 + "Subnet    : " + ct['subnet_name'])
                 for dp in ct['deployments']:
-                    print(self.tabs2 + "Deployment: " + dp['display_name'] + ", " + dp['endpoint'])
+                    self.print(self.tabs2 + "Deployment: " + dp['display_name'] + ", " + dp['endpoint'])
 
                     # print logs
                     if 'logs' in dp:
                         for index, log in enumerate(dp['logs'], start=1):
-                            print(self.tabs2 + "          : Log " + str(index) + " : " + log['name'])
+                            self.print(self.tabs2 + "          : Log " + str(index) + " : " + log['name'])
 
-                print("")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_streams_main", e)
@@ -2274,10 +2387,10 @@ class ShowOCIOutput(object):
             self.print_header("Budgets", 2)
 
             for budget in budgets:
-                print(self.taba + budget['display_name'] + " for Compartment: " + budget['compartment_name'] + " (" + budget['reset_period'] + ")")
-                print(self.tabs + "Costs   : Spent: " + budget['actual_spend'] + ", Forcasted: " + budget['forecasted_spend'], ", Time Computed: " + budget['time_spend_computed'][0:16])
-                print(self.tabs + "Created : " + budget['time_created'][0:16] + ", Total Alert Rules: " + budget['alert_rule_count'])
-                print("")
+                self.print(self.taba + budget['display_name'] + " for Compartment: " + budget['compartment_name'] + " (" + budget['reset_period'] + ")")
+                self.print(self.tabs + "Costs   : Spent: " + budget['actual_spend'] + ", Forcasted: " + budget['forecasted_spend'], ", Time Computed: " + budget['time_spend_computed'][0:16])
+                self.print(self.tabs + "Created : " + budget['time_created'][0:16] + ", Total Alert Rules: " + budget['alert_rule_count'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_budgets_main", e)
@@ -2294,12 +2407,12 @@ class ShowOCIOutput(object):
             self.print_header("Announcements", 2)
 
             for ann in announcements:
-                print(self.taba + ann['summary'][0:100] + " (" + ann['reference_ticket_number'] + ") - " + ann['announcement_type'] + ", Time: " + ann['time_one_value'][0:16] + " - " + ann['time_two_value'][0:16] + ", Time Created: " + ann['time_created'][0:16] + " (" + ann['lifecycle_state'] + ")")
+                self.print(self.taba + ann['summary'][0:100] + " (" + ann['reference_ticket_number'] + ") - " + ann['announcement_type'] + ", Time: " + ann['time_one_value'][0:16] + " - " + ann['time_two_value'][0:16] + ", Time Created: " + ann['time_created'][0:16] + " (" + ann['lifecycle_state'] + ")")
                 if ann['affected_regions']:
-                    print(self.tabs + "Regions  : " + ann['affected_regions'])
+                    self.print(self.tabs + "Regions  : " + ann['affected_regions'])
                 if ann['services']:
-                    print(self.tabs + "Services : " + ann['services'])
-                print("")
+                    self.print(self.tabs + "Services : " + ann['services'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_announcement_main", e)
@@ -2316,16 +2429,16 @@ class ShowOCIOutput(object):
             self.print_header("Announcements Active and Detailed", 2)
 
             for ann in announcements:
-                print(self.taba + ann['summary'][0:100] + " (" + ann['reference_ticket_number'] + ") - " + ann['announcement_type'] + ", Time: " + ann['time_one_value'][0:16] + " - " + ann['time_two_value'][0:16] + ", Time Created: " + ann['time_created'][0:16] + " (" + ann['lifecycle_state'] + ")")
+                self.print(self.taba + ann['summary'][0:100] + " (" + ann['reference_ticket_number'] + ") - " + ann['announcement_type'] + ", Time: " + ann['time_one_value'][0:16] + " - " + ann['time_two_value'][0:16] + ", Time Created: " + ann['time_created'][0:16] + " (" + ann['lifecycle_state'] + ")")
                 if ann['affected_regions']:
-                    print(self.tabs + "Regions     : " + ann['affected_regions'])
+                    self.print(self.tabs + "Regions     : " + ann['affected_regions'])
                 if ann['services']:
-                    print(self.tabs + "Services    : " + ann['services'])
+                    self.print(self.tabs + "Services    : " + ann['services'])
                 if ann['affected_resources']:
-                    print(self.tabs + "Resources   : (Not all resources part of this compartment)")
+                    self.print(self.tabs + "Resources   : (Not all resources part of this compartment)")
                     for an in ann['affected_resources']:
-                        print(self.tabs + "              " + an['resource_name'] + " - " + an['region'])
-                print("")
+                        self.print(self.tabs + "              " + an['resource_name'] + " - " + an['region'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_announcement_main", e)
@@ -2344,8 +2457,8 @@ class ShowOCIOutput(object):
             for arr in errors:
                 is_warning = "Warning: " if arr['is_warning'] == 'True' else "Error:   "
                 compartment = ", Compartment " + arr['compartment'] if arr['compartment'] else ""
-                print(self.taba + is_warning + arr['class'] + ":" + arr['function'] + ", " + arr['region'] + compartment + ", " + arr['error'][0:60])
-            print("")
+                self.print(self.taba + is_warning + arr['class'] + ":" + arr['function'] + ", " + arr['region'] + compartment + ", " + arr['error'][0:60])
+            self.print("")
 
         except Exception as e:
             self.__print_error("__print_errors", e)
@@ -2363,10 +2476,10 @@ class ShowOCIOutput(object):
 
             if 'cloud_guard_security_scores' in security_scores:
                 for arr in security_scores['cloud_guard_security_scores']:
-                    print(self.taba + "Security Score: " + str(arr['security_score']) + " ( " + arr['security_rating'] + ")")
+                    self.print(self.taba + "Security Score: " + str(arr['security_score']) + " ( " + arr['security_rating'] + ")")
                 for arr in security_scores['cloud_guard_risk_scores']:
-                    print(self.taba + "Risk     Score: " + str(arr['risk_score']))
-                print("")
+                    self.print(self.taba + "Risk     Score: " + str(arr['risk_score']))
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_security_scores_main", e)
@@ -2387,11 +2500,11 @@ class ShowOCIOutput(object):
                     self.print_header("Monitoring - Alarms", 2)
 
                     for alarm in alarms:
-                        print(self.taba + alarm['display_name'] + " (" + alarm['namespace'] + "), Enabled = " + str(alarm['is_enabled']) + ", Severity = " + alarm['severity'])
-                        print(self.tabs + "Query : " + alarm['query'])
+                        self.print(self.taba + alarm['display_name'] + " (" + alarm['namespace'] + "), Enabled = " + str(alarm['is_enabled']) + ", Severity = " + alarm['severity'])
+                        self.print(self.tabs + "Query : " + alarm['query'])
                         for dest in alarm['destinations_names']:
-                            print(self.tabs + "Topic : " + dest)
-                        print("")
+                            self.print(self.tabs + "Topic : " + dest)
+                        self.print("")
 
             # if events
             if 'events' in monitorings:
@@ -2400,11 +2513,11 @@ class ShowOCIOutput(object):
                     self.print_header("Events", 2)
 
                     for event in events:
-                        print(self.taba + event['display_name'] + " (" + event['description'] + "), Enabled = " + str(event['is_enabled']))
-                        print(self.tabs + "Condition : " + event['condition'])
+                        self.print(self.taba + event['display_name'] + " (" + event['description'] + "), Enabled = " + str(event['is_enabled']))
+                        self.print(self.tabs + "Condition : " + event['condition'])
                         for act in event['actions']:
-                            print(self.tabs + "Action    : " + act['action_type'] + ", Enabled = " + act['is_enabled'] + ", " + act['lifecycle_state'] + ", Dest: " + act['dest_name'])
-                        print("")
+                            self.print(self.tabs + "Action    : " + act['action_type'] + ", Enabled = " + act['is_enabled'] + ", " + act['lifecycle_state'] + ", Dest: " + act['dest_name'])
+                        self.print("")
 
             # if agents
             if 'agents' in monitorings:
@@ -2413,12 +2526,12 @@ class ShowOCIOutput(object):
                     self.print_header("Management Agents", 2)
 
                     for event in agents:
-                        print(self.taba + event['display_name'] + " (" + event['platform_name'] + "), Version = " + str(event['version']) + ", Status = " + event['availability_status'])
-                        print(self.tabs + "Auto Upgradable : " + event['is_agent_auto_upgradable'])
-                        print(self.tabs + "Plugin List     : " + event['plugin_list'])
-                        print(self.tabs + "Created         : " + event['time_created'][0:16] + ", Last Beat: " + event['time_last_heartbeat'][0:16])
-                        print(self.tabs + "Host            : " + event['host'])
-                        print("")
+                        self.print(self.taba + event['display_name'] + " (" + event['platform_name'] + "), Version = " + str(event['version']) + ", Status = " + event['availability_status'])
+                        self.print(self.tabs + "Auto Upgradable : " + event['is_agent_auto_upgradable'])
+                        self.print(self.tabs + "Plugin List     : " + event['plugin_list'])
+                        self.print(self.tabs + "Created         : " + event['time_created'][0:16] + ", Last Beat: " + event['time_last_heartbeat'][0:16])
+                        self.print(self.tabs + "Host            : " + event['host'])
+                        self.print("")
 
             # if db_managements
             if 'db_managements' in monitorings:
@@ -2427,7 +2540,7 @@ class ShowOCIOutput(object):
                     self.print_header("DB Managements", 2)
 
                     for event in agents:
-                        print(self.taba + event['name'] + ", " + event['database_type'] + ", " + str(event['database_sub_type']) + ", is_cluster = " + event['is_cluster'] + ", Created : " + event['time_created'][0:16])
+                        self.print(self.taba + event['name'] + ", " + event['database_type'] + ", " + str(event['database_sub_type']) + ", is_cluster = " + event['is_cluster'] + ", Created : " + event['time_created'][0:16])
 
         except Exception as e:
             self.__print_error("__print_monitoring_main", e)
@@ -2444,10 +2557,10 @@ class ShowOCIOutput(object):
             self.print_header("Notifications - Topics", 2)
 
             for topic in topics:
-                print(self.taba + topic['name'] + " - " + topic['description'] + ",  Created: " + topic['time_created'][0:16])
+                self.print(self.taba + topic['name'] + " - " + topic['description'] + ",  Created: " + topic['time_created'][0:16])
                 for sub in topic['subscriptions']:
-                    print(self.tabs + "Sub   : " + sub['protocol'] + ": " + sub['endpoint'])
-                print("")
+                    self.print(self.tabs + "Sub   : " + sub['protocol'] + ": " + sub['endpoint'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_notifications_main", e)
@@ -2468,56 +2581,56 @@ class ShowOCIOutput(object):
                 # if http check
                 if 'http' in edge['healthcheck']:
                     for arr in edge['healthcheck']['http']:
-                        print(self.taba + arr['display_name'] + " (" + arr['protocol'] + ": " + arr['method'] + "), Path = " + arr['path'] + ", Enabled = " + str(arr['is_enabled']))
-                        print(self.tabs + "Interval : " + arr['interval_in_seconds'] + " secs")
-                        print(self.tabs + "Targets  : " + arr['targets'])
-                        print(self.tabs + "VPoints  : " + arr['vantage_point_names'])
-                        print("")
+                        self.print(self.taba + arr['display_name'] + " (" + arr['protocol'] + ": " + arr['method'] + "), Path = " + arr['path'] + ", Enabled = " + str(arr['is_enabled']))
+                        self.print(self.tabs + "Interval : " + arr['interval_in_seconds'] + " secs")
+                        self.print(self.tabs + "Targets  : " + arr['targets'])
+                        self.print(self.tabs + "VPoints  : " + arr['vantage_point_names'])
+                        self.print("")
 
                 # if ping check
                 if 'ping' in edge['healthcheck']:
                     for arr in edge['healthcheck']['ping']:
-                        print(self.taba + arr['display_name'] + " (" + arr['protocol'] + ", Port: " + arr['port'] + "), Enabled = " + str(arr['is_enabled']))
-                        print(self.tabs + "Interval : " + arr['interval_in_seconds'] + " secs, Timeout = " + arr['timeout_in_seconds'] + " secs")
-                        print(self.tabs + "Targets  : " + arr['targets'])
-                        print(self.tabs + "VPoints  : " + arr['vantage_point_names'])
-                        print("")
+                        self.print(self.taba + arr['display_name'] + " (" + arr['protocol'] + ", Port: " + arr['port'] + "), Enabled = " + str(arr['is_enabled']))
+                        self.print(self.tabs + "Interval : " + arr['interval_in_seconds'] + " secs, Timeout = " + arr['timeout_in_seconds'] + " secs")
+                        self.print(self.tabs + "Targets  : " + arr['targets'])
+                        self.print(self.tabs + "VPoints  : " + arr['vantage_point_names'])
+                        self.print("")
 
             # if dns_zone
             if 'dns_zone' in edge:
                 self.print_header("DNS Zone", 2)
 
                 for arr in edge['dns_zone']:
-                    print(self.taba + arr['name'] + " (" + arr['zone_type'] + "), Version: " + arr['version'] + ", Serial: " + arr['serial'])
-                    print(self.tabs + "URI : " + arr['self_uri'])
-                    print("")
+                    self.print(self.taba + arr['name'] + " (" + arr['zone_type'] + "), Version: " + arr['version'] + ", Serial: " + arr['serial'])
+                    self.print(self.tabs + "URI : " + arr['self_uri'])
+                    self.print("")
 
             # if dns_steering
             if 'dns_steering' in edge:
                 self.print_header("DNS Steering Policies", 2)
 
                 for arr in edge['dns_steering']:
-                    print(self.taba + arr['display_name'] + " (" + arr['template'] + "), TTL: " + arr['ttl'])
-                    print(self.tabs + "Health Check Id : " + arr['health_check_monitor_id'])
-                    print("")
+                    self.print(self.taba + arr['display_name'] + " (" + arr['template'] + "), TTL: " + arr['ttl'])
+                    self.print(self.tabs + "Health Check Id : " + arr['health_check_monitor_id'])
+                    self.print("")
 
             # if waas_policies
             if 'waas_policies' in edge:
                 self.print_header("WAAS Policies", 2)
 
                 for arr in edge['waas_policies']:
-                    print(self.taba + arr['display_name'])
-                    print(self.tabs + "Domain : " + arr['domain'])
-                    print("")
+                    self.print(self.taba + arr['display_name'])
+                    self.print(self.tabs + "Domain : " + arr['domain'])
+                    self.print("")
 
             # if waf
             if 'waf' in edge:
                 self.print_header("Web Application Firewall", 2)
 
                 for arr in edge['waf']:
-                    print(self.taba + arr['display_name'])
-                    print(self.tabs + "backend_type : " + arr['backend_type'] + ", policy_id: " + arr['web_app_firewall_policy_id'])
-                    print("")
+                    self.print(self.taba + arr['display_name'])
+                    self.print(self.tabs + "backend_type : " + arr['backend_type'] + ", policy_id: " + arr['web_app_firewall_policy_id'])
+                    self.print("")
 
         except Exception as e:
             self.__print_error("__print_edge_services_main", e)
@@ -2539,10 +2652,10 @@ class ShowOCIOutput(object):
                 used = (" Used = " + ct['used'].ljust(16)[0:16] + " ") if ct['used'] != "" else str(" ").ljust(25)
                 available = (" Available = " + ct['available'].ljust(16)[0:16] + " ") if ct['available'] != "" else str(" ").ljust(30)
                 scope = " SCOPE=" + ct['scope_type'].ljust(8) + ct['availability_domain']
-                print(self.taba + str(ct['name'] + " ").ljust(20) + limit_name + value + used + available + scope)
+                self.print(self.taba + str(ct['name'] + " ").ljust(20) + limit_name + value + used + available + scope)
 
-            print("* numbers trimmed to 16 digits, if you need full value, please use json output")
-            print("")
+            self.print("* numbers trimmed to 16 digits, if you need full value, please use json output")
+            self.print("")
 
         except Exception as e:
             self.__print_error("__print_limits_main", e)
@@ -2559,11 +2672,11 @@ class ShowOCIOutput(object):
             self.print_header("Quotas", 2)
 
             for ct in quotas:
-                print(self.taba + ct['name'] + ", (" + ct['description'] + "), Created: " + ct['time_created'][0:16])
+                self.print(self.taba + ct['name'] + ", (" + ct['description'] + "), Created: " + ct['time_created'][0:16])
                 for st in ct['statements']:
-                    print(self.tabs + st)
+                    self.print(self.tabs + st)
 
-                print("")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_quotas_main", e)
@@ -2582,120 +2695,120 @@ class ShowOCIOutput(object):
             if 'oic' in paas_services:
                 self.print_header("OIC Native", 2)
                 for val in paas_services['oic']:
-                    print(self.taba + val['display_name'] + ", (" + val['integration_instance_type'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                    print(self.tabs + "Pack     : " + val['message_packs'] + ", " + ("BYOL License" if val['is_byol'] else "License Included"))
-                    print(self.tabs + "URL      : " + val['instance_url'])
+                    self.print(self.taba + val['display_name'] + ", (" + val['integration_instance_type'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print(self.tabs + "Pack     : " + val['message_packs'] + ", " + ("BYOL License" if val['is_byol'] else "License Included"))
+                    self.print(self.tabs + "URL      : " + val['instance_url'])
                     if val['disaster_recovery_role']:
-                        print(self.tabs + "DR Role  : " + val['disaster_recovery_role'])
+                        self.print(self.tabs + "DR Role  : " + val['disaster_recovery_role'])
                     if val['private_endpoint_outbound_connection_type']:
-                        print(self.tabs + "PE Type  : " + val['private_endpoint_outbound_connection_type'])
+                        self.print(self.tabs + "PE Type  : " + val['private_endpoint_outbound_connection_type'])
                     if val['private_endpoint_outbound_connection_subnet_name']:
-                        print(self.tabs + "PE Subnet: " + val['private_endpoint_outbound_connection_subnet_name'])
-                    print("")
+                        self.print(self.tabs + "PE Subnet: " + val['private_endpoint_outbound_connection_subnet_name'])
+                    self.print("")
 
             # OAC
             if 'oac' in paas_services:
                 self.print_header("OAC Native", 2)
                 for val in paas_services['oac']:
-                    print(
+                    self.print(
                         self.taba + val['name'] + ", (" + val['feature_set'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                    print(self.tabs + "Desc   : " + val['description'])
-                    print(self.tabs + "Email  : " + val['email_notification'] + ", License: " + str(val['license_type']) + ", Capacity: " + val['capacity_type'] + ":" + val['capacity_value'] + ", End Point: " + val['network_endpoint_details'])
-                    print(self.tabs + "URL    : " + val['service_url'])
+                    self.print(self.tabs + "Desc   : " + val['description'])
+                    self.print(self.tabs + "Email  : " + val['email_notification'] + ", License: " + str(val['license_type']) + ", Capacity: " + val['capacity_type'] + ":" + val['capacity_value'] + ", End Point: " + val['network_endpoint_details'])
+                    self.print(self.tabs + "URL    : " + val['service_url'])
                     if val['vanity_url']:
-                        print(self.tabs + "Vanity : " + val['vanity_domain'] + ", " + val['vanity_url'])
-                    print("")
+                        self.print(self.tabs + "Vanity : " + val['vanity_domain'] + ", " + val['vanity_url'])
+                    self.print("")
 
             # OCE
             if 'oce' in paas_services:
                 self.print_header("OCE Native", 2)
                 for val in paas_services['oce']:
-                    print(self.taba + val['name'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                    print(self.tabs + "Email: " + val['admin_email'])
+                    self.print(self.taba + val['name'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print(self.tabs + "Email: " + val['admin_email'])
                     if 'pod' in val['service']:
                         pod = val['service']['pod']
-                        print(self.tabs + "Pod: " + str(pod['name']) + " (" + str(pod['version']) + ") ")
-                    print("")
+                        self.print(self.tabs + "Pod: " + str(pod['name']) + " (" + str(pod['version']) + ") ")
+                    self.print("")
 
             # VB
             if 'vb' in paas_services:
                 self.print_header("Visual Builder", 2)
                 for val in paas_services['vb']:
-                    print(self.taba + val['display_name'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + "), " + val['consumption_model'] + ", Enabled = " + val['is_visual_builder_enabled'] + ", Nodes = " + val['node_count'])
-                    print(self.tabs + "URL: " + val['instance_url'])
+                    self.print(self.taba + val['display_name'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + "), " + val['consumption_model'] + ", Enabled = " + val['is_visual_builder_enabled'] + ", Nodes = " + val['node_count'])
+                    self.print(self.tabs + "URL: " + val['instance_url'])
                     if val['custom_endpoint']:
-                        print(self.tabs + "   : Custom Endpoint: " + str(pod['custom_endpoint']))
+                        self.print(self.tabs + "   : Custom Endpoint: " + str(pod['custom_endpoint']))
                     if val['alternate_custom_endpoints']:
-                        print(self.tabs + "   : Alt    Endpoint: " + str(pod['alternate_custom_endpoints']))
-                    print("")
+                        self.print(self.tabs + "   : Alt    Endpoint: " + str(pod['alternate_custom_endpoints']))
+                    self.print("")
 
             # DevOPS
             if 'devops' in paas_services:
                 self.print_header("DevOPS Projects", 2)
                 for val in paas_services['devops']:
-                    print(self.taba + val['name'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + "), " + val['namespace'])
-                    print("")
+                    self.print(self.taba + val['name'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + "), " + val['namespace'])
+                    self.print("")
 
             # Open Search
             if 'open_search' in paas_services:
                 self.print_header("Open Search Clusters", 2)
                 for val in paas_services['open_search']:
-                    print(self.taba + val['display_name'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + "), " + val['software_version'])
+                    self.print(self.taba + val['display_name'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + "), " + val['software_version'])
                     if val['availability_domains']:
-                        print(self.tabs + "ADs       : " + val['availability_domains'])
+                        self.print(self.tabs + "ADs       : " + val['availability_domains'])
                     if val['security_mode']:
-                        print(self.tabs + "Sec       : " + val['security_mode'])
-                    print(self.tabs + "Search URL: " + val['opensearch_fqdn'])
-                    print(self.tabs + "Dash URL  : " + val['opendashboard_fqdn'])
-                    print(self.tabs + "Storage   : " + val['total_storage_gb'])
-                    print(self.tabs + "Subnet    : " + val['opensearch_private_ip'] + ", " + val['subnet_name'])
-                    print(self.tabs + "Master    : " + val['master_node_count'] + " x " + val['master_node_host_type'] + "." + val['master_node_host_ocpu_count'] + "." + val['master_node_host_memory_gb'])
-                    print(self.tabs + "Data      : " + val['data_node_count'] + " x " + val['data_node_host_type'] + "." + val['data_node_host_ocpu_count'] + "." + val['data_node_host_memory_gb'])
-                    print(self.tabs + "Dashboard : " + val['opendashboard_node_count'] + " x " + val['opendashboard_node_host_ocpu_count'] + "." + val['opendashboard_node_host_memory_gb'])
-                    print("")
+                        self.print(self.tabs + "Sec       : " + val['security_mode'])
+                    self.print(self.tabs + "Search URL: " + val['opensearch_fqdn'])
+                    self.print(self.tabs + "Dash URL  : " + val['opendashboard_fqdn'])
+                    self.print(self.tabs + "Storage   : " + val['total_storage_gb'])
+                    self.print(self.tabs + "Subnet    : " + val['opensearch_private_ip'] + ", " + val['subnet_name'])
+                    self.print(self.tabs + "Master    : " + val['master_node_count'] + " x " + val['master_node_host_type'] + "." + val['master_node_host_ocpu_count'] + "." + val['master_node_host_memory_gb'])
+                    self.print(self.tabs + "Data      : " + val['data_node_count'] + " x " + val['data_node_host_type'] + "." + val['data_node_host_ocpu_count'] + "." + val['data_node_host_memory_gb'])
+                    self.print(self.tabs + "Dashboard : " + val['opendashboard_node_count'] + " x " + val['opendashboard_node_host_ocpu_count'] + "." + val['opendashboard_node_host_memory_gb'])
+                    self.print("")
 
             # OCVS
             if 'ocvs' in paas_services:
                 self.print_header("OCVS VMWare", 2)
                 for val in paas_services['ocvs']:
-                    print(self.taba + val['display_name'] + ", (" + val['vmware_software_version'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")" + ", OCPUS: " + val['sddc_ocpus'])
-                    print(self.tabs + "Version   : " + val['vmware_software_version'])
-                    print(self.tabs + "HCX       : " + val['hcx_mode'] + ", URL: " + val['hcx_fqdn'] + ", HCX License Status Update: " + val['time_hcx_license_status_updated'])
-                    print(self.tabs + "VCENTER   : " + val['vcenter_fqdn'] + " - " + val['vcenter_private_ip'] + ", User: " + val['vcenter_username'])
-                    print(self.tabs + "NSX       : " + val['nsx_manager_fqdn'] + " - " + val['nsx_manager_private_ip'] + ", User: " + val['nsx_manager_username'])
-                    print(self.tabs + "NSX GW    : " + val['nsx_edge_uplink_ip'])
-                    print(self.tabs + "Other     : Is Single Host: " + val['is_single_host_sddc'])
-                    print(self.tabs + "Clusters  : " + val['clusters_count'])
-                    print("")
+                    self.print(self.taba + val['display_name'] + ", (" + val['vmware_software_version'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")" + ", OCPUS: " + val['sddc_ocpus'])
+                    self.print(self.tabs + "Version   : " + val['vmware_software_version'])
+                    self.print(self.tabs + "HCX       : " + val['hcx_mode'] + ", URL: " + val['hcx_fqdn'] + ", HCX License Status Update: " + val['time_hcx_license_status_updated'])
+                    self.print(self.tabs + "VCENTER   : " + val['vcenter_fqdn'] + " - " + val['vcenter_private_ip'] + ", User: " + val['vcenter_username'])
+                    self.print(self.tabs + "NSX       : " + val['nsx_manager_fqdn'] + " - " + val['nsx_manager_private_ip'] + ", User: " + val['nsx_manager_username'])
+                    self.print(self.tabs + "NSX GW    : " + val['nsx_edge_uplink_ip'])
+                    self.print(self.tabs + "Other     : Is Single Host: " + val['is_single_host_sddc'])
+                    self.print(self.tabs + "Clusters  : " + val['clusters_count'])
+                    self.print("")
 
                     for cl in val['clusters']:
                         nl = cl['network_configuration']
-                        print(self.tabs + "Cluster   : " + cl['display_name'] + " - " + cl['compute_availability_domain'] + " - " + cl['vmware_software_version'] + " - " + cl['lifecycle_state'] + " - OCPUs: " + cl['cluster_ocpus'])
-                        print(self.tabs + "Subnet    : " + nl['provisioning_subnet'])
-                        print(self.tabs + "Other     : Is Shielded Instances: " + (cl['is_shielded_instance_enabled'] if cl['is_shielded_instance_enabled'] else "False") + ", VSPHERE Type: " + cl['vsphere_type'] + ", Data Stores: " + (str(len(cl['datastores'])) if cl['datastores'] else "0"))
-                        print(self.tabs + "Vlans     : " + nl['vsphere_vlan'])
-                        print(self.tabs + "    vmot  : " + nl['vmotion_vlan'])
-                        print(self.tabs + "    vsan  : " + nl['vsan_vlan'])
-                        print(self.tabs + "    vtep  : " + nl['nsx_v_tep_vlan'])
-                        print(self.tabs + "    Edge  : " + nl['nsx_edge_v_tep_vlan'])
-                        print(self.tabs + "    Up1   : " + nl['nsx_edge_uplink1_vlan'])
-                        print(self.tabs + "    Up2   : " + nl['nsx_edge_uplink2_vlan'])
-                        print(self.tabs + "    Prov  : " + nl['provisioning_vlan'])
-                        print(self.tabs + "    HCX   : " + nl['hcx_vlan'])
+                        self.print(self.tabs + "Cluster   : " + cl['display_name'] + " - " + cl['compute_availability_domain'] + " - " + cl['vmware_software_version'] + " - " + cl['lifecycle_state'] + " - OCPUs: " + cl['cluster_ocpus'])
+                        self.print(self.tabs + "Subnet    : " + nl['provisioning_subnet'])
+                        self.print(self.tabs + "Other     : Is Shielded Instances: " + (cl['is_shielded_instance_enabled'] if cl['is_shielded_instance_enabled'] else "False") + ", VSPHERE Type: " + cl['vsphere_type'] + ", Data Stores: " + (str(len(cl['datastores'])) if cl['datastores'] else "0"))
+                        self.print(self.tabs + "Vlans     : " + nl['vsphere_vlan'])
+                        self.print(self.tabs + "    vmot  : " + nl['vmotion_vlan'])
+                        self.print(self.tabs + "    vsan  : " + nl['vsan_vlan'])
+                        self.print(self.tabs + "    vtep  : " + nl['nsx_v_tep_vlan'])
+                        self.print(self.tabs + "    Edge  : " + nl['nsx_edge_v_tep_vlan'])
+                        self.print(self.tabs + "    Up1   : " + nl['nsx_edge_uplink1_vlan'])
+                        self.print(self.tabs + "    Up2   : " + nl['nsx_edge_uplink2_vlan'])
+                        self.print(self.tabs + "    Prov  : " + nl['provisioning_vlan'])
+                        self.print(self.tabs + "    HCX   : " + nl['hcx_vlan'])
                         if cl['datastores']:
                             num = 0
-                            print(self.tabs + "DataStore : " + str(len(cl['datastores'])))
+                            self.print(self.tabs + "DataStore : " + str(len(cl['datastores'])))
                             for ds in cl['datastores']:
                                 num += 1
-                                print(self.tabs + "    Vol " + str(num) + " : " + ds['datastore_type'] + ", Size: " + ds['capacity'] + "GB")
+                                self.print(self.tabs + "    Vol " + str(num) + " : " + ds['datastore_type'] + ", Size: " + ds['capacity'] + "GB")
 
-                        print(self.tabs + "ESXi Hosts: " + cl['esxi_hosts_count'])
+                        self.print(self.tabs + "ESXi Hosts: " + cl['esxi_hosts_count'])
                         num = 0
                         for esx in cl['esxihosts']:
                             num += 1
-                            print(self.tabs + "    ESXi " + str(num) + ": " + esx['display_name'] + ", Created: " + esx['time_created'] + " (" + esx['lifecycle_state'] + "),  Billing End Date: " + esx['billing_contract_end_date'][0:16] + ", Commit: " + esx['current_commitment'] + ", Next Commit: " + esx['next_commitment'] + ", Shape: " + esx['host_shape_name'] + ", Cores: " + esx['host_ocpu_count'])
+                            self.print(self.tabs + "    ESXi " + str(num) + ": " + esx['display_name'] + ", Created: " + esx['time_created'] + " (" + esx['lifecycle_state'] + "),  Billing End Date: " + esx['billing_contract_end_date'][0:16] + ", Commit: " + esx['current_commitment'] + ", Next Commit: " + esx['next_commitment'] + ", Shape: " + esx['host_shape_name'] + ", Cores: " + esx['host_ocpu_count'])
 
-                    print("")
+                    self.print("")
 
         except Exception as e:
             self.__print_error("__print_paas_services_main", e)
@@ -2714,44 +2827,44 @@ class ShowOCIOutput(object):
                 self.print_header("Cloud Guard", 2)
 
                 for val in security['cloud_guard']:
-                    print(self.taba + "Cloud Guard: " + val['display_name'] + ", (Target = " + val['target_resource_type'] + " " + val['target_resource_name'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + "), Total Recipes : " + val['recipe_count'])
+                    self.print(self.taba + "Cloud Guard: " + val['display_name'] + ", (Target = " + val['target_resource_type'] + " " + val['target_resource_name'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + "), Total Recipes : " + val['recipe_count'])
                     if val['inherited_by_compartments']:
-                        print(self.tabs + "Inherited  : " + val['inherited_by_compartments_names'])
+                        self.print(self.tabs + "Inherited  : " + val['inherited_by_compartments_names'])
 
                     for dr in val['target_detector_recipes']:
-                        print(self.tabs + "Det Recipes: Owner = " + dr['owner'] + ", " + dr['display_name'] + ", Created: " + dr['time_created'][0:16] + " (" + dr['lifecycle_state'] + ")" + " Rules: " + str(len(dr['effective_detector_rules'])))
+                        self.print(self.tabs + "Det Recipes: Owner = " + dr['owner'] + ", " + dr['display_name'] + ", Created: " + dr['time_created'][0:16] + " (" + dr['lifecycle_state'] + ")" + " Rules: " + str(len(dr['effective_detector_rules'])))
 
                     for dr in val['target_responder_recipes']:
-                        print(self.tabs + "Res Recipes: Owner = " + dr['owner'] + ", " + dr['display_name'] + ", Created: " + dr['time_created'][0:16] + " Rules: " + str(len(dr['effective_responder_rules'])))
+                        self.print(self.tabs + "Res Recipes: Owner = " + dr['owner'] + ", " + dr['display_name'] + ", Created: " + dr['time_created'][0:16] + " Rules: " + str(len(dr['effective_responder_rules'])))
 
             # bastions
             if 'bastions' in security:
                 self.print_header("Bastions", 2)
                 for val in security['bastions']:
                     subnet = "(" + val['target_subnet_name'] + "), " if val['target_subnet_name'] else ""
-                    print(self.taba + val['name'] + ", " + val['bastion_type'] + ", " + subnet + "Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                    print("")
+                    self.print(self.taba + val['name'] + ", " + val['bastion_type'] + ", " + subnet + "Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print("")
 
             # kms_vaults
             if 'kms_vaults' in security:
                 self.print_header("KMS Vaults", 2)
                 for val in security['kms_vaults']:
-                    print(self.taba + val['name'] + ", " + val['vault_type'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                    print(self.tabs2 + "Keys          : " + val['key_count'] + ", Versions: " + val['key_version_count'])
-                    print(self.tabs2 + "Software Keys : " + val['software_key_count'] + ", Versions: " + val['software_key_version_count'])
-                    print(self.tabs2 + "Management URL: " + val['management_endpoint'])
-                    print(self.tabs2 + "Crypto URL    : " + val['crypto_endpoint'])
+                    self.print(self.taba + val['name'] + ", " + val['vault_type'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print(self.tabs2 + "Keys          : " + val['key_count'] + ", Versions: " + val['key_version_count'])
+                    self.print(self.tabs2 + "Software Keys : " + val['software_key_count'] + ", Versions: " + val['software_key_version_count'])
+                    self.print(self.tabs2 + "Management URL: " + val['management_endpoint'])
+                    self.print(self.tabs2 + "Crypto URL    : " + val['crypto_endpoint'])
                     for rep in val['replicas']:
-                        print(self.tabs2 + "Replicas      : " + rep['status'] + ", " + rep['region'] + ", " + rep['crypto_endpoint'])
-                    print("")
+                        self.print(self.tabs2 + "Replicas      : " + rep['status'] + ", " + rep['region'] + ", " + rep['crypto_endpoint'])
+                    self.print("")
 
             # Logging
             if 'logging' in security:
                 self.print_header("Logging Groups", 2)
                 for val in security['logging']:
-                    print(self.taba + val['display_name'] + ", (" + val['description'] + "), Created: " + val['time_created'][0:16])
+                    self.print(self.taba + val['display_name'] + ", (" + val['description'] + "), Created: " + val['time_created'][0:16])
                     for log in val['logs']:
-                        print(self.taba + self.tabs + "Log: " + log['display_name'] +
+                        self.print(self.taba + self.tabs + "Log: " + log['display_name'] +
                               ", Enabled = " + log['is_enabled'] +
                               ", " + log['source_service'] +
                               " (" + log['source_sourcetype'] + ")" +
@@ -2759,52 +2872,52 @@ class ShowOCIOutput(object):
                               ", Resource: " + str(log['source_resource'] + "..").split(".")[1] +
                               ", State: " + log['lifecycle_state'] +
                               ", Created: " + log['time_created'][0:16])
-                    print("")
+                    self.print("")
 
             # Logging unified agents
             if 'logging_unified_agents' in security:
                 self.print_header("Logging Unified Agents Configuration", 2)
                 for val in security['logging_unified_agents']:
-                    print(self.taba + val['display_name'] + ", (" + val['description'] + "), Is Enabled: " + val['is_enabled'] + ", Type: " + val['configuration_type'] + ", Created: " + val['time_created'][0:16])
-                    print("")
+                    self.print(self.taba + val['display_name'] + ", (" + val['description'] + "), Is Enabled: " + val['is_enabled'] + ", Type: " + val['configuration_type'] + ", Created: " + val['time_created'][0:16])
+                    self.print("")
 
             # Certificates
             if 'certificates' in security:
                 self.print_header("Certificates", 2)
                 for val in security['certificates']:
-                    print(self.taba + val['name'] + ", " + val['description'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                    print(self.tabs + "Validity Between: " + val['current_validity_not_before'] + " - " + val['current_validity_not_after'])
+                    self.print(self.taba + val['name'] + ", " + val['description'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print(self.tabs + "Validity Between: " + val['current_validity_not_before'] + " - " + val['current_validity_not_after'])
                     if val['associated_resource_ids']:
-                        print(self.tabs + "Associate Ids   : " + val['associated_resource_ids'])
-                        print(self.tabs + "Associate Names : " + val['associated_resource_names'])
+                        self.print(self.tabs + "Associate Ids   : " + val['associated_resource_ids'])
+                        self.print(self.tabs + "Associate Names : " + val['associated_resource_names'])
                     else:
-                        print(self.tabs + "No Associations")
-                    print("")
+                        self.print(self.tabs + "No Associations")
+                    self.print("")
 
             # Certificate Authorities
             if 'certificate_authorities' in security:
                 self.print_header("Certificate Authorities", 2)
                 for val in security['certificate_authorities']:
-                    print(self.taba + val['name'] + ", " + val['description'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                    print(self.tabs + "Validity Between: " + val['current_validity_not_before'] + " - " + val['current_validity_not_after'])
+                    self.print(self.taba + val['name'] + ", " + val['description'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print(self.tabs + "Validity Between: " + val['current_validity_not_before'] + " - " + val['current_validity_not_after'])
                     if val['associated_resource_ids']:
-                        print(self.tabs + "Associate Ids   : " + val['associated_resource_ids'])
-                        print(self.tabs + "Associate Names : " + val['associated_resource_names'])
+                        self.print(self.tabs + "Associate Ids   : " + val['associated_resource_ids'])
+                        self.print(self.tabs + "Associate Names : " + val['associated_resource_names'])
                     else:
-                        print(self.tabs + "No Associations")
-                    print("")
+                        self.print(self.tabs + "No Associations")
+                    self.print("")
 
             # Certificates CA Bundle
             if 'certificate_ca_bundles' in security:
                 self.print_header("Certificate CA Bundle", 2)
                 for val in security['certificate_ca_bundles']:
-                    print(self.taba + val['name'] + ", " + val['description'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print(self.taba + val['name'] + ", " + val['description'] + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
                     if val['associated_resource_ids']:
-                        print(self.tabs + "Associate Ids   : " + val['associated_resource_ids'])
-                        print(self.tabs + "Associate Names : " + val['associated_resource_names'])
+                        self.print(self.tabs + "Associate Ids   : " + val['associated_resource_ids'])
+                        self.print(self.tabs + "Associate Names : " + val['associated_resource_names'])
                     else:
-                        print(self.tabs + "No Associations")
-                    print("")
+                        self.print(self.tabs + "No Associations")
+                    self.print("")
 
         except Exception as e:
             self.__print_error("__print_security_main", e)
@@ -2822,87 +2935,87 @@ class ShowOCIOutput(object):
             if 'data_catalog' in data_ai:
                 self.print_header("Data Catalog", 2)
                 for val in data_ai['data_catalog']:
-                    print(self.taba + val['display_name'] + ", (" + val['number_of_objects'] + " objects), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                print("")
+                    self.print(self.taba + val['display_name'] + ", (" + val['number_of_objects'] + " objects), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                self.print("")
 
             # Data Science
             if 'data_science' in data_ai:
                 self.print_header("Data Science", 2)
                 for val in data_ai['data_science']:
-                    print(self.taba + val['display_name'] + ", (" + val['description'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                print("")
+                    self.print(self.taba + val['display_name'] + ", (" + val['description'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                self.print("")
 
             # Data Flow
             if 'data_flow' in data_ai:
                 self.print_header("Data Flow", 2)
                 for val in data_ai['data_flow']:
-                    print(self.taba + val['display_name'] + ", (" + val['language'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                    print(self.tabs + "Owner: " + val['owner_user_name'])
-                print("")
+                    self.print(self.taba + val['display_name'] + ", (" + val['language'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print(self.tabs + "Owner: " + val['owner_user_name'])
+                self.print("")
 
             # ODA
             if 'oda' in data_ai:
                 self.print_header("ODA Native", 2)
                 for val in data_ai['oda']:
-                    print(self.taba + val['display_name'] + ", (" + val['shape_name'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + " - " + val['lifecycle_sub_state'] + ")")
-                print("")
+                    self.print(self.taba + val['display_name'] + ", (" + val['shape_name'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + " - " + val['lifecycle_sub_state'] + ")")
+                self.print("")
 
             # BDS
             if 'bds' in data_ai:
                 self.print_header("Big Data Service", 2)
                 for val in data_ai['bds']:
-                    print(self.taba + val['display_name'] + ", (" + val['cluster_version'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print(self.taba + val['display_name'] + ", (" + val['cluster_version'] + "), Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
                     is_high_availability = ", High Availability" if val['is_high_availability'] else ", No HA"
                     is_secure = ", Secure" if val['is_secure'] else ", Not Secure"
                     is_cloud_sql_configured = ", Cloud SQL Configured" if val['is_cloud_sql_configured'] else ", No Cloud SQL"
                     is_kafka_configured = ", Kafka Configured" if val['is_kafka_configured'] else ", No Kafka Configured"
-                    print(self.tabs + "Config    : " + val['number_of_nodes'] + " Nodes" + is_high_availability + is_secure + is_cloud_sql_configured + is_kafka_configured)
-                    print(self.tabs + "Versions  : Cluster: " + val['cluster_version'] + ", BDS: " + val['cluster_details_bds_version'] + ", OS: " + val['cluster_details_os_version'] + ", BDCell: " + val['cluster_details_bd_cell_version'] + ", ODH: " + val['cluster_details_bd_cell_version'])
-                    print(self.tabs + "URLS      : Ambhari: " + val['cluster_details_ambari_url'] + ", Hue: " + val['cluster_details_hue_server_url'] + ", Jupyter: " + val['cluster_details_jupyter_hub_url'] + ", BigData: " + val['cluster_details_big_data_manager_url'])
+                    self.print(self.tabs + "Config    : " + val['number_of_nodes'] + " Nodes" + is_high_availability + is_secure + is_cloud_sql_configured + is_kafka_configured)
+                    self.print(self.tabs + "Versions  : Cluster: " + val['cluster_version'] + ", BDS: " + val['cluster_details_bds_version'] + ", OS: " + val['cluster_details_os_version'] + ", BDCell: " + val['cluster_details_bd_cell_version'] + ", ODH: " + val['cluster_details_bd_cell_version'])
+                    self.print(self.tabs + "URLS      : Ambhari: " + val['cluster_details_ambari_url'] + ", Hue: " + val['cluster_details_hue_server_url'] + ", Jupyter: " + val['cluster_details_jupyter_hub_url'] + ", BigData: " + val['cluster_details_big_data_manager_url'])
                     for index, nd in enumerate(val['nodes'], start=1):
                         volumes = str(' '.join(str(x) + "gb" for x in nd['attached_block_volumes_gbs'])) + " volumes"
-                        print(self.tabs + "Node " + str(index).ljust(3) + "  : " + nd['display_name'] + " (" + nd['lifecycle_state'] + "), Created: " + nd['time_created'][0:16] + ", Type: " + nd['node_type'].ljust(9) + ", " + nd['shape'] + "." + nd['ocpus'] + "." + nd['memory_in_gbs'] + ", " + volumes + ", IP: " + nd['ip_address'] + " " + nd['subnet_name'] + ", " + nd['availability_domain'] + ":" + nd['fault_domain'])
+                        self.print(self.tabs + "Node " + str(index).ljust(3) + "  : " + nd['display_name'] + " (" + nd['lifecycle_state'] + "), Created: " + nd['time_created'][0:16] + ", Type: " + nd['node_type'].ljust(9) + ", " + nd['shape'] + "." + nd['ocpus'] + "." + nd['memory_in_gbs'] + ", " + volumes + ", IP: " + nd['ip_address'] + " " + nd['subnet_name'] + ", " + nd['availability_domain'] + ":" + nd['fault_domain'])
                     for index, nd in enumerate(val['autoscale'], start=1):
-                        print(self.tabs + "AutoScale : " + nd['display_name'] + " (" + nd['lifecycle_state'] + "), Created: " + nd['time_created'][0:16] + ", Type: " + nd['policy_type'].ljust(9) + ", " + nd['policy_trigger_type'] + ", " + nd['policy_action_type'])
-                print("")
+                        self.print(self.tabs + "AutoScale : " + nd['display_name'] + " (" + nd['lifecycle_state'] + "), Created: " + nd['time_created'][0:16] + ", Type: " + nd['policy_type'].ljust(9) + ", " + nd['policy_trigger_type'] + ", " + nd['policy_action_type'])
+                self.print("")
 
             # DI
             if 'data_integration' in data_ai:
                 self.print_header("Data Integration", 2)
                 for val in data_ai['data_integration']:
                     description = (" (" + val['description'] + ")") if val['description'] != "None" else ""
-                    print(self.taba + val['display_name'] + description + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                print("")
+                    self.print(self.taba + val['display_name'] + description + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                self.print("")
 
             # GenAI
             if 'genai' in data_ai:
                 self.print_header("Generative AI", 2)
                 for val in data_ai['genai']:
                     description = (" (" + val['description'] + ")") if val['description'] else ""
-                    print(self.taba + val['display_name'] + description + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                    print(self.tabs + "   Type    : " + val['type'] + ", Unit: " + val['unit_shape'] + ", Count: " + val['unit_count'])
-                    print(self.tabs + "   Capacity: " + val['capacity_type'] + ", Total: " + val['capacity_total_endpoint_capacity'] + ", Used: " + val['capacity_used_endpoint_capacity'])
-                print("")
+                    self.print(self.taba + val['display_name'] + description + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print(self.tabs + "   Type    : " + val['type'] + ", Unit: " + val['unit_shape'] + ", Count: " + val['unit_count'])
+                    self.print(self.tabs + "   Capacity: " + val['capacity_type'] + ", Total: " + val['capacity_total_endpoint_capacity'] + ", Used: " + val['capacity_used_endpoint_capacity'])
+                self.print("")
 
             # GenAI Agents
             if 'genai_agent' in data_ai:
                 self.print_header("Generative AI Agent", 2)
                 for val in data_ai['genai_agent']:
                     description = (" (" + val['description'] + ")") if val['description'] else ""
-                    print(self.taba + val['display_name'] + description + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                    self.print(self.taba + val['display_name'] + description + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
                     if val['llm_config']:
-                        print(self.tabs + "  LLM Cfg : " + val['llm_config'])
+                        self.print(self.tabs + "  LLM Cfg : " + val['llm_config'])
                     if val['welcome_message']:
-                        print(self.tabs + "  Welcome : " + val['welcome_message'])
-                print("")
+                        self.print(self.tabs + "  Welcome : " + val['welcome_message'])
+                self.print("")
 
             # GenAI Agents KB
             if 'genai_agent_kb' in data_ai:
                 self.print_header("Generative AI Agent KBs", 2)
                 for val in data_ai['genai_agent_kb']:
                     description = (" (" + val['description'] + ")") if val['description'] else ""
-                    print(self.taba + val['display_name'] + description + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
-                print("")
+                    self.print(self.taba + val['display_name'] + description + ", Created: " + val['time_created'][0:16] + " (" + val['lifecycle_state'] + ")")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_data_ai", e)
@@ -2919,20 +3032,20 @@ class ShowOCIOutput(object):
             self.print_header("Containers", 2)
 
             for ct in containers:
-                print(self.taba + ct['name'] + " - " + ct['lifecycle_state'] + " - " + ct['kubernetes_version'])
-                print(self.tabs + "VCN   : " + str(ct['vcn_name']))
+                self.print(self.taba + ct['name'] + " - " + ct['lifecycle_state'] + " - " + ct['kubernetes_version'])
+                self.print(self.tabs + "VCN   : " + str(ct['vcn_name']))
 
                 # print backups
                 if ct['node_pools']:
                     for nd in ct['node_pools']:
-                        print(self.tabs + "Node  : " + nd['name'] + " - " + nd['node_image_name'] + " - " + nd['node_shape'])
+                        self.print(self.tabs + "Node  : " + nd['name'] + " - " + nd['node_image_name'] + " - " + nd['node_shape'])
 
                         # subnets
                         if nd['subnets']:
                             for sub in nd['subnets']:
-                                print(self.tabs + self.tabs + self.tabs + sub)
+                                self.print(self.tabs + self.tabs + self.tabs + sub)
 
-                print("")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_email_main", e)
@@ -2949,16 +3062,16 @@ class ShowOCIOutput(object):
             self.print_header("Resource Management", 2)
 
             for val in resource_management:
-                print(self.taba + str(val['stack_name']))
+                self.print(self.taba + str(val['stack_name']))
                 if 'jobs' in val:
                     for job in val['jobs']:
-                        print(self.tabs +
+                        self.print(self.tabs +
                               str(job['display_name']) + " - " +
                               str(job['operation']).ljust(10) + " - " +
                               str(job['lifecycle_state']).ljust(10) + " - " +
                               str(job['time_finished'])[0:16]
                               )
-                print("")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_resource_management_main", e)
@@ -2976,62 +3089,62 @@ class ShowOCIOutput(object):
             self.print_header("Compute Instances", 2)
             for instance in instances:
                 if 'name' in instance:
-                    print(self.taba + instance['name'])
+                    self.print(self.taba + instance['name'])
 
                 if instance['shape_ocpu'] > 0:
                     burstable = (", Burstable Baseline: " + str(instance['shape_baseline_ocpu_utilization'])) if instance['shape_baseline_ocpu_utilization'] else ""
                     gpu = (", GPUs: " + str(instance['shape_gpus']) + " " + str(instance['shape_gpu_description'])) if instance['shape_gpus'] else ""
                     local_storage = (", Local Storage: " + str(instance['shape_storage_tb']) + "TB") if instance['shape_storage_tb'] else ""
-                    print(self.tabs2 + "Shape: Ocpus: " + str(instance['shape_ocpu']) + ", Memory: " + str(instance['shape_memory_gb']) + "GB" + burstable + ", Processor: " + str(instance['shape_processor_description']))
-                    print(self.tabs2 + "       NetBW: " + str(instance['shape_networking_bandwidth_in_gbps']) + ", Max Vnics: " + str(instance['shape_max_vnic_attachments']) + local_storage + gpu)
+                    self.print(self.tabs2 + "Shape: Ocpus: " + str(instance['shape_ocpu']) + ", Memory: " + str(instance['shape_memory_gb']) + "GB" + burstable + ", Processor: " + str(instance['shape_processor_description']))
+                    self.print(self.tabs2 + "       NetBW: " + str(instance['shape_networking_bandwidth_in_gbps']) + ", Max Vnics: " + str(instance['shape_max_vnic_attachments']) + local_storage + gpu)
 
                 if 'availability_domain' in instance and 'fault_domain' in instance:
-                    print(self.tabs2 + "AD   : " + instance['availability_domain'] + " - " + instance['fault_domain'])
+                    self.print(self.tabs2 + "AD   : " + instance['availability_domain'] + " - " + instance['fault_domain'])
 
                 if 'time_maintenance_reboot_due' in instance:
                     if instance['time_maintenance_reboot_due'] != "None":
-                        print(self.tabs2 + "MRB  : Maintenance Reboot Due " + instance['time_maintenance_reboot_due'])
+                        self.print(self.tabs2 + "MRB  : Maintenance Reboot Due " + instance['time_maintenance_reboot_due'])
 
                 if 'image' in instance:
-                    print(self.tabs2 + "Img  : " + instance['image'] + " (" + instance['image_os'] + ")")
+                    self.print(self.tabs2 + "Img  : " + instance['image'] + " (" + instance['image_os'] + ")")
 
-                print(self.tabs2 + "Mig  : Live Migration Preferred: " + (instance['is_live_migration_preferred'] if instance['is_live_migration_preferred'] else "Default") + ", Recovery Action: " + instance['recovery_action'])
+                self.print(self.tabs2 + "Mig  : Live Migration Preferred: " + (instance['is_live_migration_preferred'] if instance['is_live_migration_preferred'] else "Default") + ", Recovery Action: " + instance['recovery_action'])
 
                 if 'boot_volume' in instance:
                     for bv in instance['boot_volume']:
                         if 'desc' in bv:
-                            print(self.tabs2 + "Boot : " + bv['desc'])
+                            self.print(self.tabs2 + "Boot : " + bv['desc'])
 
                 if 'block_volume' in instance:
                     for bv in instance['block_volume']:
                         if 'desc' in bv:
-                            print(self.tabs2 + "Vol  : " + bv['desc'])
+                            self.print(self.tabs2 + "Vol  : " + bv['desc'])
 
                 if 'vnic' in instance:
                     for vnic in instance['vnic']:
                         if 'desc' in vnic:
-                            print(self.tabs2 + "VNIC : " + vnic['desc'])
+                            self.print(self.tabs2 + "VNIC : " + vnic['desc'])
                         if 'nsg_names' in vnic['details']:
                             if vnic['details']['nsg_names']:
-                                print(self.tabs2 + "     : SecGrp: " + vnic['details']['nsg_names'])
+                                self.print(self.tabs2 + "     : SecGrp: " + vnic['details']['nsg_names'])
                         if 'internal_fqdn' in vnic['details']:
                             if vnic['details']['internal_fqdn']:
-                                print(self.tabs2 + "     : Int FQDN     : " + vnic['details']['internal_fqdn'])
+                                self.print(self.tabs2 + "     : Int FQDN     : " + vnic['details']['internal_fqdn'])
                         if 'ip_addresses' in vnic:
-                            print(self.tabs2 + "     : IP Addresses : " + self.list_to_str(vnic['ip_addresses'], 'ip_address'))
+                            self.print(self.tabs2 + "     : IP Addresses : " + self.list_to_str(vnic['ip_addresses'], 'ip_address'))
 
                 if 'console' in instance:
                     if instance['console']:
-                        print(self.tabs2 + instance['console'])
+                        self.print(self.tabs2 + instance['console'])
 
                 if 'agent_is_management_disabled' in instance:
-                    print(self.tabs2 + "Agent: Is Management Disabled = " + instance['agent_is_management_disabled'] + ", Is Monitoring Disabled = " + instance['agent_is_monitoring_disabled'])
+                    self.print(self.tabs2 + "Agent: Is Management Disabled = " + instance['agent_is_management_disabled'] + ", Is Monitoring Disabled = " + instance['agent_is_monitoring_disabled'])
 
                 # print logs
                 if 'logs' in instance:
                     for index, log in enumerate(instance['logs'], start=1):
-                        print(self.tabs + "Log " + str(index) + "      : " + log['name'])
-                print("")
+                        self.print(self.tabs + "Log " + str(index) + "      : " + log['name'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_core_compute_instances", e)
@@ -3047,7 +3160,7 @@ class ShowOCIOutput(object):
 
             self.print_header("Compute Custom Images", 2)
             for image in images:
-                print(self.taba + image['desc'])
+                self.print(self.taba + image['desc'])
 
         except Exception as e:
             self.__print_error("__print_core_compute_images", e)
@@ -3071,11 +3184,11 @@ class ShowOCIOutput(object):
                 availability_domain = ct['availability_domain']
                 shapes = ",".join(x['instance_shape'] + " (R=" + str(x['reserved_count']) + ":U=" + str(x['used_count']) + ")" for x in ct['config'])
 
-                print(self.taba + display_name + " (" + lifecycle_state + ")")
-                print(self.tabs + "Reservation   = " + value + ", " + used + ", " + available)
-                print(self.tabs + "Avail. Domain = " + availability_domain)
-                print(self.tabs + "Config Shapes = " + shapes)
-                print("")
+                self.print(self.taba + display_name + " (" + lifecycle_state + ")")
+                self.print(self.tabs + "Reservation   = " + value + ", " + used + ", " + available)
+                self.print(self.tabs + "Avail. Domain = " + availability_domain)
+                self.print(self.tabs + "Config Shapes = " + shapes)
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_core_compute_capacity_reservation", e)
@@ -3091,10 +3204,10 @@ class ShowOCIOutput(object):
 
             self.print_header("Compute Instance Pool", 2)
             for pool in pools:
-                print(self.taba + pool['name'])
-                print(self.tabs + self.tabs + "ADs   : " + pool['availability_domains'])
-                print(self.tabs + self.tabs + "Config: " + pool['instance_configuration_name'])
-                print("")
+                self.print(self.taba + pool['name'])
+                self.print(self.tabs + self.tabs + "ADs   : " + pool['availability_domains'])
+                self.print(self.tabs + self.tabs + "Config: " + pool['instance_configuration_name'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_core_compute_instance_pool", e)
@@ -3110,19 +3223,19 @@ class ShowOCIOutput(object):
 
             self.print_header("Compute Autoscaling", 2)
             for auto in autos:
-                print(self.taba + auto['name'])
-                print(self.tabs + "Resource    : " + auto['resource_type'] + ": " + auto['resource_name'])
+                self.print(self.taba + auto['name'])
+                self.print(self.tabs + "Resource    : " + auto['resource_type'] + ": " + auto['resource_name'])
 
                 # Policies
                 for pol in auto['policies']:
-                    print(self.tabs + "Policy      : " + pol['display_name'] + " (" + pol['policy_type'] + ")")
-                    print(self.tabs + "   Capacity : Initial = " + pol['capacity_initial'] + ", Min = " + pol['capacity_min'] + ", Max = " + pol['capacity_max'])
+                    self.print(self.tabs + "Policy      : " + pol['display_name'] + " (" + pol['policy_type'] + ")")
+                    self.print(self.tabs + "   Capacity : Initial = " + pol['capacity_initial'] + ", Min = " + pol['capacity_min'] + ", Max = " + pol['capacity_max'])
 
                     # Rules
                     for rule in pol['rules']:
-                        print(self.tabs + "   Rule     : " + rule)
+                        self.print(self.tabs + "   Rule     : " + rule)
 
-                print("")
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_core_compute_autoscaling", e)
@@ -3138,10 +3251,10 @@ class ShowOCIOutput(object):
 
             self.print_header("Compute Inst Configuration", 2)
             for config in configs:
-                print(self.taba + config['name'])
-                print(self.tabs + self.tabs + "Shape : " + config['shape'])
-                print(self.tabs + self.tabs + "Source: " + config['source'])
-                print("")
+                self.print(self.taba + config['name'])
+                self.print(self.tabs + self.tabs + "Shape : " + config['shape'])
+                self.print(self.tabs + self.tabs + "Source: " + config['source'])
+                self.print("")
 
         except Exception as e:
             self.__print_error("__print_core_compute_instance_configuration", e)
@@ -3159,7 +3272,7 @@ class ShowOCIOutput(object):
             prev_id = ""
             for backup in backups:
                 if prev_id and prev_id != backup['id']:
-                    print("")
+                    self.print("")
 
                 # if auto backup, print only the policy name
                 desc_name = backup['desc']
@@ -3168,7 +3281,7 @@ class ShowOCIOutput(object):
                     desc_name = "AUTO (" + backup['desc'][start:] + ")"
 
                 # print the line
-                print(self.taba + backup['name'] + ", " + backup['size'] + ", " + desc_name + ", " + backup['type'])
+                self.print(self.taba + backup['name'] + ", " + backup['size'] + ", " + desc_name + ", " + backup['type'])
 
                 prev_id = backup['id']
 
@@ -3186,9 +3299,9 @@ class ShowOCIOutput(object):
 
             self.print_header("Block Volume Groups", 2)
             for volgrp in volgroups:
-                print(self.taba + volgrp['name'] + " - " + volgrp['size_in_gbs'] + "GB")
+                self.print(self.taba + volgrp['name'] + " - " + volgrp['size_in_gbs'] + "GB")
                 for vol in volgrp['volumes']:
-                    print(self.tabs + self.tabs + " Vol : " + vol)
+                    self.print(self.tabs + self.tabs + " Vol : " + vol)
 
         except Exception as e:
             self.__print_error("__print_core_compute_volume_groups", e)
@@ -3204,7 +3317,7 @@ class ShowOCIOutput(object):
 
             self.print_header("Block Volume Not Attached", 2)
             for vol in vols:
-                print(self.taba + vol['desc'])
+                self.print(self.taba + vol['desc'])
 
         except Exception as e:
             self.__print_error("__print_core_compute_volume_groups", e)
@@ -3220,7 +3333,7 @@ class ShowOCIOutput(object):
 
             self.print_header("Block Boot Not Attached", 2)
             for vol in vols:
-                print(self.taba + vol['desc'])
+                self.print(self.taba + vol['desc'])
 
         except Exception as e:
             self.__print_error("__print_core_compute_boot_vol_not_attached", e)
@@ -3348,24 +3461,41 @@ class ShowOCISummary(object):
     taba = '--> '
     error = 0
 
-    summary_global_list = []
     summary_global_data = []
-    summary_global_region_total = []
     summary_global_region_json = {}
     summary_global_total = []
 
     ############################################
     # Init
+    # vectorized - sum the sizes of a compartment with numpy if installed
     ############################################
-    def __init__(self):
+    def __init__(self, renderer=None, vectorized=False):
+
+        self.renderer = renderer if renderer else ShowOCIRenderer()
+        self.print = self.renderer.print
+
+        # counters per type for compartment, region and total
+        self.aggregator = ShowOCIAggregator(vectorized)
 
         # Initiate summary objects everytime class is instantiated
-        self.summary_global_list = []
+        self.reset()
+
+    ##########################################################################
+    # reset - clear the summary so the instance can summarize another run
+    ##########################################################################
+    def reset(self):
+        self.error = 0
+        self.aggregator.reset()
         self.summary_global_data = []
-        self.summary_global_region_total = []
         self.summary_global_region_json = {}
         self.summary_global_total = []
 
+    ##########################################################################
+    # close - release the summary data, the renderer is owned by the caller
+    ##########################################################################
+    def close(self):
+        self.reset()
+
     ##########################################################################
     # get summary total
     ##########################################################################
@@ -3380,19 +3510,45 @@ class ShowOCISummary(object):
         try:
 
             for d in data:
-                if 'type' in d:
+                self.add_summary_block(d)
 
-                    if d['type'] == "region":
-                        self.__summary_region_data(d['region'], d['data'])
+            self.print_summary_total()
+            self.renderer.flush()
 
-                    elif d['type'] == "identity":
-                        self.__summary_identity(d['data'])
+        except Exception as e:
+            self.__print_error("print_summary", e)
+
+    ##########################################################################
+    # add one data block to the summary, for blocks streamed while processed
+    ##########################################################################
+    def add_summary_block(self, d):
+
+        try:
+            if 'type' in d:
 
-            self.summary_global_total = self.__summary_group_by("type", self.summary_global_total)
+                if d['type'] == "region":
+                    self.__summary_region_data(d['region'], d['data'])
+
+                elif d['type'] == "identity":
+                    self.__summary_identity(d['data'])
+
+            self.renderer.flush()
+
+        except Exception as e:
+            self.__print_error("add_summary_block", e)
+
+    ##########################################################################
+    # print summary total after all blocks were added
+    ##########################################################################
+    def print_summary_total(self):
+
+        try:
+            self.summary_global_total = self.aggregator.get_total()
             self.__summary_print_results(self.summary_global_total, "Summary Total", 0)
+            self.renderer.flush()
 
         except Exception as e:
-            self.__print_error("print_summary", e)
+            self.__print_error("print_summary_total", e)
 
     ##########################################################################
     # get errors
@@ -3407,9 +3563,9 @@ class ShowOCISummary(object):
         classname = type(self).__name__
 
         if isinstance(e, KeyError):
-            print("\nError in " + classname + ":" + msg + ": KeyError " + str(e.args))
+            self.renderer.print_error("\nError in " + classname + ":" + msg + ": KeyError " + str(e.args))
         else:
-            print("\nError in " + classname + ":" + msg + ": " + str(e))
+            self.renderer.print_error("\nError in " + classname + ":" + msg + ": " + str(e))
 
         self.error += 1
 
@@ -3417,12 +3573,15 @@ class ShowOCISummary(object):
     # Print header centered
     ##########################################################################
     def __summary_print_header(self, name, category):
+        if not self.renderer.enabled:
+            return
+
         options = {0: 95, 1: 60, 2: 30, 3: 85}
         chars = int(options[category])
-        print("")
-        print('#' * chars)
-        print("#" + name.center(chars - 2, " ") + "#")
-        print('#' * chars)
+        self.print("")
+        self.print('#' * chars)
+        self.print("#" + name.center(chars - 2, " ") + "#")
+        self.print('#' * chars)
 
     ##########################################################################
     # Load Balancer
@@ -3436,7 +3595,7 @@ class ShowOCISummary(object):
 
             for load_balance_obj in load_balancers:
                 if 'sum_info' in load_balance_obj:
-                    self.summary_global_list.append({'type': load_balance_obj['sum_info'], 'size': 1})
+                    self.aggregator.add(load_balance_obj['sum_info'], 1)
 
         except Exception as e:
             self.__print_error("__summary_load_balancer_main", e)
@@ -3486,10 +3645,7 @@ class ShowOCISummary(object):
                         ocpus = node['node_shape_ocpus']
                         if ocpus:
                             if isinstance(ocpus, int) or isinstance(ocpus, float):
-                                self.summary_global_list.append({
-                                    'type': 'OKE Clusters OCPUs - ' + node['node_shape'],
-                                    'size': float(ocpus)
-                                })
+                                self.aggregator.add('OKE Clusters OCPUs - ' + node['node_shape'], float(ocpus))
 
         except Exception as e:
             self.__print_error("__summary_container_main", e)
@@ -3529,9 +3685,9 @@ class ShowOCISummary(object):
                 for ocvs in paas_services['ocvs']:
                     for cluster in ocvs['clusters']:
                         for esxi in cluster['esxihosts']:
-                            self.summary_global_list.append({'type': "PaaS OCVS ESXi " + esxi['host_shape_name'] + " (Count)", 'size': float(1)})
+                            self.aggregator.add("PaaS OCVS ESXi " + esxi['host_shape_name'] + " (Count)", float(1))
                             if esxi['host_ocpu_count'] and str(esxi['host_ocpu_count']).replace(".", "").isnumeric():
-                                self.summary_global_list.append({'type': "PaaS OCVS ESXi " + esxi['host_shape_name'] + " (OCPUs)", 'size': float(esxi['host_ocpu_count'])})
+                                self.aggregator.add("PaaS OCVS ESXi " + esxi['host_shape_name'] + " (OCPUs)", float(esxi['host_ocpu_count']))
 
             if 'vb' in paas_services:
                 array = [x for x in paas_services['vb'] if x['lifecycle_state'] == 'ACTIVE']
@@ -3630,12 +3786,12 @@ class ShowOCISummary(object):
                 for bds in data_ai['bds']:
                     for nd in bds['nodes']:
                         for stg in nd['attached_block_volumes_gbs']:
-                            self.summary_global_list.append({'type': "Big Data Service (Block Storage GB)", 'size': float(stg)})
+                            self.aggregator.add("Big Data Service (Block Storage GB)", float(stg))
                         if nd['lifecycle_state'] == 'ACTIVE':
                             info = "Big Data Service Compute - " + nd['shape'] + "." + nd['ocpus'] + "." + nd['memory_in_gbs']
-                            self.summary_global_list.append({'type': info, 'size': float(1)})
-                            self.summary_global_list.append({'type': "Big Data Service (OCPUs)", 'size': float(nd['ocpus'])})
-                            self.summary_global_list.append({'type': "Big Data Service (Memory GB)", 'size': float(nd['memory_in_gbs'])})
+                            self.aggregator.add(info, float(1))
+                            self.aggregator.add("Big Data Service (OCPUs)", float(nd['ocpus']))
+                            self.aggregator.add("Big Data Service (Memory GB)", float(nd['memory_in_gbs']))
 
             if 'data_integration' in data_ai:
                 array = [x for x in data_ai['data_integration'] if x['lifecycle_state'] == 'ACTIVE']
@@ -3665,7 +3821,7 @@ class ShowOCISummary(object):
     def __summary_identity(self, identity):
 
         try:
-            self.summary_global_list = []
+            self.aggregator.open_compartment()
             if not identity:
                 return
 
@@ -3726,16 +3882,13 @@ class ShowOCISummary(object):
                     if 'password_policies' in domain:
                         self.__summary_core_count(domain['password_policies'], 'Identity Domains - Password Policies')
 
-            # aggregate the data
-            self.summary_global_list = self.__summary_group_by("type", self.summary_global_list)
+            # aggregate the data and add it to the total, identity is not in a region
+            summary = self.aggregator.close_compartment(in_region=False)
 
             # append data to global data
-            self.summary_global_data.append({'type': 'identity', 'summary': self.summary_global_list})
-
-            self.__summary_print_results(self.summary_global_list, "Summary Identity", 3)
+            self.summary_global_data.append({'type': 'identity', 'summary': summary})
 
-            # Merge to Total
-            self.summary_global_total.extend(self.summary_global_list)
+            self.__summary_print_results(summary, "Summary Identity", 3)
 
         except Exception as e:
             self.__print_error("__summary_identity", e)
@@ -3776,17 +3929,17 @@ class ShowOCISummary(object):
                 if 'sum_info' in db and 'sum_count' in db:
 
                     if db['sum_count'].replace(".", "").isnumeric():
-                        self.summary_global_list.append({'type': "Total " + db['compute_model'] + "s - Autonomous Database", 'size': float(db['sum_count'])})
+                        self.aggregator.add("Total " + db['compute_model'] + "s - Autonomous Database", float(db['sum_count']))
 
                         if float(db['sum_count']) == 0:
-                            self.summary_global_list.append({'type': db['sum_info_stopped'], 'size': 1})
+                            self.aggregator.add(db['sum_info_stopped'], 1)
                         else:
-                            self.summary_global_list.append({'type': db['sum_info_count'], 'size': 1})
-                            self.summary_global_list.append({'type': db['sum_info'], 'size': float(db['sum_count'])})
+                            self.aggregator.add(db['sum_info_count'], 1)
+                            self.aggregator.add(db['sum_info'], float(db['sum_count']))
 
                 if 'sum_info_storage' in db and 'sum_size_tb' in db:
                     if db['sum_size_tb'].replace(".", "").isnumeric():
-                        self.summary_global_list.append({'type': db['sum_info_storage'], 'size': float(db['sum_size_tb'])})
+                        self.aggregator.add(db['sum_info_storage'], float(db['sum_size_tb']))
 
         except Exception as e:
             self.__print_error("__summary_database_db_autonomous", e)
@@ -3800,7 +3953,7 @@ class ShowOCISummary(object):
         try:
             for db in dbs:
                 if 'sum_info' in db:
-                    self.summary_global_list.append({'type': db['sum_info'], 'size': float(db['sum_size_gb'])})
+                    self.aggregator.add(db['sum_info'], float(db['sum_size_gb']))
 
         except Exception as e:
             self.__print_error("__summary_database_nosql", e)
@@ -3814,7 +3967,7 @@ class ShowOCISummary(object):
         try:
             for db in dbs:
                 if 'sum_info' in db:
-                    self.summary_global_list.append({'type': db['sum_info'], 'size': float(db['sum_size_gb'])})
+                    self.aggregator.add(db['sum_info'], float(db['sum_size_gb']))
 
         except Exception as e:
             self.__print_error("__summary_database_external", e)
@@ -3910,25 +4063,25 @@ class ShowOCISummary(object):
                             for dbnode in dbs['db_nodes']:
                                 if 'cpu_core_count' in dbnode:
                                     if dbnode['lifecycle_state'] == 'STOPPED':
-                                        self.summary_global_list.append({'type': 'Total Stopped OCPUs - VM/BM Database', 'size': float(dbnode['cpu_core_count'])})
+                                        self.aggregator.add('Total Stopped OCPUs - VM/BM Database', float(dbnode['cpu_core_count']))
                                     else:
-                                        self.summary_global_list.append({'type': 'Total OCPUs - VM/BM Database', 'size': float(dbnode['cpu_core_count'])})
+                                        self.aggregator.add('Total OCPUs - VM/BM Database', float(dbnode['cpu_core_count']))
 
                 # if Exa add Exadata CPUs
                 else:
                     if 'cpu_core_count' in dbs:
-                        self.summary_global_list.append({'type': 'Total OCPUs - ExaCS Database', 'size': float(dbs['cpu_core_count'])})
-                        self.summary_global_list.append({'type': dbs['sum_info'] + " OCPUs", 'size': float(dbs['cpu_core_count'])})
+                        self.aggregator.add('Total OCPUs - ExaCS Database', float(dbs['cpu_core_count']))
+                        self.aggregator.add(dbs['sum_info'] + " OCPUs", float(dbs['cpu_core_count']))
 
                 # add db to summary
                 if dbs['lifecycle_state'] == 'STOPPED':
-                    self.summary_global_list.append({'type': 'Stopped ' + dbs['sum_info'], 'size': float(nodes)})
+                    self.aggregator.add('Stopped ' + dbs['sum_info'], float(nodes))
                 else:
-                    self.summary_global_list.append({'type': dbs['sum_info'], 'size': float(nodes)})
+                    self.aggregator.add(dbs['sum_info'], float(nodes))
 
                 if dbs['sum_size_gb'] is not None:
                     if dbs['sum_size_gb'] != 'None' and dbs['sum_size_gb'] != "":
-                        self.summary_global_list.append({'type': dbs['sum_info_storage'], 'size': float(dbs['sum_size_gb'])})
+                        self.aggregator.add(dbs['sum_info_storage'], float(dbs['sum_size_gb']))
 
         except Exception as e:
             self.__print_error("__summary_database_db_system", e)
@@ -3941,18 +4094,18 @@ class ShowOCISummary(object):
         try:
             for dbs in list_exa:
                 if not (dbs['lifecycle_state'] == 'TERMINATED' or dbs['lifecycle_state'] == 'DELETED'):
-                    self.summary_global_list.append({'type': dbs['sum_info'] + " - Count", 'size': 1})
+                    self.aggregator.add(dbs['sum_info'] + " - Count", 1)
 
                 for vm in dbs['vm_clusters']:
                     if 'cpu_core_count' in vm:
-                        self.summary_global_list.append({'type': 'Total OCPUs - ExaCS Database', 'size': float(vm['cpu_core_count'])})
-                        self.summary_global_list.append({'type': vm['sum_info'] + " OCPUs", 'size': float(vm['cpu_core_count'])})
+                        self.aggregator.add('Total OCPUs - ExaCS Database', float(vm['cpu_core_count']))
+                        self.aggregator.add(vm['sum_info'] + " OCPUs", float(vm['cpu_core_count']))
 
                     # add db to summary
                     if dbs['lifecycle_state'] == 'STOPPED':
-                        self.summary_global_list.append({'type': 'Stopped ' + vm['sum_info'], 'size': 1})
+                        self.aggregator.add('Stopped ' + vm['sum_info'], 1)
                     else:
-                        self.summary_global_list.append({'type': vm['sum_info'], 'size': 1})
+                        self.aggregator.add(vm['sum_info'], 1)
 
                     # db homes
                     for db_home in vm['db_homes']:
@@ -3964,15 +4117,15 @@ class ShowOCISummary(object):
                     for ct in vm['containers']:
                         for db in ct['databases']:
                             if 'sum_info' in db and 'sum_count' in db:
-                                self.summary_global_list.append({'type': "Total OCPUs - Autonomous Database", 'size': float(db['sum_count'])})
+                                self.aggregator.add("Total OCPUs - Autonomous Database", float(db['sum_count']))
                                 if float(db['sum_count']) == 0:
-                                    self.summary_global_list.append({'type': db['sum_info_stopped'], 'size': 1})
+                                    self.aggregator.add(db['sum_info_stopped'], 1)
                                 else:
-                                    self.summary_global_list.append({'type': db['sum_info_count'], 'size': 1})
-                                    self.summary_global_list.append({'type': db['sum_info'], 'size': float(db['sum_count'])})
+                                    self.aggregator.add(db['sum_info_count'], 1)
+                                    self.aggregator.add(db['sum_info'], float(db['sum_count']))
 
                             if 'sum_info_storage' in db and 'sum_size_tb' in db:
-                                self.summary_global_list.append({'type': db['sum_info_storage'], 'size': float(db['sum_size_tb'])})
+                                self.aggregator.add(db['sum_info_storage'], float(db['sum_size_tb']))
 
         except Exception as e:
             self.__print_error("__summary_database_db_exadata", e)
@@ -3985,18 +4138,18 @@ class ShowOCISummary(object):
         try:
             for dbs in list_exa:
                 if not (dbs['lifecycle_state'] == 'TERMINATED' or dbs['lifecycle_state'] == 'DELETED'):
-                    self.summary_global_list.append({'type': dbs['sum_info'] + " - Count", 'size': 1})
+                    self.aggregator.add(dbs['sum_info'] + " - Count", 1)
 
                 for vm in dbs['vm_clusters']:
                     if 'enabled_e_cpu_count' in vm:
-                        self.summary_global_list.append({'type': 'Total ECPUs - ExaScale Database', 'size': float(vm['enabled_e_cpu_count'])})
-                        self.summary_global_list.append({'type': vm['sum_info'] + " ECPUs", 'size': float(vm['enabled_e_cpu_count'])})
+                        self.aggregator.add('Total ECPUs - ExaScale Database', float(vm['enabled_e_cpu_count']))
+                        self.aggregator.add(vm['sum_info'] + " ECPUs", float(vm['enabled_e_cpu_count']))
 
                     # add db to summary
                     if dbs['lifecycle_state'] == 'STOPPED':
-                        self.summary_global_list.append({'type': 'Stopped ' + vm['sum_info'], 'size': 1})
+                        self.aggregator.add('Stopped ' + vm['sum_info'], 1)
                     else:
-                        self.summary_global_list.append({'type': vm['sum_info'], 'size': 1})
+                        self.aggregator.add(vm['sum_info'], 1)
 
                     # db homes
                     for db_home in vm['db_homes']:
@@ -4014,12 +4167,12 @@ class ShowOCISummary(object):
         try:
             for dbs in list_exa:
                 if not (dbs['lifecycle_state'] == 'TERMINATED' or dbs['lifecycle_state'] == 'DELETED'):
-                    self.summary_global_list.append({'type': dbs['sum_info'] + " - Count", 'size': 1})
+                    self.aggregator.add(dbs['sum_info'] + " - Count", 1)
 
                 for vm in dbs['vm_clusters']:
                     if 'cpus_enabled' in vm:
-                        self.summary_global_list.append({'type': 'Total OCPUs - ExaCC Database', 'size': float(vm['cpus_enabled'])})
-                        self.summary_global_list.append({'type': vm['sum_info'] + " OCPUs", 'size': float(vm['cpus_enabled'])})
+                        self.aggregator.add('Total OCPUs - ExaCC Database', float(vm['cpus_enabled']))
+                        self.aggregator.add(vm['sum_info'] + " OCPUs", float(vm['cpus_enabled']))
 
                     # db homes
                     for db_home in vm['db_homes']:
@@ -4031,15 +4184,15 @@ class ShowOCISummary(object):
                     for ct in vm['containers']:
                         for db in ct['databases']:
                             if 'sum_info' in db and 'sum_count' in db:
-                                self.summary_global_list.append({'type': "Total OCPUs - Autonomous Database", 'size': float(db['sum_count'])})
+                                self.aggregator.add("Total OCPUs - Autonomous Database", float(db['sum_count']))
                                 if float(db['sum_count']) == 0:
-                                    self.summary_global_list.append({'type': db['sum_info_stopped'], 'size': 1})
+                                    self.aggregator.add(db['sum_info_stopped'], 1)
                                 else:
-                                    self.summary_global_list.append({'type': db['sum_info_count'], 'size': 1})
-                                    self.summary_global_list.append({'type': db['sum_info'], 'size': float(db['sum_count'])})
+                                    self.aggregator.add(db['sum_info_count'], 1)
+                                    self.aggregator.add(db['sum_info'], float(db['sum_count']))
 
                             if 'sum_info_storage' in db and 'sum_size_tb' in db:
-                                self.summary_global_list.append({'type': db['sum_info_storage'], 'size': float(db['sum_size_tb'])})
+                                self.aggregator.add(db['sum_info_storage'], float(db['sum_size_tb']))
 
         except Exception as e:
             self.__print_error("__summary_database_db_exacc", e)
@@ -4054,14 +4207,14 @@ class ShowOCISummary(object):
 
                 # add db to summary
                 if mysql['lifecycle_state'] == 'STOPPED' or mysql['lifecycle_state'] == 'INACTIVE':
-                    self.summary_global_list.append({'type': 'Stopped ' + mysql['sum_info'], 'size': 1})
+                    self.aggregator.add('Stopped ' + mysql['sum_info'], 1)
                 else:
-                    self.summary_global_list.append({'type': mysql['sum_info'], 'size': 1})
-                    self.summary_global_list.append({'type': 'Total OCPUs - Mysql Database', 'size': float(mysql['shape_ocpu'])})
+                    self.aggregator.add(mysql['sum_info'], 1)
+                    self.aggregator.add('Total OCPUs - Mysql Database', float(mysql['shape_ocpu']))
 
                 if mysql['data_storage_size_in_gbs'] is not None:
                     if mysql['data_storage_size_in_gbs'] != 'None' and mysql['data_storage_size_in_gbs'] != "":
-                        self.summary_global_list.append({'type': mysql['sum_info_storage'], 'size': float(mysql['data_storage_size_in_gbs'])})
+                        self.aggregator.add(mysql['sum_info_storage'], float(mysql['data_storage_size_in_gbs']))
 
         except Exception as e:
             self.__print_error("__summary_database_mysql", e)
@@ -4076,10 +4229,10 @@ class ShowOCISummary(object):
 
                 # add db to summary
                 if pq['lifecycle_state'] == 'STOPPED' or pq['lifecycle_state'] == 'INACTIVE':
-                    self.summary_global_list.append({'type': 'Stopped ' + pq['sum_info'], 'size': 1})
+                    self.aggregator.add('Stopped ' + pq['sum_info'], 1)
                 else:
-                    self.summary_global_list.append({'type': pq['sum_info'], 'size': 1})
-                    self.summary_global_list.append({'type': 'Total OCPUs - PostgreSQL Database', 'size': float(pq['instance_ocpu_count'])})
+                    self.aggregator.add(pq['sum_info'], 1)
+                    self.aggregator.add('Total OCPUs - PostgreSQL Database', float(pq['instance_ocpu_count']))
 
         except Exception as e:
             self.__print_error("__summary_database_postgresql", e)
@@ -4095,11 +4248,11 @@ class ShowOCISummary(object):
 
                     # add db to summary
                     if gg['lifecycle_state'] == 'STOPPED' or gg['lifecycle_state'] == "INACTIVE":
-                        self.summary_global_list.append({'type': 'Stopped ' + gg['sum_info'] + " (Count)", 'size': 1})
+                        self.aggregator.add('Stopped ' + gg['sum_info'] + " (Count)", 1)
                     else:
-                        self.summary_global_list.append({'type': 'Total OCPUs - Goldengate', 'size': float(gg['cpu_core_count'])})
-                        self.summary_global_list.append({'type': gg['sum_info'] + " OCPUs", 'size': float(gg['cpu_core_count'])})
-                        self.summary_global_list.append({'type': gg['sum_info'] + " (Count)", 'size': 1})
+                        self.aggregator.add('Total OCPUs - Goldengate', float(gg['cpu_core_count']))
+                        self.aggregator.add(gg['sum_info'] + " OCPUs", float(gg['cpu_core_count']))
+                        self.aggregator.add(gg['sum_info'] + " (Count)", 1)
 
         except Exception as e:
             self.__print_error("__summary_database_goldengate", e)
@@ -4115,19 +4268,19 @@ class ShowOCISummary(object):
 
             for instance in instances:
                 if instance['lifecycle_state'] == "STOPPED":
-                    self.summary_global_list.append({'type': ("Stopped " + instance['sum_info'] + " - " + instance['sum_shape']), 'size': float(1)})
+                    self.aggregator.add("Stopped " + instance['sum_info'] + " - " + instance['sum_shape'], float(1))
                     if 'shape_ocpu' in instance:
-                        self.summary_global_list.append({'type': 'Total Stopped OCPUs - Compute - All', 'size': float(instance['shape_ocpu'])})
+                        self.aggregator.add('Total Stopped OCPUs - Compute - All', float(instance['shape_ocpu']))
                     if 'image_os' in instance:
                         if instance['image_os'] == "Windows":
-                            self.summary_global_list.append({'type': 'Total Stopped OCPUs - Compute - Windows', 'size': float(instance['shape_ocpu'])})
+                            self.aggregator.add('Total Stopped OCPUs - Compute - Windows', float(instance['shape_ocpu']))
                 else:
-                    self.summary_global_list.append({'type': (instance['sum_info'] + " - " + instance['sum_shape']), 'size': float(1)})
+                    self.aggregator.add(instance['sum_info'] + " - " + instance['sum_shape'], float(1))
                     if 'shape_ocpu' in instance:
-                        self.summary_global_list.append({'type': 'Total OCPUs - Compute - All', 'size': float(instance['shape_ocpu'])})
+                        self.aggregator.add('Total OCPUs - Compute - All', float(instance['shape_ocpu']))
                     if 'image_os' in instance:
                         if instance['image_os'] == "Windows":
-                            self.summary_global_list.append({'type': 'Total OCPUs - Compute - Windows', 'size': float(instance['shape_ocpu'])})
+                            self.aggregator.add('Total OCPUs - Compute - Windows', float(instance['shape_ocpu']))
 
                 if 'boot_volume' in instance:
                     self.__summary_core_size(instance['boot_volume'])
@@ -4151,7 +4304,7 @@ class ShowOCISummary(object):
                 if sum_info in obj and sum_size in obj:
                     if obj[sum_size] != '':
                         if float(obj[sum_size]) > 0:
-                            self.summary_global_list.append({'type': add_info + obj[sum_info], 'size': float(obj[sum_size])})
+                            self.aggregator.add(add_info + obj[sum_info], float(obj[sum_size]))
 
         except Exception as e:
             self.__print_error("__summary_core_size", e)
@@ -4167,7 +4320,7 @@ class ShowOCISummary(object):
             if len(objects) == 0:
                 return
 
-            self.summary_global_list.append({'type': object_name, 'size': len(objects)})
+            self.aggregator.add(object_name, len(objects))
 
         except Exception as e:
             self.__print_error("__summary_core_count", e)
@@ -4233,9 +4386,9 @@ class ShowOCISummary(object):
                             for sgw in dt['sgw']:
                                 if 'services' in sgw:
                                     if 'Object Storage' in sgw['services']:
-                                        self.summary_global_list.append({'type': "Network VCN Service Gateway Object Storage", 'size': 1})
+                                        self.aggregator.add("Network VCN Service Gateway Object Storage", 1)
                                     else:
-                                        self.summary_global_list.append({'type': "Network VCN Service Gateway All Services", 'size': 1})
+                                        self.aggregator.add("Network VCN Service Gateway All Services", 1)
 
                         # IGW
                         if 'igw' in dt:
@@ -4246,9 +4399,9 @@ class ShowOCISummary(object):
                             for nat in dt['nat']:
                                 if 'block_traffic' in nat:
                                     if 'True' in nat['block_traffic']:
-                                        self.summary_global_list.append({'type': "Network VCN NAT Gateways Blocked", 'size': 1})
+                                        self.aggregator.add("Network VCN NAT Gateways Blocked", 1)
                                     else:
-                                        self.summary_global_list.append({'type': "Network VCN NAT Gateways", 'size': 1})
+                                        self.aggregator.add("Network VCN NAT Gateways", 1)
                             self.__summary_core_count(dt['vlans'], "Network VCN VLANs")
 
                         # NSG
@@ -4268,9 +4421,9 @@ class ShowOCISummary(object):
                             for lpg in dt['local_peering']:
                                 if 'peering_status' in lpg:
                                     if lpg['peering_status'] == "PEERED":
-                                        self.summary_global_list.append({'type': "Network VCN LPGs Peered", 'size': 1})
+                                        self.aggregator.add("Network VCN LPGs Peered", 1)
                                     else:
-                                        self.summary_global_list.append({'type': "Network VCN LPGs Not Peered", 'size': 1})
+                                        self.aggregator.add("Network VCN LPGs Not Peered", 1)
 
             # DRG
             if 'drg' in data:
@@ -4293,59 +4446,30 @@ class ShowOCISummary(object):
                     if 'tunnels' in ipsec:
                         for tunnel in ipsec['tunnels']:
                             if tunnel['status'] == "UP":
-                                self.summary_global_list.append({'type': "Network DRG IPSEC Tunnels UP", 'size': 1})
+                                self.aggregator.add("Network DRG IPSEC Tunnels UP", 1)
                             else:
-                                self.summary_global_list.append({'type': "Network DRG IPSEC Tunnels Down", 'size': 1})
+                                self.aggregator.add("Network DRG IPSEC Tunnels Down", 1)
 
             # VC
             if 'virtual_circuit' in data:
                 for vc in data['virtual_circuit']:
                     if vc['bgp_session_state'] == "UP":
-                        self.summary_global_list.append({'type': "Network DRG Circuits BGP UP", 'size': 1})
+                        self.aggregator.add("Network DRG Circuits BGP UP", 1)
                     else:
-                        self.summary_global_list.append({'type': "Network DRG Circuits BGP Down", 'size': 1})
+                        self.aggregator.add("Network DRG Circuits BGP Down", 1)
 
             # RPG
             if 'remote_peering' in data:
                 for rpg in data['remote_peering']:
                     if 'peering_status' in rpg:
                         if rpg['peering_status'] == "PEERED":
-                            self.summary_global_list.append({'type': "Network DRG RPG Peered", 'size': 1})
+                            self.aggregator.add("Network DRG RPG Peered", 1)
                         else:
-                            self.summary_global_list.append({'type': "Network DRG RPG Not Peered", 'size': 1})
+                            self.aggregator.add("Network DRG RPG Not Peered", 1)
 
         except Exception as e:
             self.__print_error("__summary_core_network_main", e)
 
-    ##########################################################################
-    # Summary Group By
-    # took the function from stackoverflow
-    ##########################################################################
-
-    def __summary_group_by(self, key, list_of_dicts):
-
-        try:
-            d = {}
-            for dct in list_of_dicts:
-                if dct[key] not in d:
-                    d[dct[key]] = {}
-                for k, v in dct.items():
-                    if k != key:
-                        if k not in d[dct[key]]:
-                            d[dct[key]][k] = v
-                        else:
-                            d[dct[key]][k] += v
-            final_list = []
-            for k, v in d.items():
-                temp_d = {key: k}
-                for k2, v2 in v.items():
-                    temp_d[k2] = v2
-                final_list.append(temp_d)
-            return final_list
-
-        except Exception as e:
-            self.__print_error("__summary_group_by", e)
-
     ##########################################################################
     # Print summary  data
     ##########################################################################
@@ -4353,12 +4477,12 @@ class ShowOCISummary(object):
 
         try:
 
-            if len(data) > 0:
+            if len(data) > 0 and self.renderer.enabled:
                 self.__summary_print_header(header, header_size)
 
                 # sort and print
                 for d in sorted(data, key=lambda i: i['type']):
-                    print(d['type'].ljust(75, '.')[0:74] + str(round(d['size'])).rjust(10, '.'))
+                    self.print(d['type'].ljust(75, '.')[0:74] + str(round(d['size'])).rjust(10, '.'))
 
         except Exception as e:
             self.__print_error("__summary_print_results", e)
@@ -4372,13 +4496,12 @@ class ShowOCISummary(object):
             if not data:
                 return
             self.__summary_print_header("Summary - " + region_name, 0)
-            self.summary_global_region_total = []
+            self.aggregator.open_region()
             region_data_exist = False
 
             # loop on compartments
             for cdata in data:
-                self.summary_global_list = []
-
+                self.aggregator.open_compartment()
                 compartment_header = ""
 
                 if 'network' in cdata:
@@ -4407,31 +4530,27 @@ class ShowOCISummary(object):
                     self.__summary_data_edge(cdata['edge'])
 
                 # print compartment header if data in the global list
-                if 'path' in cdata and self.summary_global_list:
+                if 'path' in cdata and self.aggregator.has_data():
                     compartment_header = "Summary - Compartment " + cdata['path']
                     region_data_exist = True
 
-                # aggregate the data
-                self.summary_global_list = self.__summary_group_by("type", self.summary_global_list)
+                # aggregate the data and roll it up to region and total
+                summary = self.aggregator.close_compartment()
 
                 # print results compartment
-                self.__summary_print_results(self.summary_global_list, compartment_header, 3)
-
-                # append data to global and region
-                self.summary_global_total.extend(self.summary_global_list)
-                self.summary_global_region_total.extend(self.summary_global_list)
+                self.__summary_print_results(summary, compartment_header, 3)
 
                 # append data to global data
-                self.summary_global_data.append({'region': region_name, 'compartment_name': cdata['path'], 'summary': self.summary_global_list})
+                self.summary_global_data.append({'region': region_name, 'compartment_name': cdata['path'], 'summary': summary})
 
-            # If region data , aggregate the data, print and add to JSON
+            # If region data , print and add to JSON
+            region_total = self.aggregator.close_region()
             if region_data_exist:
-                self.summary_global_region_total = self.__summary_group_by("type", self.summary_global_region_total)
-                self.summary_global_region_json[region_name] = self.summary_global_region_total
-                self.__summary_print_results(self.summary_global_region_total, "Summary Region Total - " + region_name, 3)
+                self.summary_global_region_json[region_name] = region_total
+                self.__summary_print_results(region_total, "Summary Region Total - " + region_name, 3)
             else:
-                print("")
-                print("No Summary data exist in this region")
+                self.print("")
+                self.print("No Summary data exist in this region")
 
         except Exception as e:
             self.__print_error("__summary_region_data", e)
@@ -4451,6 +4570,7 @@ class ShowOCICSV(object):
     error_array = []
     csv_tags_to_cols = False
     csv_file_header = ""
+    csv_write_buffer = 1024 * 1024
     csv_announcements = []
     csv_announcements_detailed = []
     csv_errors = []
@@ -4558,6 +4678,8 @@ class ShowOCICSV(object):
     csv_genai_agent = []
     csv_genai_agent_kb = []
     csv_add_date_field = True
+    csv_delta_dir = ""
+    csv_format = "csv"
     csv_columns = []
     csv_streams_queues = []
     csv_monitor_agents = []
@@ -4576,6 +4698,30 @@ class ShowOCICSV(object):
     ############################################
     def __init__(self, start_time):
         self.start_time = start_time
+        self.columnar = None
+        self.reset()
+
+    ##########################################################################
+    # reset - give the instance its own empty rows and errors, the class
+    # level lists above are only the defaults and must not be appended to,
+    # called by generate_csv so one instance can export many tenancies
+    ##########################################################################
+    def reset(self, start_time=None):
+        if start_time:
+            self.start_time = start_time
+
+        self.error = 0
+        self.error_array = []
+        for name, value in vars(ShowOCICSV).items():
+            if name.startswith("csv_") and isinstance(value, list):
+                setattr(self, name, [])
+
+    ##########################################################################
+    # close - release the rows of the last export
+    ##########################################################################
+    def close(self):
+        self.reset()
+        self.columnar = None
 
     ##########################################################################
     # get errors
@@ -4620,8 +4766,12 @@ class ShowOCICSV(object):
     ##########################################################################
     # generate_csv
     ##########################################################################
-    def generate_csv(self, data, csv_file_header, tenancy, add_date_field=True, csv_columns=""):
+    def generate_csv(self, data, csv_file_header, tenancy, add_date_field=True, csv_columns="", delta_dir="", file_format="csv"):
+        self.reset()
         self.csv_add_date_field = add_date_field
+        self.csv_delta_dir = delta_dir if file_format == "csv" else ""
+        self.csv_format = file_format
+        self.columnar = ShowOCIColumnar(file_format) if file_format != "csv" else None
         self.csv_file_header = csv_file_header
         self.csv_columns = str(csv_columns).split(",")
         self.tenant_id = str(tenancy['id'])[-6:]
@@ -4797,79 +4947,201 @@ class ShowOCICSV(object):
     #######################################
     def get_all_keys_in_order(self, list_of_dicts):
         try:
-            ordered_keys = []
+            # dict keeps insertion order and has O(1) lookup
+            ordered_keys = {}
             for dict_ in list_of_dicts:
-                for key in dict_:
-                    if key not in ordered_keys:
-                        ordered_keys.append(key)
-            return ordered_keys
+                ordered_keys.update(dict.fromkeys(dict_))
+            return list(ordered_keys)
         except Exception as e:
             raise Exception("Error in get_all_keys_in_order: " + str(e.args))
 
     #######################################
     # extract_tags_to_columns             #
     #######################################
-    def extract_tags_to_columns(self, list_of_dicts):
+    def extract_tags_to_columns(self, list_of_dicts, tags_cache=None):
         try:
-            new_result = []
+            # tag strings repeat across rows, parse each once
+            if tags_cache is None:
+                tags_cache = {}
+
             for row in list_of_dicts:
                 for tag_type in ['defined_tags', 'freeform_tags']:
                     if tag_type in row:
-                        tags = row[tag_type].split(', ')
-                        for tag in tags:
-                            tag_split = tag.split("=")
-                            if len(tag_split) > 1:
-                                key_value = 'Tag_' + tag_split[0]
-                                data_value = tag_split[1]
-                                row.update({key_value: data_value})
-                # Append the row
-                new_result.append(row)
-            return new_result
+                        columns = tags_cache.get(row[tag_type])
+                        if columns is None:
+                            columns = []
+                            tags = row[tag_type].split(', ')
+                            for tag in tags:
+                                tag_split = tag.split("=")
+                                if len(tag_split) > 1:
+                                    key_value = 'Tag_' + tag_split[0]
+                                    data_value = tag_split[1]
+                                    columns.append((key_value, data_value))
+                            tags_cache[row[tag_type]] = columns
+                        row.update(columns)
+                # yield the row
+                yield row
         except Exception as e:
             raise Exception("Error in extract_tags_to_columns: " + str(e.args))
 
+    ##########################################################################
+    # csv rows - generator of the decorated rows, so only the row being
+    # written exists and the data can be walked once for the fields and
+    # once for the write
+    ##########################################################################
+    def __csv_rows(self, data):
+
+        tenant_dict = {'tenant_name': self.tenant_name, 'tenant_id': self.tenant_id}
+
+        for item in data:
+            row = dict(tenant_dict)
+            row.update(item)
+
+            # add start_date to each dictionary
+            if self.csv_add_date_field:
+                row['extract_date'] = self.start_time
+
+            yield row
+
     ##########################################################################
     # create csv file
     ##########################################################################
     def __export_to_csv_file(self, file_subject, data):
 
         try:
+            # read the previous export before the file is written, csv_delta_dir
+            # can be the directory of the CSV files
+            previous = self.__read_csv_delta_previous(file_subject) if self.csv_delta_dir else None
+
             # if no data
             if len(data) == 0:
+                # rows of the previous export are removed
+                if self.csv_delta_dir:
+                    self.__export_to_csv_delta_file(file_subject, [], [], previous)
                 return
 
             # get the file name of the CSV
             file_name = self.csv_file_header + "_" + file_subject + ".csv"
-            tenant_dict = {'tenant_name': self.tenant_name, 'tenant_id': self.tenant_id}
-
-            # add start_date to each dictionary
-            result = []
-            if self.csv_add_date_field:
-                result = [dict(list(tenant_dict.items()) + list(item.items()), extract_date=self.start_time) for item in data]
-            else:
-                result = [dict(list(tenant_dict.items()) + list(item.items())) for item in data]
 
             # if convert tags to cols
+            rows = self.__csv_rows
             if self.csv_tags_to_cols:
-                result = self.extract_tags_to_columns(result)
+                tags_cache = {}
+                rows = lambda data: self.extract_tags_to_columns(self.__csv_rows(data), tags_cache)
 
             # generate fields
-            fields = self.get_all_keys_in_order(result)
+            fields = self.get_all_keys_in_order(rows(data))
 
-            with open(file_name, mode='w', newline='') as csv_file:
-                writer = csv.DictWriter(csv_file, fieldnames=fields)
+            # typed columnar file instead of csv
+            if self.columnar:
+                file_name = self.csv_file_header + "_" + file_subject + self.columnar.extension
+                self.columnar.write_table(file_name, fields, rows(data))
+                print("CSV: " + file_subject.ljust(35) + " --> " + file_name)
+                return
+
+            with open(file_name, mode='w', newline='', buffering=self.csv_write_buffer) as csv_file:
+                writer = csv.writer(csv_file)
 
                 # write header
-                writer.writeheader()
+                writer.writerow(fields)
 
-                for row in result:
-                    writer.writerow(row)
+                # write rows in bulk, missing columns are None which csv writes empty like csv.DictWriter
+                writer.writerows(map(row.get, fields) for row in rows(data))
 
             print("CSV: " + file_subject.ljust(35) + " --> " + file_name)
 
+            if self.csv_delta_dir:
+                self.__export_to_csv_delta_file(file_subject, fields, rows(data), previous)
+
         except Exception as e:
             raise Exception("Error in __export_to_csv_file: " + str(e.args))
 
+    ##########################################################################
+    # stable row id - parent id with a content hash of the row key,
+    # unlike hash() it is the same on every run
+    ##########################################################################
+    def __csv_row_id(self, parent_id, key):
+        return parent_id + ":" + hashlib.sha1(str(key).encode('utf-8')).hexdigest()[0:16]
+
+    ##########################################################################
+    # csv row keys - {key: content hash}, the key is the row id or the
+    # content hash for files without id, the hash skips empty columns and
+    # extract_date so it only changes when the resource changes
+    ##########################################################################
+    def __csv_row_keys(self, rows):
+
+        keys = {}
+        for row in rows:
+            content = "\x1f".join(k + "=" + str(v) for k, v in sorted(row.items()) if k != 'extract_date' and v is not None and v != "")
+            content_hash = hashlib.sha1(content.encode('utf-8')).hexdigest()
+            key = str(row['id']) if row.get('id') else content_hash
+
+            # same id in more than one row, keep them apart
+            occurrence = 1
+            row_key = key
+            while row_key in keys:
+                occurrence += 1
+                row_key = key + "#" + str(occurrence)
+
+            keys[row_key] = (content_hash, row)
+        return keys
+
+    ##########################################################################
+    # previous export - (fields, row keys) of the same file in csv_delta_dir,
+    # no rows when there is no previous file
+    ##########################################################################
+    def __read_csv_delta_previous(self, file_subject):
+
+        try:
+            previous_file = os.path.join(self.csv_delta_dir, os.path.basename(self.csv_file_header) + "_" + file_subject + ".csv")
+            if not os.path.exists(previous_file):
+                return [], {}
+
+            with open(previous_file, mode='r', newline='') as csv_file:
+                reader = csv.DictReader(csv_file)
+                previous = self.__csv_row_keys(reader)
+                return reader.fieldnames or [], previous
+
+        except Exception as e:
+            raise Exception("Error in __read_csv_delta_previous: " + str(e.args))
+
+    ##########################################################################
+    # create delta csv file
+    # rows added, changed or removed since the previous export
+    ##########################################################################
+    def __export_to_csv_delta_file(self, file_subject, fields, rows, previous):
+
+        try:
+            previous_fields, previous = previous
+            current = self.__csv_row_keys(rows)
+
+            delta = []
+            for key, (content_hash, row) in current.items():
+                if key not in previous:
+                    delta.append(dict(row, delta_status="added"))
+                elif previous[key][0] != content_hash:
+                    delta.append(dict(row, delta_status="changed"))
+
+            for key, (content_hash, row) in previous.items():
+                if key not in current:
+                    delta.append(dict(row, delta_status="removed"))
+
+            if not delta:
+                return
+
+            file_name = self.csv_file_header + "_" + file_subject + "_delta.csv"
+            delta_fields = self.get_all_keys_in_order([dict.fromkeys(fields), dict.fromkeys(previous_fields), {'delta_status': None}])
+
+            with open(file_name, mode='w', newline='', buffering=self.csv_write_buffer) as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(delta_fields)
+                writer.writerows(map(row.get, delta_fields) for row in delta)
+
+            print("CSV: " + (file_subject + " delta").ljust(35) + " --> " + file_name + " (" + str(len(delta)) + " rows)")
+
+        except Exception as e:
+            raise Exception("Error in __export_to_csv_delta_file: " + str(e.args))
+
     ##########################################################################
     # print error
     ##########################################################################
@@ -6190,7 +6462,7 @@ class ShowOCICSV(object):
                         'time_created': sl['time_created'][0:16],
                         'vcn_id': vcn['id'],
                         'sec_id': sl['id'],
-                        'id': sl['id'] + ":" + str(hash("Empty"))
+                        'id': self.__csv_row_id(sl['id'], "Empty")
                     }
                     self.csv_network_security_list.append(data)
 
@@ -6224,7 +6496,7 @@ class ShowOCICSV(object):
                             'time_created': sl['time_created'],
                             'vcn_id': vcn['id'],
                             'sec_id': sl['id'],
-                            'id': sl['id'] + ":" + str(hash(slr['desc']))
+                            'id': self.__csv_row_id(sl['id'], slr['desc'])
                         }
                         # check if id is in the list already
                         item_exists = False
@@ -6611,7 +6883,7 @@ class ShowOCICSV(object):
                             'time_created': rt['time_created'][0:16],
                             'vcn_id': vcn['id'],
                             'route_id': rt['id'],
-                            'id': rt['id'] + ":" + str(hash(rl['desc']))
+                            'id': self.__csv_row_id(rt['id'], rl['desc'])
                         }
 
                         # check if id is in the list already
@@ -11284,3 +11556,205 @@ class ShowOCICSV(object):
         except Exception as e:
             self.__print_error("__csv_region_data", e)
             raise
+
+
+##########################################################################
+# class ShowOCIJSON
+# writes the JSON data file one block at a time while the data is
+# processed, each block is flushed so a region is on disk before the next
+# one is processed. Default output is the same as json.dump(data, indent=4),
+# compact drops the indentation, a file name ending with .gz is written
+# gzip compressed
+##########################################################################
+class ShowOCIJSON(object):
+
+    indent = ' ' * 4
+
+    ############################################
+    # Init
+    ############################################
+    def __init__(self, file_name, compact=False):
+
+        self.file_name = file_name
+        self.compact = compact
+        self.blocks = 0
+
+        if compact:
+            self.encoder = json.JSONEncoder(separators=(',', ':'), default=view_to_json)
+        else:
+            self.encoder = json.JSONEncoder(indent=4, default=view_to_json)
+
+        if file_name.endswith(".gz"):
+            self.file = gzip.open(file_name, 'wt', compresslevel=6)
+        else:
+            self.file = open(file_name, 'w', buffering=1024 * 1024)
+
+        self.file.write("[")
+
+    ##########################################################################
+    # write block
+    ##########################################################################
+    def write_block(self, block):
+
+        try:
+            if self.compact:
+                if self.blocks:
+                    self.file.write(",")
+                self.file.write(self.encoder.encode(block))
+            else:
+                # json.dump indents the list items one level
+                self.file.write(",\n" + self.indent if self.blocks else "\n" + self.indent)
+                self.file.write(self.encoder.encode(block).replace("\n", "\n" + self.indent))
+
+            self.blocks += 1
+            self.file.flush()
+
+        except Exception as e:
+            raise Exception("Error in ShowOCIJSON.write_block: " + str(e.args))
+
+    ##########################################################################
+    # write blocks
+    ##########################################################################
+    def write_blocks(self, blocks):
+        for block in blocks:
+            self.write_block(block)
+
+    ##########################################################################
+    # close the list and the file
+    ##########################################################################
+    def close(self):
+
+        if self.blocks and not self.compact:
+            self.file.write("\n")
+
+        self.file.write("]")
+        self.file.close()
+
+
+##########################################################################
+# class ShowOCIColumnar
+# writes the rows of one ShowOCICSV file as a typed Parquet or Arrow IPC
+# file, pyarrow is only needed when this export is requested
+#
+# files are written one at a time, so only the current table is held as
+# columns. Columns are typed by pyarrow, string columns whose values all
+# cast to int64, float64 or timestamp (UTC) get that type, the other
+# strings are dictionary encoded. A number column is only cast when no
+# value has a leading zero and every value reads back as the same number,
+# so identifiers like 0007 stay text
+##########################################################################
+class ShowOCIColumnar(object):
+
+    batch_size = 65536
+
+    __number = re.compile(r'-?\d+(\.\d*)?([eE][-+]?\d+)?$')
+    __leading_zero = re.compile(r'-?0\d')
+    __timestamp = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+    ############################################
+    # Init
+    ############################################
+    def __init__(self, file_format="parquet"):
+
+        if file_format not in ("parquet", "arrow"):
+            raise ValueError("Unknown columnar format " + str(file_format))
+
+        try:
+            import pyarrow
+            import pyarrow.compute
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("pyarrow is required for -csv_format " + file_format + ", please install it with pip install pyarrow")
+
+        self.pa = pyarrow
+        self.pc = pyarrow.compute
+        self.pq = pyarrow.parquet
+        self.file_format = file_format
+        self.extension = ".parquet" if file_format == "parquet" else ".arrow"
+
+    ##########################################################################
+    # write table
+    ##########################################################################
+    def write_table(self, file_name, fields, rows):
+
+        try:
+            rows = list(rows)
+            table = self.pa.table([self.__column([row.get(field) for row in rows]) for field in fields], names=fields)
+            del rows
+
+            if self.file_format == "parquet":
+                self.pq.write_table(table, file_name, row_group_size=self.batch_size)
+            else:
+                with self.pa.ipc.new_file(file_name, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=self.batch_size)
+
+        except Exception as e:
+            raise Exception("Error in ShowOCIColumnar.write_table: " + str(e.args))
+
+    ##########################################################################
+    # typed column from the values of one field
+    ##########################################################################
+    def __column(self, values):
+
+        pa = self.pa
+
+        # empty is null like the empty csv cell
+        values = [None if value == "" else value for value in values]
+
+        try:
+            array = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # mixed types are written as text like csv does
+            values = [None if value is None else str(value) for value in values]
+            array = pa.array(values, pa.string())
+
+        if pa.types.is_null(array.type):
+            array = array.cast(pa.string())
+
+        if not pa.types.is_string(array.type):
+            return array
+
+        # numbers and dates kept as text, the first value picks the casts to try
+        first = next((value for value in values if value is not None), "")
+        if self.__number.match(first):
+            targets = (pa.int64(), pa.float64()) if self.__is_number_column(values) else ()
+        elif self.__timestamp.match(first):
+            targets = (pa.timestamp('us', tz='UTC'), pa.timestamp('us'))
+        else:
+            targets = ()
+
+        for target in targets:
+            try:
+                typed = self.pc.cast(array, target)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                continue
+            if not self.__round_trips(array, typed):
+                continue
+            if target == pa.timestamp('us'):
+                typed = self.pc.assume_timezone(typed, 'UTC')
+            return typed
+
+        return array.dictionary_encode()
+
+    ##########################################################################
+    # every value is a number without a leading zero
+    ##########################################################################
+    def __is_number_column(self, values):
+
+        return all(value is None or (self.__number.match(value) and not self.__leading_zero.match(value)) for value in values)
+
+    ##########################################################################
+    # the typed column reads back as the same values, integers as the same
+    # text, floats as the same number to 15 significant digits
+    ##########################################################################
+    def __round_trips(self, array, typed):
+
+        pa = self.pa
+
+        if pa.types.is_integer(typed.type):
+            return self.pc.cast(typed, pa.string()).equals(array)
+
+        if pa.types.is_floating(typed.type):
+            return all(text is None or decimal.Decimal(text) == decimal.Decimal('%.15g' % number) for text, number in zip(array.to_pylist(), typed.to_pylist()))
+
+        return True
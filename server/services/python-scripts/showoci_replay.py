@@ -0,0 +1,933 @@
+##########################################################################
+# showoci_replay.py
+#
+# Supports Python 3 and above
+#
+# coding: utf-8
+##########################################################################
+# Offline replay of a showoci service cache
+#
+# Record : python3 showoci.py -a -cachef cache.json
+#          (the -cachef file is the recorded fixture)
+#
+# Load   : python3 showoci.py -a -cachein cache.json -sjf out.json
+#          runs the normal showoci outputs from the cache, skipping the API phase
+#
+# Replay : python3 showoci_replay.py -cache cache.json [-args "-a -so"]
+#          runs ShowOCIData.process_oci_data and the summary against the
+#          cache through ShowOCIReplayService, no OCI calls are made
+#
+# Scale  : python3 showoci_replay.py -cache cache.json -scale 10 -savecache cache10.json
+#          copies every resource list N times with rewritten OCIDs
+#
+# Binary : python3 showoci.py -a -cacheb cache.bin
+#          compact binary cache, msgpack frames per main key and sub key
+#          compressed with zstd, -cachein and -cache read both formats,
+#          -savecacheb converts a json cache
+#
+# Bench  : python3 showoci_replay.py -cache cache.json -benchmark 1,10,100
+#          wall time of process_oci_data, print_summary, generate_csv and
+#          print_data plus peak RSS, one child process per scale factor
+#          (pytest tests/test_showoci_benchmark.py --benchmark-only runs the
+#          same phases with pytest-benchmark)
+#
+# Export : python3 showoci_replay.py -cache cache.json -scale 100 -benchmark_export
+#          write time, size and scan time of the csv, parquet and arrow
+#          exports of generate_csv, parquet and arrow need pyarrow
+#
+# Cache  : python3 showoci_replay.py -cache cache.json -scale 100 -benchmark_cache
+#          size, save and load time of the json and binary cache formats
+#
+# Soak   : python3 showoci_replay.py -cache cache.json -soak 50
+#          runs showoci.run_extracts with -csv N times from the cache in this process,
+#          fails when RSS keeps growing after the warm up runs
+##########################################################################
+from __future__ import print_function
+from showoci_service import ShowOCIService
+from showoci_data import ShowOCIData
+from showoci_output import ShowOCIOutput, ShowOCISummary, ShowOCICSV
+
+import contextlib
+import csv
+import datetime
+import gzip
+import json
+import multiprocessing
+import os
+import queue
+import re
+import resource
+import shlex
+import shutil
+import struct
+import sys
+import tempfile
+import time
+
+
+##########################################################################
+# ShowOCIReplayService - ShowOCIService serving a loaded cache
+##########################################################################
+class ShowOCIReplayService(ShowOCIService):
+
+    ############################################
+    # Init - no config, signer or clients, the
+    # getters of ShowOCIService read self.data
+    ############################################
+    def __init__(self, flags, cache_data):
+        self.flags = flags
+        self.data = cache_data
+        self.error = 0
+        self.warning = 0
+        self.error_array = []
+        self.reboot_migration_counter = 0
+        self.dbsystem_maintenance = []
+        self.start_time = str(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+    ############################################
+    # the cache is already loaded
+    ############################################
+    def load_service_data(self):
+        return True
+
+
+##########################################################################
+# cache file header
+#
+# -cachef writes the header as the first key of the cache, a cache is only
+# loaded when it was written by the same showoci version with the same
+# cache schema, older caches have to be extracted again
+##########################################################################
+CACHE_HEADER = "showoci_cache"
+CACHE_SCHEMA = 1
+
+
+class ShowOCICacheError(Exception):
+    pass
+
+
+def get_cache_header():
+    return {
+        'version': ShowOCIService.version,
+        'schema': CACHE_SCHEMA,
+        'created': str(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    }
+
+
+##########################################################################
+# check the header of a cache file, raises ShowOCICacheError
+##########################################################################
+def check_cache_header(header, file_name, check_version=True):
+
+    if not check_version:
+        return
+
+    if header is None:
+        raise ShowOCICacheError("Cache file " + file_name + " has no cache header, it was written by an older showoci version, please extract the cache again")
+
+    if header.get('schema') != CACHE_SCHEMA:
+        raise ShowOCICacheError("Cache file " + file_name + " has cache schema " + str(header.get('schema')) + ", expected " + str(CACHE_SCHEMA) + ", please extract the cache again")
+
+    if header.get('version') != ShowOCIService.version:
+        raise ShowOCICacheError("Cache file " + file_name + " was written by showoci " + str(header.get('version')) + ", expected " + ShowOCIService.version + ", please extract the cache again")
+
+
+##########################################################################
+# cache data with the header as first key, for writing with json.dump
+##########################################################################
+def get_cache_file_data(service_data):
+    cache_data = {CACHE_HEADER: get_cache_header()}
+    cache_data.update((key, value) for key, value in service_data.items() if key != CACHE_HEADER)
+    return cache_data
+
+
+##########################################################################
+# ShowOCICacheReader - streaming loader for -cachef files
+#
+# the file is read in chunks into a sliding text window, the header is
+# checked before anything else is parsed and every element of the resource
+# lists is decoded on its own with the C json decoder, so a multi GB cache
+# never exists as one string and the peak memory is the loaded data itself
+##########################################################################
+class ShowOCICacheReader(object):
+
+    __separator = re.compile(r'[\s,:]*')
+
+    ############################################
+    # Init
+    ############################################
+    def __init__(self, file_name, chunk_size=4 * 1024 * 1024):
+        self.file_name = file_name
+        self.chunk_size = chunk_size
+        self.header = None
+        self.decoder = json.JSONDecoder()
+        self.keys = {}
+        self.infile = None
+        self.text = ""
+        self.pos = 0
+
+    ############################################
+    # load and check the cache
+    ############################################
+    def load(self, check_version=True):
+
+        with open(self.file_name, 'r', encoding='utf-8') as self.infile:
+            if not self.__read_chunk(self.chunk_size):
+                raise ShowOCICacheError("Cache file " + self.file_name + " is empty")
+
+            try:
+                return self.__load_cache(check_version)
+            except ValueError as e:
+                raise ShowOCICacheError("Cache file " + self.file_name + " is not a valid cache, " + str(e))
+            finally:
+                self.text = ""
+
+    ############################################
+    # top level - header then main keys
+    ############################################
+    def __load_cache(self, check_version):
+
+        data = {}
+        self.__expect('{')
+
+        while self.__peek() != '}':
+            key = self.__read_key()
+
+            if key == CACHE_HEADER:
+                self.header = self.__read_value()
+                self.__check_header(check_version)
+                continue
+
+            if self.header is None:
+                self.__check_header(check_version)
+
+            data[key] = self.__load_main() if self.__peek() == '{' else self.__read_value()
+
+        return data
+
+    ############################################
+    # main key - object of sub keys
+    ############################################
+    def __load_main(self):
+
+        main_data = {}
+        self.__expect('{')
+
+        while self.__peek() != '}':
+            key = self.__read_key()
+            main_data[key] = self.__load_array() if self.__peek() == '[' else self.__read_value()
+
+        self.pos += 1
+        return main_data
+
+    ############################################
+    # resource list - one element at a time
+    ############################################
+    def __load_array(self):
+
+        array = []
+        self.__expect('[')
+
+        while self.__peek() != ']':
+            array.append(self.__share_keys(self.__read_value()))
+
+        self.pos += 1
+        return array
+
+    ############################################
+    # share dict keys between elements, json.load
+    # does the same for a document parsed at once
+    ############################################
+    def __share_keys(self, value):
+
+        if isinstance(value, dict):
+            keys = self.keys
+            return {keys.setdefault(k, k): self.__share_keys(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.__share_keys(v) for v in value]
+        return value
+
+    ############################################
+    # header check
+    ############################################
+    def __check_header(self, check_version):
+        check_cache_header(self.header, self.file_name, check_version)
+
+    ############################################
+    # window helpers
+    ############################################
+    def __read_chunk(self, size):
+
+        chunk = self.infile.read(size)
+        if not chunk:
+            return False
+
+        # drop the consumed text so the window only holds the current value
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def __peek(self):
+
+        while True:
+            self.pos = self.__separator.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.__read_chunk(self.chunk_size):
+                raise ValueError("unexpected end of file")
+
+    def __expect(self, char):
+        if self.__peek() != char:
+            raise ValueError("expected " + char + " at '" + self.text[self.pos:self.pos + 40] + "'")
+        self.pos += 1
+
+    def __read_key(self):
+        if self.__peek() != '"':
+            raise ValueError("expected key at '" + self.text[self.pos:self.pos + 40] + "'")
+        return self.__read_value()
+
+    def __is_cut(self, value, end):
+        if end >= len(self.text):
+            return True
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and self.text[end] in "0123456789.eE+-"
+
+    def __read_value(self):
+
+        self.__peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.text, self.pos)
+
+                # a number at the end of the window may continue in the next chunk
+                if not self.__is_cut(value, end) or not self.__read_chunk(self.chunk_size):
+                    self.pos = end
+                    return value
+
+            except json.JSONDecodeError:
+                # value continues past the window, grow it geometrically
+                if not self.__read_chunk(max(self.chunk_size, len(self.text))):
+                    raise
+
+
+##########################################################################
+# ShowOCICacheBinary - compact binary cache written by -cacheb
+#
+# file   : magic, frames, index, footer
+# frame  : the value of one sub key of a main key, resource lists are split
+#          in frames of frame_items elements, encoded with msgpack (json
+#          when msgpack is not installed) and compressed with zstd (gzip
+#          when zstandard is not installed)
+# index  : json with the cache header, codec, compression and the frames
+#          of every main key, so a main key (C_NETWORK, C_COMPUTE, ...) is
+#          loaded by reading its frames only
+# footer : index offset and length, 8 bytes each, and the magic
+#
+# msgpack and zstandard are optional, a file written with them needs them
+# to be loaded
+##########################################################################
+CACHE_BINARY_MAGIC = b"SHOWOCIB"
+CACHE_BINARY_FOOTER = struct.Struct(">QQ8s")
+
+
+class ShowOCICacheBinary(object):
+
+    ############################################
+    # Init
+    ############################################
+    def __init__(self, file_name, frame_items=5000):
+        self.file_name = file_name
+        self.frame_items = frame_items
+        self.index = None
+
+    ############################################
+    # write cache data with the header as first key
+    ############################################
+    def write(self, cache_data, codec=None, compression=None):
+
+        codec, encode, _ = self.__get_codec(codec)
+        compression, compress, _ = self.__get_compression(compression)
+        sections = []
+
+        with open(self.file_name, 'wb') as outfile:
+            outfile.write(CACHE_BINARY_MAGIC)
+
+            def write_frame(value):
+                frame = compress(encode(value))
+                offset = outfile.tell()
+                outfile.write(frame)
+                return [offset, len(frame)]
+
+            for main_key, main_data in cache_data.items():
+                if main_key == CACHE_HEADER:
+                    continue
+
+                if not isinstance(main_data, dict):
+                    sections.append({'key': main_key, 'value': write_frame(main_data)})
+                    continue
+
+                sub_keys = []
+                for sub_key, value in main_data.items():
+                    if isinstance(value, list):
+                        frames = [write_frame(value[i:i + self.frame_items]) for i in range(0, len(value), self.frame_items)]
+                        sub_keys.append({'key': sub_key, 'list': frames, 'items': len(value)})
+                    else:
+                        sub_keys.append({'key': sub_key, 'value': write_frame(value)})
+                sections.append({'key': main_key, 'sub_keys': sub_keys})
+
+            self.index = {
+                'header': cache_data.get(CACHE_HEADER) or get_cache_header(),
+                'codec': codec,
+                'compression': compression,
+                'sections': sections
+            }
+            index = json.dumps(self.index).encode('utf-8')
+            offset = outfile.tell()
+            outfile.write(index)
+            outfile.write(CACHE_BINARY_FOOTER.pack(offset, len(index), CACHE_BINARY_MAGIC))
+
+    ############################################
+    # read the index, the main keys are in
+    # index['sections']
+    ############################################
+    def read_index(self):
+        with open(self.file_name, 'rb') as infile:
+            return self.__read_index(infile)
+
+    ############################################
+    # load and check the cache, sections limits
+    # the main keys loaded
+    ############################################
+    def load(self, check_version=True, sections=None):
+
+        with open(self.file_name, 'rb') as infile:
+            index = self.__read_index(infile)
+            check_cache_header(index.get('header'), self.file_name, check_version)
+
+            _, _, decode = self.__get_codec(index.get('codec'))
+            _, _, decompress = self.__get_compression(index.get('compression'))
+
+            def read_frame(frame):
+                infile.seek(frame[0])
+                value = infile.read(frame[1])
+                if len(value) != frame[1]:
+                    raise ShowOCICacheError("Cache file " + self.file_name + " is truncated")
+                try:
+                    return decode(decompress(value))
+                except Exception as e:
+                    raise ShowOCICacheError("Cache file " + self.file_name + " has a corrupt frame at offset " + str(frame[0]) + ", " + str(e))
+
+            data = {}
+            for section in index['sections']:
+                if sections is not None and section['key'] not in sections:
+                    continue
+
+                if 'value' in section:
+                    data[section['key']] = read_frame(section['value'])
+                    continue
+
+                main_data = {}
+                for sub_key in section['sub_keys']:
+                    if 'list' in sub_key:
+                        items = []
+                        for frame in sub_key['list']:
+                            items.extend(read_frame(frame))
+                        main_data[sub_key['key']] = items
+                    else:
+                        main_data[sub_key['key']] = read_frame(sub_key['value'])
+                data[section['key']] = main_data
+
+        return data
+
+    ############################################
+    # index from the footer
+    ############################################
+    def __read_index(self, infile):
+
+        if infile.read(len(CACHE_BINARY_MAGIC)) != CACHE_BINARY_MAGIC:
+            raise ShowOCICacheError("Cache file " + self.file_name + " is not a binary cache")
+
+        infile.seek(0, os.SEEK_END)
+        size = infile.tell()
+        if size < len(CACHE_BINARY_MAGIC) + CACHE_BINARY_FOOTER.size:
+            raise ShowOCICacheError("Cache file " + self.file_name + " is truncated")
+
+        infile.seek(size - CACHE_BINARY_FOOTER.size)
+        offset, length, magic = CACHE_BINARY_FOOTER.unpack(infile.read(CACHE_BINARY_FOOTER.size))
+        if magic != CACHE_BINARY_MAGIC or offset + length > size - CACHE_BINARY_FOOTER.size:
+            raise ShowOCICacheError("Cache file " + self.file_name + " is truncated")
+
+        infile.seek(offset)
+        try:
+            self.index = json.loads(infile.read(length).decode('utf-8'))
+        except ValueError as e:
+            raise ShowOCICacheError("Cache file " + self.file_name + " has a corrupt index, " + str(e))
+        return self.index
+
+    ############################################
+    # codec - name, encode, decode
+    ############################################
+    def __get_codec(self, name):
+
+        if name in (None, "msgpack"):
+            try:
+                import msgpack
+                return "msgpack", lambda value: msgpack.packb(value, use_bin_type=True), lambda value: msgpack.unpackb(value, raw=False, strict_map_key=False)
+            except ImportError:
+                if name:
+                    raise ShowOCICacheError("Cache file " + self.file_name + " needs the msgpack package, pip install msgpack")
+
+        if name in (None, "json"):
+            return "json", lambda value: json.dumps(value, separators=(',', ':')).encode('utf-8'), lambda value: json.loads(value.decode('utf-8'))
+
+        raise ShowOCICacheError("Cache file " + self.file_name + " has unknown codec " + str(name))
+
+    ############################################
+    # compression - name, compress, decompress
+    ############################################
+    def __get_compression(self, name):
+
+        if name in (None, "zstd"):
+            try:
+                import zstandard
+                return "zstd", zstandard.ZstdCompressor(level=3).compress, zstandard.ZstdDecompressor().decompress
+            except ImportError:
+                if name:
+                    raise ShowOCICacheError("Cache file " + self.file_name + " needs the zstandard package, pip install zstandard")
+
+        if name in (None, "gzip"):
+            return "gzip", lambda value: gzip.compress(value, compresslevel=6), gzip.decompress
+
+        raise ShowOCICacheError("Cache file " + self.file_name + " has unknown compression " + str(name))
+
+
+##########################################################################
+# True if the file is a binary cache
+##########################################################################
+def is_binary_cache_file(file_name):
+    with open(file_name, 'rb') as infile:
+        return infile.read(len(CACHE_BINARY_MAGIC)) == CACHE_BINARY_MAGIC
+
+
+##########################################################################
+# load cache written by -cachef or -cacheb
+#
+# sections limits the main keys returned, a binary cache reads only their
+# frames, a json cache is parsed in full
+##########################################################################
+def load_cache_file(file_name, check_version=True, sections=None):
+
+    if is_binary_cache_file(file_name):
+        return ShowOCICacheBinary(file_name).load(check_version, sections)
+
+    data = ShowOCICacheReader(file_name).load(check_version)
+    if sections is not None:
+        data = dict((key, value) for key, value in data.items() if key in sections)
+    return data
+
+
+##########################################################################
+# save cache data as json or binary, json indent=4 as -cachef writes it
+##########################################################################
+def save_cache_file(file_name, service_data, binary=False, indent=None):
+
+    cache_data = get_cache_file_data(service_data)
+    if binary:
+        ShowOCICacheBinary(file_name).write(cache_data)
+    else:
+        with open(file_name, 'w') as outfile:
+            json.dump(cache_data, outfile, indent=indent, sort_keys=False)
+
+
+##########################################################################
+# create flags from showoci command line arguments
+##########################################################################
+def get_flags(showoci_args):
+    import showoci
+    cmd = showoci.set_parser_arguments(showoci_args.split())
+    if not cmd:
+        raise ValueError("Invalid showoci arguments: " + showoci_args)
+    return showoci.set_service_extract_flags(cmd)
+
+
+##########################################################################
+# scale cache - copy every resource list factor times
+#
+# each copy rewrites the OCIDs it contains with a copy suffix so ids stay
+# unique and references between copied resources stay consistent,
+# compartment and tenancy OCIDs are kept so copies land in the same
+# compartments, identity is not copied
+##########################################################################
+def scale_cache(cache_data, factor):
+
+    if factor <= 1:
+        return cache_data
+
+    def rewrite(value, suffix):
+        if isinstance(value, str):
+            if value.startswith("ocid1.") and not value.startswith(("ocid1.compartment.", "ocid1.tenancy.")):
+                return value + suffix
+            return value
+        if isinstance(value, dict):
+            return {k: rewrite(v, suffix) for k, v in value.items()}
+        if isinstance(value, list):
+            return [rewrite(v, suffix) for v in value]
+        return value
+
+    scaled = {}
+    for main_key, main_data in cache_data.items():
+        if main_key == ShowOCIService.C_IDENTITY or not isinstance(main_data, dict):
+            scaled[main_key] = main_data
+            continue
+
+        scaled[main_key] = {}
+        for sub_key, items in main_data.items():
+            if not isinstance(items, list) or not items or not isinstance(items[0], dict):
+                scaled[main_key][sub_key] = items
+                continue
+
+            array = list(items)
+            for copy in range(1, factor):
+                suffix = ".x" + str(copy)
+                array.extend(rewrite(item, suffix) for item in items)
+            scaled[main_key][sub_key] = array
+
+    return scaled
+
+
+##########################################################################
+# count resources in cache lists
+##########################################################################
+def count_cache_items(cache_data):
+    count = 0
+    for main_data in cache_data.values():
+        if isinstance(main_data, dict):
+            for items in main_data.values():
+                if isinstance(items, list):
+                    count += len(items)
+    return count
+
+
+##########################################################################
+# replay - process the cache and print summary
+##########################################################################
+def replay(cache_data, showoci_args):
+    flags = get_flags(showoci_args)
+    data = ShowOCIData(flags, ShowOCIReplayService(flags, cache_data))
+    extracted_data = data.process_oci_data()
+
+    output = ShowOCIOutput()
+    summary = ShowOCISummary()
+    output.print_data(extracted_data)
+    summary.print_summary(extracted_data)
+    return extracted_data
+
+
+##########################################################################
+# peak RSS of this process in MB
+##########################################################################
+def peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return rss / (1024.0 * 1024.0) if sys.platform == "darwin" else rss / 1024.0
+
+
+##########################################################################
+# current RSS of this process in MB, peak RSS where /proc is not available
+##########################################################################
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1048576.0
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+##########################################################################
+# soak - run the showoci extract with csv from the cache runs times in
+# this process
+#
+# RSS is sampled after every run, the first warmup runs fill allocator
+# pools and caches, after them RSS must stay flat within max_growth_mb,
+# returns True when flat
+##########################################################################
+def run_soak(cache_file, showoci_args, runs, warmup=5, max_growth_mb=10.0):
+    import showoci
+
+    csv_dir = tempfile.mkdtemp(prefix="showoci_soak_")
+    args = ["-cachein", cache_file, "-noscreen", "-csv", os.path.join(csv_dir, "soak")] + shlex.split(showoci_args)
+    samples = []
+
+    try:
+        print("Run  RSS(MB)")
+        for run in range(1, runs + 1):
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                result = showoci.run_extracts([args])[0]
+            if result is None:
+                print("Run " + str(run) + " failed, args: " + " ".join(shlex.quote(arg) for arg in args))
+                return False
+            samples.append(current_rss_mb())
+            print(str(run).rjust(3) + '{:9.1f}'.format(samples[-1]))
+    finally:
+        shutil.rmtree(csv_dir, ignore_errors=True)
+
+    baseline = samples[min(warmup, len(samples)) - 1]
+    growth = max(samples[warmup:] or samples) - baseline
+    print("RSS after warm up " + '{:.1f}'.format(baseline) + " MB, growth " + '{:.1f}'.format(growth) + " MB over " + str(len(samples) - warmup) + " runs")
+    return growth <= max_growth_mb
+
+
+##########################################################################
+# seconds a benchmark child process may run before it is terminated
+##########################################################################
+BENCHMARK_TIMEOUT = 3600
+
+
+##########################################################################
+# benchmark one scale factor, runs in a child process
+##########################################################################
+def benchmark_scale(cache_file, showoci_args, factor, result_queue):
+
+    result = {'factor': factor, 'phases': []}
+    queue_result = None
+
+    def phase(name, func):
+        start = time.time()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            value = func()
+        result['phases'].append((name, time.time() - start, peak_rss_mb()))
+        return value
+
+    csv_dir = tempfile.mkdtemp(prefix="showoci_bench_")
+    try:
+        cache_data = phase("load cache", lambda: scale_cache(load_cache_file(cache_file), factor))
+        result['resources'] = count_cache_items(cache_data)
+
+        flags = get_flags(showoci_args)
+        data = ShowOCIData(flags, ShowOCIReplayService(flags, cache_data))
+        tenancy = data.get_tenancy_data()
+
+        extracted_data = phase("process_oci_data", data.process_oci_data)
+        phase("print_summary", lambda: ShowOCISummary().print_summary(extracted_data))
+        phase("generate_csv", lambda: ShowOCICSV(str(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))).generate_csv(
+            extracted_data, os.path.join(csv_dir, "bench"), tenancy, True, ""))
+        phase("print_data", lambda: ShowOCIOutput().print_data(extracted_data))
+        queue_result = result
+    finally:
+        # always answer, the parent waits on the queue
+        result_queue.put(queue_result)
+        shutil.rmtree(csv_dir, ignore_errors=True)
+
+
+##########################################################################
+# result of a benchmark child process
+#
+# None when the child exits without an answer (killed, out of memory) or
+# does not answer within timeout seconds, the child is terminated then
+##########################################################################
+def get_child_result(process, result_queue, timeout):
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            return result_queue.get(timeout=1)
+        except queue.Empty:
+            if process.exitcode is not None:
+                # the answer may still be in the pipe when the child exits
+                try:
+                    return result_queue.get(timeout=1)
+                except queue.Empty:
+                    return None
+
+    process.terminate()
+    return None
+
+
+##########################################################################
+# benchmark all scale factors, one fresh process each so RSS is per scale
+##########################################################################
+def run_benchmark(cache_file, showoci_args, factors, timeout=BENCHMARK_TIMEOUT):
+
+    context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else multiprocessing.get_context()
+    success = True
+
+    print("Scale  Resources  Phase             Time(s)  Peak RSS(MB)")
+    for factor in factors:
+        result_queue = context.Queue()
+        process = context.Process(target=benchmark_scale, args=(cache_file, showoci_args, factor, result_queue))
+        process.start()
+        result = get_child_result(process, result_queue, timeout)
+        process.join()
+
+        if not result:
+            print(str(factor).rjust(5) + "  failed, exit code " + str(process.exitcode))
+            success = False
+            continue
+
+        for name, elapsed, rss in result['phases']:
+            print(str(factor).rjust(5) + "  " + str(result['resources']).rjust(9) + "  " + name.ljust(16) + '{:9.2f}'.format(elapsed) + '{:14.1f}'.format(rss))
+
+    return success
+
+
+##########################################################################
+# benchmark the json and binary cache formats - size, save and load time
+# and the load time of one main key
+##########################################################################
+def run_cache_benchmark(cache_data, section=None):
+
+    section = section or ShowOCIService.C_NETWORK
+    cache_dir = tempfile.mkdtemp(prefix="showoci_cache_")
+    formats = (
+        ("json -cachef", "cache.json", False, 4),
+        ("json compact", "compact.json", False, None),
+        ("binary -cacheb", "cache.bin", True, None)
+    )
+
+    try:
+        print("Resources " + str(count_cache_items(cache_data)) + ", section " + section)
+        print("Format           Size(MB)   Save(s)   Load(s)  Section(s)  Same")
+        for name, file_name, binary, indent in formats:
+            path = os.path.join(cache_dir, file_name)
+
+            start = time.time()
+            save_cache_file(path, cache_data, binary, indent)
+            save_time = time.time() - start
+
+            start = time.time()
+            loaded = load_cache_file(path)
+            load_time = time.time() - start
+
+            start = time.time()
+            load_cache_file(path, sections=[section])
+            section_time = time.time() - start
+
+            same = loaded == dict((key, value) for key, value in cache_data.items() if key != CACHE_HEADER)
+            loaded = None
+
+            print(name.ljust(15) + '{:9.2f}'.format(os.path.getsize(path) / 1048576.0) + '{:10.2f}'.format(save_time) + '{:10.2f}'.format(load_time) + '{:12.2f}'.format(section_time) + "  " + str(same))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+##########################################################################
+# scan exported files - read every row, typed for parquet and arrow
+##########################################################################
+def scan_export(export_dir, file_format):
+
+    rows = 0
+    for file_name in sorted(os.listdir(export_dir)):
+        path = os.path.join(export_dir, file_name)
+        if file_format == "csv":
+            with open(path, newline='') as infile:
+                rows += sum(1 for _ in csv.reader(infile)) - 1
+        elif file_format == "parquet":
+            import pyarrow.parquet
+            rows += pyarrow.parquet.read_table(path).num_rows
+        else:
+            import pyarrow
+            rows += pyarrow.ipc.open_file(path).read_all().num_rows
+    return rows
+
+
+##########################################################################
+# benchmark one export format, runs in a child process
+##########################################################################
+def benchmark_export(cache_data, showoci_args, file_format, result_queue):
+
+    export_dir = tempfile.mkdtemp(prefix="showoci_export_")
+    queue_result = None
+    try:
+        flags = get_flags(showoci_args)
+        data = ShowOCIData(flags, ShowOCIReplayService(flags, cache_data))
+        tenancy = data.get_tenancy_data()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            extracted_data = data.process_oci_data()
+
+        start = time.time()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            ShowOCICSV(str(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))).generate_csv(
+                extracted_data, os.path.join(export_dir, "bench"), tenancy, True, "", "", file_format)
+        write_time = time.time() - start
+
+        size = sum(os.path.getsize(os.path.join(export_dir, x)) for x in os.listdir(export_dir))
+
+        start = time.time()
+        rows = scan_export(export_dir, file_format)
+        queue_result = (write_time, size, time.time() - start, rows)
+    finally:
+        # always answer, the parent waits on the queue
+        result_queue.put(queue_result)
+        shutil.rmtree(export_dir, ignore_errors=True)
+
+
+##########################################################################
+# benchmark csv, parquet and arrow export of generate_csv, one fresh
+# process each so the peak RSS of one format does not carry into the next
+##########################################################################
+def run_export_benchmark(cache_data, showoci_args, formats=("csv", "parquet", "arrow"), timeout=BENCHMARK_TIMEOUT):
+
+    context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else multiprocessing.get_context()
+    success = True
+
+    print("Format   Write(s)    Size(MB)  Scan(s)      Rows")
+    for file_format in formats:
+        result_queue = context.Queue()
+        process = context.Process(target=benchmark_export, args=(cache_data, showoci_args, file_format, result_queue))
+        process.start()
+        result = get_child_result(process, result_queue, timeout)
+        process.join()
+
+        if not result:
+            print(file_format.ljust(7) + "  failed, exit code " + str(process.exitcode))
+            success = False
+            continue
+
+        write_time, size, scan_time, rows = result
+        print(file_format.ljust(7) + '{:9.2f}'.format(write_time) + '{:12.1f}'.format(size / 1048576.0) + '{:9.2f}'.format(scan_time) + str(rows).rjust(10))
+
+    return success
+
+
+##########################################################################
+# Main
+##########################################################################
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Replay, scale and benchmark a showoci -cachef service cache offline')
+    parser.add_argument('-cache', required=True, dest='cache', help='Service cache file written by showoci.py -cachef.')
+    parser.add_argument('-args', default="-a", dest='showoci_args', help='showoci arguments for the extract flags (default="-a").')
+    parser.add_argument('-scale', default=1, dest='scale', type=int, help='Copy every resource list N times (default=1).')
+    parser.add_argument('-savecache', default="", dest='savecache', help='Write the scaled cache to file instead of replaying.')
+    parser.add_argument('-savecacheb', default="", dest='savecacheb', help='Write the scaled cache to file in binary format instead of replaying.')
+    parser.add_argument('-benchmark_cache', action='store_true', default=False, dest='benchmark_cache', help='Benchmark size, save and load time of the json and binary cache formats of the scaled cache.')
+    parser.add_argument('-benchmark', default="", dest='benchmark', help='Benchmark scale factors, comma seperated (i.e. 1,10,100).')
+    parser.add_argument('-benchmark_export', action='store_true', default=False, dest='benchmark_export', help='Benchmark csv, parquet and arrow export of the scaled cache.')
+    parser.add_argument('-benchmark_timeout', default=BENCHMARK_TIMEOUT, dest='benchmark_timeout', type=int, help='Seconds a benchmark process may run (default=' + str(BENCHMARK_TIMEOUT) + ').')
+    parser.add_argument('-soak', default=0, dest='soak', type=int, help='Run showoci from the cache N times in one process and check RSS stays flat.')
+    cmd = parser.parse_args()
+
+    if cmd.benchmark:
+        if not run_benchmark(cmd.cache, cmd.showoci_args, [int(x) for x in cmd.benchmark.split(",")], cmd.benchmark_timeout):
+            sys.exit(1)
+
+    elif cmd.benchmark_export:
+        if not run_export_benchmark(scale_cache(load_cache_file(cmd.cache), cmd.scale), cmd.showoci_args, timeout=cmd.benchmark_timeout):
+            sys.exit(1)
+
+    elif cmd.soak:
+        if not run_soak(cmd.cache, cmd.showoci_args, cmd.soak):
+            print("RSS is not flat")
+            sys.exit(1)
+
+    elif cmd.benchmark_cache:
+        run_cache_benchmark(scale_cache(load_cache_file(cmd.cache), cmd.scale))
+
+    elif cmd.savecache or cmd.savecacheb:
+        scaled = scale_cache(load_cache_file(cmd.cache), cmd.scale)
+        save_cache_file(cmd.savecache or cmd.savecacheb, scaled, bool(cmd.savecacheb))
+        print("Scaled cache with " + str(count_cache_items(scaled)) + " resources written to " + (cmd.savecache or cmd.savecacheb))
+
+    else:
+        replay(scale_cache(load_cache_file(cmd.cache), cmd.scale), cmd.showoci_args)
+
+    sys.exit(0)
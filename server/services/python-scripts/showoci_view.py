@@ -0,0 +1,188 @@
+##########################################################################
+# showoci_view.py
+#
+# Supports Python 3 and above
+#
+# coding: utf-8
+##########################################################################
+# ShowOCIView class - read only view of a ShowOCIService cache item
+#
+# ShowOCIData used to copy 40-80 keys of every cached item into a new
+# dict for the processed data. A view keeps a reference to the cached
+# item and a small overlay dict with the derived fields (name, sum_info,
+# sum_shape, desc, ...). The keys, their order and the cache key each one
+# is read from are in a ShowOCIViewFields shared by all the views of a
+# resource type. Values set on a view go to the overlay, the cached item
+# is never changed.
+#
+# A view is a Mapping, json.dump needs default=view_to_json to write it,
+# pickle (the process pool) turns it into a dict.
+#
+# Run this file directly to benchmark against the dict copy:
+#    python3 showoci_view.py [-resources 100000]
+# tests/test_showoci_view.py checks the views write the JSON of the copy.
+##########################################################################
+from __future__ import print_function
+from operator import itemgetter
+import sys
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+
+##########################################################################
+# ShowOCIViewFields - output keys of a resource type
+#
+# keys    - output keys in order
+# renames - output key -> cache key when the names differ
+# derived - output keys the overlay provides, not read from the cache
+##########################################################################
+class ShowOCIViewFields(object):
+
+    def __init__(self, keys, renames=None, derived=()):
+
+        self.keys = tuple(keys)
+        self.index = frozenset(self.keys)
+        self.derived = frozenset(derived)
+        renames = renames or {}
+        self.source = dict((key, renames.get(key, key)) for key in self.keys if key not in self.derived)
+        self.required = frozenset(self.source.values())
+
+        # reads the cache keys of all non derived fields in one call
+        self.read_keys = tuple(self.source)
+        getter = itemgetter(*self.source.values()) if self.source else (lambda item: ())
+        self.read = getter if len(self.source) != 1 else (lambda item: (getter(item),))
+
+
+class ShowOCIView(Mapping):
+
+    __slots__ = ('item', 'fields', 'overlay')
+
+    ############################################
+    # Init, a cache item without one of the keys raises KeyError here,
+    # like the dict copy did
+    ############################################
+    def __init__(self, item, fields, overlay):
+
+        if not item.keys() >= fields.required:
+            raise KeyError(sorted(fields.required - item.keys())[0])
+
+        self.item = item
+        self.fields = fields
+        self.overlay = overlay
+
+    def __getitem__(self, key):
+
+        overlay = self.overlay
+        if key in overlay:
+            return overlay[key]
+        return self.item[self.fields.source[key]]
+
+    def __setitem__(self, key, value):
+        self.overlay[key] = value
+
+    def __contains__(self, key):
+        return key in self.overlay or key in self.fields.source
+
+    def __iter__(self):
+
+        for key in self.fields.keys:
+            yield key
+        for key in self.overlay:
+            if key not in self.fields.index:
+                yield key
+
+    def __len__(self):
+        return len(self.fields.keys) + sum(1 for key in self.overlay if key not in self.fields.index)
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+    ##########################################################################
+    # copy - the view as a dict, in the key order of the dict copy
+    ##########################################################################
+    def copy(self):
+
+        value = dict.fromkeys(self.fields.keys)
+        value.update(zip(self.fields.read_keys, self.fields.read(self.item)))
+        value.update(self.overlay)
+        return value
+
+
+##########################################################################
+# json default for views, json.dump(data, f, default=view_to_json)
+##########################################################################
+def view_to_json(obj):
+
+    if isinstance(obj, ShowOCIView):
+        return obj.copy()
+    raise TypeError("Object of type " + type(obj).__name__ + " is not JSON serializable")
+
+
+##########################################################################
+# Benchmark
+##########################################################################
+def run_benchmark(resources=100000, mode=""):
+    import json
+    import time
+    import hashlib
+    import subprocess
+    import resource
+
+    keys = ['key' + str(i) for i in range(70)]
+    fields = ShowOCIViewFields(['id', 'name', 'sum_info', 'sum_shape'] + keys + ['logs'], derived=['name', 'sum_info', 'sum_shape', 'logs'])
+
+    def cache_item(n):
+        item = dict((key, key + "-" + str(n)) for key in keys)
+        item['id'] = "ocid1.instance." + str(n)
+        return item
+
+    def copy_item(item):
+        value = {'id': item['id'], 'name': item['key1'] + " - " + item['key2'], 'sum_info': 'Compute', 'sum_shape': item['key3'][0:21]}
+        for key in keys:
+            value[key] = item[key]
+        value['logs'] = []
+        return value
+
+    def view_item(item):
+        return ShowOCIView(item, fields, {'name': item['key1'] + " - " + item['key2'], 'sum_info': 'Compute', 'sum_shape': item['key3'][0:21], 'logs': []})
+
+    # one mode per process, so the maximum RSS is of that mode only
+    if mode:
+        cache = [cache_item(n) for n in range(resources)]
+        base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.time()
+        data = [copy_item(item) for item in cache] if mode == "copy" else [view_item(item) for item in cache]
+        build = time.time() - start
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base
+        start = time.time()
+        text = json.dumps(data, default=view_to_json)
+        write = time.time() - start
+        print(json.dumps({'build': build, 'rss_kb': rss, 'write': write, 'hash': hashlib.md5(text.encode()).hexdigest()}))
+        return
+
+    results = {}
+    for name in ("copy", "view"):
+        out = subprocess.check_output([sys.executable, __file__, '-resources', str(resources), '-mode', name])
+        results[name] = json.loads(out.decode())
+
+    print("Resources      : " + str(resources) + " cache items of " + str(len(keys) + 1) + " keys")
+    for name, label in (("copy", "Dict copy"), ("view", "ShowOCIView")):
+        r = results[name]
+        print(label.ljust(15) + ": build " + '{:.3f}'.format(r['build']) + "s, processed data RSS " + str(r['rss_kb'] // 1024) + "MB, json " + '{:.3f}'.format(r['write']) + "s")
+    print("Same JSON      : " + str(results['copy']['hash'] == results['view']['hash']))
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Benchmark ShowOCIView against the dict copy')
+    parser.add_argument('-resources', default=100000, dest='resources', type=int, help='Number of synthetic cache items (default=100000).')
+    parser.add_argument('-mode', default='', dest='mode', choices=['', 'copy', 'view'], help=argparse.SUPPRESS)
+    cmd = parser.parse_args()
+    run_benchmark(cmd.resources, cmd.mode)
+    sys.exit(0)
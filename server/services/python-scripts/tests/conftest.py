@@ -0,0 +1,77 @@
+"""
+Shared fixtures of the Cloudedze python script tests
+
+showoci_cache - small showoci -cachef service cache (tenancy, compartments
+                and object storage buckets) written to a temp file, the
+                showoci tests are skipped where showoci_service.py of the
+                showoci distribution is not next to the scripts
+"""
+
+import pytest
+
+SHOWOCI_ARGS = "-os"
+REGION = "us-ashburn-1"
+COMPARTMENTS = 4
+BUCKETS = 40
+
+
+def showoci_bucket(index, compartment):
+    return {
+        "id": f"ocid1.bucket.oc1..b{index}",
+        "name": f"bucket-{index}",
+        "compartment_id": compartment["id"],
+        "compartment_name": compartment["name"],
+        "compartment_path": compartment["path"],
+        "region_name": REGION,
+        "namespace_name": "test",
+        "time_created": "2024-01-01 00:00",
+        "approximate_count": str(index),
+        "approximate_size": str(index * 1000),
+        "size_gb": index / 1000.0,
+        "count": index,
+        "preauthenticated_requests": "",
+        "object_lifecycle": "",
+        "public_access_type": "NoPublicAccess",
+        "storage_tier": "Standard",
+        "object_events_enabled": "False",
+        "kms_key_id": None,
+        "object_lifecycle_policy_etag": "",
+        "replication_enabled": "False",
+        "is_read_only": "False",
+        "versioning": "Disabled",
+        "auto_tiering": "Disabled",
+        "archival_state": "",
+        "error_message": "",
+        "defined_tags": {},
+        "freeform_tags": {"index": str(index)}
+    }
+
+
+@pytest.fixture
+def showoci_cache(tmp_path):
+    """Path of a small -cachef cache file"""
+    showoci_service = pytest.importorskip("showoci_service")
+    import showoci_replay
+
+    service = showoci_service.ShowOCIService
+    compartments = [{"id": f"ocid1.compartment.oc1..c{i}", "name": f"c{i}", "path": f"c{i}"} for i in range(COMPARTMENTS)]
+    tenancy = {
+        "id": "ocid1.tenancy.oc1..test",
+        "name": "test",
+        "home_region_key": "IAD",
+        "subscribe_regions": REGION,
+        "list_region_subscriptions": [REGION]
+    }
+    cache_data = {
+        service.C_IDENTITY: {
+            service.C_IDENTITY_TENANCY: tenancy,
+            service.C_IDENTITY_COMPARTMENTS: compartments
+        },
+        service.C_OS: {
+            service.C_OS_BUCKETS: [showoci_bucket(i, compartments[i % COMPARTMENTS]) for i in range(BUCKETS)]
+        }
+    }
+
+    cache_file = tmp_path / "cache.json"
+    showoci_replay.save_cache_file(str(cache_file), cache_data)
+    return str(cache_file)
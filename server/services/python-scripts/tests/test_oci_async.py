@@ -0,0 +1,196 @@
+"""
+AsyncDiscovery against the fake OCI server of oci_async serving a
+synthetic tenancy
+"""
+
+import json
+import pytest
+
+from oci_async import (AsyncDiscovery, RequestSigner, synthetic_tenancy, start_fake_oci_server, load_thread_pool_discovery,
+                       RestSDKClient, RestSDKClients)
+from oci_profile import CallProfile
+from oci_scheduler import HTTPStatusError
+
+COMPARTMENTS = 3
+PER_TYPE = 2
+
+
+@pytest.fixture(scope="module")
+def tenancy():
+    return synthetic_tenancy(COMPARTMENTS, PER_TYPE)
+
+
+@pytest.fixture(scope="module")
+def config(tenancy):
+    return {"tenancy": tenancy["tenancy"]["id"], "user": "ocid1.user.oc1..test", "fingerprint": "00:00", "region": "test-1"}
+
+
+@pytest.fixture
+def server(tenancy):
+    """start(**options) -> (url, stats), servers are stopped after the test"""
+    servers = []
+
+    def start(**options):
+        options.setdefault("latency", 0.0)
+        server, url, stats = start_fake_oci_server(tenancy, **options)
+        servers.append(server)
+        return url, stats
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def api_key():
+    """(PEM private key, public key) of a throwaway API key"""
+    pytest.importorskip("cryptography")
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    return pem, key.public_key()
+
+
+def signer(config, pem):
+    return RequestSigner(config["tenancy"], config["user"], config["fingerprint"], key_content=pem)
+
+
+def discovery(config, url, **options):
+    options.setdefault("signer", False)
+    options.setdefault("compartment_db", None)
+    options.setdefault("compartment_ttl", 0)
+    return AsyncDiscovery(config, endpoint=url, **options)
+
+
+def canonical(resources):
+    return {key: sorted(json.dumps(r, sort_keys=True, default=str) for r in records) for key, records in resources.items()}
+
+
+def test_signed_requests_are_verified(config, server):
+    pem, public_key = api_key()
+    url, stats = server(public_key=public_key)
+
+    result = discovery(config, url, signer=signer(config, pem)).run()
+
+    assert result["success"]
+    assert stats["rejected"] == 0
+    assert result["summary"]["compartments_scanned"] == COMPARTMENTS + 1
+
+
+def test_bad_signature_is_rejected_with_401(config, server):
+    _, public_key = api_key()
+    other_pem, _ = api_key()
+    url, stats = server(public_key=public_key)
+
+    with pytest.raises(HTTPStatusError) as error:
+        discovery(config, url, signer=signer(config, other_pem)).run()
+
+    assert error.value.status == 401
+    assert stats["rejected"] > 0
+
+
+@pytest.mark.asyncio
+async def test_pages_are_followed(config, tenancy, server):
+    url, stats = server(page_size=1)
+    engine = discovery(config, url)
+    compartment_id = "ocid1.compartment.oc1..c0"
+    try:
+        records = await engine.list_all("iaas", "/20160918/vcns", {"compartmentId": compartment_id})
+        first_page = await engine.list_all("iaas", "/20160918/vcns", {"compartmentId": compartment_id}, pages=1)
+    finally:
+        await engine.pool.close()
+
+    assert [r["id"] for r in records] == [r["id"] for r in tenancy["lists"]["/20160918/vcns"][compartment_id]]
+    assert len(records) == PER_TYPE
+    assert len(first_page) == 1
+    assert stats["requests"] == PER_TYPE + 1
+
+
+@pytest.mark.asyncio
+async def test_throttled_requests_are_retried(config, server):
+    url, stats = server(throttle=3, retry_after=0.05)
+    profile = CallProfile()
+    engine = discovery(config, url, profile=profile)
+    try:
+        namespace, _ = await engine.request("objectstorage", "/n/")
+    finally:
+        await engine.pool.close()
+
+    assert namespace == "benchspace"
+    assert stats["throttled"] == 3
+    assert engine.backoff.throttled == 3
+
+    operation = profile.to_dict()["operations"][0]
+    assert (operation["service"], operation["operation"], operation["region"]) == ("objectstorage", "get_namespace", "test-1")
+    assert (operation["calls"], operation["throttled"], operation["retries"]) == (4, 3, 3)
+
+
+@pytest.mark.asyncio
+async def test_error_status_raises(config, server):
+    url, _ = server()
+    engine = discovery(config, url)
+    try:
+        with pytest.raises(HTTPStatusError) as error:
+            await engine.request("iaas", "/20160918/unknown")
+    finally:
+        await engine.pool.close()
+
+    assert error.value.status == 404
+
+
+def test_budgets_are_listed_in_the_root_compartment_only(config, server):
+    url, stats = server()
+    result = discovery(config, url).run()
+
+    assert result["resources"]["budgets"]
+    assert {r["compartment_id"] for r in result["resources"]["budgets"]} == {config["tenancy"]}
+    assert stats["hosts"]["usage.test-1.oci.oraclecloud.com"] == 1
+
+
+def test_compartment_tree_cache(config, server, tmp_path):
+    url, stats = server()
+    path = str(tmp_path / "compartments.db")
+
+    first = discovery(config, url, compartment_db=path, compartment_ttl=900)
+    first.run()
+    requests = stats["requests"]
+    second = discovery(config, url, compartment_db=path, compartment_ttl=900)
+    second.run()
+
+    assert first.compartment_tree.source == "fetched"
+    assert second.compartment_tree.source == "cache"
+    assert [c.id for c in second.compartments] == [c.id for c in first.compartments]
+    # everything but the compartment list and root
+    assert stats["requests"] - requests == requests - 2
+
+
+def test_api_rate_limits_every_host(config, server):
+    url, _ = server()
+    result = discovery(config, url, api_rate=1000.0).run()
+
+    rates = result["metadata"]["api_rates"]
+    assert "iaas.test-1.oraclecloud.com" in rates
+    assert sum(r["calls"] for r in rates.values()) == sum(h["requests"] for h in result["metadata"]["http"].values())
+
+
+def test_output_of_the_thread_pool_path(config, tenancy, server):
+    """Same records, relationships and output shape as CloudedzeShowOCI"""
+    pytest.importorskip("oci")
+    module = load_thread_pool_discovery()
+    url, _ = server()
+
+    async_result = discovery(config, url, api_rate=1000.0, relationships=True).run()
+
+    clients = RestSDKClients(config, RestSDKClient(url, config["region"]))
+    service = module.CloudedzeShowOCI(config, {}, None, compartment_db=None, compartment_ttl=0, relationships=True)
+    service.clients = clients
+    service.scopes = [module.RegionScope(config["region"], clients, service.resources, tag=False)]
+    thread_result = service.discover_all_resources()
+
+    assert canonical(async_result["resources"]) == canonical(thread_result["resources"])
+    assert sorted(map(tuple, async_result["relationships"]["edges"])) == sorted(map(tuple, thread_result["relationships"]["edges"]))
+    assert async_result.keys() == thread_result.keys()
+    assert async_result["summary"] == thread_result["summary"]
+    assert set(async_result["metadata"]) - set(thread_result["metadata"]) == {"engine", "http"}
+    assert async_result["resources"].keys() == thread_result["resources"].keys()
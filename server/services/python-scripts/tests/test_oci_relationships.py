@@ -0,0 +1,103 @@
+"""
+RelationshipGraph edges of the discovery records
+"""
+
+from oci_relationships import RelationshipGraph, synthetic_inventory, nested_loop_vcns, nested_loop_volumes
+
+
+def inventory(region=None, suffix=""):
+    """Two VCNs with the same 10.0.0.0/16 range, one instance and LB in each,
+    the OCIDs end with suffix"""
+    def tag(record):
+        return dict(record, region=region) if region else record
+
+    return {
+        "subnets": [
+            tag({"id": f"s{name}{suffix}", "vcn_id": f"vcn{name}{suffix}", "private_ips": {"10.0.0.5": f"vnic{name}{suffix}"}})
+            for name in ("A", "B")
+        ],
+        "compute_instances": [
+            tag({"id": f"i{name}{suffix}", "boot_volume_id": f"boot{name}{suffix}", "volume_ids": [f"vol{name}{suffix}"],
+                 "vnic_attachments": [{"vnic_id": f"vnic{name}{suffix}", "subnet_id": f"s{name}{suffix}"}]})
+            for name in ("A", "B")
+        ],
+        "load_balancers": [
+            tag({"id": f"lb{name}{suffix}", "subnet_ids": [f"s{name}{suffix}"], "backends": [{"ip_address": "10.0.0.5", "port": 80}]})
+            for name in ("A", "B")
+        ],
+        "block_volumes": [tag({"id": f"volA{suffix}", "kms_key_id": "key1"})]
+    }
+
+
+def merge(*inventories):
+    merged = {}
+    for resources in inventories:
+        for key, records in resources.items():
+            merged.setdefault(key, []).extend(records)
+    return merged
+
+
+def test_edges():
+    graph = RelationshipGraph.build(inventory())
+
+    assert graph.follow("iA", "vnic", "subnet", "vcn") == ["vcnA"]
+    assert sorted(graph.sources("iA", "attached_to")) == ["bootA", "volA"]
+    assert graph.targets("volA", "kms_key") == ["key1"]
+    assert graph.to_dict()["counts"]["backend"] == 2
+
+
+def test_backend_ip_resolves_in_the_vcn_of_the_lb():
+    graph = RelationshipGraph.build(inventory())
+
+    assert graph.targets("lbA", "backend") == ["iA"]
+    assert graph.targets("lbB", "backend") == ["iB"]
+    assert graph.unresolved_backends == 0
+
+
+def test_backend_ip_outside_the_lb_vcn_is_unresolved():
+    resources = inventory()
+    resources["subnets"][0]["private_ips"] = {}
+
+    graph = RelationshipGraph.build(resources)
+
+    assert graph.targets("lbA", "backend") == []
+    assert graph.unresolved_backends == 1
+
+
+def test_backend_ip_resolves_in_the_region_of_the_lb():
+    graph = RelationshipGraph.build(merge(inventory("us-ashburn-1"), inventory("eu-frankfurt-1", "-fra")))
+
+    assert graph.targets("lbA", "backend") == ["iA"]
+    assert graph.targets("lbA-fra", "backend") == ["iA-fra"]
+    assert graph.unresolved_backends == 0
+
+
+def test_lb_subnet_of_another_region_is_not_used():
+    resources = merge(inventory("us-ashburn-1"), inventory("eu-frankfurt-1", "-fra"))
+    resources["load_balancers"][0]["subnet_ids"] = ["sA-fra"]
+
+    graph = RelationshipGraph.build(resources)
+
+    assert graph.targets("lbA", "backend") == []
+    assert graph.unresolved_backends == 1
+
+
+def test_ambiguous_backend_ip_is_unresolved():
+    resources = inventory()
+    resources["load_balancers"][0]["subnet_ids"] = ["sA", "sB"]
+
+    graph = RelationshipGraph.build(resources)
+
+    assert graph.targets("lbA", "backend") == []
+    assert graph.unresolved_backends == 1
+
+
+def test_graph_matches_nested_loops():
+    resources, _ = synthetic_inventory(2000)
+    graph = RelationshipGraph.build(resources)
+
+    for instance in resources["compute_instances"]:
+        volumes = [v for v in graph.sources(instance["id"], "attached_to") if v != instance["boot_volume_id"]]
+        assert graph.follow(instance["id"], "vnic", "subnet", "vcn") == nested_loop_vcns(resources, instance)
+        assert sorted(volumes) == sorted(nested_loop_volumes(resources, instance["id"]))
+    assert graph.unresolved_backends == 0
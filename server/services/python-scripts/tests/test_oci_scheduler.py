@@ -0,0 +1,142 @@
+"""
+AdaptiveRateLimiter and ThrottleBackoff against the local endpoint of
+oci_scheduler that answers 429 above a fixed rate per path
+"""
+
+import time
+import threading
+import urllib.error
+import urllib.request
+import concurrent.futures
+import pytest
+
+from oci_scheduler import AdaptiveRateLimiter, ThrottleBackoff, HTTPStatusError, DiscoveryScheduler, start_throttling_endpoint
+
+
+def get(url):
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.read()
+    except urllib.error.HTTPError as e:
+        raise HTTPStatusError(e.code, dict(e.headers))
+
+
+@pytest.fixture
+def endpoint():
+    """start(capacity, latency, retry_after) -> (url, stats), servers are stopped after the test"""
+    servers = []
+
+    def start(capacity, latency=0.0, retry_after=None):
+        server, url, stats = start_throttling_endpoint(capacity, latency, retry_after)
+        servers.append(server)
+        return url, stats
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_no_calls_lost_when_throttled(endpoint):
+    url, stats = endpoint(capacity=20.0, latency=0.005)
+    limiter = AdaptiveRateLimiter(rate=80.0, max_retries=20, base_delay=0.2)
+    lost = []
+
+    def worker(i):
+        for j in range(10):
+            path = f"/service{(i + j) % 2}"
+            try:
+                limiter.call_endpoint(path, get, url + path)
+            except Exception:
+                lost.append(path)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(worker, range(8)))
+
+    assert lost == []
+    assert stats["ok"] == 80
+    assert stats["throttled"] > 0
+    assert limiter.throttled == stats["throttled"]
+    assert sum(r["throttled"] for r in limiter.rates().values()) == stats["throttled"]
+
+
+def test_retry_after_is_honoured(endpoint):
+    url, stats = endpoint(capacity=2.0, retry_after=0.6)
+    # without the hint the first retry would wait 2.5s to 5s
+    limiter = ThrottleBackoff(max_retries=3, base_delay=5.0)
+
+    limiter.call_endpoint("service", get, url + "/service")
+    limiter.call_endpoint("service", get, url + "/service")
+    start = time.time()
+    limiter.call_endpoint("service", get, url + "/service")
+    elapsed = time.time() - start
+
+    assert stats == {"ok": 3, "throttled": 1}
+    assert 0.6 <= elapsed < 2.0
+
+
+def test_retry_after_pauses_all_callers_of_the_endpoint(endpoint):
+    url, stats = endpoint(capacity=1.0, retry_after=0.5)
+    limiter = ThrottleBackoff(max_retries=3, base_delay=5.0)
+    limiter.call_endpoint("service", get, url + "/service")
+
+    start = time.time()
+    throttled = threading.Thread(target=limiter.call_endpoint, args=("service", get, url + "/service"))
+    throttled.start()
+    while not limiter.throttled:
+        time.sleep(0.01)
+    limiter.call_endpoint("service", get, url + "/other")
+    throttled.join()
+
+    # /other is not throttled by the server, the endpoint pause still applies
+    assert time.time() - start >= 0.5
+
+
+def test_rate_decreases_on_429_and_recovers(endpoint):
+    slow_url, slow_stats = endpoint(capacity=5.0)
+    fast_url, fast_stats = endpoint(capacity=1000.0)
+    limiter = AdaptiveRateLimiter(rate=40.0, increase=10.0, cooldown=0.2, max_retries=20, base_delay=0.1)
+
+    for _ in range(20):
+        limiter.call_endpoint("service", get, slow_url + "/service")
+    throttled_rate = limiter.rates()["service"]["rate"]
+
+    assert slow_stats["throttled"] > 0
+    assert throttled_rate < 40.0
+
+    # the endpoint keeps up again, every success raises the rate
+    for _ in range(30):
+        limiter.call_endpoint("service", get, fast_url + "/service")
+
+    assert fast_stats["throttled"] == 0
+    assert limiter.rates()["service"]["rate"] > throttled_rate + 10.0
+
+
+def test_rate_limits_calls_per_second():
+    limiter = AdaptiveRateLimiter(rate=20.0, max_rate=20.0)
+    start = time.time()
+    for _ in range(21):
+        limiter.call_endpoint("service", lambda: None)
+
+    # one token is saved up at the start, the other 20 calls take a second
+    assert time.time() - start >= 0.9
+
+
+def test_scheduler_endpoint_limit():
+    scheduler = DiscoveryScheduler(max_workers=8, endpoint_limit=2)
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+
+    def task():
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        time.sleep(0.02)
+        with lock:
+            running["now"] -= 1
+
+    futures = [scheduler.submit("service", task) for _ in range(10)]
+    concurrent.futures.wait(futures)
+    scheduler.shutdown()
+
+    assert running["max"] == 2
@@ -0,0 +1,84 @@
+"""
+Incremental scans of CloudedzeShowOCI against a SnapshotStore, the
+discovery methods are replaced by a fixed set of instances
+"""
+
+import types
+import pytest
+
+from oci_snapshot import SnapshotStore
+
+TENANCY = "ocid1.tenancy.oc1..test"
+OTHER_METHODS = ("_discover_storage_resources", "_discover_network_resources", "_discover_database_resources",
+                 "_discover_additional_services", "_discover_security_resources", "_discover_developer_services")
+
+
+@pytest.fixture(scope="module")
+def module():
+    pytest.importorskip("oci")
+    from oci_async import load_thread_pool_discovery
+    return load_thread_pool_discovery()
+
+
+@pytest.fixture
+def scan(module, tmp_path):
+    """scan(compartments, full_rescan_hours, failing) -> result, one instance
+    per compartment, the compute discovery of the failing compartments fails"""
+    path = str(tmp_path / "snapshots.db")
+
+    def run(compartments, full_rescan_hours=24, failing=()):
+        service = module.CloudedzeShowOCI({"tenancy": TENANCY, "region": "us-ashburn-1", "user": "ocid1.user.oc1..test"}, {},
+                                          compartment_db=None, compartment_ttl=0, relationships=False)
+        tree = [types.SimpleNamespace(id=cid, name=cid) for cid in compartments] + [types.SimpleNamespace(id=TENANCY, name="root")]
+
+        def load_compartments():
+            service.compartments = tree
+
+        def discover_compute(scope, compartment_id, compartment_name):
+            if compartment_id in failing:
+                service._discovery_error(f"Error discovering compute in {compartment_name}")
+            elif compartment_id != TENANCY:
+                scope.resources["compute_instances"].append({"id": "instance-" + compartment_id, "compartment_id": compartment_id})
+
+        service._load_compartments = load_compartments
+        service._search_fingerprints = lambda: {(cid, "compute_instances"): cid for cid in compartments}
+        service._discover_compute_resources = discover_compute
+        for method in OTHER_METHODS:
+            setattr(service, method, lambda *args: None)
+
+        store = SnapshotStore(path)
+        try:
+            return service.discover_incremental(store, full_rescan_hours)
+        finally:
+            store.close()
+
+    return run
+
+
+def instances(result):
+    return sorted(record["id"] for record in result["resources"]["compute_instances"])
+
+
+@pytest.mark.parametrize("full_rescan_hours", [24, 1e-9])
+def test_dropped_compartment_is_removed(scan, full_rescan_hours):
+    scan(["c1", "c2"])
+    result = scan(["c1"], full_rescan_hours)
+
+    assert result["incremental"]["full_rescan"] == (full_rescan_hours < 1)
+    assert instances(result) == ["instance-c1"]
+    assert [(r["resource_type"], r["id"]) for r in result["delta"]["removed"]] == [("compute_instances", "instance-c2")]
+
+    # and stays removed
+    result = scan(["c1"])
+    assert instances(result) == ["instance-c1"]
+    assert result["delta"]["counts"] == {"added": 0, "removed": 0, "changed": 0}
+
+
+def test_failed_group_keeps_its_records_on_a_full_rescan(scan):
+    scan(["c1", "c2"])
+    result = scan(["c1", "c2"], 1e-9, failing=["c2"])
+
+    assert result["incremental"]["full_rescan"]
+    assert result["incremental"]["groups_failed"] == 1
+    assert instances(result) == ["instance-c1", "instance-c2"]
+    assert result["delta"]["counts"]["removed"] == 0
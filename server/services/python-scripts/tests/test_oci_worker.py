@@ -0,0 +1,135 @@
+"""
+oci_worker jobs against the local endpoint of oci_scheduler that answers
+429 above a fixed rate per path, the SDK clients are replaced by clients
+making their list calls through base_client.call_api to that endpoint
+"""
+
+import io
+import json
+import types
+import urllib.error
+import urllib.request
+import pytest
+
+oci = pytest.importorskip("oci")
+
+import oci_clients
+from oci_scheduler import HTTPStatusError, start_throttling_endpoint
+from oci_worker import OCIDiscoveryWorker
+
+TENANCY = "ocid1.tenancy.oc1..test"
+COMPARTMENTS = 10
+CREDENTIALS = {"tenancyId": TENANCY, "userId": "ocid1.user.oc1..test", "fingerprint": "00:00", "region": "us-ashburn-1",
+               "privateKey": "unused"}
+
+
+class Record:
+    """SDK model stand-in, attributes it was not given are None"""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+    def __getattr__(self, name):
+        return None
+
+
+class BaseClient:
+    def __init__(self, url):
+        self.url = url
+
+    def call_api(self, resource_path, method, operation_name=None):
+        try:
+            with urllib.request.urlopen(self.url + resource_path) as response:
+                response.read()
+        except urllib.error.HTTPError as e:
+            raise HTTPStatusError(e.code, dict(e.headers))
+        return types.SimpleNamespace(status=200, headers={})
+
+
+def fake_client_class(url):
+    """Client class with the list calls of the simple discovery, one record
+    per compartment and list"""
+
+    class Client:
+        def __init__(self, config, signer=None):
+            self.base_client = BaseClient(url)
+
+        def _call(self, operation, data):
+            response = self.base_client.call_api("/" + operation, "GET", operation_name=operation)
+            return types.SimpleNamespace(data=data, has_next_page=False, next_page=None, headers=response.headers)
+
+        def list_compartments(self, compartment_id, **kwargs):
+            return self._call("list_compartments", [Record(id=f"c{i}", name=f"compartment{i}", compartment_id=TENANCY,
+                                                           lifecycle_state="ACTIVE") for i in range(COMPARTMENTS)])
+
+        def get_compartment(self, compartment_id):
+            return self._call("get_compartment", Record(id=TENANCY, name="root", lifecycle_state="ACTIVE"))
+
+        def get_tenancy(self, tenancy_id):
+            return self._call("get_tenancy", Record(id=tenancy_id))
+
+        def __getattr__(self, name):
+            if not name.startswith("list_"):
+                raise AttributeError(name)
+
+            def list_call(compartment_id, page=None):
+                return self._call(name, [Record(id=f"{name}.{compartment_id}", display_name=name)])
+            return list_call
+
+    return Client
+
+
+@pytest.fixture
+def endpoint(monkeypatch):
+    """The clients of the worker call a local endpoint that throttles above 3 calls per second and path"""
+    server, url, stats = start_throttling_endpoint(capacity=3.0, latency=0.0, retry_after=0.1)
+    client_class = fake_client_class(url)
+    packages = types.SimpleNamespace(IdentityClient=client_class, ComputeClient=client_class, BlockstorageClient=client_class,
+                                     VirtualNetworkClient=client_class)
+    monkeypatch.setattr(oci, "identity", packages)
+    monkeypatch.setattr(oci, "core", packages)
+    monkeypatch.setattr(oci_clients, "config_signer", lambda config: None)
+    yield stats
+    server.shutdown()
+    server.server_close()
+
+
+def run_job(worker, message):
+    """Messages the worker sent for the job"""
+    worker.output = io.StringIO()
+    worker.run_job(message)
+    return [json.loads(line) for line in worker.output.getvalue().splitlines()]
+
+
+def test_throttled_discover_job_loses_no_compartment(endpoint, capsys):
+    worker = OCIDiscoveryWorker(compartment_db=None, compartment_ttl=0)
+
+    messages = run_job(worker, {"id": "1", "operation": "discover", "credentials": CREDENTIALS})
+
+    result = messages[-1]
+    assert result["type"] == "result"
+    assert result["result"]["summary"]["compartments_scanned"] == COMPARTMENTS + 1
+    assert result["result"]["summary"]["by_service"] == {key: COMPARTMENTS + 1 for key in ("compute_instances", "block_volumes", "vcns", "subnets")}
+    assert endpoint["throttled"] > 0
+    assert "Error scanning compartment" not in capsys.readouterr().err
+
+    received = {}
+    for message in messages[:-1]:
+        assert (message["id"], message["type"]) == ("1", "resources")
+        received.setdefault(message["resource_type"], []).extend(item["id"] for item in message["items"])
+    assert sorted(received["vcns"]) == sorted(f"list_vcns.{cid}" for cid in [f"c{i}" for i in range(COMPARTMENTS)] + [TENANCY])
+
+
+def test_clients_are_cached_per_credential(endpoint):
+    worker = OCIDiscoveryWorker(compartment_db=None, compartment_ttl=0)
+
+    run_job(worker, {"id": "1", "operation": "discover", "credentials": CREDENTIALS})
+    clients = worker.clients.get(CREDENTIALS)
+    messages = run_job(worker, {"id": "2", "operation": "validate", "credentials": CREDENTIALS})
+
+    assert messages[-1]["result"]["success"]
+    assert worker.clients.get(CREDENTIALS) is clients
+    assert len(worker.clients) == 1
+    assert worker.clients.get(dict(CREDENTIALS, region="eu-frankfurt-1")) is not clients
+    # one rate per region and client, the limiter of the cached registry
+    assert set(clients.limiter.rates()) >= {"us-ashburn-1/compute", "us-ashburn-1/network"}
@@ -0,0 +1,81 @@
+"""
+ShowOCIAggregator and the ShowOCISummary JSON it sums, against the
+append and group by summary it replaced
+"""
+
+import json
+import pytest
+
+from showoci_aggregate import ShowOCIAggregator, synthetic_summary_data, summary_group_by
+from showoci_output import ShowOCISummary, ShowOCIRenderer
+
+
+def summary_json(data, vectorized=False):
+    summary = ShowOCISummary(ShowOCIRenderer("none"), vectorized)
+    summary.print_summary(data)
+    return summary.get_summary_json()
+
+
+@pytest.fixture(scope="module")
+def data():
+    data, _ = synthetic_summary_data(resources=2000, regions=3, compartments=20)
+    return data
+
+
+def test_summary_is_the_group_by_summary(data):
+    assert json.dumps(summary_json(data), sort_keys=True) == json.dumps(summary_group_by(data), sort_keys=True)
+
+
+def test_vectorized_summary_is_the_group_by_summary(data):
+    pytest.importorskip("numpy")
+
+    assert json.dumps(summary_json(data, True), sort_keys=True) == json.dumps(summary_group_by(data), sort_keys=True)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_levels_roll_up(vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    aggregator = ShowOCIAggregator(vectorized)
+
+    aggregator.add("Compute", 1)
+    aggregator.add("Storage (GB)", 50.5)
+    aggregator.add("Compute", 1)
+    assert aggregator.close_compartment() == [{'type': "Compute", 'size': 2}, {'type': "Storage (GB)", 'size': 50.5}]
+
+    aggregator.add("Storage (GB)", 10.0)
+    aggregator.close_compartment()
+    assert aggregator.close_region() == [{'type': "Compute", 'size': 2}, {'type': "Storage (GB)", 'size': 60.5}]
+
+    # identity is not in a region, it only adds to the total
+    aggregator.add("Users", 3)
+    aggregator.close_compartment(in_region=False)
+    assert aggregator.close_region() == []
+    assert aggregator.get_total() == [{'type': "Compute", 'size': 2}, {'type': "Storage (GB)", 'size': 60.5}, {'type': "Users", 'size': 3}]
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_int_sizes_stay_int(vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    aggregator = ShowOCIAggregator(vectorized)
+
+    aggregator.add("Users", 1)
+    aggregator.add("Users", 2)
+    aggregator.add("OCPUs", 1)
+    aggregator.add("OCPUs", 0.5)
+    rows = aggregator.close_compartment()
+
+    assert [type(row['size']) for row in rows] == [int, float]
+
+
+def test_open_compartment_drops_a_failed_compartment():
+    aggregator = ShowOCIAggregator()
+
+    aggregator.add("Compute", 1)
+    assert aggregator.has_data()
+    aggregator.open_compartment()
+
+    assert not aggregator.has_data()
+    assert aggregator.close_compartment() == []
+    assert aggregator.get_total() == []
@@ -0,0 +1,105 @@
+"""
+pytest-benchmark suite of the showoci offline replay
+
+Wall time of process_oci_data, print_summary, generate_csv and print_data
+per scale factor of the fixture cache, the peak RSS of the test process is
+in the extra info of every benchmark. showoci_replay.py -benchmark runs the
+same phases with one process per scale factor.
+
+    pytest tests/test_showoci_benchmark.py --benchmark-only
+"""
+
+import os
+import json
+import datetime
+import contextlib
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("showoci_service")
+
+import showoci_replay
+from showoci_data import ShowOCIData
+from showoci_output import ShowOCIOutput, ShowOCISummary, ShowOCICSV
+from .conftest import SHOWOCI_ARGS, BUCKETS
+
+SCALES = [1, 10]
+ROUNDS = 3
+
+
+def quiet(func):
+    """func with stdout discarded, showoci prints its progress"""
+    def run(*args, **kwargs):
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            return func(*args, **kwargs)
+    return run
+
+
+def replay_data(cache_data):
+    flags = showoci_replay.get_flags(SHOWOCI_ARGS)
+    return ShowOCIData(flags, showoci_replay.ShowOCIReplayService(flags, cache_data))
+
+
+def record_rss(benchmark, scale):
+    benchmark.extra_info["scale"] = scale
+    benchmark.extra_info["peak_rss_mb"] = round(showoci_replay.peak_rss_mb(), 1)
+
+
+@pytest.fixture(params=SCALES, ids=lambda scale: f"x{scale}")
+def scaled_cache(request, showoci_cache):
+    return request.param, showoci_replay.scale_cache(showoci_replay.load_cache_file(showoci_cache), request.param)
+
+
+@pytest.fixture
+def extracted_data(scaled_cache):
+    scale, cache_data = scaled_cache
+    data = replay_data(cache_data)
+    return scale, data.get_tenancy_data(), quiet(data.process_oci_data)()
+
+
+def test_process_oci_data(benchmark, scaled_cache):
+    scale, cache_data = scaled_cache
+    result = benchmark.pedantic(quiet(lambda data: data.process_oci_data()),
+                                setup=lambda: ((replay_data(cache_data),), {}), rounds=ROUNDS)
+    record_rss(benchmark, scale)
+
+    assert any(block['type'] == "region" for block in result)
+
+
+def test_print_summary(benchmark, extracted_data):
+    scale, tenancy, data = extracted_data
+    benchmark.pedantic(quiet(lambda: ShowOCISummary().print_summary(data)), rounds=ROUNDS)
+    record_rss(benchmark, scale)
+
+
+def test_generate_csv(benchmark, extracted_data, tmp_path):
+    scale, tenancy, data = extracted_data
+    csv_file = str(tmp_path / "bench")
+
+    def generate_csv():
+        ShowOCICSV(str(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))).generate_csv(data, csv_file, tenancy, True, "")
+
+    benchmark.pedantic(quiet(generate_csv), rounds=ROUNDS)
+    record_rss(benchmark, scale)
+
+    with open(csv_file + "_object_storage_buckets.csv") as infile:
+        assert sum(1 for _ in infile) == BUCKETS * scale + 1
+
+
+def test_print_data(benchmark, extracted_data):
+    scale, tenancy, data = extracted_data
+    benchmark.pedantic(quiet(lambda: ShowOCIOutput().print_data(data)), rounds=ROUNDS)
+    record_rss(benchmark, scale)
+
+
+def test_benchmark_reports_failed_child(tmp_path):
+    bad_cache = tmp_path / "bad.json"
+    bad_cache.write_text(json.dumps({showoci_replay.CACHE_HEADER: showoci_replay.get_cache_header()})[:-2])
+
+    assert showoci_replay.run_benchmark(str(bad_cache), SHOWOCI_ARGS, [1], timeout=60) is False
+
+
+def test_export_benchmark_reports_failed_child(showoci_cache):
+    cache_data = showoci_replay.load_cache_file(showoci_cache)
+
+    assert showoci_replay.run_export_benchmark(cache_data, "-no_such_flag", ("csv",), timeout=60) is False
@@ -0,0 +1,52 @@
+"""
+Column typing of the Parquet and Arrow export of ShowOCIColumnar
+"""
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from showoci_output import ShowOCIColumnar
+
+
+@pytest.fixture
+def table(tmp_path):
+    """write_table then read the Parquet file back"""
+    import pyarrow.parquet
+
+    def write(**columns):
+        file_name = str(tmp_path / "table.parquet")
+        fields = list(columns)
+        rows = [dict(zip(fields, values)) for values in zip(*columns.values())]
+        ShowOCIColumnar("parquet").write_table(file_name, fields, rows)
+        return pyarrow.parquet.read_table(file_name)
+
+    return write
+
+
+def test_numbers_and_dates_are_typed(table):
+    result = table(size=["1", "20", ""], ocpus=["1.5", "2", None], created=["2024-01-01 00:00", "2024-02-01 10:30", ""])
+
+    assert pa.types.is_int64(result.schema.field("size").type)
+    assert result.column("size").to_pylist() == [1, 20, None]
+    assert pa.types.is_float64(result.schema.field("ocpus").type)
+    assert pa.types.is_timestamp(result.schema.field("created").type)
+
+
+def test_mixed_types_are_text(table):
+    result = table(value=[1, "x"])
+
+    assert result.column("value").to_pylist() == ["1", "x"]
+
+
+def test_identifiers_keep_leading_zeros(table):
+    result = table(code=["0123", "0007"], amount=["0.5", "007.5"])
+
+    assert result.column("code").to_pylist() == ["0123", "0007"]
+    assert result.column("amount").to_pylist() == ["0.5", "007.5"]
+
+
+def test_numbers_that_do_not_round_trip_are_text(table):
+    result = table(ocid=["12345678901234567890123", "1"])
+
+    assert result.column("ocid").to_pylist() == ["12345678901234567890123", "1"]
@@ -0,0 +1,50 @@
+"""
+ShowOCICSV -csv_delta export, rows added, changed or removed since the
+previous export of the same file
+"""
+
+import os
+import csv
+import contextlib
+import pytest
+
+pytest.importorskip("showoci_service")
+
+import showoci_replay
+from showoci_output import ShowOCICSV
+from .conftest import SHOWOCI_ARGS, BUCKETS
+
+TENANCY = {'id': "ocid1.tenancy.oc1..test", 'name': "test"}
+
+
+def export(cache_data, directory):
+    """generate_csv of the cache into directory with -csv_delta the same
+    directory, rows of the bucket delta file"""
+    flags = showoci_replay.get_flags(SHOWOCI_ARGS)
+    data = showoci_replay.ShowOCIData(flags, showoci_replay.ShowOCIReplayService(flags, cache_data)).process_oci_data()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        ShowOCICSV("2024-01-01 00:00:00").generate_csv(data, str(directory / "showoci"), TENANCY, delta_dir=str(directory))
+
+    delta_file = directory / "showoci_object_storage_buckets_delta.csv"
+    if not delta_file.exists():
+        return []
+    with open(delta_file, newline='') as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    delta_file.unlink()
+    return rows
+
+
+def test_delta_in_the_csv_directory_compares_the_previous_export(showoci_cache, tmp_path):
+    cache_data = showoci_replay.load_cache_file(showoci_cache)
+    buckets = cache_data[showoci_replay.ShowOCIService.C_OS][showoci_replay.ShowOCIService.C_OS_BUCKETS]
+
+    assert [row['delta_status'] for row in export(cache_data, tmp_path)] == ["added"] * BUCKETS
+
+    # same tenancy, no delta
+    assert export(cache_data, tmp_path) == []
+
+    removed = buckets.pop(0)
+    buckets[0]['count'] += 1000
+    rows = export(cache_data, tmp_path)
+
+    assert sorted((row['delta_status'], row['bucket_name']) for row in rows) == sorted([("removed", removed['name']), ("changed", buckets[0]['name'])])
@@ -0,0 +1,53 @@
+"""
+ShowOCIIndex answers against the linear search of the cache it replaced
+"""
+
+import itertools
+import pytest
+
+from showoci_index import ShowOCIIndex, ShowOCIIndexBenchmarkService
+
+
+def cache():
+    """Small cache with duplicate keys and None values"""
+    return {'core': {'instances': [{
+        'id': "instance." + str(i),
+        'region_name': "region" + str(i % 2),
+        'compartment_id': "compartment" + str(i % 3) if i % 5 else None
+    } for i in range(12)]}}
+
+
+def searches():
+    values = ["region0", "region1", "compartment0", "compartment2", "instance.4", None, "missing"]
+    for key1, value1 in itertools.product(['id', 'region_name', 'compartment_id'], values):
+        yield 'instances', key1, value1, None, None
+        yield 'instances', key1, value1, 'compartment_id', "compartment1"
+        yield 'instances', key1, value1, 'compartment_id', None
+    yield 'volumes', 'id', "volume.1", None, None
+
+
+def test_index_matches_linear_search():
+    service = ShowOCIIndexBenchmarkService(cache())
+    index = ShowOCIIndex(service)
+
+    for sub_key, key1, value1, key2, value2 in searches():
+        linear = service.search_multi_items('core', sub_key, key1, value1, key2, value2)
+        assert index.search_multi_items('core', sub_key, key1, value1, key2, value2) == linear
+        assert index.search_unique_item('core', sub_key, key1, value1, key2, value2) is service.search_unique_item('core', sub_key, key1, value1, key2, value2)
+    assert index.error == 0
+
+
+def test_item_without_the_key_field_raises_like_linear_search():
+    data = cache()
+    del data['core']['instances'][3]['region_name']
+    service = ShowOCIIndexBenchmarkService(data)
+    index = ShowOCIIndex(service)
+
+    for search in (index, service):
+        with pytest.raises(KeyError):
+            search.search_multi_items('core', 'instances', 'region_name', "region1")
+        with pytest.raises(KeyError):
+            search.search_unique_item('core', 'instances', 'region_name', "region0")
+
+    # lists that have the key field stay indexed
+    assert index.search_multi_items('core', 'instances', 'id', "instance.3") == [data['core']['instances'][3]]
@@ -0,0 +1,34 @@
+"""
+showoci runs from a service cache in one process, the per-run state of
+ShowOCIData, ShowOCISummary and ShowOCICSV must not grow across runs
+"""
+
+import os
+import shutil
+import contextlib
+import pytest
+
+pytest.importorskip("showoci_service")
+
+import showoci_replay
+from .conftest import SHOWOCI_ARGS
+
+SOAK_RUNS = 50
+
+
+def test_soak_rss_is_flat(showoci_cache, tmp_path):
+    # the cache path is one argument even with spaces
+    cache_dir = tmp_path / "cache dir"
+    cache_dir.mkdir()
+    cache_file = str(cache_dir / "service cache.json")
+    shutil.copy(showoci_cache, cache_file)
+
+    assert showoci_replay.run_soak(cache_file, SHOWOCI_ARGS, SOAK_RUNS)
+
+
+def test_replay_matches_cache(showoci_cache):
+    cache_data = showoci_replay.load_cache_file(showoci_cache)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        data = showoci_replay.replay(cache_data, SHOWOCI_ARGS)
+
+    assert any(block['type'] == "region" for block in data)
@@ -0,0 +1,110 @@
+"""
+ShowOCIView, the processed showoci resources that read through to the
+cached item instead of copying it
+"""
+
+import copy
+import json
+import pickle
+import pytest
+
+from showoci_view import ShowOCIView, ShowOCIViewFields, view_to_json
+from .conftest import SHOWOCI_ARGS
+
+KEYS = ['key' + str(i) for i in range(10)]
+FIELDS = ShowOCIViewFields(['id', 'name', 'size'] + KEYS + ['logs'], renames={'size': 'approximate_size'}, derived=['name', 'logs'])
+
+
+def cache_item(n):
+    item = dict((key, key + "-" + str(n)) for key in KEYS)
+    item['id'] = "ocid1.instance." + str(n)
+    item['approximate_size'] = str(n * 10)
+    return item
+
+
+def copy_item(item):
+    """The processed dict ShowOCIData built before the views"""
+    value = {'id': item['id'], 'name': item['key1'] + " - " + item['key2'], 'size': item['approximate_size']}
+    for key in KEYS:
+        value[key] = item[key]
+    value['logs'] = []
+    return value
+
+
+def view_item(item):
+    return ShowOCIView(item, FIELDS, {'name': item['key1'] + " - " + item['key2'], 'logs': []})
+
+
+def test_view_writes_the_json_of_the_dict_copy():
+    cache = [cache_item(n) for n in range(100)]
+
+    views = json.dumps([view_item(item) for item in cache], default=view_to_json)
+
+    assert views == json.dumps([copy_item(item) for item in cache])
+
+
+def test_view_reads_renamed_and_derived_keys():
+    view = view_item(cache_item(1))
+
+    assert view['size'] == "10"
+    assert view['name'] == "key1-1 - key2-1"
+    assert 'approximate_size' not in view
+    assert list(view) == list(FIELDS.keys)
+    assert len(view) == len(FIELDS.keys)
+
+
+def test_set_goes_to_the_overlay():
+    item = cache_item(1)
+    before = copy.deepcopy(item)
+    view = view_item(item)
+
+    view['key0'] = "changed"
+    view['desc'] = "added"
+
+    assert item == before
+    assert view['key0'] == "changed"
+    assert list(view)[-1] == 'desc'
+    assert len(view) == len(FIELDS.keys) + 1
+    assert view.copy() == dict(copy_item(item), key0="changed", desc="added")
+
+
+def test_missing_cache_key_raises_key_error():
+    item = cache_item(1)
+    del item['approximate_size']
+
+    with pytest.raises(KeyError):
+        view_item(item)
+
+
+def test_pickle_gives_a_dict():
+    view = view_item(cache_item(1))
+
+    value = pickle.loads(pickle.dumps(view))
+
+    assert type(value) is dict
+    assert list(value.items()) == list(copy_item(cache_item(1)).items())
+
+
+def test_json_default_rejects_other_objects():
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=view_to_json)
+
+
+def test_bucket_views_leave_the_cache_unchanged(showoci_cache):
+    import showoci_replay
+
+    cache_data = showoci_replay.load_cache_file(showoci_cache)
+    buckets = cache_data[showoci_replay.ShowOCIService.C_OS][showoci_replay.ShowOCIService.C_OS_BUCKETS]
+    before = copy.deepcopy(buckets)
+
+    flags = showoci_replay.get_flags(SHOWOCI_ARGS)
+    data = showoci_replay.ShowOCIData(flags, showoci_replay.ShowOCIReplayService(flags, cache_data)).process_oci_data()
+    views = [view for block in data if block['type'] == "region" for compartment in block['data'] for view in compartment.get('object_storage', [])]
+
+    assert len(views) == len(buckets)
+    assert all(isinstance(view, ShowOCIView) for view in views)
+    assert buckets == before
+    for view in views:
+        assert json.loads(json.dumps(view, default=view_to_json)) == json.loads(json.dumps(view.copy()))
+        assert view['objects'] == view.item['approximate_count']
+        assert view['desc'].startswith(view['name'])